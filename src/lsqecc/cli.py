@@ -0,0 +1,219 @@
+# Copyright (C) 2020-2021 - George Watkins and Alex Nguyen
+#
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or (at your option) any later version.
+#
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public
+# License along with this library; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301
+# USA
+
+"""The lsqecc command line interface.
+
+Each command builds its own parser and imports the parts of the compiler it needs when it runs,
+so that e.g. ``lsqecc --help`` or ``lsqecc emit-instructions`` don't load qiskit.
+"""
+
+import argparse
+import pathlib
+import sys
+import time
+import traceback
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+Command = Callable[[List[str], str], int]
+
+
+def _add_circuit_options(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("files", nargs="+", type=pathlib.Path, help="QASM files")
+    parser.add_argument(
+        "--no-litinski-transform",
+        dest="apply_litinski_transform",
+        action="store_false",
+        help="Don't apply the Litinski transform",
+    )
+
+
+def compile_command(argv: List[str], prog: str) -> int:
+    from lsqecc.pipeline import batch_compilation
+
+    return min(batch_compilation.main(argv, prog), 1)
+
+
+def estimate_command(argv: List[str], prog: str) -> int:
+    parser = argparse.ArgumentParser(
+        prog=prog, description="Estimate the resources needed by QASM circuits."
+    )
+    _add_circuit_options(parser)
+    args = parser.parse_args(argv)
+
+    from lsqecc.pipeline.compilation_pipeline import CompilationPipeline, ReportLevel
+
+    failures = 0
+    for path in args.files:
+        try:
+            pipeline = CompilationPipeline(path.read_text(), args.apply_litinski_transform)
+            text = pipeline.compilation_text(ReportLevel.ESTIMATE).strip()
+        except Exception:
+            # Also when the estimator can't be imported, e.g. without the opensurgery submodule
+            failures += 1
+            details = traceback.format_exc()
+            print(f"{path}: failed, {details.strip().splitlines()[-1]}", flush=True)
+            print(details, file=sys.stderr)
+            continue
+        print(f"{path}:\n{text or 'No estimate'}", flush=True)
+    return min(failures, 1)
+
+
+def emit_instructions_command(argv: List[str], prog: str) -> int:
+    parser = argparse.ArgumentParser(
+        prog=prog,
+        description="Write the lattice surgery instructions of a QASM circuit, lowered to "
+        "Clifford+T gates.",
+    )
+    parser.add_argument("file", type=pathlib.Path, help="QASM file")
+    parser.add_argument(
+        "-o", "--output", type=pathlib.Path, help="Output file (default: standard output)"
+    )
+    parser.add_argument(
+        "--compress-rotations",
+        action="store_true",
+        help="Compress the rotation approximations",
+    )
+    args = parser.parse_args(argv)
+
+    from lsqecc.gates.gates_circuit import GatesCircuit
+    from lsqecc.ls_instructions.ls_instructions_from_gates import (
+        LSInstructionsFromGatesGenerator,
+    )
+
+    circuit = GatesCircuit.from_qasm(args.file).to_clifford_plus_t(args.compress_rotations)
+    text = LSInstructionsFromGatesGenerator.text_from_gates_circuit(circuit) + "\n"
+    if args.output is None:
+        sys.stdout.write(text)
+    else:
+        args.output.write_text(text)
+    return 0
+
+
+_STAGES = [
+    "parse",
+    "remove_y",
+    "transformed_circuit",
+    "logical_computation",
+    "estimate",
+    "make_computation",
+    "slices",
+]
+
+
+def benchmark_command(argv: List[str], prog: str) -> int:
+    # Imported before parsing for the choices of the options, as the stages need them anyway
+    from lsqecc.patches.ancilla_region_routing import RoutingStrategy
+    from lsqecc.pipeline.compilation_pipeline import CompilationPipeline
+    from lsqecc.simulation.logical_patch_state_simulation import SimulatorType
+
+    parser = argparse.ArgumentParser(
+        prog=prog, description="Time the compilation stages on QASM circuits."
+    )
+    _add_circuit_options(parser)
+    parser.add_argument(
+        "--until",
+        choices=_STAGES,
+        default="slices",
+        help="Last stage to run (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--simulation",
+        choices=[simulator.value for simulator in SimulatorType],
+        default=SimulatorType.NOOP.value,
+        help="Simulator run during the layout (default: %(default)s, while the library "
+        f"defaults to {SimulatorType.FULL_STATE_VECTOR.value})",
+    )
+    parser.add_argument(
+        "--routing",
+        choices=[strategy.value for strategy in RoutingStrategy],
+        default=RoutingStrategy.SHORTEST_PATHS.value,
+        help="How the ancilla regions are routed (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--pack-slices",
+        action="store_true",
+        help="Put independent operations in the same time slice when they fit",
+    )
+    parser.add_argument(
+        "--track-memory",
+        action="store_true",
+        help="Record the peak memory of each stage, which slows them down",
+    )
+    args = parser.parse_args(argv)
+
+    failures = 0
+    for path in args.files:
+        pipeline: Optional[CompilationPipeline] = None
+        start = time.perf_counter()
+        try:
+            pipeline = CompilationPipeline(
+                path.read_text(),
+                args.apply_litinski_transform,
+                simulation_type=SimulatorType(args.simulation),
+                track_memory=args.track_memory,
+                routing_strategy=RoutingStrategy(args.routing),
+                pack_time_slices=args.pack_slices,
+            )
+            start = time.perf_counter()
+            getattr(pipeline, args.until)()
+        except Exception:
+            # Keep the stages that finished in the row, so a failing circuit is still comparable
+            failures += 1
+            total = time.perf_counter() - start
+            details = traceback.format_exc()
+            row = f"{path}: failed after {total:.3f}s, {details.strip().splitlines()[-1]}"
+            if pipeline is not None and pipeline.records:
+                row += f"\n{pipeline.render_records()}"
+            print(row, flush=True)
+            print(details, file=sys.stderr)
+            continue
+        total = time.perf_counter() - start
+        print(f"{path}: {total:.3f}s\n{pipeline.render_records()}", flush=True)
+    return min(failures, 1)
+
+
+COMMANDS: Dict[str, Tuple[Command, str]] = {
+    "compile": (compile_command, "Compile QASM files to lattice surgery slices, in parallel"),
+    "estimate": (estimate_command, "Estimate the resources needed by QASM circuits"),
+    "emit-instructions": (
+        emit_instructions_command,
+        "Write the lattice surgery instructions of a QASM circuit",
+    ),
+    "benchmark": (benchmark_command, "Time the compilation stages on QASM circuits"),
+}
+
+
+def _usage() -> str:
+    lines = ["usage: lsqecc <command> [<args>]", "", "commands:"]
+    width = max(map(len, COMMANDS))
+    for name, (_, description) in COMMANDS.items():
+        lines.append(f"  {name:<{width}}  {description}")
+    lines += ["", "Run lsqecc <command> --help for the arguments of a command."]
+    return "\n".join(lines)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    args = list(sys.argv[1:] if argv is None else argv)
+    if not args or args[0] in {"-h", "--help"}:
+        print(_usage())
+        return 0 if args else 2
+    if args[0] not in COMMANDS:
+        print(f"lsqecc: unknown command {args[0]}\n\n{_usage()}", file=sys.stderr)
+        return 2
+
+    command, _ = COMMANDS[args[0]]
+    return command(args[1:], f"lsqecc {args[0]}")
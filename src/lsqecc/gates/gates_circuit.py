@@ -4,6 +4,7 @@ from typing import Sequence
 
 import lsqecc.gates.parse
 from lsqecc.gates import gates  # noqa: F401
+from lsqecc.gates.qasm_tokenizer import QasmSource
 
 
 @dataclass
@@ -22,5 +23,7 @@ class GatesCircuit:
         )
 
     @staticmethod
-    def from_qasm(qasm: str) -> "GatesCircuit":
+    def from_qasm(qasm: QasmSource) -> "GatesCircuit":
+        """Parse a QASM program, given as a string, a file object or a pathlib.Path. Paths and
+        file objects are read as the gates are parsed, see lsqecc.gates.qasm_tokenizer."""
         return GatesCircuit(lsqecc.gates.parse.parse_gates_circuit(qasm))
@@ -1,281 +1,53 @@
-# flake8: noqa
 """
 Gate sequences to approximate rz gates with arguments pi/2^n.
 Key is n so 0->rz(pi/1), 1->rz(pi/2), 2->rx(pi/4) ...
 Note that rz(theta) is a rotation by theta/2 about the Z axis in our convention.
 
-List generated using `gridsynth` with precision -d 42 (except for rz(pi/4)).
+List generated using `gridsynth` with precision -d 42 (except for rz(pi/4), which was manually
+changed to T).
 It is the lowest precision for which the pi/2^135 could be approximated.
+
+The sequences are stored one per line, line n for rz(pi/2^n), in the package data file
+pi_over_2_to_the_n_rz_gate_approximations.txt. It is only read the first time a sequence is
+looked up, as it is about 150 KB.
 """
-get_pi_over_2_to_the_n_rz_gate = [
-    # rz(pi/2^0)
-    "SS",
-    # rz(pi/2^1)
-    "S",
-    # rz(pi/2^2)  NOTE: Manually changed this to T
-    "T",
-    # rz(pi/2^3)
-    "SSSXHSTHTHSTHTHSTHSTHSTHTHTHSTHSTHSTHSTHTHTHSTHTHSTHTHSTHTHSTHSTHSTHSTHSTHTHSTHTHTHTHTHTHTHTHTHTHTHSTHTHSTHSTHTHSTHTHTHTHTHSTHSTHTHTHTHSTHSTHSTHTHTHSTHTHTHTHSTHTHSTHSTHSTHSTHTHTHTHTHTHTHSTHTHSTHTHTHSTHSTHTHSTHTHSTHTHTHTHSTHTHSTHTHTHTHSTHTHSTHTHSTHTHSTHTHSTHTHTHSTHTHTHSTHTHSTHTHSTHTHTHSTHTHSTHSTHTHSTHTHTHTHSTHTHTHTHTHSTHTHSTHSTHTHTHTHSTHTHTHSTHSTHSTHTHSTHTHSTHTHSTHSTHSTHTHSTHSTHTHSTHSTHSTHSTHSTHSTHTHTHSTHTHSTHSTHSTHTHTHSTHSTHTHTHSTHSTHTHSTHSTHSTHTHSTHSTHSTHSTHTHSTHSTHTHSTHSTHTHTHTHSTHTHSTHSTHTHTHTHTHSTHSTHSTHSTHSTHSTHSTHSTHSTHTHTHTHTHSTHTHSTHTHSTHTHTHTHSTHSTHSTHTHSTHSTHTHSTHTHTHTHSTHSTHTHSTHTHSTHTHSTHSTHTHSTHSTHTHSTHSTHSTHTHSTHTHSTHSTHTHSTHTHTHSTHTHSTHTHTHTHTHTHSTHSTHSTHTHSTHTHTHTHTHSTHTHSTHSTHTHSTHTHTHSTHTHSTHTHSTHSTHTHSTHTHTHSTHTHSTHSTHTHSTHSTHSTHSTHTHSTHTHTHSTHTHSTHSTHSTHTHSTHSTHTHSTHTHTHSTHSTHSTHTHSTHSTHTHSTHSTHTHTHSTHTHTHTHTHTHSTHSTHTHSTHSTHTHSTHSTHSTHTHSTHSTHTHTHSTHSTHSTHSTHSTHTHTHSTHSTHSTHSTHTHSTHSTHTHSTHSTHTHSTHTHSTHTHSTHTHSTHSTHTHTHTHSTHTHSTHSTHSTHTHSTHTHSTHSTHSTHTHSTHSTHTHSTHSTHSTHTHSTHTHTHSTHTHSTHTHSTHSTHSTHTHTHSTHTHSTHS",
-    # rz(pi/2^4)
-    "SSSXHSTHSTHTHTHTHSTHSTHTHSTHSTHSTHSTHTHTHTHTHSTHSTHTHTHSTHSTHTHTHTHSTHTHSTHTHTHTHTHTHSTHTHSTHTHTHTHTHTHSTHTHTHTHTHSTHSTHTHTHTHSTHTHTHTHSTHSTHTHSTHTHSTHSTHSTHTHTHSTHTHSTHTHTHSTHSTHTHTHSTHTHTHSTHSTHSTHTHSTHTHTHTHSTHSTHTHTHTHSTHSTHTHTHTHSTHTHTHTHTHSTHSTHTHSTHTHSTHTHSTHSTHTHTHTHSTHSTHSTHSTHTHTHTHTHTHSTHTHSTHSTHSTHSTHTHTHTHTHSTHSTHTHTHTHTHSTHSTHTHTHSTHSTHSTHTHSTHSTHTHTHTHSTHSTHSTHSTHSTHSTHSTHSTHTHSTHSTHSTHTHTHTHSTHTHTHTHTHSTHSTHSTHSTHTHTHSTHSTHSTHTHSTHTHTHTHSTHSTHSTHTHSTHSTHTHTHSTHTHSTHTHSTHTHSTHSTHTHSTHTHSTHSTHTHSTHTHSTHSTHTHSTHTHTHTHSTHSTHSTHTHSTHTHSTHSTHTHTHSTHTHSTHSTHTHSTHTHTHSTHTHTHTHSTHSTHSTHSTHSTHSTHSTHSTHTHSTHTHTHSTHSTHSTHSTHSTHSTHTHTHTHTHSTHSTHTHSTHTHSTHTHTHSTHTHSTHSTHTHSTHTHSTHSTHSTHTHSTHTHTHSTHSTHTHSTHSTHTHSTHSTHSTHSTHSTHSTHSTHTHTHSTHTHTHTHSTHTHTHTHSTHTHSTHSTHSTHTHTHTHSTHSTHTHSTHTHSTHSTHTHTHSTHSTHSTHTHSTHTHTHSTHTHTHSTHSTHTHTHTHSTHTHTHTHTHSTHTHSTHSTHSTHTHTHSTHSTHSTHSTHTHSTHTHSTHSTHTHSTHSTHSTHTHSTHTHTHSTHTHTHSTHSTHTHSTHTHSTHTHTHSTHSTHTHSTHTHTHTHSTHTHTHSTHTHTHTHSTHTHSTHSTHTHSTHTHSTHTHTHSTHSTHTHSTHSTHTHS",
-    # rz(pi/2^5)
-    "SSSXHSTHTHTHTHSTHTHTHTHSTHSTHSTHTHTHSTHSTHTHTHSTHSTHTHTHTHTHTHTHSTHSTHTHTHSTHSTHTHSTHTHSTHTHTHSTHSTHTHSTHTHTHTHTHTHTHSTHTHSTHTHSTHSTHTHTHSTHTHSTHTHSTHTHTHTHSTHSTHTHSTHTHTHTHTHTHTHSTHTHSTHTHSTHTHSTHSTHTHSTHTHTHSTHSTHSTHSTHTHSTHSTHTHTHSTHTHSTHTHSTHSTHSTHSTHTHSTHTHTHSTHSTHTHTHTHSTHTHTHTHTHSTHTHSTHTHTHSTHSTHSTHTHSTHTHSTHTHSTHTHTHSTHSTHTHTHSTHTHTHTHSTHSTHSTHSTHSTHSTHSTHSTHSTHTHTHSTHSTHSTHTHSTHTHSTHTHTHSTHTHSTHTHSTHTHTHSTHSTHTHSTHSTHSTHSTHTHSTHSTHTHTHSTHTHSTHTHTHTHSTHSTHTHTHSTHTHTHSTHSTHSTHTHSTHTHSTHSTHTHSTHTHTHTHTHTHSTHTHTHTHTHTHTHTHTHTHTHSTHTHTHTHTHTHSTHSTHTHSTHTHTHTHTHSTHTHTHSTHSTHTHSTHSTHSTHTHTHSTHTHTHTHSTHSTHSTHTHTHSTHSTHTHTHSTHTHTHSTHSTHSTHTHTHTHTHTHSTHTHTHTHSTHTHSTHSTHSTHTHTHTHTHSTHTHTHSTHTHTHTHSTHTHSTHSTHSTHTHTHTHTHTHSTHTHSTHTHTHSTHTHSTHSTHSTHSTHSTHSTHTHTHSTHTHTHTHSTHTHSTHTHTHSTHSTHSTHTHSTHSTHTHSTHSTHTHSTHSTHSTHTHSTHTHSTHSTHSTHSTHTHTHTHTHSTHTHTHSTHSTHSTHSTHTHSTHSTHTHSTHTHSTHSTHTHTHTHTHTHTHTHTHTHTHTHSTHSTHSTHSTHTHSTHSTHSTHTHTHSTHTHSTHSTHTHSTHSTHTHTHSTHTHTHTHSTHTHTHSTHSTHSTHTHSTHTHSTHSTHSTHSTHTHSTHTHS",
-    # rz(pi/2^6)
-    "SXHTHTHTHSTHSTHTHTHSTHTHSTHTHTHTHSTHSTHSTHSTHTHTHSTHSTHSTHSTHTHSTHSTHTHSTHTHSTHSTHSTHTHSTHSTHTHSTHSTHTHTHTHSTHTHSTHTHTHSTHSTHTHTHTHSTHSTHTHTHSTHSTHSTHSTHSTHSTHTHTHTHTHTHSTHTHTHTHTHSTHSTHTHSTHSTHSTHTHSTHSTHSTHTHSTHSTHSTHTHSTHTHTHSTHSTHTHSTHTHTHTHSTHSTHSTHTHSTHTHTHSTHTHTHSTHTHTHTHTHTHTHSTHTHTHTHTHTHTHTHTHTHTHSTHTHTHTHSTHTHTHSTHSTHSTHTHTHTHTHSTHTHSTHTHTHSTHTHTHTHTHTHSTHTHSTHTHTHSTHSTHTHSTHSTHTHSTHSTHSTHTHTHTHSTHTHTHSTHSTHTHTHTHTHSTHTHTHTHTHSTHSTHTHSTHTHSTHTHTHSTHSTHSTHSTHSTHSTHTHTHSTHTHTHSTHTHTHSTHTHTHSTHTHSTHSTHSTHTHTHSTHSTHTHTHTHTHSTHSTHSTHSTHTHTHSTHTHTHSTHSTHTHTHSTHTHTHTHTHTHTHTHSTHTHTHSTHSTHTHTHSTHSTHSTHSTHSTHSTHSTHSTHTHSTHSTHSTHTHSTHSTHSTHTHTHTHSTHTHTHTHSTHSTHSTHSTHSTHTHTHSTHTHTHSTHSTHSTHSTHSTHTHTHSTHTHTHSTHTHTHSTHSTHSTHTHTHSTHSTHTHSTHSTHTHTHTHTHSTHSTHTHTHSTHSTHSTHTHTHTHTHTHTHSTHTHSTHTHTHTHSTHSTHSTHSTHSTHSTHSTHSTHTHTHTHSTHSTHTHSTHTHTHTHSTHTHTHTHTHTHSTHSTHSTHSTHTHSTHTHSTHSTHSTHTHTHSTHTHTHTHSTHSTHTHSTHTHSTHTHSTHSTHTHTHTHSTHTHSTHTHSTHSTHTHTHTHSTHSTHTHTHSTHTHSTHTHSTHTHTHTHSTHTHTHSTHSTHTHSTHSTHSTHTHTHSTHS",
-    # rz(pi/2^7)
-    "SSXHTHTHTHSTHSTHTHSTHTHSTHTHSTHSTHTHTHSTHSTHTHTHTHTHTHSTHSTHSTHSTHSTHSTHSTHTHSTHTHSTHSTHTHTHSTHSTHTHSTHTHSTHTHTHSTHTHSTHSTHTHSTHTHSTHSTHSTHTHTHSTHTHSTHSTHTHSTHTHSTHSTHTHTHTHTHSTHSTHSTHSTHTHTHSTHTHTHTHSTHSTHSTHTHSTHTHSTHSTHSTHTHTHTHTHTHSTHSTHTHSTHTHTHSTHSTHSTHSTHSTHSTHTHSTHSTHTHTHSTHSTHSTHTHTHSTHSTHSTHSTHTHTHSTHTHTHTHTHSTHSTHSTHSTHSTHSTHTHTHTHSTHSTHTHTHTHSTHSTHTHSTHTHTHSTHSTHTHSTHTHSTHSTHSTHSTHTHSTHTHSTHTHTHTHSTHTHSTHTHSTHSTHSTHSTHSTHSTHSTHSTHSTHTHTHSTHSTHTHSTHTHSTHTHSTHTHSTHTHTHSTHTHTHTHSTHTHTHSTHSTHTHSTHSTHTHSTHTHSTHTHTHTHSTHTHSTHSTHSTHSTHSTHTHTHSTHSTHTHTHTHTHSTHSTHTHSTHTHSTHSTHTHTHSTHTHSTHTHSTHSTHSTHTHTHTHSTHSTHSTHSTHTHTHSTHSTHSTHSTHTHTHSTHTHSTHTHSTHSTHSTHTHTHSTHTHSTHTHSTHTHSTHTHSTHSTHSTHTHSTHSTHSTHSTHSTHSTHTHTHSTHTHSTHTHSTHTHSTHSTHSTHTHTHSTHSTHTHTHTHSTHTHTHTHSTHSTHSTHTHSTHSTHTHSTHTHSTHSTHSTHTHTHSTHTHTHSTHTHTHTHSTHSTHTHSTHTHSTHTHTHTHTHSTHTHTHSTHTHSTHSTHSTHTHSTHSTHTHTHTHSTHTHSTHSTHTHSTHTHSTHTHTHTHSTHTHSTHTHTHTHSTHSTHSTHSTHSTHTHSTHSTHSTHTHSTHSTHSTHSTHSTHTHTHSTHSTHSTHSTHSTHSTHSTHTHSTHSTHSTHTHTHTHSTHSTHTHTHSTHSTHSTHSTHTHSTHTHTHTHSTHTHSTHTHTHSTHS",
-    # rz(pi/2^8)
-    "SXHSTHSTHTHTHTHTHSTHTHSTHTHSTHSTHTHSTHTHSTHSTHTHTHTHSTHTHSTHTHTHTHTHTHSTHSTHTHTHSTHTHTHTHTHTHSTHSTHSTHSTHTHTHTHSTHSTHSTHSTHSTHTHTHTHSTHTHTHSTHSTHTHTHTHTHTHTHTHSTHTHTHSTHTHSTHTHTHSTHSTHSTHSTHSTHSTHSTHTHTHTHTHTHSTHSTHSTHTHSTHSTHTHSTHTHTHTHSTHTHTHSTHTHSTHTHTHSTHTHTHTHSTHTHSTHSTHSTHTHTHTHSTHSTHTHSTHSTHSTHTHSTHSTHSTHSTHSTHTHSTHSTHTHTHTHSTHTHTHSTHTHSTHSTHSTHTHTHTHTHTHSTHSTHSTHTHTHSTHSTHSTHTHTHTHTHSTHSTHSTHSTHSTHTHSTHTHSTHSTHTHTHSTHTHSTHSTHSTHTHTHSTHTHSTHTHSTHSTHSTHSTHTHSTHSTHTHSTHSTHSTHSTHSTHTHSTHSTHSTHSTHSTHTHSTHSTHSTHSTHTHSTHTHSTHSTHTHSTHSTHSTHSTHSTHSTHSTHSTHTHSTHSTHTHTHSTHSTHSTHTHTHTHTHTHTHTHSTHTHTHSTHSTHSTHSTHTHTHSTHTHTHTHTHTHTHTHSTHSTHTHTHSTHTHTHSTHTHSTHTHTHSTHSTHTHTHTHSTHSTHTHSTHTHTHTHTHTHSTHSTHSTHSTHSTHTHSTHSTHTHSTHTHTHTHSTHTHSTHSTHSTHTHSTHTHTHSTHSTHSTHSTHSTHSTHSTHTHSTHTHSTHTHSTHSTHTHTHTHTHSTHSTHTHTHTHSTHTHTHSTHTHTHSTHSTHTHSTHTHSTHSTHSTHSTHSTHTHSTHTHTHSTHTHSTHSTHSTHTHTHSTHSTHSTHTHTHTHTHSTHSTHSTHSTHTHSTHTHSTHTHSTHSTHTHSTHTHSTHSTHSTHSTHTHSTHTHSTHSTHSTHSTHSTHTHTHTHSTHSTHSTHTHSTHSTHSTHSTHTHTHSTHSTHTHTHSTHSTHTHTHTHSTHSTHSTHTHSTHTHSTHS",
-    # rz(pi/2^9)
-    "XTHSTHTHSTHSTHSTHTHSTHSTHSTHSTHSTHTHSTHSTHTHSTHSTHTHSTHTHSTHTHTHSTHTHTHTHSTHSTHTHTHTHTHTHSTHSTHTHTHSTHTHSTHSTHSTHTHTHTHTHSTHTHSTHTHTHTHTHSTHSTHTHSTHSTHSTHSTHTHTHSTHSTHTHSTHSTHSTHTHTHSTHTHTHTHSTHTHSTHSTHSTHSTHSTHSTHSTHSTHTHTHSTHSTHSTHTHSTHTHTHSTHSTHSTHSTHSTHTHSTHSTHTHSTHTHTHTHTHSTHSTHSTHSTHSTHSTHTHTHTHTHSTHTHTHTHSTHTHSTHTHSTHSTHTHTHSTHTHSTHSTHTHTHSTHSTHSTHTHSTHSTHSTHSTHTHSTHTHSTHTHTHTHSTHTHSTHSTHSTHTHSTHSTHSTHSTHSTHTHTHSTHTHTHTHSTHTHSTHSTHSTHTHTHTHTHSTHSTHTHSTHTHTHSTHSTHTHTHSTHTHTHSTHTHTHSTHTHSTHSTHTHSTHSTHTHTHTHSTHTHSTHSTHTHSTHTHTHTHTHTHTHSTHTHSTHSTHSTHTHSTHTHSTHTHTHTHSTHTHSTHTHTHTHSTHSTHTHSTHTHTHSTHSTHTHSTHSTHTHTHTHSTHSTHTHSTHTHSTHSTHSTHSTHTHSTHSTHTHSTHSTHTHSTHTHSTHSTHTHSTHSTHSTHSTHSTHTHTHSTHSTHTHSTHSTHTHSTHTHSTHSTHTHTHSTHTHSTHTHSTHSTHTHTHTHSTHSTHTHSTHSTHTHTHTHSTHSTHTHSTHSTHTHTHTHSTHSTHSTHSTHTHSTHTHSTHSTHTHTHTHTHSTHSTHSTHSTHSTHTHSTHSTHSTHTHTHSTHSTHTHSTHTHTHSTHTHSTHTHTHSTHTHTHSTHSTHSTHTHTHTHSTHSTHSTHTHTHSTHSTHTHTHSTHSTHTHSTHTHTHSTHTHSTHSTHTHSTHTHSTHSTHTHTHSTHSTHSTHSTHTHTHTHTHSTHSTHTHTHSTHTHSTHSTHSTHTHTHSTHTHSTHSTHSTHTHSTHTHTHSTH",
-    # rz(pi/2^10)
-    "SHSTHSTHSTHTHSTHTHTHTHTHTHSTHTHTHTHSTHSTHSTHSTHTHSTHTHTHTHSTHTHSTHSTHSTHTHTHTHTHTHTHSTHTHTHTHSTHTHTHTHSTHTHTHSTHTHSTHSTHTHTHTHTHSTHTHTHSTHSTHTHSTHTHTHTHSTHSTHTHSTHSTHSTHSTHSTHSTHTHSTHTHTHTHTHTHTHSTHSTHSTHTHTHSTHTHSTHSTHSTHSTHSTHTHTHTHTHTHTHSTHTHTHTHTHTHTHTHSTHSTHTHTHTHSTHTHTHSTHTHTHTHSTHTHTHSTHSTHSTHTHSTHSTHSTHSTHSTHTHTHTHTHSTHSTHSTHTHSTHSTHTHTHTHSTHTHTHSTHTHTHTHSTHTHTHTHTHTHTHSTHSTHSTHSTHSTHTHSTHTHSTHSTHTHTHTHTHTHSTHSTHTHSTHTHSTHTHTHSTHTHSTHSTHTHTHTHSTHSTHSTHSTHSTHSTHSTHSTHTHSTHTHSTHTHTHTHSTHTHTHSTHSTHSTHTHTHSTHTHSTHTHTHSTHSTHSTHSTHSTHTHTHSTHTHTHSTHSTHTHSTHTHSTHTHSTHSTHTHSTHSTHSTHTHTHTHSTHTHTHSTHSTHTHTHTHSTHTHSTHSTHSTHSTHSTHSTHTHSTHTHSTHSTHSTHSTHSTHTHTHTHTHSTHSTHTHTHSTHTHSTHSTHSTHSTHTHSTHSTHTHSTHSTHSTHTHTHTHTHTHTHSTHTHTHSTHTHSTHSTHSTHSTHTHTHTHSTHSTHTHTHTHSTHTHSTHTHTHSTHTHSTHTHTHSTHTHSTHSTHSTHSTHTHSTHTHTHTHTHTHTHSTHSTHSTHTHSTHSTHSTHSTHSTHTHSTHSTHTHTHSTHSTHSTHTHTHTHSTHTHSTHTHTHSTHTHTHTHTHTHTHSTHSTHTHSTHSTHTHSTHSTHTHTHSTHTHTHSTHSTHTHSTHSTHSTHTHTHSTHTHSTHSTHTHTHSTHTHTHTHSTHSTHTHTHTHTHSTHSTHTHSTHSTHSTHTHTHSTHTHS",
-    # rz(pi/2^11)
-    "SHTHSTHTHSTHTHTHSTHTHTHTHTHSTHSTHTHTHTHTHSTHSTHSTHTHSTHSTHSTHSTHTHTHTHTHSTHSTHSTHTHSTHTHSTHSTHTHTHSTHTHSTHSTHTHSTHTHTHSTHSTHTHTHTHSTHTHSTHTHSTHTHTHTHSTHTHTHSTHTHTHTHSTHSTHSTHSTHSTHSTHSTHSTHSTHSTHTHSTHSTHSTHTHTHSTHSTHSTHTHSTHTHSTHSTHTHTHTHSTHTHSTHSTHSTHSTHTHTHTHTHTHSTHTHSTHSTHTHSTHSTHTHSTHSTHSTHSTHSTHSTHTHTHTHSTHSTHSTHSTHTHTHSTHTHTHSTHTHTHSTHSTHSTHTHSTHTHTHTHTHSTHTHTHSTHSTHTHTHSTHSTHTHSTHTHTHTHSTHSTHSTHSTHTHSTHSTHTHTHSTHSTHTHSTHSTHSTHTHSTHSTHTHSTHSTHSTHTHTHTHTHTHTHTHTHTHSTHTHSTHTHSTHTHTHTHSTHTHSTHSTHTHSTHSTHTHSTHSTHSTHSTHTHTHTHTHSTHSTHTHSTHTHSTHSTHSTHTHSTHTHTHTHSTHTHSTHTHSTHSTHTHSTHSTHSTHTHTHSTHTHTHTHTHTHTHTHSTHSTHTHTHSTHSTHTHTHTHSTHSTHTHSTHSTHSTHTHSTHSTHSTHSTHTHTHTHTHTHTHTHSTHSTHSTHTHTHTHTHSTHTHTHTHTHSTHTHSTHSTHTHSTHTHTHSTHSTHTHSTHTHTHSTHSTHSTHTHSTHTHTHSTHSTHSTHTHSTHSTHSTHSTHSTHTHTHSTHSTHSTHSTHSTHSTHTHTHTHSTHTHTHTHSTHSTHSTHSTHSTHSTHSTHTHSTHSTHTHSTHTHTHSTHTHTHSTHSTHTHSTHTHTHSTHTHTHSTHTHTHTHTHTHTHSTHSTHTHTHTHSTHSTHSTHSTHSTHTHTHSTHTHTHSTHSTHTHSTHSTHSTHSTHTHTHTHTHTHSTHSTHSTHSTHTHTHTHSTHSTHSTHSTHTHTHSTHSTHTHSTHTHSTHTHTHS",
-    # rz(pi/2^12)
-    "SSSXHSTHSTHTHTHTHSTHSTHSTHTHSTHSTHSTHSTHSTHTHTHTHSTHSTHSTHSTHSTHSTHSTHTHSTHTHSTHTHTHSTHSTHSTHTHSTHSTHTHTHTHTHTHSTHTHTHTHTHSTHSTHSTHTHTHTHSTHSTHTHTHTHSTHSTHTHTHSTHSTHSTHTHSTHSTHTHTHSTHTHTHSTHSTHTHTHTHSTHSTHSTHTHTHSTHTHSTHTHSTHTHTHSTHSTHTHTHTHSTHTHTHSTHTHTHTHSTHTHSTHSTHSTHSTHTHTHTHSTHSTHSTHTHSTHSTHTHSTHSTHTHTHTHTHTHTHTHSTHTHSTHTHSTHTHSTHTHTHTHTHSTHTHTHTHTHTHTHTHTHTHSTHTHTHTHSTHTHTHTHTHSTHSTHTHSTHSTHTHSTHSTHTHTHTHSTHSTHTHSTHSTHSTHSTHSTHSTHSTHSTHTHSTHSTHSTHTHSTHSTHTHSTHSTHSTHSTHTHSTHTHTHTHTHSTHTHTHTHSTHSTHTHSTHTHSTHTHSTHTHSTHSTHSTHTHSTHTHSTHTHSTHSTHSTHTHTHTHSTHTHSTHTHSTHSTHTHTHTHTHSTHTHSTHTHTHTHSTHTHTHTHSTHSTHTHSTHSTHTHTHTHSTHSTHSTHTHSTHTHSTHSTHTHTHSTHSTHTHSTHTHSTHSTHSTHTHTHSTHSTHSTHSTHSTHTHTHTHTHTHSTHTHTHTHSTHSTHSTHSTHTHSTHSTHSTHTHTHSTHTHSTHSTHTHTHSTHSTHTHSTHSTHSTHTHSTHSTHTHSTHTHTHTHSTHTHTHTHSTHSTHTHTHTHTHTHSTHTHSTHTHTHSTHSTHTHTHTHSTHSTHTHTHSTHSTHTHSTHSTHTHTHSTHTHSTHTHTHTHSTHTHSTHTHTHSTHTHSTHTHTHTHTHSTHSTHSTHTHSTHTHTHSTHSTHTHSTHTHTHTHSTHTHTHSTHTHSTHTHSTHSTHTHSTHTHTHTHSTHSTHTHSTHSTHTHTHSTHTHTHSTHSTHTHTHTHTHSTHTHTHS",
-    # rz(pi/2^13)
-    "SSXHSTHSTHSTHTHTHSTHTHTHSTHSTHTHTHSTHTHSTHSTHTHSTHSTHTHTHSTHSTHTHSTHTHSTHSTHSTHSTHSTHSTHTHTHTHSTHSTHTHSTHSTHTHTHSTHTHSTHSTHSTHSTHSTHTHSTHTHSTHSTHTHSTHTHSTHTHTHTHTHTHSTHTHSTHTHSTHSTHSTHTHSTHSTHSTHSTHSTHTHTHTHSTHSTHTHSTHSTHSTHTHSTHTHSTHTHTHTHTHSTHSTHTHTHSTHTHTHSTHSTHTHTHTHSTHSTHSTHTHSTHSTHSTHSTHTHTHTHTHSTHTHTHTHSTHTHTHSTHSTHTHTHSTHTHSTHTHSTHSTHSTHSTHTHTHSTHTHTHTHSTHSTHSTHTHSTHSTHTHTHSTHSTHSTHTHSTHSTHTHTHSTHSTHSTHTHSTHTHSTHSTHSTHSTHTHTHTHSTHTHTHSTHTHTHSTHTHSTHSTHSTHTHSTHTHSTHTHSTHTHTHSTHSTHTHTHSTHSTHTHTHTHSTHTHSTHSTHTHSTHTHSTHSTHTHSTHTHTHSTHTHSTHSTHSTHSTHSTHTHTHSTHTHTHSTHTHTHSTHSTHSTHTHTHSTHTHSTHSTHTHSTHSTHTHSTHTHTHSTHTHSTHSTHSTHSTHTHSTHSTHSTHTHTHSTHTHTHTHSTHSTHTHTHSTHSTHSTHTHSTHTHTHSTHTHSTHTHTHSTHTHSTHSTHTHTHTHTHTHTHTHSTHTHTHSTHSTHTHTHSTHSTHTHSTHTHSTHTHSTHSTHTHTHSTHTHTHTHSTHSTHSTHSTHSTHTHSTHTHSTHTHTHSTHTHSTHTHTHTHTHSTHTHSTHTHSTHTHTHTHSTHSTHTHTHTHSTHTHSTHTHTHSTHSTHSTHTHSTHTHSTHTHTHSTHTHTHSTHSTHSTHSTHSTHTHTHTHTHTHSTHSTHSTHSTHSTHTHSTHSTHSTHTHSTHSTHTHTHTHSTHSTHSTHSTHTHSTHSTHTHSTHSTHSTHTHSTHSTHTHTHSTHTHSTHTHTHSTHTHSTHTHTHTHSTHTHSTHTH",
-    # rz(pi/2^14)
-    "SSXHSTHTHTHSTHTHTHTHTHTHTHSTHTHSTHSTHSTHTHSTHSTHSTHTHTHTHTHTHSTHTHTHTHTHSTHSTHSTHTHSTHSTHSTHSTHTHSTHSTHSTHTHTHTHSTHSTHTHTHSTHTHTHTHTHTHTHSTHTHTHSTHTHSTHTHSTHSTHTHSTHTHTHSTHTHTHSTHTHTHSTHSTHTHSTHTHSTHTHSTHTHSTHSTHSTHSTHSTHTHSTHSTHTHSTHTHSTHTHTHTHTHTHTHSTHSTHTHSTHTHSTHTHTHSTHTHTHSTHSTHSTHSTHSTHSTHTHSTHTHTHTHTHTHSTHSTHSTHTHTHSTHSTHTHTHSTHSTHTHTHSTHSTHTHSTHTHSTHTHTHSTHSTHSTHTHTHSTHTHSTHTHSTHTHSTHSTHSTHTHSTHTHTHSTHTHTHSTHSTHSTHTHTHSTHSTHTHSTHSTHSTHSTHTHSTHSTHTHTHSTHSTHTHSTHTHSTHTHTHTHTHSTHSTHTHTHTHSTHTHSTHSTHSTHSTHTHTHTHSTHSTHSTHTHSTHTHSTHSTHSTHTHTHSTHTHTHSTHTHSTHSTHTHSTHSTHTHSTHTHTHTHSTHSTHTHSTHTHSTHSTHTHTHSTHSTHSTHTHTHTHSTHSTHSTHTHSTHTHSTHTHSTHSTHTHTHTHTHSTHSTHSTHTHSTHSTHTHSTHTHTHTHSTHTHSTHSTHSTHTHTHTHTHSTHTHSTHTHSTHTHSTHTHSTHSTHTHSTHSTHTHSTHTHTHSTHSTHSTHSTHSTHSTHTHTHSTHSTHTHTHTHTHSTHSTHSTHSTHSTHSTHSTHTHTHSTHSTHSTHSTHSTHSTHSTHTHTHSTHTHTHSTHSTHSTHTHSTHSTHSTHSTHTHTHTHTHSTHTHSTHSTHTHTHSTHSTHTHSTHSTHTHSTHTHSTHSTHSTHSTHTHSTHTHSTHTHTHTHTHTHSTHTHTHTHSTHTHTHSTHSTHTHSTHSTHTHSTHSTHTHTHSTHSTHTHTHTHSTHTHSTHTHTHTHSTHTHTHTHSTHSTHSTHTHTHSTH",
-    # rz(pi/2^15)
-    "XHSTHTHTHSTHSTHTHSTHSTHSTHTHTHTHSTHSTHSTHTHSTHSTHTHTHSTHTHTHSTHSTHTHTHSTHSTHTHSTHSTHTHSTHTHSTHTHSTHTHSTHSTHSTHSTHTHTHTHSTHSTHSTHTHSTHSTHSTHTHSTHSTHSTHSTHTHTHTHSTHSTHTHTHSTHTHTHSTHSTHSTHTHSTHTHTHSTHTHTHSTHTHTHSTHTHTHSTHSTHTHTHSTHSTHSTHTHTHTHTHTHSTHTHSTHSTHSTHSTHTHTHTHSTHTHTHSTHTHSTHSTHSTHTHTHTHTHTHTHSTHSTHTHSTHSTHTHTHTHSTHSTHSTHSTHSTHSTHTHSTHTHTHSTHSTHTHSTHTHSTHTHTHTHTHSTHTHTHSTHSTHSTHSTHSTHTHSTHSTHTHTHTHSTHTHTHTHSTHSTHTHSTHSTHTHTHSTHTHSTHSTHSTHSTHSTHTHTHSTHSTHSTHTHSTHSTHTHTHSTHTHSTHSTHSTHSTHTHTHSTHTHSTHTHSTHTHSTHTHSTHSTHSTHSTHTHSTHTHSTHTHSTHTHSTHSTHSTHSTHSTHSTHTHTHTHSTHTHSTHTHSTHSTHSTHSTHSTHSTHTHSTHSTHTHTHSTHTHTHTHSTHTHSTHSTHSTHSTHSTHTHSTHSTHSTHSTHTHTHSTHTHSTHTHSTHTHSTHSTHTHSTHTHTHTHTHSTHSTHSTHTHTHTHSTHTHSTHSTHSTHTHSTHTHTHTHSTHTHSTHTHTHTHSTHTHSTHSTHSTHSTHTHSTHSTHTHSTHTHTHSTHTHTHTHSTHSTHTHSTHSTHSTHTHTHTHSTHSTHSTHTHSTHSTHSTHSTHTHSTHTHSTHTHSTHTHSTHSTHTHTHTHTHTHTHTHTHSTHSTHTHTHSTHSTHTHTHSTHSTHTHTHSTHTHSTHTHTHTHSTHTHTHTHSTHSTHSTHTHTHSTHTHTHTHTHSTHTHTHSTHTHSTHTHTHTHSTHSTHTHSTHTHTHTHTHTHSTHTHSTHTHTHTHSTHSTHTHTHSTHSTHST",
-    # rz(pi/2^16)
-    "THSTHTHSTHSTHSTHTHSTHSTHSTHTHTHSTHTHTHSTHSTHSTHTHTHSTHTHSTHTHTHTHSTHTHTHTHSTHSTHSTHSTHSTHSTHSTHSTHTHTHTHSTHSTHSTHSTHSTHTHSTHSTHTHSTHSTHTHTHSTHTHTHSTHTHTHTHTHSTHSTHTHTHSTHTHSTHSTHTHTHSTHTHTHSTHSTHTHSTHSTHTHSTHTHSTHSTHSTHTHTHSTHTHTHSTHTHSTHTHSTHTHSTHSTHTHTHTHTHTHTHSTHTHTHTHTHSTHSTHTHTHSTHTHSTHSTHSTHSTHSTHSTHTHSTHTHTHSTHTHTHTHSTHTHTHTHSTHSTHSTHTHSTHSTHTHSTHTHTHSTHSTHSTHSTHTHTHSTHSTHSTHSTHSTHTHSTHTHSTHTHSTHTHTHTHSTHSTHTHSTHTHTHSTHSTHSTHTHSTHSTHTHTHTHTHSTHTHTHSTHSTHSTHSTHTHSTHSTHSTHTHTHTHSTHTHSTHTHSTHTHSTHTHTHTHTHSTHSTHTHTHSTHTHSTHTHTHSTHSTHTHTHTHTHSTHTHTHSTHTHTHTHSTHSTHSTHTHTHTHTHTHSTHTHTHSTHSTHSTHTHSTHTHTHSTHSTHTHTHTHTHSTHTHTHSTHTHTHSTHTHTHTHTHTHTHTHSTHTHTHSTHSTHTHTHTHSTHTHSTHSTHTHTHSTHSTHTHTHTHTHTHTHTHSTHTHTHSTHTHTHTHSTHSTHSTHTHSTHTHSTHSTHSTHTHSTHSTHSTHSTHSTHTHSTHTHSTHSTHTHTHSTHSTHSTHTHSTHSTHSTHTHSTHSTHSTHSTHSTHTHSTHTHSTHTHSTHTHSTHSTHSTHSTHTHSTHTHSTHTHSTHTHSTHTHTHSTHSTHTHTHSTHSTHTHTHTHSTHTHSTHSTHSTHSTHSTHSTHTHTHTHSTHSTHSTHTHTHSTHSTHSTHSTHTHTHSTHSTHTHTHSTHTHTHSTHTHTHSTHTHSTHTHTHTHSTHTHTHTHTHTHSTHTHTHTHTHTHTHTH",
-    # rz(pi/2^17)
-    "SSSHTHTHSTHSTHSTHTHSTHTHSTHTHSTHSTHTHSTHTHSTHSTHSTHTHSTHTHTHSTHTHSTHTHSTHSTHSTHTHSTHTHSTHTHTHSTHTHSTHTHSTHSTHSTHTHTHSTHTHTHSTHTHSTHSTHSTHSTHSTHTHTHSTHTHTHTHTHTHSTHSTHSTHSTHSTHSTHSTHSTHTHSTHTHSTHSTHTHSTHSTHTHSTHTHTHSTHTHTHSTHTHSTHSTHSTHSTHTHTHSTHTHTHTHTHSTHSTHSTHTHTHSTHTHTHTHSTHSTHTHTHTHTHTHSTHSTHSTHTHTHSTHTHSTHTHTHTHTHSTHTHTHTHSTHSTHTHTHTHSTHTHTHTHTHTHTHTHSTHSTHTHSTHTHTHSTHSTHTHSTHSTHSTHSTHTHTHSTHSTHTHSTHTHSTHTHSTHTHTHTHSTHSTHTHSTHTHSTHSTHTHTHTHSTHSTHSTHSTHTHTHSTHSTHSTHSTHSTHTHSTHTHSTHSTHSTHTHSTHTHSTHSTHSTHSTHTHSTHTHSTHTHTHTHSTHTHSTHSTHTHSTHSTHSTHTHTHSTHTHTHTHTHTHSTHSTHTHSTHSTHSTHTHTHTHSTHSTHSTHTHTHSTHTHSTHSTHTHTHTHSTHTHSTHSTHTHSTHSTHTHSTHTHSTHTHTHSTHTHTHSTHSTHSTHTHSTHTHTHSTHTHSTHSTHSTHSTHTHTHTHTHTHSTHTHTHSTHTHSTHTHSTHSTHTHTHSTHTHTHTHTHTHTHSTHTHSTHSTHSTHTHSTHTHSTHSTHTHTHSTHTHTHSTHSTHTHSTHTHSTHSTHTHTHTHTHTHTHTHTHTHTHTHTHTHTHTHTHSTHTHTHTHTHTHSTHSTHSTHSTHTHSTHTHSTHTHSTHSTHTHTHTHSTHTHSTHSTHSTHTHTHSTHTHSTHSTHSTHTHSTHTHTHSTHTHSTHTHTHTHSTHSTHSTHTHSTHTHSTHTHTHSTHTHTHSTHTHTHSTHSTHTHSTHSTHST",
-    # rz(pi/2^18)
-    "SSSHSTHTHSTHSTHSTHSTHTHTHSTHSTHSTHTHTHTHSTHSTHTHSTHSTHTHSTHSTHSTHSTHSTHSTHSTHSTHSTHTHSTHSTHTHTHTHTHSTHTHTHSTHTHSTHTHTHSTHTHTHTHTHSTHTHTHSTHSTHTHSTHTHSTHSTHSTHSTHSTHSTHTHTHSTHTHTHSTHTHTHSTHSTHSTHTHSTHSTHTHSTHSTHTHSTHTHTHSTHSTHTHSTHTHTHTHSTHTHTHTHSTHSTHTHTHSTHSTHTHTHSTHTHTHTHSTHTHSTHSTHTHSTHSTHSTHSTHSTHSTHTHTHSTHTHTHTHTHSTHTHTHSTHSTHSTHTHTHSTHSTHSTHTHSTHSTHSTHTHTHSTHTHSTHSTHSTHSTHTHTHSTHTHTHTHSTHSTHSTHTHTHTHTHTHSTHSTHSTHTHTHSTHTHSTHTHSTHSTHTHSTHSTHSTHSTHTHSTHTHTHTHTHSTHTHTHTHTHSTHTHSTHTHTHSTHSTHTHTHTHTHTHTHSTHSTHSTHSTHTHSTHTHTHSTHTHSTHSTHTHSTHSTHTHTHSTHSTHSTHSTHTHSTHTHTHSTHSTHSTHSTHSTHSTHSTHSTHTHTHSTHSTHTHTHSTHSTHSTHTHTHSTHSTHTHSTHSTHSTHSTHSTHTHSTHSTHTHSTHSTHSTHSTHSTHTHSTHSTHTHSTHTHSTHSTHTHSTHTHTHSTHTHTHSTHTHSTHTHSTHSTHSTHTHSTHTHSTHSTHSTHSTHTHTHTHSTHTHTHTHSTHSTHSTHSTHTHTHSTHSTHSTHSTHSTHTHSTHSTHTHSTHTHTHSTHTHTHSTHTHTHTHSTHTHSTHTHSTHSTHSTHSTHSTHTHSTHTHSTHSTHTHSTHSTHTHSTHSTHTHTHTHSTHSTHSTHSTHSTHTHTHTHSTHTHSTHSTHSTHSTHTHTHTHSTHTHTHTHSTHTHTHSTHTHSTHSTHTHTHTHTHSTHSTHSTHSTHSTHTHTHSTHSTHSTHTHSTHTHSTHSTHSTHTHTHTHSTHTHTHSTHTHSTHTHSTHSTHTHTHTHTHTH",
-    # rz(pi/2^19)
-    "STHTHSTHSTHTHTHTHSTHSTHSTHSTHSTHSTHTHTHSTHSTHSTHTHSTHSTHTHSTHSTHTHTHTHTHSTHSTHTHTHSTHTHTHTHSTHTHTHSTHTHSTHTHTHSTHSTHTHTHTHTHSTHTHTHTHTHTHSTHSTHSTHTHTHTHSTHTHSTHTHSTHTHTHSTHTHTHSTHSTHSTHSTHTHSTHSTHSTHTHSTHSTHTHSTHTHTHSTHTHTHSTHSTHTHSTHTHTHTHSTHSTHSTHTHSTHSTHTHSTHTHSTHSTHTHTHSTHTHTHSTHSTHTHSTHTHTHSTHSTHSTHSTHSTHSTHSTHSTHSTHSTHTHSTHTHTHSTHSTHTHTHSTHSTHSTHSTHSTHTHTHSTHSTHSTHSTHSTHTHSTHSTHSTHSTHTHTHTHSTHTHSTHSTHSTHSTHSTHSTHSTHTHTHTHTHTHSTHTHTHTHSTHTHSTHSTHTHSTHTHSTHTHSTHTHTHSTHSTHSTHTHTHTHTHSTHSTHTHSTHSTHSTHSTHSTHTHTHSTHSTHSTHTHSTHTHSTHTHTHSTHTHTHSTHTHTHSTHSTHSTHSTHSTHSTHTHTHTHSTHTHTHSTHTHSTHTHTHSTHTHTHSTHSTHTHSTHSTHSTHSTHSTHTHSTHSTHTHSTHSTHSTHSTHSTHSTHSTHSTHTHTHSTHTHTHSTHSTHSTHTHSTHTHSTHSTHTHSTHTHTHTHTHTHSTHTHSTHSTHSTHTHSTHSTHTHTHTHSTHTHSTHSTHTHSTHSTHTHSTHTHTHSTHSTHSTHTHTHSTHTHTHSTHTHSTHTHTHTHSTHSTHSTHSTHTHSTHTHSTHTHTHTHSTHSTHSTHTHTHSTHTHTHTHSTHTHTHSTHSTHSTHSTHSTHTHSTHTHTHSTHSTHSTHTHTHSTHSTHSTHSTHTHSTHSTHTHTHSTHSTHSTHSTHTHTHTHTHTHSTHSTHSTHSTHTHSTHTHTHSTHTHTHSTHTHSTHSTHTHTHTHSTHSTHSTHSTHSTHTHTHSTHSTHSTHSTHTHSTHTHTHTHTHTHTHSTHSTHSTH",
-    # rz(pi/2^20)
-    "STHTHSTHTHTHSTHTHTHTHTHTHTHTHSTHSTHTHSTHSTHSTHSTHTHSTHTHSTHTHTHTHSTHTHSTHTHTHSTHTHSTHTHSTHTHSTHSTHSTHTHSTHSTHTHSTHSTHTHTHSTHSTHTHSTHTHTHSTHSTHTHSTHSTHSTHTHSTHTHTHTHSTHSTHTHSTHSTHSTHSTHTHTHTHSTHTHSTHSTHSTHSTHSTHTHTHTHTHTHSTHTHSTHTHSTHSTHSTHTHTHSTHTHTHTHTHTHTHTHTHSTHTHSTHTHTHTHTHSTHSTHSTHTHTHSTHSTHSTHTHTHSTHSTHTHTHTHSTHSTHTHTHTHSTHSTHSTHSTHTHSTHTHTHSTHTHTHTHSTHSTHTHSTHSTHSTHTHTHTHSTHSTHTHSTHSTHTHTHSTHTHSTHSTHSTHTHSTHSTHSTHTHTHSTHSTHTHTHTHSTHSTHSTHSTHTHTHSTHTHSTHTHTHTHSTHSTHSTHTHTHSTHSTHTHSTHSTHTHTHTHTHSTHTHSTHTHSTHSTHTHTHSTHTHSTHTHTHTHSTHSTHTHSTHTHSTHTHSTHTHTHSTHTHTHSTHSTHSTHSTHSTHTHSTHSTHTHTHSTHTHSTHTHTHTHTHSTHTHSTHSTHSTHTHSTHTHTHTHSTHSTHTHTHSTHTHTHTHSTHTHSTHSTHTHTHTHTHTHSTHTHSTHTHSTHSTHTHSTHTHTHSTHSTHTHTHSTHSTHTHTHTHSTHSTHSTHSTHSTHSTHSTHSTHTHSTHSTHTHSTHTHTHSTHTHSTHTHTHSTHSTHTHTHSTHSTHSTHSTHSTHSTHSTHSTHSTHSTHSTHSTHTHSTHSTHSTHTHTHSTHSTHSTHTHTHSTHTHTHSTHSTHSTHSTHTHSTHTHSTHSTHTHTHTHTHSTHTHTHSTHTHSTHSTHSTHTHSTHSTHSTHSTHSTHSTHTHTHSTHTHTHTHSTHTHSTHSTHSTHTHTHTHSTHTHTHTHTHSTHSTHTHTHTHTHTHSTHSTHTHTHTHSTHTHTHTHTHSTHSTHSTHTHSTHTHSTHS",
-    # rz(pi/2^21)
-    "SSSXTHSTHTHSTHSTHTHSTHSTHSTHSTHSTHTHTHTHTHTHTHSTHTHTHSTHSTHTHTHTHTHTHTHSTHTHSTHTHTHTHTHTHSTHTHSTHSTHSTHSTHSTHTHSTHTHTHTHTHTHTHSTHSTHTHTHTHSTHTHSTHSTHTHSTHTHSTHSTHSTHTHSTHSTHTHTHTHTHTHSTHSTHTHTHTHTHTHSTHSTHSTHTHTHTHSTHSTHSTHTHTHSTHTHTHTHSTHTHTHSTHTHTHSTHSTHTHSTHTHTHSTHTHTHTHSTHTHTHTHSTHTHSTHSTHSTHSTHSTHSTHTHSTHTHTHSTHSTHTHSTHTHTHSTHTHSTHTHSTHSTHSTHSTHSTHSTHSTHSTHTHTHSTHTHSTHSTHTHTHTHSTHTHTHSTHSTHTHSTHSTHTHTHTHTHTHSTHTHTHSTHTHTHSTHTHSTHTHTHSTHTHTHSTHSTHTHTHTHSTHSTHSTHTHTHTHTHSTHSTHSTHTHTHTHTHTHSTHSTHTHTHTHTHSTHSTHTHTHSTHTHSTHSTHTHSTHSTHTHSTHSTHSTHSTHTHTHSTHTHTHTHTHSTHSTHSTHSTHSTHSTHTHSTHTHSTHSTHTHTHSTHTHSTHSTHSTHSTHSTHSTHTHSTHTHTHSTHTHSTHSTHSTHTHSTHTHSTHSTHTHSTHSTHSTHTHSTHSTHTHTHSTHSTHSTHTHTHSTHTHTHTHSTHTHTHTHSTHTHSTHTHTHTHSTHSTHSTHSTHTHTHSTHSTHSTHSTHSTHTHTHTHSTHTHSTHTHTHTHSTHTHSTHSTHSTHTHSTHTHSTHSTHTHSTHTHTHSTHTHSTHSTHTHTHSTHTHTHSTHSTHTHSTHTHSTHSTHSTHTHTHSTHSTHTHTHTHSTHSTHSTHTHSTHSTHTHTHSTHTHTHSTHTHTHSTHSTHTHTHTHTHSTHTHTHSTHSTHTHTHSTHSTHTHTHTHSTHTHSTHSTHSTHTHTHTHSTHSTHTHTHSTHTHSTHTHTHTHSTHSTHSTHSTHSTHTHTHSTHSTHSTH",
-    # rz(pi/2^22)
-    "SHTHTHSTHTHSTHSTHSTHSTHSTHTHTHTHSTHSTHSTHSTHTHSTHTHTHSTHSTHSTHSTHSTHSTHTHTHSTHTHSTHTHSTHTHTHSTHTHSTHSTHSTHSTHSTHSTHTHSTHSTHSTHSTHSTHTHSTHSTHSTHSTHSTHSTHSTHSTHTHSTHTHTHSTHTHSTHSTHTHTHTHTHSTHTHTHTHTHTHTHTHSTHTHSTHTHTHSTHSTHSTHTHTHTHTHTHSTHSTHSTHTHSTHTHTHSTHTHSTHSTHTHTHTHSTHSTHTHSTHTHTHTHSTHTHTHSTHSTHTHTHTHSTHTHSTHSTHSTHTHTHSTHTHTHTHTHSTHTHTHSTHSTHTHSTHSTHTHSTHTHTHSTHTHSTHSTHSTHSTHSTHTHSTHTHTHSTHSTHTHTHSTHSTHSTHSTHSTHSTHTHSTHSTHSTHSTHSTHSTHTHSTHTHTHTHSTHSTHSTHTHTHTHSTHSTHTHTHTHTHTHTHTHSTHTHTHSTHSTHSTHSTHSTHTHSTHSTHSTHTHSTHSTHTHSTHTHSTHSTHSTHTHTHTHTHSTHSTHSTHSTHTHSTHTHTHSTHSTHSTHTHSTHTHSTHSTHSTHSTHTHTHTHSTHTHTHSTHSTHSTHTHTHTHTHTHSTHTHSTHTHTHTHSTHSTHTHTHSTHTHSTHSTHSTHTHSTHTHTHSTHTHTHSTHTHTHTHSTHTHSTHSTHSTHTHSTHSTHTHSTHTHTHTHTHSTHSTHSTHSTHTHTHSTHSTHSTHTHTHTHSTHTHTHSTHSTHSTHSTHTHSTHSTHSTHSTHSTHSTHSTHSTHSTHSTHTHTHSTHSTHTHSTHSTHSTHSTHTHTHSTHTHTHSTHSTHSTHTHSTHSTHSTHSTHTHSTHSTHTHSTHSTHSTHTHTHTHSTHTHSTHSTHTHTHSTHTHTHTHTHSTHTHTHSTHSTHTHSTHSTHSTHTHTHSTHTHSTHSTHSTHSTHSTHSTHTHTHTHTHTHTHTHTHSTHTHSTHTHTHTHSTHSTHSTHSTHSTHTHSTHSTHSTHSTHSTHTHSTHSTHSTHSTHTHSTHTH",
-    # rz(pi/2^23)
-    "SSSHTHTHTHTHSTHTHTHSTHTHSTHSTHSTHSTHSTHTHSTHSTHSTHTHTHSTHTHTHTHSTHSTHTHTHTHSTHTHSTHTHSTHTHTHSTHTHSTHTHTHTHTHTHTHSTHTHTHTHTHTHSTHSTHSTHTHTHTHTHSTHSTHSTHSTHTHTHSTHTHTHTHSTHSTHSTHSTHSTHTHSTHSTHTHTHTHSTHSTHTHTHSTHTHSTHTHSTHSTHTHSTHSTHTHSTHTHSTHTHSTHSTHSTHTHTHTHSTHSTHTHSTHSTHSTHTHTHTHTHTHSTHTHSTHSTHTHTHSTHSTHSTHTHSTHTHSTHTHSTHSTHTHTHSTHSTHSTHSTHTHTHSTHSTHTHTHTHSTHTHSTHSTHTHSTHSTHTHTHTHSTHSTHTHTHSTHTHTHSTHTHSTHSTHTHTHTHSTHSTHTHTHSTHTHSTHTHSTHSTHSTHTHSTHSTHSTHSTHTHSTHSTHTHTHSTHTHTHTHTHSTHTHTHSTHSTHTHSTHTHSTHSTHSTHSTHTHTHTHTHSTHSTHSTHSTHSTHTHTHTHTHTHTHSTHTHTHTHTHSTHTHTHSTHTHSTHSTHTHTHSTHSTHSTHTHSTHSTHSTHTHSTHSTHTHSTHSTHTHTHTHTHSTHSTHSTHSTHTHTHTHTHSTHSTHSTHSTHTHSTHSTHSTHSTHTHSTHSTHTHTHTHSTHSTHSTHTHTHSTHSTHTHSTHTHTHTHSTHTHSTHSTHSTHTHSTHSTHSTHTHSTHSTHTHSTHSTHSTHTHTHTHTHSTHTHTHSTHTHTHSTHSTHSTHTHSTHSTHSTHTHSTHSTHTHTHSTHTHTHTHTHSTHSTHSTHSTHSTHSTHTHTHTHTHTHTHSTHSTHTHSTHTHTHSTHTHTHTHTHSTHSTHSTHSTHSTHTHSTHTHTHSTHTHSTHSTHTHSTHSTHTHTHTHTHTHTHSTHSTHSTHSTHSTHTHTHSTHSTHTHSTHTHTHSTHTHTHSTHSTHTHSTHSTHTHSTHTHTHTHTHTHTHSTHTHTHSTHSTHTHTHS",
-    # rz(pi/2^24)
-    "SHTHTHTHSTHTHSTHSTHTHSTHTHSTHTHSTHTHSTHSTHTHSTHSTHSTHSTHTHSTHTHTHSTHTHSTHTHSTHTHTHTHTHTHSTHTHSTHTHSTHSTHTHSTHSTHTHSTHTHSTHSTHSTHSTHSTHSTHTHTHTHTHTHTHSTHTHSTHSTHTHSTHTHSTHSTHTHSTHSTHTHSTHTHTHSTHTHTHTHSTHTHTHSTHTHSTHTHSTHTHSTHSTHSTHTHTHTHSTHTHTHTHSTHTHTHSTHSTHSTHSTHSTHTHSTHSTHTHTHTHTHTHTHTHTHSTHTHSTHTHSTHTHTHTHTHTHSTHSTHTHSTHTHSTHSTHSTHSTHSTHSTHSTHSTHTHSTHSTHTHTHSTHSTHSTHSTHTHTHSTHSTHTHTHTHTHTHSTHTHTHSTHSTHTHSTHTHTHSTHSTHTHTHSTHSTHSTHSTHSTHTHTHTHTHSTHSTHTHSTHTHSTHSTHTHTHTHSTHTHSTHSTHTHTHSTHSTHSTHSTHSTHSTHTHSTHSTHTHTHTHTHSTHTHTHTHTHSTHSTHSTHTHSTHTHTHSTHTHSTHTHSTHSTHSTHSTHTHTHSTHTHSTHSTHTHSTHSTHSTHTHTHTHSTHSTHTHTHTHSTHSTHSTHSTHTHSTHSTHTHSTHSTHSTHTHSTHSTHSTHTHSTHSTHSTHTHTHSTHSTHSTHSTHTHSTHSTHSTHTHTHSTHTHTHTHTHSTHSTHSTHTHSTHTHTHTHSTHSTHSTHSTHTHTHTHSTHSTHTHSTHSTHTHSTHSTHSTHTHSTHTHSTHSTHSTHSTHSTHTHSTHSTHTHSTHTHTHTHTHTHTHTHSTHTHSTHTHTHTHSTHTHTHSTHSTHTHSTHTHSTHTHSTHTHSTHTHSTHSTHTHTHTHSTHTHTHTHTHSTHTHSTHSTHSTHSTHSTHSTHSTHTHSTHSTHTHTHTHSTHTHSTHTHTHSTHTHSTHTHSTHSTHTHSTHSTHSTHTHSTHTHTHSTHTHSTHTHSTHTHSTHTHSTHSTHTHTHSTHTHSTHTHTHTHSTH",
-    # rz(pi/2^25)
-    "SSHSTHSTHSTHTHSTHSTHSTHTHTHSTHTHTHSTHTHTHTHSTHTHSTHTHSTHTHTHSTHSTHTHTHTHSTHSTHSTHTHSTHSTHSTHTHTHTHTHTHSTHTHTHTHSTHTHTHSTHSTHTHTHSTHTHTHSTHTHTHTHTHTHSTHSTHSTHTHTHSTHTHTHSTHSTHSTHSTHSTHSTHTHTHSTHSTHTHSTHTHSTHTHSTHTHSTHTHSTHSTHTHTHSTHTHSTHSTHSTHSTHSTHTHTHSTHTHTHSTHSTHSTHTHTHSTHSTHSTHSTHSTHTHTHSTHSTHSTHTHTHTHTHSTHSTHSTHSTHSTHTHTHSTHTHSTHTHSTHTHTHTHSTHSTHSTHTHTHTHTHTHSTHSTHSTHSTHSTHTHSTHTHTHTHTHTHTHSTHSTHSTHSTHSTHSTHTHTHTHTHSTHSTHSTHSTHSTHSTHTHSTHTHSTHSTHSTHTHSTHSTHTHSTHSTHTHTHTHTHSTHTHSTHSTHTHTHTHTHTHTHSTHSTHTHSTHTHTHSTHTHSTHTHSTHTHTHSTHTHSTHTHTHTHSTHTHTHTHTHTHSTHSTHTHTHTHTHTHSTHTHTHSTHSTHTHTHSTHTHSTHTHTHTHSTHTHTHTHTHTHSTHTHTHTHSTHTHSTHSTHTHSTHSTHTHSTHTHSTHSTHTHSTHTHTHTHSTHTHTHSTHTHSTHTHTHSTHTHTHSTHSTHTHSTHSTHTHSTHTHTHTHSTHSTHSTHSTHSTHSTHTHSTHSTHSTHSTHTHTHTHTHSTHSTHSTHTHSTHTHTHTHSTHTHTHSTHTHTHTHSTHTHSTHTHSTHSTHTHTHTHTHSTHSTHTHSTHSTHSTHSTHSTHTHSTHTHSTHSTHTHSTHSTHSTHSTHSTHTHTHSTHSTHSTHSTHSTHTHTHTHSTHSTHSTHTHTHSTHSTHSTHTHSTHSTHTHTHSTHTHSTHSTHTHSTHTHSTHSTHSTHSTHTHSTHSTHTHSTHSTHTHTHTHTHSTHSTHTHTHSTHSTHSTHSTHTHTHSTHTHSTHTHSTHTH",
-    # rz(pi/2^26)
-    "XHTHTHSTHTHTHSTHSTHTHTHSTHSTHTHSTHSTHTHTHSTHSTHTHTHTHSTHTHTHTHTHSTHSTHTHSTHTHSTHTHSTHTHTHTHSTHTHTHSTHSTHTHTHTHSTHSTHSTHTHTHTHSTHSTHSTHSTHTHSTHSTHSTHTHTHTHTHSTHSTHTHTHTHSTHSTHTHSTHSTHTHTHSTHTHTHTHTHTHSTHTHTHSTHSTHSTHTHTHTHTHSTHSTHSTHTHTHTHSTHSTHTHTHTHSTHTHSTHSTHTHSTHSTHSTHTHSTHSTHSTHTHTHTHSTHTHSTHTHTHSTHTHTHSTHSTHSTHTHTHTHTHTHTHSTHTHTHSTHTHTHTHTHTHTHTHSTHTHSTHSTHSTHTHTHSTHSTHTHTHTHSTHSTHSTHSTHTHSTHTHTHSTHSTHSTHTHTHTHTHSTHSTHTHTHTHSTHTHTHSTHTHTHSTHTHTHSTHSTHSTHTHTHTHTHSTHTHSTHTHTHSTHTHTHSTHSTHSTHTHTHSTHSTHSTHSTHSTHTHTHSTHTHSTHTHSTHSTHTHSTHTHTHTHTHTHTHSTHTHTHTHTHSTHSTHSTHSTHSTHSTHTHTHTHTHTHSTHSTHSTHTHTHTHTHSTHSTHSTHSTHTHTHSTHSTHTHTHSTHTHTHTHTHSTHSTHTHTHTHTHTHTHTHTHSTHTHTHTHSTHSTHSTHTHTHSTHSTHTHSTHSTHTHSTHTHTHTHSTHTHSTHTHTHTHTHTHTHSTHTHSTHTHTHSTHSTHTHTHSTHTHSTHTHTHSTHTHSTHSTHTHTHSTHSTHSTHTHSTHTHTHSTHSTHTHSTHTHTHSTHSTHTHSTHTHTHSTHSTHSTHTHTHTHSTHSTHTHTHTHTHTHSTHTHSTHTHTHTHSTHTHTHTHTHTHSTHSTHSTHSTHSTHTHSTHTHTHSTHTHTHSTHTHSTHTHSTHSTHSTHTHSTHTHTHTHTHTHSTHSTHTHTHTHTHTHSTHTHSTHSTHTHSTHTHSTH",
-    # rz(pi/2^27)
-    "STHTHTHTHTHTHTHTHSTHSTHSTHSTHTHSTHSTHTHSTHTHTHSTHSTHTHTHTHTHSTHSTHTHTHSTHTHTHSTHTHTHTHTHTHSTHSTHSTHTHSTHSTHTHTHSTHSTHSTHSTHTHSTHSTHSTHSTHTHSTHTHSTHTHSTHSTHTHSTHSTHSTHSTHSTHTHSTHTHSTHSTHTHTHSTHSTHSTHTHTHTHSTHSTHTHSTHSTHTHTHTHSTHSTHTHTHTHTHTHSTHSTHTHTHTHSTHSTHSTHTHTHTHSTHTHSTHTHTHSTHSTHTHTHTHSTHSTHTHTHTHSTHTHTHSTHTHSTHSTHSTHTHSTHTHSTHTHTHSTHTHSTHSTHTHTHTHSTHSTHSTHSTHSTHSTHTHSTHSTHTHSTHSTHSTHTHTHTHTHSTHTHSTHTHTHSTHSTHTHTHSTHTHSTHSTHSTHTHSTHTHTHSTHTHSTHSTHSTHSTHTHTHTHSTHSTHSTHTHSTHTHSTHTHSTHSTHSTHSTHTHSTHSTHSTHTHTHTHTHTHSTHTHSTHTHSTHTHTHTHTHTHTHSTHSTHSTHTHSTHSTHTHTHTHSTHTHSTHSTHTHSTHTHSTHTHTHSTHTHSTHTHTHSTHTHSTHSTHSTHTHSTHSTHSTHTHSTHTHTHSTHSTHTHSTHTHSTHSTHTHSTHSTHSTHSTHSTHSTHSTHSTHTHTHSTHSTHTHSTHSTHSTHTHTHTHSTHSTHTHSTHTHTHTHTHSTHTHSTHSTHTHSTHTHSTHTHSTHSTHSTHSTHSTHTHTHTHSTHSTHSTHTHSTHTHTHTHTHTHTHSTHTHTHTHTHSTHTHSTHTHSTHTHSTHTHSTHSTHTHSTHSTHTHTHTHSTHTHTHTHTHTHTHSTHTHSTHTHTHTHSTHSTHSTHSTHTHTHSTHTHTHTHTHSTHTHTHTHSTHTHTHTHTHSTHSTHTHTHSTHSTHSTHTHSTHSTHTHSTHTHTHTHSTHSTHTHTHTHSTHTHSTHTHTHSTHTHTHSTHSTHTHSTHSTHSTHSTHSTHTH",
-    # rz(pi/2^28)
-    "SXHTHSTHTHSTHSTHSTHTHSTHSTHTHTHSTHSTHTHTHSTHTHTHTHSTHTHSTHSTHSTHSTHSTHTHSTHSTHSTHTHTHTHSTHSTHTHSTHTHTHSTHTHTHTHTHSTHTHSTHSTHTHTHTHTHSTHTHTHTHTHTHTHSTHSTHSTHSTHSTHSTHTHSTHSTHSTHTHSTHTHTHTHTHTHSTHSTHSTHSTHTHSTHTHTHTHTHSTHTHTHTHSTHSTHSTHTHTHSTHSTHSTHTHTHSTHSTHSTHSTHSTHTHTHSTHTHTHTHSTHSTHSTHTHTHSTHTHTHSTHSTHTHTHSTHSTHSTHSTHTHTHSTHTHSTHTHSTHTHSTHSTHTHTHSTHTHSTHTHTHTHTHSTHSTHSTHTHSTHTHTHSTHTHSTHTHTHSTHSTHSTHSTHTHSTHSTHSTHTHSTHTHSTHSTHSTHSTHTHTHSTHTHSTHTHTHTHSTHSTHSTHTHTHSTHTHSTHSTHTHSTHSTHSTHSTHTHTHTHSTHSTHTHTHTHTHTHSTHTHTHSTHSTHSTHSTHTHSTHTHSTHSTHTHSTHTHSTHSTHSTHTHTHTHSTHTHSTHSTHSTHTHTHSTHTHTHTHSTHSTHSTHTHSTHTHTHSTHSTHTHTHTHSTHTHTHSTHTHTHTHSTHTHTHSTHSTHSTHTHTHSTHSTHSTHSTHTHSTHTHSTHSTHSTHSTHSTHSTHTHTHSTHTHTHSTHSTHSTHSTHTHSTHTHTHSTHSTHTHSTHSTHSTHTHSTHTHTHTHSTHSTHTHTHSTHTHTHSTHSTHTHSTHSTHTHTHSTHTHSTHTHTHSTHSTHSTHSTHTHSTHSTHTHSTHTHSTHTHSTHSTHSTHSTHTHSTHSTHSTHTHTHTHSTHSTHTHSTHSTHSTHTHTHTHTHTHTHTHTHTHTHSTHSTHTHSTHTHSTHTHTHTHSTHTHTHTHTHSTHTHTHTHSTHSTHTHTHTHTHSTHTHTHTHTHSTHTHTHTHSTHSTHSTHSTHTHTHSTHSTHTHTHTHTHTHTHTHSTHSTHTHSTHSTHSTHTH",
-    # rz(pi/2^29)
-    "SSXHTHSTHTHSTHSTHSTHTHTHTHTHTHTHSTHTHTHTHTHTHSTHSTHSTHTHTHTHTHSTHSTHSTHSTHSTHSTHSTHSTHSTHTHSTHSTHTHSTHSTHTHTHTHSTHTHSTHSTHSTHSTHTHTHTHTHSTHSTHTHSTHSTHTHTHTHSTHSTHTHSTHTHTHTHSTHSTHSTHTHTHSTHTHTHSTHSTHTHSTHTHSTHSTHTHSTHSTHTHSTHSTHSTHTHSTHTHTHTHTHTHTHSTHSTHTHTHTHTHSTHTHTHSTHSTHTHSTHSTHTHSTHTHSTHTHSTHSTHSTHSTHTHSTHTHSTHTHSTHTHSTHTHSTHSTHTHSTHSTHTHSTHTHTHTHSTHTHSTHTHTHTHTHSTHTHTHSTHSTHSTHSTHSTHSTHSTHSTHSTHTHTHTHSTHTHTHTHTHTHSTHTHSTHTHTHSTHTHSTHSTHTHTHTHTHSTHSTHTHSTHTHSTHSTHSTHSTHTHTHSTHSTHSTHSTHTHSTHTHSTHTHSTHTHTHTHTHTHTHSTHSTHTHSTHTHTHTHSTHSTHTHTHTHTHSTHTHTHSTHSTHTHTHTHSTHSTHSTHSTHSTHTHTHTHSTHTHSTHTHSTHSTHTHTHTHSTHTHTHSTHTHTHSTHSTHSTHTHSTHSTHSTHTHSTHSTHSTHSTHTHTHTHSTHSTHSTHTHSTHSTHSTHTHTHTHSTHSTHSTHTHSTHTHTHSTHSTHSTHSTHSTHTHTHTHSTHTHSTHTHTHTHSTHTHTHTHSTHSTHSTHTHTHSTHTHTHSTHSTHTHSTHTHTHSTHTHSTHSTHSTHTHSTHSTHSTHSTHSTHSTHTHTHSTHTHTHSTHSTHTHSTHTHTHTHSTHSTHTHTHTHTHTHSTHSTHTHTHTHTHTHTHSTHSTHTHTHTHSTHSTHSTHSTHSTHSTHSTHTHSTHTHSTHTHSTHTHSTHTHSTHTHSTHTHSTHSTHTHTHTHTHTHSTHSTHTHSTHTHTHTHTHSTHSTHSTHSTHTHSTHTHTHSTHTHTHSTHTHS",
-    # rz(pi/2^30)
-    "SSXHTHTHTHTHSTHSTHSTHTHTHTHSTHTHSTHTHSTHTHSTHTHTHTHTHTHSTHTHTHSTHSTHSTHTHSTHTHSTHTHTHTHSTHTHSTHSTHTHSTHSTHSTHSTHTHSTHTHSTHTHSTHSTHTHTHTHSTHSTHTHSTHTHSTHTHTHSTHTHSTHSTHSTHSTHSTHSTHSTHTHTHTHSTHSTHSTHSTHSTHTHTHTHSTHTHTHTHSTHSTHTHTHTHSTHTHSTHSTHSTHSTHTHTHSTHSTHTHTHSTHTHTHTHTHTHTHSTHTHTHTHSTHTHSTHSTHSTHTHTHTHTHSTHTHTHSTHTHSTHSTHTHSTHTHTHTHSTHSTHSTHTHTHTHTHTHSTHTHTHTHTHSTHSTHTHSTHSTHTHSTHTHTHTHSTHTHTHTHTHSTHTHTHSTHSTHTHTHTHSTHSTHTHSTHTHTHSTHTHSTHSTHTHTHSTHSTHSTHTHSTHTHSTHSTHTHSTHSTHTHSTHSTHSTHTHTHTHSTHSTHTHSTHSTHSTHSTHSTHSTHTHTHTHSTHSTHSTHSTHSTHTHTHTHSTHTHTHSTHTHSTHSTHTHSTHSTHTHSTHTHTHTHTHTHTHTHTHSTHTHSTHTHTHSTHTHSTHSTHSTHSTHSTHTHTHSTHTHSTHSTHTHSTHSTHTHSTHSTHTHTHTHTHSTHTHSTHSTHSTHTHSTHSTHSTHTHSTHSTHSTHSTHSTHSTHTHSTHTHSTHSTHSTHSTHSTHSTHSTHTHSTHTHSTHSTHTHTHTHSTHSTHSTHSTHTHTHSTHSTHTHSTHTHSTHTHTHTHSTHSTHTHSTHSTHTHTHSTHTHSTHTHTHTHTHSTHTHSTHTHTHTHSTHSTHSTHTHTHTHTHSTHSTHTHSTHSTHSTHTHTHSTHSTHSTHSTHSTHSTHSTHSTHSTHTHTHTHSTHTHSTHSTHSTHSTHTHTHTHTHSTHSTHSTHSTHTHSTHSTHSTHTHTHSTHSTHTHSTHSTHSTHTHTHTHTHTHTHSTHSTHTHTHTHTHTHSTHTHTHTHTHTHSTHSTH",
-    # rz(pi/2^31)
-    "SSSXHSTHTHSTHSTHTHTHTHSTHTHSTHTHSTHTHSTHTHSTHSTHSTHTHTHSTHTHTHTHTHSTHSTHTHSTHSTHSTHSTHSTHTHSTHSTHTHSTHTHSTHTHTHTHTHTHSTHSTHTHSTHTHTHTHSTHTHTHSTHSTHTHTHTHSTHSTHSTHTHTHTHSTHTHTHTHSTHTHTHTHSTHTHTHSTHTHSTHTHTHTHTHSTHTHSTHSTHTHSTHSTHSTHTHTHSTHSTHTHTHTHTHTHTHTHTHTHSTHSTHTHTHTHTHTHTHTHSTHTHSTHTHSTHTHSTHSTHSTHTHTHSTHTHTHTHTHTHTHSTHTHTHTHSTHSTHSTHSTHSTHTHSTHTHTHTHSTHSTHTHTHSTHSTHSTHSTHSTHSTHSTHSTHSTHTHSTHSTHTHSTHSTHSTHSTHTHTHTHSTHSTHSTHSTHSTHTHSTHSTHSTHTHTHSTHTHSTHTHSTHTHTHSTHTHSTHTHSTHSTHTHTHTHSTHTHSTHTHSTHTHTHTHTHSTHSTHTHSTHSTHTHSTHTHSTHTHTHTHTHTHSTHSTHSTHSTHSTHSTHTHTHSTHTHSTHSTHTHTHTHTHSTHTHSTHTHSTHTHTHTHSTHSTHTHTHTHSTHTHTHTHTHSTHTHSTHSTHSTHSTHTHTHTHSTHTHTHSTHTHTHSTHSTHTHTHTHTHTHTHTHSTHSTHTHSTHTHSTHSTHSTHSTHSTHSTHTHTHSTHTHSTHTHTHTHSTHTHSTHSTHTHSTHTHTHTHTHSTHTHTHTHTHSTHTHTHSTHSTHSTHSTHSTHTHTHTHSTHTHTHTHTHTHSTHSTHTHTHSTHSTHSTHSTHSTHTHTHSTHSTHTHTHTHTHSTHSTHSTHSTHTHSTHSTHSTHTHSTHSTHSTHSTHSTHTHSTHSTHTHTHSTHSTHSTHSTHTHSTHSTHSTHSTHSTHTHTHSTHSTHTHTHTHSTHSTHSTHTHSTHSTHSTHTHTHSTHTHTHSTHTHTHSTHSTHTHTHSTHTHTHSTHTHSTHTHSTHSTHSTHTH",
-    # rz(pi/2^32)
-    "SXTHTHSTHTHTHTHTHSTHTHSTHTHTHTHTHSTHSTHTHSTHSTHTHSTHTHTHSTHTHSTHTHSTHTHTHSTHSTHTHSTHSTHTHSTHTHTHSTHSTHSTHTHSTHSTHTHSTHSTHTHSTHSTHSTHSTHSTHTHSTHTHSTHTHSTHSTHTHSTHTHSTHTHTHSTHTHTHTHTHSTHTHSTHSTHTHTHTHTHTHTHSTHTHTHSTHSTHTHTHTHSTHSTHTHSTHTHTHSTHTHTHTHTHSTHTHSTHTHTHTHTHTHSTHTHTHTHTHTHTHTHSTHSTHSTHTHSTHSTHTHSTHSTHTHTHSTHSTHTHTHTHSTHTHTHSTHSTHTHSTHTHSTHTHTHSTHSTHTHSTHTHSTHTHTHTHSTHSTHTHTHTHTHSTHSTHSTHSTHSTHTHTHSTHSTHTHTHSTHTHSTHSTHSTHSTHSTHSTHSTHSTHTHSTHSTHTHSTHTHTHTHTHSTHSTHTHSTHTHTHTHTHTHSTHSTHTHTHSTHTHSTHTHSTHTHSTHTHSTHTHTHTHTHTHTHSTHTHTHSTHSTHSTHTHSTHTHTHTHTHTHSTHSTHSTHTHSTHTHSTHSTHTHSTHTHTHTHTHTHSTHTHSTHTHSTHTHSTHTHTHSTHSTHTHSTHSTHTHSTHSTHTHSTHTHTHSTHTHSTHTHSTHTHSTHTHSTHTHSTHSTHSTHTHSTHSTHTHSTHSTHSTHSTHSTHSTHSTHSTHTHTHSTHTHSTHSTHSTHSTHTHSTHTHSTHTHTHTHTHTHSTHTHSTHSTHSTHTHTHSTHTHSTHTHSTHTHSTHTHTHTHSTHTHTHSTHTHTHSTHTHSTHTHSTHTHSTHSTHTHSTHSTHTHTHTHSTHTHTHTHTHTHTHSTHSTHSTHTHSTHTHTHTHSTHSTHTHTHSTHTHTHTHTHTHSTHTHTHSTHTHSTHTHSTHTHTHSTHTHSTHSTHTHSTHSTHSTHTHTHSTHTHSTHTHTHSTHSTHSTHTHSTHTHTHSTHSTHTHSTHTHSTHSTHSTHTHTHS",
-    # rz(pi/2^33)
-    "SHSTHSTHTHTHTHTHSTHSTHSTHSTHSTHSTHSTHTHSTHTHTHSTHTHTHSTHTHSTHSTHTHSTHTHSTHSTHTHSTHTHTHSTHTHSTHTHTHTHTHSTHTHTHSTHSTHSTHTHSTHSTHSTHTHTHSTHTHTHSTHSTHSTHSTHTHTHSTHSTHSTHTHTHSTHTHSTHTHTHSTHSTHTHSTHTHTHTHTHTHSTHSTHSTHTHTHSTHTHTHSTHSTHTHSTHSTHTHTHTHTHSTHTHTHSTHSTHSTHSTHSTHSTHTHSTHTHSTHSTHTHTHTHTHSTHSTHTHSTHSTHSTHSTHSTHSTHTHSTHTHTHSTHSTHSTHSTHSTHTHSTHTHTHSTHTHTHSTHSTHTHSTHTHTHTHSTHSTHSTHSTHTHSTHTHTHTHTHTHSTHTHTHTHTHSTHSTHTHTHTHSTHTHSTHSTHTHTHTHTHTHSTHTHSTHSTHTHSTHTHSTHTHTHSTHSTHTHSTHSTHTHSTHSTHTHTHTHTHTHSTHTHSTHTHTHTHSTHSTHSTHSTHSTHTHTHSTHTHSTHSTHTHSTHTHTHSTHSTHTHTHTHSTHSTHTHSTHSTHTHSTHSTHTHTHSTHTHSTHTHTHTHSTHTHSTHSTHSTHTHTHTHTHTHTHSTHTHTHSTHSTHTHSTHSTHTHTHSTHTHSTHTHTHSTHSTHTHTHSTHSTHTHTHSTHTHSTHSTHSTHTHSTHSTHSTHTHSTHSTHTHSTHTHTHTHTHSTHSTHTHSTHTHSTHTHSTHTHSTHSTHSTHTHSTHSTHSTHSTHSTHSTHSTHSTHTHTHTHSTHSTHTHTHSTHTHSTHTHTHSTHSTHTHSTHSTHTHTHTHTHTHTHSTHSTHSTHTHTHSTHTHTHSTHSTHTHSTHSTHTHSTHTHTHSTHSTHTHSTHTHTHSTHTHTHTHSTHSTHSTHTHSTHSTHTHTHTHTHSTHTHTHSTHSTHTHTHSTHSTHTHTHSTHTHSTHSTHSTHTHSTHSTHSTHTHSTHTHTHTHSTHSTHSTHTHTHTHSTHSTHSTHSTH",
-    # rz(pi/2^34)
-    "SHSTHSTHSTHSTHSTHSTHSTHTHTHSTHTHTHTHSTHSTHSTHSTHTHTHTHSTHTHSTHTHSTHTHTHSTHSTHTHTHSTHTHTHTHSTHTHSTHTHTHTHSTHSTHSTHSTHSTHTHSTHSTHSTHSTHSTHSTHTHSTHSTHTHTHTHSTHTHTHTHSTHSTHSTHSTHSTHTHTHSTHSTHTHTHSTHTHTHTHSTHSTHTHSTHTHTHSTHTHSTHSTHTHTHTHTHSTHSTHTHSTHTHSTHTHTHTHSTHTHTHSTHTHTHSTHSTHTHTHSTHTHTHTHTHTHSTHSTHSTHSTHTHSTHTHTHSTHTHTHTHTHSTHTHSTHTHTHTHTHSTHSTHSTHSTHSTHTHSTHSTHTHSTHTHTHTHSTHTHSTHSTHSTHTHTHSTHSTHSTHSTHSTHSTHTHSTHSTHTHTHTHSTHTHTHTHTHTHTHTHSTHSTHSTHTHSTHSTHTHSTHSTHSTHTHSTHTHTHSTHTHTHTHTHTHSTHTHTHTHTHSTHSTHTHSTHSTHTHSTHTHTHTHSTHTHSTHSTHTHTHSTHTHSTHSTHTHSTHTHSTHTHSTHSTHTHTHTHTHTHSTHTHSTHTHSTHSTHTHTHSTHSTHSTHTHTHSTHTHSTHTHSTHSTHTHTHSTHTHSTHTHSTHTHTHSTHSTHTHTHTHSTHTHTHTHTHTHSTHSTHSTHSTHTHTHSTHTHTHSTHSTHTHSTHSTHSTHSTHTHSTHSTHSTHTHTHTHSTHTHTHSTHSTHTHTHTHTHSTHTHSTHTHSTHTHTHSTHSTHSTHSTHTHSTHSTHTHTHTHTHTHTHSTHTHSTHSTHTHSTHTHTHSTHSTHTHSTHTHTHSTHTHTHTHSTHTHSTHTHTHSTHSTHSTHTHTHSTHTHTHSTHSTHTHSTHTHSTHTHSTHTHSTHTHTHTHSTHTHTHTHSTHTHTHTHSTHTHTHTHTHTHSTHSTHSTHTHSTHTHTHSTHTHSTHSTHSTHTHSTHSTHTHSTHTHTHTHSTHTHTHTHTHSTHTHSTHSTH",
-    # rz(pi/2^35)
-    "XHSTHSTHTHTHSTHSTHSTHSTHTHSTHTHSTHTHTHTHTHSTHTHSTHSTHTHSTHSTHTHSTHSTHTHTHSTHTHSTHTHSTHTHTHTHSTHTHSTHTHSTHSTHSTHTHSTHTHSTHTHSTHTHTHSTHSTHSTHSTHSTHTHTHSTHTHSTHSTHSTHSTHTHSTHSTHTHTHTHSTHTHSTHTHTHSTHSTHSTHSTHSTHSTHTHTHTHTHTHTHSTHSTHSTHSTHTHSTHTHTHSTHTHTHSTHTHTHSTHSTHTHSTHSTHSTHTHTHTHSTHSTHSTHTHTHTHTHTHSTHSTHSTHSTHSTHTHSTHTHTHTHSTHSTHTHSTHSTHSTHSTHTHSTHSTHTHSTHSTHTHSTHSTHSTHTHTHTHTHSTHSTHTHTHTHSTHTHSTHTHTHTHSTHSTHSTHSTHSTHTHSTHSTHSTHTHTHSTHTHSTHSTHSTHSTHTHSTHTHTHTHSTHSTHTHSTHSTHSTHTHTHSTHSTHTHTHSTHTHSTHTHTHSTHSTHTHSTHTHTHTHSTHTHTHTHTHTHSTHTHSTHSTHTHTHSTHSTHSTHSTHTHTHTHTHSTHTHTHTHTHSTHTHSTHSTHSTHTHTHSTHTHSTHTHSTHTHSTHTHSTHTHTHTHTHSTHSTHSTHSTHTHTHTHTHTHSTHTHSTHTHTHSTHTHSTHTHTHSTHSTHTHTHTHTHTHTHTHTHSTHTHTHTHTHSTHSTHTHTHTHTHTHTHSTHTHSTHTHTHTHSTHTHSTHSTHSTHTHSTHTHSTHSTHSTHSTHTHTHTHSTHTHTHTHTHTHTHTHSTHSTHTHSTHTHSTHTHSTHTHSTHSTHTHTHSTHTHTHTHSTHSTHSTHSTHTHTHTHSTHTHSTHTHTHTHSTHTHSTHTHSTHSTHSTHSTHTHSTHTHTHTHSTHTHSTHTHTHSTHTHTHSTHTHSTHSTHTHTHTHSTHSTHTHTHTHSTHTHTHSTHSTHTHTHTHTHSTHSTHSTHTHTHTHTHTHSTHSTHSTHSTHTHTHTHSTH",
-    # rz(pi/2^36)
-    "SSTHSTHTHSTHSTHSTHSTHTHTHSTHSTHTHTHTHSTHTHSTHTHSTHTHTHSTHSTHTHTHTHSTHSTHTHTHSTHTHSTHTHSTHTHTHTHTHTHSTHSTHSTHSTHSTHTHSTHTHSTHSTHTHSTHTHTHSTHSTHTHTHSTHSTHSTHSTHTHTHTHSTHSTHSTHSTHSTHSTHSTHSTHTHSTHSTHTHTHTHSTHSTHSTHTHTHSTHSTHSTHSTHTHTHTHTHSTHSTHSTHSTHTHTHSTHTHSTHSTHTHTHSTHSTHTHSTHSTHSTHTHSTHSTHSTHSTHTHSTHTHTHSTHTHSTHSTHSTHTHSTHSTHTHSTHSTHTHTHTHSTHSTHSTHSTHSTHSTHSTHTHTHSTHTHTHSTHSTHTHTHSTHTHSTHTHTHSTHTHSTHTHSTHTHTHTHSTHTHTHSTHTHSTHTHSTHTHTHSTHSTHTHSTHTHSTHTHTHSTHSTHSTHTHTHSTHSTHTHTHSTHSTHSTHSTHSTHTHTHTHSTHTHTHSTHTHSTHTHSTHTHTHSTHTHSTHTHTHTHTHTHSTHSTHTHTHSTHSTHTHSTHSTHTHSTHTHTHSTHSTHSTHSTHTHSTHSTHSTHTHTHSTHSTHTHTHSTHSTHTHSTHSTHTHSTHSTHTHSTHTHSTHSTHSTHTHTHTHTHTHSTHTHSTHTHTHTHTHSTHSTHSTHSTHTHTHSTHSTHTHTHTHSTHSTHSTHSTHTHTHSTHTHTHTHTHTHSTHTHSTHTHTHSTHTHTHSTHSTHSTHTHTHTHTHTHSTHTHTHSTHSTHTHSTHSTHTHSTHSTHTHSTHSTHTHTHTHTHTHTHTHTHSTHTHTHTHTHTHTHTHSTHSTHSTHTHSTHSTHSTHSTHTHTHTHTHTHSTHTHSTHTHSTHTHSTHTHTHSTHTHSTHTHSTHTHTHSTHSTHTHTHSTHTHSTHTHSTHTHSTHTHSTHSTHSTHTHSTHTHTHSTHTHSTHSTHTHSTHTHSTHTHSTHSTHSTHSTHTHTHTHSTHSTHSTHTHTHSTHTHSTHSTHTHSTHSTHSTH",
-    # rz(pi/2^37)
-    "XHSTHTHTHTHTHTHSTHTHSTHTHSTHSTHSTHSTHTHSTHTHSTHSTHSTHTHTHSTHTHSTHTHSTHSTHSTHTHTHSTHSTHSTHSTHTHSTHTHTHSTHTHSTHSTHSTHTHSTHTHTHTHTHSTHSTHSTHSTHSTHTHSTHTHSTHSTHSTHSTHSTHSTHTHTHSTHSTHTHTHTHSTHTHTHTHTHSTHSTHSTHSTHTHSTHTHTHTHTHTHSTHSTHTHSTHSTHTHSTHTHSTHSTHTHTHSTHSTHTHSTHTHTHSTHTHSTHSTHTHTHSTHTHSTHSTHTHSTHSTHTHSTHSTHTHTHSTHTHSTHTHTHTHSTHSTHSTHTHSTHTHTHSTHSTHTHSTHSTHSTHTHSTHSTHSTHSTHTHSTHTHTHSTHTHSTHSTHTHTHSTHTHTHTHTHTHSTHTHTHTHTHTHSTHTHSTHSTHTHSTHSTHSTHSTHTHSTHTHSTHSTHSTHTHTHSTHSTHSTHSTHTHSTHTHTHTHTHSTHSTHSTHTHTHTHTHTHTHSTHTHTHSTHSTHSTHSTHSTHSTHSTHSTHTHTHSTHTHSTHSTHSTHTHSTHSTHTHTHTHSTHSTHTHTHTHSTHTHSTHTHTHTHSTHSTHTHTHSTHSTHTHSTHTHTHTHTHSTHSTHTHTHSTHTHSTHSTHSTHSTHTHSTHSTHSTHTHTHTHTHTHTHTHTHSTHSTHSTHTHSTHSTHTHTHSTHSTHTHTHSTHSTHSTHTHTHTHTHSTHSTHTHTHSTHTHSTHSTHTHSTHTHTHSTHSTHTHTHTHTHTHTHSTHTHSTHSTHSTHSTHSTHTHSTHTHTHSTHSTHTHSTHTHTHTHTHTHTHSTHSTHSTHTHTHTHTHTHSTHTHSTHSTHSTHSTHTHTHTHTHSTHSTHTHSTHTHSTHTHSTHSTHTHTHTHSTHTHTHTHTHTHSTHSTHTHTHSTHSTHTHSTHSTHTHTHSTHTHSTHTHTHSTHSTHTHSTHTHTHTHSTHSTHSTHSTHTHTHTHSTHTHTHSTHTHTHSTHSTHTHST",
-    # rz(pi/2^38)
-    "SSSXHTHTHSTHSTHSTHSTHSTHTHSTHSTHTHSTHSTHTHSTHSTHTHTHSTHSTHSTHSTHTHTHTHTHTHTHTHTHTHSTHSTHTHTHTHSTHSTHTHTHSTHTHSTHSTHTHSTHTHTHTHTHSTHTHTHSTHTHTHTHTHTHTHTHTHTHTHTHSTHTHTHTHSTHTHSTHSTHSTHTHSTHTHTHTHTHSTHTHSTHSTHSTHSTHSTHTHTHSTHSTHTHSTHSTHTHTHTHTHTHSTHSTHTHTHTHSTHSTHSTHTHTHSTHSTHTHTHSTHSTHSTHTHTHTHSTHSTHTHTHSTHTHSTHTHSTHTHSTHSTHSTHSTHTHTHTHSTHTHSTHTHSTHSTHSTHSTHSTHSTHSTHTHTHTHTHTHSTHTHSTHSTHTHSTHSTHTHTHTHTHSTHSTHSTHSTHTHSTHSTHTHTHTHSTHTHSTHTHSTHTHSTHSTHSTHTHSTHSTHTHTHTHTHTHTHSTHTHSTHTHTHSTHSTHSTHSTHSTHTHSTHTHSTHSTHSTHSTHTHSTHSTHSTHTHSTHTHTHTHTHSTHTHSTHSTHTHTHTHSTHSTHTHTHTHTHTHSTHSTHTHTHTHSTHTHTHTHTHSTHTHSTHSTHSTHSTHTHTHSTHSTHSTHSTHSTHSTHTHTHTHTHSTHSTHSTHSTHSTHSTHTHTHTHSTHSTHSTHTHSTHTHTHSTHSTHTHTHTHSTHSTHTHTHTHTHSTHTHSTHSTHTHTHSTHSTHSTHSTHTHTHSTHSTHTHSTHTHTHSTHTHTHSTHSTHTHTHSTHTHSTHSTHSTHSTHSTHTHTHSTHTHSTHSTHTHTHSTHSTHTHTHSTHTHTHTHTHTHTHTHTHSTHSTHTHTHSTHTHSTHTHSTHSTHTHTHTHTHSTHTHTHTHTHTHSTHTHSTHSTHTHTHSTHSTHTHTHSTHSTHTHTHTHTHTHTHTHSTHSTHTHSTHSTHSTHSTHSTHSTHSTHTHTHSTHTHSTHSTHTHTHTHTHTHSTHSTHTHTHSTHTHSTHSTHTHSTHTHTHS",
-    # rz(pi/2^39)
-    "XHSTHSTHSTHTHTHTHSTHSTHSTHSTHTHTHTHTHTHSTHTHTHSTHTHSTHSTHTHSTHTHSTHTHSTHTHTHTHSTHSTHTHSTHSTHSTHTHTHSTHTHTHSTHTHSTHTHSTHTHSTHTHTHTHSTHSTHTHTHSTHTHSTHTHSTHTHSTHSTHTHTHSTHTHSTHTHSTHSTHSTHTHSTHTHSTHTHTHTHSTHTHSTHSTHSTHSTHTHTHTHTHTHSTHTHTHSTHTHSTHSTHTHTHSTHTHSTHSTHSTHSTHTHTHTHTHTHSTHSTHTHSTHTHTHTHTHTHTHTHSTHTHSTHSTHSTHSTHSTHTHTHSTHSTHTHSTHTHTHSTHTHSTHTHSTHSTHSTHTHSTHTHSTHSTHTHSTHTHTHTHSTHSTHSTHSTHTHSTHSTHSTHTHTHTHSTHSTHTHTHTHTHTHTHSTHTHSTHSTHSTHTHSTHTHSTHSTHTHSTHTHTHSTHTHTHTHTHTHTHTHTHSTHSTHTHTHSTHTHSTHTHSTHTHSTHTHTHTHSTHSTHSTHSTHSTHSTHSTHTHSTHTHTHSTHTHSTHTHSTHSTHTHTHSTHTHTHSTHSTHSTHTHTHTHSTHSTHSTHSTHSTHTHTHTHTHTHSTHTHTHSTHTHTHTHSTHTHTHTHSTHSTHSTHTHSTHTHSTHSTHSTHSTHSTHTHSTHTHTHSTHSTHSTHTHTHTHTHTHSTHSTHSTHSTHTHTHTHTHSTHSTHTHTHTHSTHSTHSTHSTHSTHTHSTHTHTHSTHTHTHSTHSTHTHSTHSTHSTHTHTHSTHSTHSTHTHTHTHSTHSTHSTHTHTHSTHTHSTHTHTHTHTHTHTHSTHSTHSTHSTHSTHTHSTHTHSTHSTHTHSTHTHTHSTHSTHSTHSTHSTHTHTHSTHTHTHSTHTHSTHSTHSTHTHSTHSTHSTHSTHTHSTHTHTHSTHTHTHSTHTHTHTHTHTHSTHSTHSTHSTHSTHSTHTHTHSTHSTHSTHSTHTHSTHTHTHTHTHSTHSTHSTHTHTHSTHSTHSTHTHTHSTHTH",
-    # rz(pi/2^40)
-    "XHSTHTHTHTHTHSTHSTHTHSTHTHSTHSTHTHTHSTHTHTHTHTHTHSTHSTHSTHTHTHSTHTHTHTHTHSTHSTHTHSTHTHSTHSTHSTHTHSTHTHTHSTHSTHSTHSTHSTHSTHSTHSTHSTHSTHSTHSTHTHSTHSTHSTHTHSTHSTHSTHTHTHSTHSTHSTHTHSTHTHSTHTHTHTHTHSTHSTHSTHSTHSTHTHSTHTHTHSTHSTHSTHSTHTHSTHSTHTHTHSTHSTHTHTHSTHTHTHTHSTHSTHSTHSTHTHTHSTHTHSTHTHTHSTHSTHSTHSTHTHTHSTHTHTHSTHSTHTHSTHTHSTHTHSTHSTHTHTHSTHTHTHSTHSTHTHTHTHSTHSTHSTHSTHSTHSTHSTHSTHSTHTHSTHSTHSTHSTHSTHTHSTHSTHTHTHTHSTHSTHTHSTHTHTHTHSTHSTHSTHTHSTHSTHTHSTHSTHTHSTHSTHSTHSTHSTHTHSTHTHSTHTHSTHSTHTHTHTHTHTHSTHTHSTHSTHTHTHSTHTHTHTHSTHTHSTHSTHSTHTHSTHTHTHTHTHSTHTHTHSTHSTHSTHTHSTHSTHTHSTHTHSTHTHSTHTHTHTHTHSTHSTHSTHTHTHTHSTHSTHSTHTHTHTHSTHTHSTHSTHTHSTHSTHTHTHTHTHSTHSTHSTHSTHSTHSTHTHTHSTHSTHSTHTHSTHTHTHSTHTHTHSTHTHSTHSTHTHTHSTHSTHSTHTHTHSTHTHTHTHTHSTHTHTHSTHTHSTHTHTHSTHTHSTHTHSTHSTHSTHTHSTHSTHTHTHSTHSTHSTHTHSTHSTHSTHTHSTHSTHSTHTHSTHTHTHSTHTHTHSTHSTHSTHSTHTHTHSTHSTHSTHTHSTHTHSTHSTHTHTHSTHTHSTHTHTHSTHTHTHTHSTHTHSTHSTHTHSTHSTHSTHTHSTHTHSTHSTHSTHSTHTHTHTHTHSTHSTHSTHSTHSTHSTHTHTHSTHSTHTHSTHTHTHSTHTHSTHTHSTHTHSTHSTHSTHSTHSTHSTHTHTHTHSTHSTHSTHSTHSTHSTHTHTHSTH",
-    # rz(pi/2^41)
-    "SSSTHSTHSTHSTHTHTHTHTHSTHTHSTHSTHTHSTHTHTHSTHTHTHTHSTHSTHTHSTHSTHTHSTHTHSTHSTHSTHTHTHSTHTHSTHTHSTHTHSTHTHTHTHTHSTHTHSTHTHTHTHSTHSTHTHSTHTHSTHTHTHTHTHSTHSTHSTHSTHTHTHSTHSTHTHTHTHTHSTHSTHSTHSTHSTHSTHSTHSTHSTHSTHSTHSTHSTHSTHSTHTHSTHTHTHTHSTHSTHSTHSTHSTHTHTHTHSTHTHSTHSTHSTHSTHTHTHTHTHTHSTHTHTHSTHTHSTHSTHSTHTHTHTHTHTHSTHSTHTHTHSTHTHTHSTHSTHSTHTHSTHTHSTHSTHSTHTHTHSTHSTHTHSTHSTHSTHSTHTHTHTHTHTHTHTHTHSTHSTHSTHTHTHTHTHTHSTHSTHSTHSTHSTHSTHTHSTHSTHSTHSTHTHSTHTHTHTHSTHSTHTHSTHTHSTHSTHTHTHTHSTHTHTHTHTHTHSTHSTHTHTHTHSTHSTHSTHTHTHTHSTHTHTHSTHSTHTHTHSTHTHSTHTHTHTHTHSTHTHTHSTHTHTHTHSTHTHSTHTHSTHSTHSTHSTHSTHTHSTHSTHSTHTHTHSTHTHTHTHSTHSTHSTHTHSTHTHSTHSTHTHSTHSTHTHTHSTHSTHTHSTHTHTHTHTHSTHTHSTHTHTHSTHSTHTHSTHTHTHSTHSTHSTHTHSTHSTHSTHSTHSTHTHSTHTHSTHTHTHSTHTHTHTHSTHTHSTHSTHSTHTHSTHSTHSTHTHSTHSTHSTHTHTHTHTHTHSTHTHTHTHSTHTHSTHTHSTHTHSTHSTHTHSTHSTHTHTHTHTHSTHTHTHSTHTHSTHSTHSTHSTHSTHSTHTHTHSTHTHSTHSTHSTHTHSTHTHTHTHTHSTHTHSTHSTHTHSTHSTHSTHTHTHTHTHTHSTHSTHTHTHTHSTHTHSTHSTHTHTHTHTHSTHSTHTHSTHSTHTHTHSTHSTHSTHSTHSTHSTHTHSTHTHTHTHSTHTHSTHTHTHTHTHTH",
-    # rz(pi/2^42)
-    "SSTHTHTHTHSTHSTHSTHTHSTHTHTHTHSTHTHSTHSTHSTHSTHTHTHSTHSTHSTHSTHTHTHSTHSTHSTHTHTHTHSTHTHTHSTHTHSTHSTHSTHTHSTHSTHTHSTHSTHTHSTHSTHTHTHSTHTHTHSTHTHSTHTHTHSTHSTHSTHTHSTHTHSTHSTHTHSTHTHTHSTHSTHSTHTHSTHTHSTHSTHTHTHSTHTHTHTHSTHSTHTHSTHTHTHSTHSTHSTHSTHSTHTHTHTHSTHSTHTHSTHSTHSTHSTHSTHTHSTHTHTHSTHSTHTHTHSTHTHSTHSTHTHTHSTHTHTHTHSTHSTHTHTHSTHSTHSTHSTHSTHSTHTHTHTHTHTHTHTHSTHTHTHSTHSTHTHSTHTHSTHTHSTHSTHTHTHTHTHTHTHTHSTHSTHTHTHSTHSTHTHSTHSTHTHTHTHSTHTHSTHTHSTHSTHTHTHSTHTHSTHSTHSTHTHSTHSTHTHTHTHSTHTHTHTHSTHSTHSTHSTHSTHTHSTHTHSTHSTHTHTHSTHSTHSTHSTHTHTHTHTHTHSTHTHTHTHSTHSTHTHSTHTHTHSTHTHTHSTHTHSTHTHTHTHSTHTHTHTHTHTHTHSTHSTHTHSTHSTHSTHTHSTHSTHTHTHTHSTHTHSTHSTHSTHTHTHTHTHSTHTHSTHSTHTHSTHTHTHTHTHSTHTHSTHTHSTHSTHSTHTHTHSTHTHTHSTHSTHTHTHSTHTHSTHTHTHTHTHSTHSTHSTHTHTHSTHSTHTHSTHSTHTHSTHTHTHSTHSTHSTHTHSTHSTHSTHTHSTHSTHSTHSTHTHTHSTHTHTHSTHSTHTHSTHSTHSTHTHTHSTHTHTHSTHTHSTHSTHSTHTHSTHTHSTHSTHSTHSTHSTHSTHSTHTHTHSTHSTHSTHSTHTHSTHSTHSTHTHSTHSTHSTHTHSTHSTHTHTHTHTHTHSTHSTHTHTHSTHTHSTHTHTHTHSTHTHSTHSTHTHSTHTHSTHSTHTHSTHSTHTHSTHSTHTHTHTHSTHSTHSTHTHSTHSTH",
-    # rz(pi/2^43)
-    "SXTHTHTHSTHSTHSTHTHSTHSTHTHTHSTHTHTHSTHTHTHTHTHTHTHSTHTHSTHTHTHSTHSTHSTHSTHTHTHTHSTHSTHTHSTHSTHTHTHSTHTHTHSTHSTHTHSTHTHSTHTHSTHTHSTHTHTHTHSTHSTHTHTHSTHTHTHTHTHTHSTHTHTHTHSTHSTHSTHTHSTHTHSTHSTHSTHSTHTHSTHSTHSTHSTHSTHSTHTHSTHTHTHSTHSTHSTHTHSTHTHTHTHSTHTHSTHTHSTHSTHSTHTHTHTHSTHTHSTHTHTHSTHSTHSTHTHSTHSTHTHSTHTHSTHSTHSTHSTHSTHTHTHTHSTHSTHSTHTHSTHSTHTHSTHSTHSTHSTHTHTHTHSTHSTHTHSTHTHSTHTHTHSTHTHSTHTHTHSTHSTHSTHSTHSTHSTHSTHSTHTHSTHSTHTHSTHSTHTHTHSTHTHTHTHTHSTHTHSTHTHSTHSTHTHSTHSTHSTHTHSTHTHTHSTHTHTHSTHTHSTHSTHSTHSTHSTHTHTHSTHSTHSTHTHSTHSTHTHTHSTHSTHTHTHSTHTHSTHSTHSTHSTHSTHTHTHSTHTHSTHTHTHSTHTHTHTHSTHSTHTHTHSTHTHSTHSTHSTHSTHSTHTHTHSTHTHSTHTHTHSTHTHSTHSTHTHSTHSTHSTHSTHTHSTHTHTHSTHTHSTHSTHTHSTHTHTHSTHSTHSTHSTHSTHSTHSTHTHTHTHSTHSTHSTHSTHTHTHSTHTHSTHTHSTHTHTHTHSTHSTHTHTHSTHSTHTHSTHSTHSTHSTHSTHSTHSTHTHTHSTHSTHTHSTHTHTHTHSTHSTHSTHTHSTHSTHTHSTHTHTHSTHSTHTHTHTHTHTHTHSTHTHSTHTHTHSTHSTHSTHSTHSTHTHSTHSTHSTHSTHSTHSTHTHTHTHTHTHTHTHTHSTHSTHTHSTHTHTHSTHSTHSTHSTHSTHSTHSTHTHTHSTHSTHSTHSTHSTHSTHSTHSTHTHTHTHTHSTHTHSTHTHTHTHTHSTHTHTHSTHSTHSTH",
-    # rz(pi/2^44)
-    "XTHTHSTHSTHSTHSTHSTHSTHTHTHTHSTHTHTHTHSTHSTHTHSTHSTHTHSTHTHTHSTHTHTHTHTHSTHTHSTHTHSTHSTHSTHTHTHSTHSTHSTHTHTHSTHTHTHTHTHSTHSTHSTHTHSTHSTHSTHTHSTHTHTHSTHSTHTHSTHTHTHSTHSTHSTHSTHSTHSTHTHSTHTHTHTHTHTHSTHSTHTHTHSTHTHSTHSTHSTHSTHSTHTHSTHSTHSTHTHTHTHTHTHTHSTHSTHTHSTHSTHTHTHSTHSTHTHTHTHTHTHSTHSTHTHSTHTHSTHTHSTHSTHTHSTHSTHSTHTHSTHSTHSTHSTHSTHSTHSTHSTHSTHTHTHSTHTHSTHTHTHSTHTHSTHSTHTHSTHSTHTHSTHSTHTHTHTHSTHTHTHTHTHSTHSTHTHSTHSTHSTHTHTHSTHSTHSTHTHSTHTHTHTHSTHTHTHTHSTHTHTHTHTHSTHSTHSTHSTHTHTHSTHSTHTHSTHSTHSTHSTHSTHSTHTHSTHTHSTHSTHSTHTHSTHSTHSTHSTHSTHTHTHTHSTHSTHSTHSTHTHTHSTHTHSTHTHSTHSTHSTHSTHTHTHTHTHSTHTHTHSTHSTHTHSTHSTHTHTHSTHSTHTHTHSTHSTHSTHTHSTHSTHSTHSTHSTHTHTHSTHSTHTHSTHTHTHSTHSTHSTHSTHSTHTHTHSTHTHSTHSTHSTHTHTHSTHSTHTHTHTHSTHTHTHSTHTHSTHTHSTHSTHTHTHSTHSTHTHTHTHTHTHTHSTHSTHSTHSTHSTHSTHTHTHTHTHSTHTHSTHTHTHSTHTHTHSTHTHTHTHTHTHTHSTHSTHTHSTHSTHSTHTHSTHSTHTHTHTHSTHSTHTHTHTHSTHSTHSTHTHTHSTHSTHSTHTHSTHSTHTHTHSTHTHSTHTHSTHTHSTHSTHSTHTHSTHTHSTHSTHTHTHTHSTHSTHSTHTHTHTHSTHTHSTHTHSTHSTHSTHSTHTHTHSTHSTHSTHTHSTHTHTHSTHTHSTHSTHTHTHTHSTHTHSTHSTHSTH",
-    # rz(pi/2^45)
-    "HTHSTHSTHSTHTHTHSTHSTHSTHSTHSTHTHTHTHSTHSTHTHSTHTHSTHSTHSTHSTHSTHSTHSTHTHTHTHTHTHTHTHTHTHSTHSTHTHTHTHSTHTHTHTHSTHTHSTHSTHSTHTHSTHTHTHSTHSTHSTHSTHTHSTHTHSTHTHSTHSTHSTHSTHSTHSTHTHSTHSTHSTHSTHSTHSTHTHSTHTHTHSTHTHTHTHTHSTHSTHSTHSTHSTHTHTHTHTHSTHSTHTHTHSTHTHSTHTHSTHTHTHSTHSTHTHTHSTHSTHSTHSTHTHSTHSTHTHTHTHSTHSTHSTHSTHSTHSTHSTHTHTHTHSTHSTHSTHTHSTHSTHSTHSTHTHSTHTHSTHSTHTHSTHTHSTHTHSTHTHSTHTHSTHSTHTHSTHTHTHSTHTHSTHSTHSTHSTHTHSTHSTHTHTHTHSTHSTHSTHTHSTHTHSTHSTHTHSTHSTHSTHTHSTHTHTHTHTHSTHSTHSTHSTHSTHTHSTHSTHTHTHTHTHSTHTHSTHSTHTHTHTHSTHTHSTHTHTHTHTHTHSTHSTHTHTHTHSTHSTHSTHSTHTHTHSTHTHSTHTHTHTHTHSTHTHSTHSTHTHSTHTHTHSTHTHSTHSTHSTHTHSTHTHSTHTHSTHTHSTHSTHSTHSTHSTHTHTHSTHTHSTHSTHTHSTHTHSTHSTHTHSTHTHTHTHTHTHSTHTHTHSTHTHSTHTHTHSTHTHTHTHTHSTHTHTHSTHTHTHSTHSTHTHTHSTHTHTHTHSTHTHSTHSTHSTHSTHTHSTHSTHTHTHTHSTHSTHSTHSTHSTHSTHTHTHSTHSTHTHTHTHSTHTHSTHTHTHTHSTHTHTHTHSTHTHTHTHTHSTHTHSTHSTHTHSTHTHSTHTHTHTHTHSTHSTHSTHSTHSTHSTHSTHTHSTHSTHTHSTHSTHSTHSTHTHSTHSTHTHTHSTHTHTHTHSTHSTHSTHSTHSTHTHTHTHTHTHSTHSTHTHTHSTHSTHSTHSTHTHSTHSTHSTHTHSTHTHTHTHTHTHTHST",
-    # rz(pi/2^46)
-    "SXHSTHTHTHSTHSTHTHTHSTHSTHSTHSTHSTHSTHSTHSTHTHTHTHSTHTHTHSTHSTHTHSTHTHTHTHSTHSTHTHSTHTHTHSTHTHSTHSTHTHTHTHSTHTHSTHTHTHTHSTHTHSTHTHTHTHSTHTHSTHSTHTHTHSTHTHTHTHSTHSTHSTHTHTHTHTHSTHTHTHTHSTHSTHSTHSTHTHSTHTHSTHTHTHSTHSTHSTHTHTHSTHTHSTHSTHTHSTHSTHSTHTHTHSTHTHTHTHTHSTHSTHSTHTHTHTHSTHTHSTHTHSTHTHTHTHTHSTHSTHTHTHTHTHTHTHTHTHSTHSTHTHSTHTHTHSTHSTHSTHTHTHSTHSTHSTHTHTHTHTHTHSTHSTHTHTHSTHTHSTHSTHSTHSTHTHTHSTHTHSTHSTHSTHSTHTHSTHTHTHSTHSTHTHSTHSTHSTHSTHTHTHSTHSTHSTHSTHSTHSTHTHTHSTHTHSTHTHTHTHTHTHTHSTHTHTHSTHSTHTHTHTHSTHSTHTHSTHSTHSTHTHTHTHTHTHTHTHSTHTHTHSTHSTHTHTHSTHTHSTHSTHTHTHSTHSTHSTHSTHSTHSTHSTHSTHSTHTHSTHSTHTHSTHTHTHTHTHTHTHTHTHSTHTHSTHTHSTHSTHTHTHTHTHSTHSTHTHTHTHTHSTHTHTHTHSTHTHSTHTHSTHSTHTHTHSTHSTHSTHSTHSTHSTHSTHTHSTHSTHTHSTHSTHSTHTHTHSTHTHTHTHTHSTHSTHTHTHSTHSTHTHTHSTHTHTHSTHTHTHSTHTHTHTHTHTHSTHTHSTHTHTHTHTHSTHSTHTHSTHTHTHSTHSTHTHTHTHSTHTHTHSTHTHTHSTHSTHSTHSTHTHTHSTHTHSTHSTHSTHTHTHTHTHTHTHSTHTHTHTHTHSTHSTHSTHTHSTHSTHSTHTHTHTHTHSTHTHTHSTHTHTHTHTHSTHSTHSTHSTHSTHSTHSTHTHSTHTHSTHTHTHSTHSTHSTHTHSTHSTHSTHSTHSTHSTHSTHTHSTH",
-    # rz(pi/2^47)
-    "SSTHTHSTHTHTHSTHTHSTHSTHSTHTHSTHSTHTHSTHSTHTHSTHSTHSTHTHTHTHSTHTHSTHSTHTHSTHSTHSTHTHSTHSTHTHSTHSTHSTHSTHTHTHTHTHTHSTHTHSTHSTHSTHSTHSTHSTHSTHSTHTHSTHTHTHSTHTHTHTHSTHSTHTHSTHSTHTHTHSTHSTHTHSTHTHSTHSTHTHTHTHSTHSTHSTHSTHSTHSTHTHSTHTHTHSTHTHSTHSTHTHTHTHTHSTHSTHSTHSTHTHTHTHSTHSTHSTHSTHTHSTHTHTHTHTHTHSTHTHTHTHTHSTHTHSTHTHSTHSTHSTHTHSTHSTHSTHSTHSTHTHSTHSTHSTHSTHSTHSTHTHTHTHSTHSTHSTHSTHTHTHSTHTHTHSTHTHTHSTHTHSTHTHTHSTHSTHSTHSTHTHSTHTHSTHTHSTHSTHTHSTHSTHTHSTHSTHSTHSTHSTHSTHSTHSTHSTHSTHSTHSTHSTHTHSTHSTHSTHSTHSTHTHSTHTHTHTHSTHTHSTHTHTHTHSTHSTHTHTHSTHTHSTHSTHTHTHSTHTHTHSTHSTHTHTHTHTHSTHTHSTHSTHSTHTHTHSTHSTHTHSTHSTHSTHTHTHSTHSTHTHTHSTHTHTHSTHTHSTHTHTHTHSTHTHTHSTHTHSTHSTHTHSTHTHSTHTHSTHTHTHSTHSTHTHTHTHTHTHSTHTHSTHTHTHSTHTHTHSTHTHTHTHSTHSTHSTHTHTHTHTHTHSTHTHTHTHTHSTHSTHTHSTHTHTHSTHSTHTHTHTHTHTHSTHSTHTHTHTHSTHSTHTHSTHTHSTHSTHTHTHSTHSTHTHSTHTHSTHTHSTHTHTHSTHSTHTHSTHTHSTHSTHTHSTHSTHTHSTHTHSTHSTHTHTHSTHTHTHTHSTHSTHSTHSTHSTHTHTHSTHSTHSTHSTHSTHTHTHTHTHTHTHSTHSTHSTHSTHSTHSTHSTHTHTHTHTHSTHSTHTHTHTHSTHTHTHSTHTHSTHSTHSTHTHTHSTHSTHTHTHSTHSTHTHSTHTH",
-    # rz(pi/2^48)
-    "XTHSTHSTHSTHSTHTHTHSTHTHSTHTHSTHSTHSTHTHTHTHSTHSTHTHTHTHTHSTHSTHTHSTHSTHTHTHTHTHSTHSTHSTHTHSTHTHSTHTHSTHTHTHTHTHSTHSTHSTHTHSTHSTHTHTHTHTHTHSTHSTHSTHSTHTHSTHTHTHSTHSTHSTHSTHTHSTHSTHSTHTHSTHTHTHTHSTHSTHTHTHTHSTHSTHSTHSTHSTHTHTHSTHSTHSTHSTHSTHTHSTHSTHTHSTHTHTHSTHTHTHTHSTHSTHTHTHTHTHSTHSTHSTHTHTHTHTHSTHTHSTHTHTHSTHTHTHSTHSTHSTHTHTHTHSTHSTHSTHSTHTHSTHSTHTHTHTHTHSTHSTHSTHSTHSTHSTHTHSTHTHSTHTHTHTHSTHSTHSTHTHSTHTHTHSTHTHSTHTHTHTHTHSTHSTHSTHTHSTHTHSTHTHSTHTHSTHTHTHSTHSTHTHSTHTHSTHTHSTHSTHTHSTHTHSTHSTHTHSTHTHTHSTHTHSTHSTHSTHTHSTHTHSTHSTHSTHTHSTHTHTHSTHSTHTHSTHTHSTHTHSTHTHSTHSTHTHTHSTHSTHSTHSTHTHTHSTHTHTHSTHTHSTHSTHSTHSTHSTHSTHTHTHTHSTHSTHTHTHTHTHTHSTHSTHSTHTHTHTHSTHSTHSTHTHTHTHTHSTHTHTHSTHSTHSTHTHSTHTHTHSTHSTHTHTHTHSTHSTHTHTHTHTHSTHTHSTHTHTHSTHSTHSTHTHSTHSTHSTHSTHTHTHSTHTHSTHSTHSTHSTHTHSTHSTHTHTHTHTHSTHSTHTHSTHSTHSTHSTHSTHSTHTHSTHSTHTHTHTHTHTHTHSTHSTHSTHSTHSTHSTHSTHTHSTHTHTHSTHSTHTHSTHTHTHTHSTHSTHTHTHSTHSTHTHSTHSTHSTHSTHSTHSTHSTHTHTHSTHSTHSTHTHSTHSTHTHTHSTHSTHTHSTHSTHTHSTHSTHSTHSTHTHTHSTHTHTHSTHTHTHTHSTHTHSTHTHSTHSTHTHSTHSTHTHSTHTHSTHS",
-    # rz(pi/2^49)
-    "SSHSTHSTHTHSTHSTHTHTHSTHTHTHSTHSTHSTHSTHTHSTHTHSTHSTHSTHSTHSTHTHTHTHTHSTHSTHTHSTHSTHSTHTHTHSTHSTHSTHSTHSTHSTHTHSTHSTHTHSTHTHSTHTHTHTHTHSTHTHTHTHTHSTHSTHSTHSTHSTHTHSTHTHTHTHTHSTHTHTHTHTHSTHSTHSTHSTHSTHTHTHTHSTHTHSTHSTHSTHTHSTHTHSTHSTHTHSTHSTHSTHTHTHTHTHSTHTHTHTHTHSTHTHTHSTHTHTHTHSTHSTHSTHSTHTHSTHSTHTHSTHTHSTHSTHTHTHSTHSTHTHSTHSTHSTHTHSTHSTHSTHTHTHSTHTHTHTHTHTHSTHTHTHTHTHSTHTHSTHSTHSTHSTHTHSTHTHTHSTHTHSTHTHTHSTHSTHSTHTHSTHSTHSTHTHTHTHTHTHTHSTHTHTHSTHSTHTHTHTHSTHTHSTHSTHSTHSTHTHTHSTHTHSTHTHTHTHSTHSTHSTHTHTHTHTHTHSTHSTHSTHSTHTHSTHSTHSTHTHTHSTHSTHTHTHSTHTHSTHSTHSTHTHSTHTHSTHSTHSTHTHSTHSTHTHTHTHTHSTHTHTHTHSTHTHSTHSTHTHSTHSTHTHTHSTHTHSTHSTHSTHSTHTHSTHSTHTHTHTHSTHSTHSTHSTHTHSTHTHSTHTHTHSTHTHTHTHSTHSTHTHTHSTHSTHTHSTHSTHSTHSTHTHTHSTHSTHSTHSTHSTHSTHTHSTHSTHSTHSTHSTHTHTHSTHSTHSTHTHTHTHTHTHSTHTHTHTHTHSTHSTHTHTHTHSTHTHTHSTHSTHSTHSTHSTHTHSTHTHTHSTHSTHTHSTHSTHTHSTHTHSTHSTHSTHSTHTHSTHSTHSTHTHTHTHTHSTHSTHTHTHSTHTHSTHTHTHTHSTHTHTHSTHTHTHSTHSTHTHTHSTHTHTHSTHTHTHTHSTHSTHTHTHTHSTHSTHSTHTHSTHSTHTHTHSTHSTHSTHTHTHSTHTHSTHTHSTHSTHSTHSTHTHTHTHTHSTHSTHTHTHS",
-    # rz(pi/2^50)
-    "SSXHTHSTHSTHTHTHTHSTHSTHSTHTHSTHTHTHSTHTHSTHSTHTHSTHTHTHSTHSTHSTHSTHTHTHTHSTHSTHSTHTHSTHSTHSTHTHTHSTHTHTHSTHSTHTHSTHTHTHSTHTHSTHTHTHSTHSTHTHTHSTHSTHSTHTHTHTHTHTHTHTHSTHTHTHSTHSTHTHTHTHTHTHTHTHTHSTHSTHTHSTHSTHSTHTHTHTHSTHSTHTHTHTHTHTHTHTHTHSTHSTHSTHSTHSTHTHTHTHSTHTHTHTHTHSTHTHSTHTHTHTHTHSTHSTHSTHSTHTHSTHSTHSTHSTHTHSTHSTHSTHTHSTHTHSTHSTHTHTHSTHSTHTHTHSTHSTHSTHSTHTHTHTHSTHTHSTHSTHSTHSTHTHTHTHSTHSTHTHTHSTHTHSTHTHTHTHTHTHSTHSTHTHTHTHSTHTHTHTHSTHTHSTHSTHTHSTHSTHSTHTHSTHTHSTHTHSTHTHSTHSTHTHSTHTHSTHTHSTHTHSTHSTHTHSTHTHSTHTHSTHTHTHTHSTHTHTHSTHSTHTHTHSTHSTHTHSTHSTHSTHSTHSTHSTHSTHTHSTHSTHSTHSTHSTHSTHTHSTHSTHTHTHTHSTHTHSTHSTHTHSTHTHTHTHTHSTHSTHSTHTHSTHTHSTHSTHTHTHTHSTHTHTHSTHSTHSTHSTHSTHTHTHSTHTHSTHTHTHSTHTHTHSTHTHSTHSTHSTHTHSTHSTHSTHTHSTHTHTHSTHSTHTHTHSTHSTHSTHTHSTHTHSTHTHTHSTHTHSTHTHTHSTHTHSTHSTHTHTHTHSTHSTHTHSTHSTHTHTHSTHSTHSTHTHTHSTHSTHTHTHSTHTHTHTHSTHSTHSTHSTHTHSTHTHSTHSTHSTHSTHTHTHSTHTHTHSTHTHTHSTHSTHSTHTHTHSTHSTHTHTHTHSTHTHTHTHSTHSTHSTHTHSTHSTHTHSTHSTHSTHSTHSTHSTHTHSTHTHTHSTHSTHSTHTHTHSTHTHSTHTHTHSTHSTHSTHTHSTHSTHTHSTHTHTHS",
-    # rz(pi/2^51)
-    "SHSTHSTHSTHSTHSTHTHSTHTHSTHSTHTHSTHTHSTHSTHTHSTHSTHTHTHTHTHSTHSTHTHTHTHSTHTHTHTHSTHSTHSTHTHSTHSTHSTHSTHSTHTHSTHTHTHTHSTHTHSTHTHTHTHSTHTHSTHSTHTHSTHTHSTHTHSTHTHSTHSTHTHSTHSTHSTHSTHSTHSTHSTHSTHTHTHTHTHTHTHSTHSTHTHTHSTHSTHTHTHTHSTHSTHSTHTHSTHSTHTHTHTHSTHTHSTHTHSTHTHSTHSTHTHTHTHTHSTHTHSTHSTHSTHSTHSTHTHTHTHSTHTHSTHTHSTHSTHTHTHSTHTHTHSTHSTHSTHTHSTHTHTHTHSTHTHTHTHTHSTHTHTHTHSTHTHTHSTHSTHSTHTHTHSTHSTHTHTHTHTHTHTHSTHSTHTHSTHSTHSTHSTHSTHSTHSTHSTHTHSTHSTHTHSTHTHTHTHTHSTHSTHTHSTHTHSTHSTHSTHTHTHTHSTHTHSTHSTHTHTHTHTHTHSTHSTHSTHTHSTHTHTHTHSTHSTHSTHSTHSTHTHTHTHSTHTHTHSTHTHTHTHTHSTHTHTHSTHTHTHTHSTHTHSTHSTHTHTHSTHSTHSTHTHSTHSTHSTHSTHSTHTHSTHSTHSTHSTHTHSTHTHTHSTHTHSTHSTHTHSTHSTHSTHSTHSTHSTHSTHTHTHSTHSTHTHTHSTHSTHSTHSTHSTHSTHTHTHTHTHSTHTHTHTHSTHTHTHTHSTHSTHSTHSTHTHSTHSTHSTHSTHSTHTHSTHTHTHTHSTHSTHSTHTHSTHSTHTHTHSTHTHSTHTHTHSTHTHSTHSTHTHTHSTHTHTHTHSTHTHTHTHSTHTHTHSTHSTHSTHSTHTHTHSTHSTHSTHTHTHSTHTHTHTHSTHTHTHTHSTHSTHSTHTHSTHSTHTHTHSTHTHSTHTHSTHTHTHSTHTHSTHTHTHSTHSTHTHTHSTHTHSTHSTHTHTHSTHTHSTHSTHSTHTHSTHTHSTHTHTHSTHTHSTHTHTHTHTHSTHSTHTHSTHSTHST",
-    # rz(pi/2^52)
-    "SSTHSTHTHTHSTHSTHTHTHSTHTHTHSTHSTHTHSTHTHTHTHTHTHTHTHSTHSTHTHSTHSTHTHSTHTHSTHTHSTHTHTHSTHTHTHSTHSTHSTHSTHSTHSTHSTHSTHTHTHSTHSTHSTHTHTHTHSTHTHTHTHSTHTHSTHTHTHTHTHTHTHTHTHTHTHTHSTHSTHTHTHTHSTHTHTHSTHTHTHSTHSTHSTHSTHSTHTHSTHTHSTHSTHSTHSTHTHSTHSTHSTHTHSTHSTHTHSTHSTHSTHSTHTHSTHSTHSTHSTHTHSTHSTHTHSTHTHSTHSTHTHSTHTHSTHSTHTHTHTHTHTHTHTHSTHTHTHSTHTHTHTHSTHTHTHTHTHTHTHTHSTHSTHTHTHTHTHSTHSTHTHTHSTHSTHTHSTHTHTHSTHTHTHTHSTHSTHSTHSTHTHTHSTHSTHSTHSTHTHSTHTHTHSTHSTHSTHSTHSTHTHSTHTHSTHTHSTHTHSTHSTHSTHSTHSTHTHTHTHSTHSTHSTHSTHTHSTHSTHSTHTHSTHTHSTHTHSTHSTHSTHTHTHTHSTHTHSTHSTHTHTHSTHTHTHTHSTHSTHTHTHTHTHSTHTHSTHTHTHTHSTHSTHTHTHTHTHTHTHTHSTHSTHTHSTHSTHTHTHTHTHSTHTHSTHSTHTHTHTHTHSTHSTHTHSTHSTHSTHSTHTHSTHSTHTHSTHTHSTHTHSTHTHSTHTHSTHTHTHTHTHTHSTHSTHTHTHSTHTHTHTHSTHSTHSTHTHSTHTHTHSTHSTHSTHTHSTHTHTHTHSTHSTHTHTHSTHSTHSTHSTHSTHSTHSTHSTHSTHTHTHSTHSTHTHSTHSTHTHSTHTHTHSTHTHTHSTHSTHSTHSTHSTHTHSTHTHTHTHSTHSTHTHSTHSTHTHTHTHTHTHSTHTHTHTHSTHTHTHTHSTHSTHTHTHTHSTHTHSTHSTHSTHSTHTHTHSTHSTHSTHSTHTHSTHTHSTHTHTHSTHSTHTHTHSTHTHTHSTHTHSTHS",
-    # rz(pi/2^53)
-    "SSSXHTHSTHSTHTHTHTHTHTHSTHSTHSTHSTHTHTHSTHTHTHSTHTHSTHSTHTHTHTHTHTHSTHTHTHTHTHTHTHTHSTHSTHSTHTHSTHSTHSTHTHTHTHTHTHSTHTHTHSTHTHSTHSTHTHSTHTHSTHTHSTHTHTHSTHSTHSTHTHTHTHSTHTHTHSTHTHTHTHSTHTHTHTHSTHSTHTHSTHTHTHTHTHTHSTHTHSTHSTHSTHSTHTHTHTHSTHSTHSTHTHTHSTHTHSTHSTHSTHTHTHTHSTHSTHSTHSTHTHSTHSTHTHSTHTHSTHTHSTHSTHTHTHSTHSTHSTHTHTHTHSTHTHTHSTHSTHTHTHTHTHSTHSTHSTHTHSTHTHSTHSTHSTHTHTHSTHTHSTHSTHTHSTHTHSTHSTHSTHTHSTHSTHSTHSTHSTHTHTHTHTHTHSTHTHTHSTHTHSTHSTHSTHSTHTHTHTHSTHSTHSTHTHSTHSTHSTHSTHTHTHSTHTHSTHSTHTHTHTHTHSTHTHTHTHTHTHTHTHTHTHSTHSTHTHSTHTHSTHTHSTHTHSTHSTHTHSTHSTHTHSTHSTHTHSTHSTHSTHTHTHSTHTHTHTHSTHSTHTHTHSTHTHTHSTHTHTHSTHTHSTHSTHTHTHSTHTHTHSTHSTHSTHTHSTHTHTHTHSTHTHSTHTHSTHTHSTHSTHSTHTHTHSTHSTHTHTHSTHSTHSTHTHSTHTHTHSTHTHSTHSTHTHSTHSTHTHTHSTHSTHSTHSTHSTHTHSTHTHTHSTHTHTHTHSTHTHSTHSTHTHSTHTHSTHTHSTHTHTHTHTHTHSTHTHTHTHSTHTHTHTHTHTHSTHTHSTHTHTHTHSTHTHSTHTHTHSTHSTHSTHSTHSTHSTHTHSTHTHSTHTHTHSTHTHSTHTHSTHSTHTHTHSTHTHTHSTHSTHTHSTHSTHTHSTHSTHTHTHTHTHSTHSTHSTHSTHSTHTHSTHSTHTHSTHSTHSTHTHTHSTHSTHTHTHTHTHSTHSTHSTHTHTHSTHSTHTHSTHTHTHS",
-    # rz(pi/2^54)
-    "SSSXTHSTHSTHSTHTHSTHSTHTHTHTHTHTHSTHSTHTHSTHSTHTHSTHSTHSTHTHSTHTHTHTHTHSTHSTHTHTHSTHTHTHSTHSTHTHTHSTHSTHSTHSTHTHSTHTHTHSTHTHSTHTHTHSTHTHSTHSTHTHSTHSTHSTHSTHTHTHTHTHTHSTHSTHTHTHSTHTHTHTHTHSTHTHTHSTHSTHSTHTHSTHSTHTHSTHTHSTHSTHSTHTHSTHTHTHTHTHTHTHSTHTHSTHTHSTHTHTHTHSTHTHSTHSTHSTHSTHSTHSTHTHSTHTHSTHSTHTHTHSTHSTHTHTHTHTHTHTHTHTHTHTHSTHTHTHTHTHSTHSTHSTHSTHTHTHSTHTHSTHSTHTHSTHTHTHSTHTHTHTHTHSTHTHTHTHSTHTHTHSTHTHSTHSTHSTHTHTHTHTHSTHTHTHSTHTHTHTHSTHTHSTHTHSTHTHSTHSTHSTHTHTHTHTHSTHTHTHSTHSTHSTHTHTHSTHTHSTHTHTHTHTHSTHTHSTHSTHTHSTHSTHSTHSTHSTHTHTHTHSTHTHTHTHTHTHTHTHTHSTHTHSTHTHTHTHSTHSTHSTHSTHSTHTHTHTHTHTHTHSTHSTHTHSTHTHTHSTHTHTHTHSTHSTHSTHSTHTHTHSTHSTHSTHSTHSTHTHSTHTHSTHSTHSTHSTHTHSTHSTHSTHSTHSTHTHTHTHTHSTHTHTHTHTHSTHSTHTHSTHSTHTHTHTHTHTHTHTHSTHSTHSTHTHTHSTHTHTHSTHTHSTHTHTHSTHSTHTHTHTHTHSTHTHTHTHSTHTHTHSTHSTHTHSTHTHSTHSTHTHSTHSTHSTHTHSTHSTHTHSTHSTHTHSTHSTHTHSTHSTHTHTHTHSTHSTHTHTHSTHSTHSTHSTHSTHTHSTHTHTHSTHTHTHSTHSTHTHTHTHTHTHSTHSTHTHSTHTHSTHSTHTHSTHTHTHTHTHTHSTHTHSTHSTHTHTHTHTHTHTHSTHTHSTHSTHTHTHSTHSTHTHTHTHSTHTHSTHS",
-    # rz(pi/2^55)
-    "SXHTHSTHTHSTHTHTHSTHTHTHSTHSTHSTHSTHTHSTHSTHTHTHSTHSTHSTHTHSTHSTHSTHSTHTHTHSTHSTHTHTHSTHSTHTHSTHTHSTHTHSTHSTHTHTHSTHSTHTHSTHSTHSTHSTHSTHSTHSTHTHTHTHSTHTHTHTHSTHTHSTHTHSTHTHTHTHTHSTHSTHTHSTHTHSTHTHTHTHTHSTHSTHTHSTHSTHTHSTHSTHTHTHSTHTHTHSTHSTHTHTHTHTHTHTHTHSTHSTHTHSTHSTHSTHSTHTHSTHSTHTHSTHTHSTHTHTHSTHTHSTHSTHSTHTHTHSTHSTHSTHTHSTHTHTHTHTHTHSTHTHSTHSTHTHSTHTHTHSTHSTHSTHSTHSTHSTHTHSTHSTHSTHSTHTHSTHSTHTHTHSTHTHTHTHSTHTHSTHTHSTHTHTHSTHTHSTHTHSTHSTHSTHTHTHSTHSTHSTHTHTHTHTHSTHTHSTHTHTHTHTHTHSTHTHSTHTHSTHTHSTHSTHSTHSTHTHTHSTHSTHSTHTHSTHSTHTHTHSTHTHSTHSTHTHTHTHTHTHSTHTHSTHSTHTHSTHTHTHSTHTHTHTHSTHTHTHSTHSTHTHSTHTHSTHTHSTHSTHTHTHSTHTHTHSTHSTHTHTHTHSTHSTHSTHSTHSTHTHTHSTHSTHTHSTHTHSTHSTHSTHSTHTHSTHSTHSTHTHTHTHTHSTHSTHTHSTHTHSTHTHTHSTHSTHTHSTHSTHTHSTHTHSTHSTHTHSTHTHSTHTHTHTHTHSTHSTHSTHSTHTHTHTHTHTHTHTHSTHSTHTHSTHTHSTHTHSTHSTHTHSTHSTHTHTHTHTHTHSTHTHSTHSTHSTHSTHTHSTHSTHTHTHSTHTHTHSTHTHTHTHSTHSTHSTHSTHSTHSTHTHTHTHTHTHTHSTHSTHSTHSTHSTHTHTHTHSTHSTHTHTHTHTHTHSTHSTHSTHSTHTHTHSTHTHSTHSTHSTHSTHTHTHTHTHSTHTHSTHSTHSTHTHTHSTHSTHTHTHSTHTHTHSTHSTHSTH",
-    # rz(pi/2^56)
-    "SSXHTHTHSTHSTHTHTHSTHSTHSTHTHSTHTHSTHTHTHTHSTHTHTHSTHTHTHSTHSTHSTHSTHTHSTHSTHTHSTHSTHTHSTHTHSTHTHSTHSTHTHSTHTHSTHSTHSTHSTHTHSTHTHSTHSTHTHSTHSTHSTHTHTHTHTHTHSTHTHTHSTHSTHTHTHTHTHTHTHTHTHTHSTHTHTHSTHSTHTHTHTHTHSTHSTHTHTHSTHTHSTHSTHTHSTHSTHSTHSTHTHTHSTHTHSTHSTHSTHSTHTHTHTHSTHSTHSTHTHSTHTHSTHTHSTHTHSTHSTHSTHSTHSTHTHTHTHTHTHSTHTHTHSTHSTHTHSTHTHTHSTHSTHTHTHTHSTHTHSTHTHSTHSTHTHSTHSTHTHTHSTHSTHTHTHSTHSTHTHSTHTHSTHTHTHSTHTHSTHSTHSTHSTHSTHSTHSTHTHTHTHSTHTHTHSTHSTHTHSTHSTHTHSTHTHTHSTHSTHSTHSTHTHTHTHTHTHTHSTHTHSTHTHTHTHSTHTHTHSTHTHTHTHSTHSTHTHTHSTHSTHTHSTHSTHSTHSTHSTHSTHTHTHTHSTHTHTHTHSTHSTHSTHSTHSTHSTHSTHSTHSTHTHSTHTHTHSTHTHTHSTHSTHTHSTHSTHTHTHSTHTHTHTHSTHTHTHSTHTHSTHTHSTHSTHSTHSTHSTHTHSTHTHSTHTHTHSTHSTHSTHSTHTHSTHTHTHTHTHTHSTHSTHSTHTHTHSTHTHTHSTHTHTHTHSTHTHSTHTHSTHSTHTHSTHTHTHTHSTHSTHSTHSTHTHTHSTHSTHSTHTHTHSTHTHTHTHTHTHTHSTHSTHSTHTHSTHSTHSTHTHTHTHTHTHSTHSTHSTHTHTHSTHSTHTHSTHTHSTHTHSTHTHSTHSTHTHSTHSTHTHSTHSTHTHTHSTHTHTHTHSTHTHSTHTHSTHTHTHSTHTHSTHSTHTHTHTHSTHTHTHSTHTHSTHTHTHSTHSTHSTHTHTHTHSTHTHTHTHSTHST",
-    # rz(pi/2^57)
-    "SXHTHTHSTHTHSTHSTHSTHTHTHSTHTHSTHTHSTHSTHTHTHTHSTHSTHTHTHSTHSTHSTHTHSTHSTHSTHTHSTHSTHSTHTHSTHTHTHSTHTHTHSTHSTHTHSTHTHTHTHTHTHTHSTHTHSTHTHSTHSTHSTHTHSTHTHTHSTHTHTHTHTHSTHTHSTHTHTHSTHSTHSTHSTHTHSTHSTHSTHSTHTHTHSTHTHTHSTHSTHTHSTHSTHTHSTHTHTHSTHSTHTHTHTHTHSTHSTHTHSTHTHTHTHTHSTHSTHSTHSTHSTHTHTHTHTHTHTHTHTHTHSTHTHSTHSTHTHSTHSTHSTHTHSTHTHTHTHTHTHSTHTHSTHSTHTHSTHSTHTHTHTHSTHSTHTHSTHTHSTHTHTHTHSTHSTHSTHTHTHTHSTHTHSTHSTHTHTHTHTHSTHTHSTHTHSTHTHTHSTHSTHTHTHTHSTHSTHTHTHTHSTHSTHTHTHSTHSTHTHTHTHSTHSTHTHTHTHTHSTHSTHTHSTHTHTHSTHTHSTHSTHTHTHTHTHSTHSTHSTHSTHTHSTHSTHSTHSTHTHSTHSTHSTHSTHTHTHTHSTHTHSTHSTHSTHTHTHTHSTHSTHSTHTHSTHTHTHSTHSTHTHSTHTHTHSTHTHSTHTHSTHTHSTHSTHTHTHTHSTHSTHSTHTHTHTHTHTHSTHTHSTHTHSTHTHSTHSTHSTHSTHTHSTHTHTHTHTHTHTHSTHSTHSTHTHTHTHSTHSTHSTHTHSTHSTHTHSTHSTHSTHSTHSTHSTHSTHSTHSTHTHTHTHSTHSTHSTHTHSTHSTHSTHSTHSTHTHTHSTHTHSTHTHTHTHTHSTHSTHTHSTHTHTHTHSTHTHSTHTHSTHTHSTHTHTHTHTHTHTHSTHSTHSTHTHSTHSTHTHSTHTHSTHTHTHSTHSTHSTHTHSTHSTHTHTHSTHSTHSTHTHSTHSTHTHTHTHSTHSTHSTHSTHSTHTHTHSTHTHSTHSTHTHSTHSTHTHTHTHSTHSTHTHTHSTHSTHTHTHSTHSTHTHTHSTHSTH",
-    # rz(pi/2^58)
-    "SSHTHTHSTHTHTHSTHTHSTHSTHTHSTHTHTHSTHTHTHTHSTHTHSTHTHTHTHSTHTHSTHTHTHSTHTHSTHTHSTHSTHTHSTHSTHTHSTHTHTHSTHSTHSTHSTHSTHSTHSTHTHSTHTHSTHTHSTHSTHSTHSTHSTHSTHTHTHTHSTHSTHTHTHSTHTHTHSTHTHSTHSTHTHTHSTHSTHSTHTHTHSTHTHTHSTHTHTHSTHTHTHTHTHTHTHSTHSTHTHTHTHTHTHSTHSTHSTHTHTHTHTHTHTHTHTHSTHSTHSTHSTHSTHTHSTHSTHTHTHSTHSTHTHSTHSTHSTHTHSTHSTHSTHTHSTHTHSTHSTHSTHSTHSTHSTHSTHSTHTHTHSTHSTHTHTHTHTHSTHTHSTHTHTHTHTHTHSTHTHSTHTHTHTHSTHSTHSTHSTHTHTHSTHSTHSTHSTHSTHSTHTHTHSTHSTHSTHTHSTHSTHTHTHSTHTHTHSTHTHTHTHSTHTHSTHTHTHSTHSTHSTHSTHTHTHTHTHTHTHTHTHSTHTHSTHTHTHSTHSTHSTHTHTHTHSTHSTHTHTHSTHTHSTHTHTHSTHSTHSTHTHSTHSTHSTHTHTHTHSTHSTHSTHSTHSTHSTHTHSTHSTHTHTHSTHTHSTHTHSTHTHSTHTHTHSTHSTHSTHSTHTHTHTHTHSTHSTHSTHTHSTHTHTHTHTHTHSTHSTHTHTHTHSTHSTHSTHTHTHSTHTHTHTHTHSTHSTHTHTHTHTHSTHSTHSTHTHTHSTHTHTHSTHSTHSTHSTHTHTHSTHSTHSTHTHSTHTHTHTHSTHTHTHSTHSTHSTHTHTHTHTHSTHSTHTHTHTHSTHSTHSTHSTHTHTHTHSTHTHSTHTHTHSTHTHTHSTHSTHTHTHTHSTHTHSTHSTHSTHSTHSTHTHTHSTHSTHTHTHSTHSTHSTHTHSTHTHSTHSTHSTHSTHTHTHSTHTHTHTHTHSTHSTHTHSTHSTHSTHSTHSTHSTHSTHSTHSTHTHTHSTHTHTHTHSTHTHTHSTHTHSTHTHSTHSTHSTHS",
-    # rz(pi/2^59)
-    "SSXHTHTHSTHSTHTHTHTHTHSTHTHSTHSTHSTHTHSTHTHTHTHTHSTHSTHTHSTHSTHSTHTHSTHSTHSTHTHTHSTHTHTHSTHTHTHSTHSTHSTHSTHTHTHSTHTHTHSTHTHTHSTHSTHTHTHSTHSTHTHTHSTHSTHSTHTHTHTHTHTHTHSTHSTHSTHTHTHTHTHSTHSTHTHTHTHSTHSTHTHTHSTHSTHTHTHTHSTHTHTHSTHSTHTHTHSTHSTHTHSTHSTHSTHSTHSTHTHTHSTHTHSTHSTHSTHSTHSTHSTHSTHSTHSTHSTHSTHSTHSTHTHTHSTHSTHSTHSTHTHSTHTHTHTHSTHSTHSTHSTHTHTHSTHTHTHSTHTHSTHSTHSTHTHTHTHSTHTHTHSTHSTHSTHSTHTHSTHSTHTHTHTHTHSTHTHSTHTHSTHTHSTHSTHTHSTHTHSTHSTHSTHSTHTHTHSTHTHSTHSTHTHSTHTHSTHTHSTHTHTHTHTHSTHTHTHTHSTHSTHSTHTHSTHTHTHTHSTHSTHSTHSTHTHTHTHSTHTHTHTHTHTHTHTHTHTHTHSTHTHSTHSTHSTHTHSTHTHSTHTHSTHSTHSTHTHTHTHTHSTHTHSTHSTHTHSTHTHTHTHTHSTHSTHSTHSTHTHTHSTHSTHSTHTHSTHSTHSTHTHSTHSTHSTHSTHSTHTHTHSTHSTHSTHSTHSTHTHTHTHTHTHSTHTHSTHSTHTHSTHSTHTHTHTHSTHTHTHSTHSTHTHSTHSTHSTHSTHSTHTHSTHTHTHTHTHSTHTHTHTHSTHTHSTHTHSTHSTHTHTHTHSTHSTHSTHTHSTHTHSTHSTHTHTHTHTHSTHSTHTHTHSTHSTHTHSTHTHTHSTHSTHTHTHTHTHTHTHSTHSTHSTHSTHSTHTHSTHTHTHTHTHSTHSTHSTHSTHSTHTHSTHSTHSTHTHTHSTHSTHTHTHTHSTHTHSTHTHTHTHSTHSTHSTHTHTHSTHSTHSTHTHTHTHTHTHSTHSTHTHTHSTHSTHSTHTHSTHTHSTHTHSTHSTH",
-    # rz(pi/2^60)
-    "SXTHSTHSTHSTHSTHTHSTHTHTHSTHTHSTHSTHTHTHTHTHTHSTHSTHSTHTHTHTHTHTHSTHSTHSTHSTHSTHTHTHSTHSTHSTHSTHSTHTHTHSTHTHSTHSTHSTHTHSTHTHSTHTHTHTHTHTHSTHTHSTHTHTHSTHSTHSTHTHTHTHSTHTHSTHTHTHTHTHSTHTHSTHSTHSTHTHSTHSTHSTHTHSTHSTHTHTHTHSTHSTHSTHTHSTHSTHSTHTHTHTHSTHTHSTHSTHSTHTHTHTHSTHTHTHTHTHTHTHSTHTHSTHSTHSTHSTHSTHTHTHTHTHTHTHTHSTHTHSTHTHTHSTHSTHTHSTHSTHSTHSTHTHTHSTHTHTHTHSTHSTHSTHSTHTHTHTHTHSTHTHSTHTHTHTHTHTHTHSTHTHSTHSTHSTHTHTHSTHSTHSTHSTHSTHTHTHTHTHTHSTHSTHTHTHSTHTHSTHSTHSTHTHTHTHSTHTHTHSTHTHSTHTHSTHSTHSTHSTHTHTHSTHTHSTHSTHTHSTHTHSTHSTHSTHTHTHTHSTHTHTHTHTHSTHTHSTHTHTHSTHTHTHTHTHTHTHSTHSTHTHSTHSTHSTHSTHSTHTHSTHSTHTHTHSTHSTHTHSTHSTHSTHTHSTHTHSTHSTHTHSTHSTHTHSTHSTHTHTHTHSTHTHSTHTHSTHSTHTHSTHSTHSTHSTHSTHTHSTHSTHSTHTHTHTHTHTHTHTHTHTHTHSTHTHSTHTHSTHTHSTHTHTHTHTHSTHTHTHTHTHSTHSTHSTHSTHTHTHSTHTHSTHSTHTHTHSTHSTHSTHTHSTHTHSTHTHTHTHSTHSTHTHSTHTHSTHTHSTHSTHTHTHSTHTHSTHSTHTHTHTHTHTHSTHTHTHSTHTHSTHSTHSTHSTHSTHSTHSTHSTHTHTHSTHSTHSTHTHSTHSTHTHSTHTHSTHTHSTHTHSTHTHTHSTHTHSTHSTHTHTHSTHTHTHSTHSTHTHTHSTHTHSTHTHSTHTHTHSTHSTHSTHTHSTHTHSTHSTHSTHS",
-    # rz(pi/2^61)
-    "STHSTHSTHTHSTHSTHSTHSTHSTHSTHSTHSTHTHTHSTHSTHSTHSTHTHTHTHTHTHSTHSTHTHTHSTHTHSTHTHSTHTHSTHSTHSTHTHSTHTHTHTHSTHTHTHSTHTHTHSTHSTHTHSTHTHSTHTHTHTHSTHTHTHSTHSTHTHSTHTHTHSTHSTHTHSTHTHSTHTHSTHSTHTHTHTHTHTHSTHTHSTHTHTHTHTHSTHTHSTHTHTHSTHTHSTHTHSTHTHTHSTHSTHTHSTHSTHSTHTHTHSTHSTHTHSTHSTHSTHTHSTHTHSTHTHTHTHSTHSTHSTHTHSTHSTHTHSTHTHTHSTHTHTHSTHTHSTHSTHTHTHTHSTHTHSTHTHTHTHTHSTHTHTHTHTHTHTHTHSTHSTHTHTHTHSTHSTHSTHSTHTHSTHSTHTHSTHSTHSTHTHSTHSTHTHSTHSTHTHSTHSTHTHTHSTHTHSTHTHTHTHSTHTHSTHSTHTHSTHSTHSTHTHSTHTHSTHSTHTHSTHSTHSTHSTHTHTHTHTHSTHTHTHTHTHSTHTHSTHTHSTHTHTHSTHTHSTHTHTHTHTHSTHSTHTHSTHSTHSTHTHTHTHTHSTHTHSTHSTHTHTHTHSTHSTHSTHTHTHTHSTHTHSTHSTHTHSTHTHTHSTHTHTHSTHSTHSTHSTHSTHSTHTHTHSTHTHSTHTHTHSTHSTHSTHSTHSTHTHTHTHSTHSTHSTHTHTHTHTHTHTHSTHTHSTHTHSTHSTHSTHSTHSTHSTHTHTHTHSTHSTHTHTHTHTHTHSTHSTHSTHTHSTHTHSTHTHTHSTHSTHTHSTHSTHSTHTHSTHSTHSTHTHTHSTHTHSTHTHTHSTHTHSTHTHTHSTHSTHSTHTHSTHSTHSTHTHSTHSTHTHTHSTHTHTHSTHSTHTHSTHSTHTHSTHTHSTHTHTHSTHSTHTHTHTHTHSTHSTHSTHSTHSTHTHTHSTHSTHTHSTHSTHTHSTHTHSTHSTHSTHTHSTHSTHSTHTHTHTHSTHTHTHSTHTHTHTHTHTHTHSTHTH",
-    # rz(pi/2^62)
-    "SSHSTHSTHTHSTHTHTHSTHSTHSTHSTHTHSTHSTHSTHTHTHTHTHSTHSTHSTHTHTHTHSTHSTHTHSTHSTHSTHTHSTHTHTHTHTHTHSTHSTHTHSTHSTHTHTHSTHSTHTHSTHSTHSTHSTHSTHTHSTHSTHSTHTHSTHTHTHTHTHTHSTHSTHSTHSTHTHSTHTHSTHTHSTHTHSTHTHTHSTHTHSTHSTHTHTHTHTHTHTHTHTHSTHTHTHTHTHTHTHTHSTHSTHTHTHTHSTHSTHSTHTHTHTHTHSTHSTHTHTHTHTHSTHTHTHTHTHTHTHSTHTHSTHTHSTHTHTHSTHTHTHTHSTHSTHTHTHSTHTHTHTHSTHSTHTHTHTHTHSTHSTHTHTHSTHSTHTHTHTHSTHTHSTHSTHSTHTHTHSTHTHTHTHTHTHSTHTHSTHSTHTHTHSTHSTHTHSTHTHSTHSTHSTHSTHTHTHTHTHSTHTHTHSTHTHTHTHSTHTHSTHSTHSTHTHSTHSTHTHTHSTHTHTHTHSTHTHTHSTHSTHTHTHSTHTHSTHTHTHTHTHTHTHTHSTHSTHSTHTHTHTHTHSTHTHTHSTHTHTHSTHSTHTHSTHTHSTHSTHTHTHSTHSTHSTHSTHSTHTHSTHSTHTHTHSTHSTHSTHSTHTHSTHTHSTHSTHSTHSTHSTHTHTHTHTHTHSTHSTHTHTHSTHSTHSTHTHSTHSTHTHSTHTHTHTHTHTHTHTHSTHTHTHTHSTHTHSTHTHSTHSTHTHSTHTHTHSTHTHTHSTHSTHSTHTHSTHSTHTHTHSTHTHSTHSTHSTHSTHTHTHSTHTHSTHTHSTHTHTHTHTHSTHSTHTHTHTHTHSTHTHTHSTHSTHSTHTHSTHTHTHSTHTHTHSTHSTHSTHSTHSTHTHSTHSTHSTHTHTHTHTHSTHTHTHSTHTHSTHSTHSTHTHSTHSTHSTHTHTHTHSTHSTHSTHSTHTHTHTHSTHTHTHTHTHSTHSTHTHTHTHTHSTHSTHTHSTHSTHTHTHTHTHTHSTH",
-    # rz(pi/2^63)
-    "SSSXTHTHSTHSTHSTHTHTHTHSTHSTHSTHSTHTHSTHSTHSTHTHTHSTHSTHTHSTHSTHTHSTHTHTHSTHSTHSTHSTHTHSTHSTHTHSTHSTHTHTHSTHSTHTHTHTHSTHSTHTHTHTHTHTHTHTHTHSTHSTHTHTHTHTHSTHSTHTHSTHSTHTHTHSTHTHSTHTHSTHSTHTHTHTHSTHSTHSTHSTHTHSTHTHTHSTHTHSTHSTHTHTHTHTHSTHSTHTHSTHTHTHTHTHTHSTHTHTHSTHSTHTHSTHTHSTHSTHSTHSTHTHTHTHSTHTHTHTHTHSTHTHSTHSTHSTHSTHSTHSTHSTHTHSTHSTHTHSTHTHSTHTHTHTHSTHTHSTHTHTHSTHTHTHTHSTHSTHSTHTHTHTHTHTHTHTHSTHTHSTHSTHTHTHSTHTHTHTHSTHTHTHSTHTHTHSTHTHSTHSTHSTHTHTHSTHSTHTHSTHSTHSTHSTHTHSTHSTHSTHTHTHSTHSTHSTHSTHSTHTHTHSTHSTHTHSTHTHSTHSTHSTHSTHTHSTHTHSTHSTHSTHSTHSTHSTHTHTHTHTHTHSTHTHTHTHTHSTHTHSTHSTHSTHSTHTHSTHTHTHSTHTHSTHTHTHTHSTHSTHTHSTHSTHSTHTHSTHTHTHSTHSTHTHSTHTHSTHSTHTHTHTHSTHTHTHTHTHTHTHSTHTHTHTHSTHSTHTHSTHTHTHTHSTHTHTHSTHSTHTHSTHSTHSTHTHSTHSTHSTHSTHSTHSTHTHTHTHSTHSTHSTHSTHTHTHTHSTHTHSTHTHSTHTHSTHSTHTHTHTHSTHSTHSTHTHSTHSTHSTHTHTHTHTHSTHSTHSTHTHTHTHSTHSTHTHTHTHTHSTHTHTHTHTHTHTHSTHSTHSTHSTHSTHSTHSTHSTHTHSTHTHTHTHTHSTHSTHTHSTHTHTHSTHSTHTHTHTHSTHTHSTHTHSTHTHSTHTHTHTHSTHSTHSTHTHSTHTHTHSTHTHTHSTHSTHSTHTHSTHSTHSTHSTHSTHTHSTHSTHSTHSTHTHTH",
-    # rz(pi/2^64)
-    "HTHTHTHTHSTHSTHSTHSTHTHTHSTHTHTHSTHTHTHSTHTHSTHTHTHTHSTHTHTHTHSTHSTHSTHTHTHTHSTHSTHSTHSTHTHTHSTHTHSTHTHSTHTHTHSTHTHSTHTHTHSTHSTHSTHTHTHSTHTHSTHSTHTHTHSTHTHTHSTHTHTHTHSTHTHSTHSTHSTHSTHSTHSTHSTHTHSTHTHSTHSTHSTHTHTHSTHTHTHSTHSTHSTHTHTHTHTHTHTHSTHSTHTHSTHTHTHSTHSTHTHTHTHSTHSTHSTHTHTHTHTHTHTHSTHTHTHTHTHSTHSTHSTHSTHSTHSTHTHSTHSTHTHSTHTHTHTHTHSTHTHTHTHTHTHSTHTHSTHTHSTHTHSTHTHSTHTHTHTHTHTHSTHTHSTHSTHTHTHTHTHTHSTHTHSTHSTHSTHSTHSTHSTHTHSTHTHSTHSTHSTHTHSTHTHTHSTHSTHSTHTHTHTHTHTHSTHTHTHTHTHSTHTHSTHSTHTHTHSTHTHTHSTHTHSTHSTHTHTHSTHTHTHSTHTHSTHTHSTHTHSTHSTHSTHSTHTHTHTHTHTHSTHTHSTHTHTHSTHSTHSTHTHSTHSTHSTHSTHTHSTHSTHTHSTHTHTHTHTHSTHSTHTHSTHTHSTHTHTHSTHSTHSTHTHTHSTHTHTHTHSTHTHTHTHSTHSTHSTHSTHSTHSTHTHSTHTHTHTHSTHSTHTHTHSTHSTHSTHSTHSTHSTHSTHSTHSTHSTHSTHSTHSTHSTHTHTHSTHSTHSTHTHTHSTHSTHTHSTHTHSTHTHTHTHTHTHSTHSTHTHTHTHSTHTHTHSTHTHTHSTHSTHTHSTHTHSTHSTHTHSTHTHTHTHTHTHSTHTHSTHSTHTHSTHTHTHTHTHTHTHTHSTHTHTHTHSTHTHTHSTHTHSTHSTHSTHSTHTHSTHTHSTHTHSTHSTHTHTHTHTHTHTHTHSTHTHTHTHTHSTHTHTHTHSTHTHSTHTHTHTHSTHSTHSTHTHSTHSTHTHSTHTHSTHTHTHSTHTHS",
-    # rz(pi/2^65)
-    "SSSXHTHSTHTHTHSTHTHTHSTHSTHSTHSTHTHSTHTHTHSTHTHTHTHTHSTHTHSTHTHSTHSTHSTHSTHTHSTHTHTHSTHSTHSTHTHTHSTHTHTHSTHSTHTHSTHTHTHSTHSTHTHSTHTHSTHSTHTHSTHTHSTHTHSTHSTHSTHTHSTHTHSTHTHTHTHTHSTHSTHSTHSTHTHTHSTHSTHSTHSTHTHSTHTHTHTHSTHSTHSTHTHTHSTHTHSTHSTHTHTHTHSTHSTHTHTHTHSTHSTHTHSTHTHTHTHSTHTHTHTHSTHTHTHTHTHSTHSTHTHTHTHTHTHSTHTHTHSTHTHTHTHSTHTHTHSTHSTHTHSTHSTHTHTHSTHSTHSTHTHTHTHSTHTHTHTHSTHTHSTHTHTHSTHSTHTHSTHSTHTHTHTHTHSTHTHTHTHTHTHSTHSTHTHSTHTHSTHTHTHTHTHTHTHSTHTHTHTHTHSTHTHSTHSTHTHTHSTHSTHSTHSTHTHSTHSTHTHSTHTHSTHTHTHSTHTHTHTHTHSTHTHSTHSTHTHTHSTHSTHTHTHSTHSTHTHSTHTHTHTHSTHTHSTHTHTHTHTHSTHSTHTHSTHSTHTHTHSTHTHTHTHSTHTHSTHSTHSTHSTHTHTHTHTHTHSTHTHTHSTHTHTHSTHTHTHSTHTHTHSTHSTHSTHSTHTHTHSTHTHSTHTHSTHSTHSTHSTHSTHSTHSTHSTHSTHSTHSTHSTHTHSTHSTHSTHSTHTHSTHSTHTHSTHSTHSTHSTHTHTHTHSTHSTHTHTHTHTHSTHSTHTHSTHSTHSTHTHSTHTHSTHSTHTHSTHTHSTHTHSTHSTHTHTHSTHSTHTHSTHTHTHSTHTHTHTHSTHSTHTHSTHTHTHSTHTHTHSTHSTHSTHSTHSTHTHSTHTHSTHSTHTHSTHSTHSTHTHTHTHSTHTHTHTHSTHSTHTHSTHSTHTHTHTHTHSTHSTHTHSTHSTHSTHSTHSTHSTHSTHSTHTHTHSTHSTHTHSTHSTHTHSTHSTHTHSTHSTHTHSTHSTHSTHST",
-    # rz(pi/2^66)
-    "SSHTHTHTHTHTHTHTHSTHSTHTHTHSTHSTHTHSTHSTHSTHTHSTHTHTHTHTHTHSTHTHSTHTHSTHTHTHSTHSTHSTHTHTHSTHSTHTHTHSTHSTHTHTHTHSTHTHTHSTHTHSTHSTHTHSTHTHSTHSTHTHTHTHTHSTHTHSTHSTHSTHSTHSTHSTHSTHTHSTHTHSTHSTHSTHSTHTHTHSTHSTHSTHSTHTHSTHSTHSTHSTHTHTHTHSTHTHSTHSTHSTHTHSTHSTHTHSTHSTHSTHSTHTHTHTHTHTHTHSTHSTHTHTHTHTHTHTHSTHSTHTHSTHTHSTHTHSTHSTHTHSTHSTHTHTHTHTHTHTHSTHTHTHSTHSTHTHSTHTHTHSTHTHTHTHTHTHTHSTHTHSTHSTHSTHSTHTHTHSTHSTHTHSTHSTHSTHTHTHTHSTHTHSTHSTHSTHSTHSTHTHSTHSTHSTHTHTHSTHTHTHTHSTHSTHSTHTHSTHTHTHTHTHSTHTHSTHSTHTHTHSTHSTHSTHSTHSTHSTHSTHSTHSTHSTHSTHTHSTHTHSTHTHSTHSTHTHTHTHTHTHSTHTHTHSTHSTHSTHTHSTHTHSTHSTHSTHTHTHTHTHTHSTHSTHTHSTHTHTHSTHSTHSTHTHTHSTHTHSTHTHTHTHTHSTHTHTHSTHTHTHSTHTHTHSTHTHSTHTHTHSTHTHTHTHTHSTHSTHTHTHSTHTHTHSTHSTHSTHTHTHSTHSTHSTHSTHTHTHTHSTHSTHTHSTHSTHTHSTHTHTHSTHSTHTHTHSTHTHSTHTHSTHTHTHSTHSTHTHTHSTHSTHTHTHSTHTHSTHSTHSTHSTHTHTHTHSTHSTHTHTHTHSTHTHTHTHSTHSTHTHTHTHSTHSTHTHSTHTHTHSTHTHSTHTHTHSTHTHSTHSTHTHSTHTHTHTHSTHTHTHSTHTHSTHTHTHTHTHTHSTHSTHSTHSTHTHSTHTHTHTHSTHSTHSTHSTHTHTHSTHSTHSTHTHTHSTHTHTHSTHSTHTHTHSTHTHTHSTHSTHSTHS",
-    # rz(pi/2^67)
-    "SSSXHTHSTHSTHTHTHTHSTHSTHSTHSTHSTHSTHSTHTHTHSTHSTHTHTHTHSTHTHTHTHSTHTHTHSTHTHSTHTHSTHSTHSTHSTHTHSTHSTHSTHTHTHSTHSTHTHSTHSTHSTHSTHTHTHSTHSTHTHSTHSTHTHTHSTHTHSTHTHSTHSTHTHTHSTHSTHSTHSTHTHTHTHSTHTHTHSTHSTHSTHTHTHSTHSTHTHTHTHTHTHSTHSTHSTHSTHSTHTHTHTHSTHTHSTHSTHTHSTHSTHSTHSTHTHSTHTHTHTHTHSTHTHSTHSTHSTHTHTHSTHSTHTHSTHTHSTHSTHSTHTHTHSTHSTHTHSTHTHSTHTHTHSTHTHTHSTHSTHTHSTHTHSTHTHTHSTHTHTHTHTHSTHTHSTHTHSTHSTHTHSTHSTHTHSTHSTHSTHSTHSTHTHTHSTHSTHSTHSTHSTHSTHTHSTHTHTHSTHSTHSTHTHTHSTHTHSTHSTHTHTHTHSTHSTHTHSTHSTHTHSTHSTHTHSTHSTHTHTHSTHTHTHSTHSTHSTHSTHSTHSTHTHTHTHSTHTHTHTHSTHTHSTHSTHTHSTHSTHSTHSTHSTHTHSTHSTHTHSTHSTHTHSTHTHSTHSTHSTHSTHSTHSTHTHTHSTHSTHSTHTHSTHSTHSTHTHTHSTHTHSTHSTHSTHTHSTHSTHTHTHSTHTHTHTHTHTHTHTHSTHTHSTHSTHTHSTHSTHSTHSTHTHSTHTHTHTHTHTHSTHSTHSTHSTHTHTHTHTHTHTHTHTHSTHSTHTHSTHSTHTHTHSTHTHTHTHSTHTHSTHSTHTHTHTHTHSTHTHSTHSTHTHSTHTHSTHSTHSTHTHTHTHSTHTHSTHSTHSTHSTHSTHTHSTHSTHTHSTHSTHSTHSTHSTHTHTHSTHSTHTHSTHTHSTHTHSTHTHSTHTHSTHSTHSTHSTHSTHSTHTHSTHSTHSTHSTHTHSTHSTHSTHTHSTHSTHSTHSTHTHSTHTHSTHSTHTHTHSTHSTHSTHSTHSTHSTHSTHSTHTHSTHTHSTHSTHSTHTHTHSTHTHSTHSTHTHSTHTH",
-    # rz(pi/2^68)
-    "SSSHSTHSTHTHTHSTHSTHTHTHSTHTHSTHSTHTHTHSTHSTHSTHTHTHSTHSTHSTHTHSTHTHTHSTHSTHSTHTHSTHTHSTHSTHSTHTHSTHTHTHSTHTHTHSTHTHSTHSTHSTHTHTHSTHSTHSTHTHSTHSTHSTHSTHTHSTHTHTHSTHSTHSTHTHSTHTHTHSTHSTHSTHSTHSTHTHSTHSTHTHTHTHSTHSTHTHSTHSTHSTHSTHTHTHSTHTHTHSTHSTHSTHTHSTHSTHSTHTHSTHTHTHSTHTHTHSTHSTHTHTHSTHTHTHSTHTHTHSTHSTHTHSTHTHSTHSTHSTHTHSTHTHSTHTHSTHSTHSTHSTHTHSTHTHTHTHSTHSTHTHTHTHTHTHSTHTHTHTHTHSTHTHTHTHTHTHTHSTHSTHTHTHSTHTHTHTHSTHTHSTHSTHTHTHSTHSTHSTHSTHSTHSTHTHSTHSTHSTHSTHTHTHSTHTHSTHTHTHTHSTHSTHSTHTHSTHTHTHSTHTHTHSTHSTHSTHTHSTHSTHTHTHSTHTHSTHTHSTHTHTHTHSTHSTHSTHSTHSTHTHSTHSTHTHTHSTHTHSTHTHSTHSTHTHSTHSTHSTHSTHSTHTHTHTHTHSTHTHTHTHTHSTHTHTHSTHTHSTHTHSTHSTHSTHTHSTHSTHSTHTHSTHSTHSTHTHSTHTHTHSTHTHSTHTHSTHSTHSTHTHTHSTHTHTHSTHTHTHSTHSTHSTHTHSTHSTHTHSTHTHSTHSTHTHSTHSTHSTHSTHSTHTHTHSTHSTHSTHSTHSTHSTHSTHSTHTHSTHTHTHSTHTHSTHTHTHSTHSTHSTHTHSTHSTHSTHTHSTHSTHTHSTHTHSTHSTHSTHSTHSTHTHTHTHSTHSTHSTHSTHSTHSTHSTHSTHTHSTHSTHSTHTHSTHTHTHTHSTHTHTHTHSTHSTHSTHTHTHTHTHTHTHSTHTHTHSTHTHTHSTHTHSTHTHTHTHSTHSTHTHTHSTHSTHSTHTHTHTHTHSTHTHSTHSTHTHSTHSTHTHTHSTHSTHTHSTHSTHTHSTHTHSTHSTHTHSTHS",
-    # rz(pi/2^69)
-    "SSXTHSTHSTHTHTHSTHTHSTHSTHSTHTHTHSTHSTHSTHTHTHSTHSTHSTHSTHTHTHSTHSTHSTHSTHTHSTHTHSTHSTHTHTHSTHTHSTHSTHSTHSTHTHSTHSTHSTHTHSTHSTHTHTHTHTHSTHTHSTHTHTHTHTHTHTHTHTHTHTHTHSTHTHTHTHSTHTHSTHTHSTHSTHSTHTHTHSTHSTHTHTHTHSTHTHTHSTHSTHTHTHSTHSTHSTHTHTHTHSTHSTHSTHSTHSTHSTHTHSTHTHTHSTHTHSTHTHSTHSTHTHTHTHSTHSTHTHTHSTHSTHSTHTHSTHTHTHSTHTHSTHSTHSTHTHSTHTHTHTHTHSTHSTHTHTHTHTHSTHTHSTHSTHTHTHTHSTHSTHTHSTHTHTHTHTHSTHTHTHTHSTHTHTHTHTHSTHTHTHSTHSTHTHSTHSTHTHSTHTHSTHTHSTHTHTHSTHSTHSTHTHSTHTHSTHSTHSTHTHSTHTHSTHTHTHTHSTHTHTHTHTHTHSTHTHSTHSTHSTHTHTHSTHSTHSTHTHSTHTHSTHTHTHTHSTHTHTHTHSTHSTHTHTHTHSTHSTHTHSTHSTHSTHTHSTHTHTHTHSTHTHSTHTHTHTHTHTHTHTHTHTHSTHSTHSTHSTHTHTHTHTHSTHTHTHTHTHSTHSTHSTHSTHSTHSTHTHTHTHTHSTHSTHTHSTHTHTHSTHTHTHSTHSTHTHTHSTHTHTHTHTHSTHSTHSTHTHSTHSTHSTHTHSTHSTHSTHTHSTHSTHSTHTHSTHTHTHTHTHTHSTHTHTHTHSTHTHTHSTHTHTHTHTHSTHSTHSTHSTHSTHSTHTHTHSTHSTHSTHTHSTHTHTHTHTHTHSTHSTHTHSTHTHSTHTHSTHTHSTHSTHSTHTHTHTHSTHTHTHTHSTHSTHSTHSTHSTHSTHSTHTHSTHTHSTHTHSTHSTHTHTHSTHSTHTHTHTHTHSTHSTHTHSTHSTHSTHSTHSTHSTHTHSTHTHSTHSTHTHSTHTHTHTHSTHSTHSTHTHSTHTHTH",
-    # rz(pi/2^70)
-    "HTHTHTHSTHSTHTHTHSTHSTHSTHTHSTHTHTHSTHTHSTHSTHTHTHSTHTHSTHTHSTHTHTHTHTHTHTHTHSTHSTHSTHTHSTHSTHSTHTHSTHSTHSTHSTHTHTHSTHSTHTHSTHTHTHSTHSTHSTHTHTHTHTHTHTHTHTHSTHTHSTHTHTHTHTHTHTHSTHSTHSTHSTHTHTHSTHTHSTHTHSTHSTHTHTHTHSTHSTHSTHSTHTHSTHTHSTHTHSTHSTHSTHSTHTHSTHSTHSTHTHSTHSTHTHSTHTHTHTHTHTHTHTHTHSTHTHTHSTHSTHSTHSTHTHTHTHTHTHTHTHTHSTHTHTHSTHTHTHSTHTHSTHSTHSTHTHSTHTHSTHSTHSTHSTHSTHTHTHTHSTHSTHTHSTHTHSTHTHTHSTHTHTHSTHTHSTHTHSTHTHSTHSTHSTHTHSTHSTHTHTHTHTHTHSTHTHTHSTHSTHTHTHSTHTHSTHSTHTHSTHTHSTHTHTHSTHTHTHSTHSTHTHTHSTHTHTHTHTHTHSTHTHTHSTHSTHSTHSTHTHSTHSTHSTHSTHTHTHSTHTHTHTHTHTHTHTHSTHSTHTHSTHTHSTHTHSTHSTHSTHSTHTHTHSTHSTHSTHSTHTHTHTHSTHTHSTHSTHSTHSTHTHSTHSTHTHTHSTHSTHSTHTHSTHSTHTHTHTHSTHTHSTHTHTHSTHSTHTHTHTHTHTHTHTHTHTHTHTHTHTHSTHTHTHSTHTHTHTHTHTHSTHSTHTHSTHSTHSTHTHTHSTHTHTHTHSTHSTHSTHSTHSTHTHSTHTHSTHTHSTHTHTHTHTHSTHTHSTHTHSTHSTHSTHTHTHSTHTHTHSTHSTHTHTHSTHSTHSTHSTHTHSTHSTHTHTHSTHSTHTHSTHTHSTHTHSTHSTHSTHSTHTHSTHTHSTHSTHTHSTHSTHSTHTHTHTHSTHSTHTHSTHSTHSTHSTHTHTHSTHSTHTHSTHTHSTHSTHSTHTHTHSTHTHTHSTHSTHTHSTHSTHTHSTHSTHTHSTHTHSTHS",
-    # rz(pi/2^71)
-    "HTHTHTHSTHSTHSTHSTHSTHSTHSTHTHSTHSTHTHSTHTHSTHSTHTHSTHTHTHSTHSTHTHTHSTHTHSTHSTHTHSTHTHTHTHTHTHSTHSTHSTHSTHSTHTHSTHTHSTHSTHTHTHSTHTHTHTHSTHTHSTHSTHTHTHSTHSTHSTHSTHSTHSTHTHTHSTHSTHTHTHSTHTHTHSTHSTHSTHTHSTHSTHSTHTHSTHSTHTHSTHTHSTHSTHTHTHSTHSTHTHSTHSTHSTHSTHSTHSTHSTHTHTHSTHSTHSTHTHSTHSTHSTHSTHTHSTHSTHTHTHTHSTHSTHTHTHSTHSTHSTHSTHSTHTHSTHTHTHTHSTHTHTHSTHSTHSTHSTHSTHSTHTHSTHTHSTHTHTHSTHTHSTHSTHSTHTHTHTHSTHTHTHSTHSTHSTHSTHTHTHTHSTHSTHSTHSTHSTHSTHTHTHSTHSTHSTHSTHSTHSTHTHSTHTHSTHSTHTHSTHSTHTHTHTHSTHSTHTHSTHSTHSTHTHSTHSTHTHTHTHSTHSTHTHTHTHTHSTHSTHTHSTHSTHTHSTHSTHSTHSTHSTHTHTHTHSTHSTHTHSTHTHSTHTHTHSTHTHTHSTHSTHTHTHSTHTHTHTHSTHTHSTHTHTHSTHTHSTHTHSTHTHTHSTHSTHSTHSTHTHSTHSTHSTHTHTHTHTHSTHSTHTHTHSTHSTHTHTHTHSTHTHTHTHSTHSTHSTHSTHSTHSTHSTHTHSTHSTHSTHTHSTHSTHSTHSTHTHTHTHSTHTHSTHTHSTHSTHTHSTHTHSTHSTHTHSTHSTHSTHTHTHTHTHSTHTHSTHSTHSTHTHSTHSTHSTHTHTHSTHSTHTHTHTHTHTHTHSTHTHTHTHSTHSTHTHSTHSTHSTHSTHSTHTHTHTHSTHSTHTHSTHSTHTHSTHSTHTHTHTHTHTHSTHTHSTHSTHSTHTHSTHSTHSTHTHSTHSTHTHSTHTHSTHSTHTHTHTHSTHSTHSTHTHTHTHTHTHTHSTHSTHTHTHTHSTHSTHTHTHTHSTHTHSTHTHSTHTHTHSTHTHTHSTH",
-    # rz(pi/2^72)
-    "SSHSTHSTHTHTHTHTHTHSTHTHTHTHTHSTHTHTHTHTHTHTHSTHSTHSTHSTHTHSTHTHTHSTHTHTHSTHTHTHSTHSTHTHSTHTHSTHSTHSTHTHSTHSTHSTHTHSTHTHSTHSTHSTHTHSTHTHTHSTHTHTHTHSTHTHSTHSTHSTHSTHSTHSTHSTHTHSTHTHTHTHSTHSTHTHTHTHTHTHSTHTHSTHSTHTHTHTHTHTHTHTHSTHSTHSTHTHSTHSTHSTHSTHTHTHSTHTHTHSTHSTHTHTHTHSTHTHTHSTHSTHSTHSTHSTHTHTHSTHSTHSTHTHTHTHSTHTHTHSTHSTHTHSTHSTHSTHTHSTHTHSTHSTHSTHTHSTHTHTHSTHSTHSTHSTHSTHTHTHSTHSTHTHTHTHTHSTHTHSTHSTHSTHTHSTHTHTHSTHTHTHTHSTHTHSTHTHTHTHTHTHSTHSTHSTHSTHSTHSTHTHTHTHSTHTHSTHTHTHSTHSTHSTHTHSTHSTHTHSTHTHTHTHSTHTHTHSTHSTHTHTHSTHTHTHTHSTHTHSTHTHSTHTHSTHTHTHSTHTHTHTHTHTHSTHTHTHSTHTHTHTHSTHTHSTHTHSTHSTHTHSTHTHTHSTHTHSTHSTHTHSTHSTHSTHSTHTHTHSTHSTHTHSTHSTHTHSTHTHSTHSTHSTHSTHTHSTHTHSTHTHSTHSTHSTHTHSTHSTHSTHSTHSTHTHSTHSTHTHTHTHTHTHSTHTHSTHTHSTHSTHTHTHSTHSTHTHSTHTHSTHTHTHSTHSTHSTHTHSTHSTHSTHTHTHSTHSTHSTHTHTHTHSTHTHSTHSTHSTHSTHTHTHSTHTHTHTHSTHTHSTHSTHSTHTHTHSTHSTHSTHSTHSTHTHSTHTHTHSTHTHSTHTHSTHTHTHSTHTHTHSTHTHTHTHSTHTHSTHSTHSTHSTHSTHTHTHTHTHSTHSTHSTHTHTHSTHSTHTHSTHSTHSTHTHSTHSTHTHTHSTHTHSTHSTHTHSTHSTHTHSTHTHTHSTHSTHSTHTHSTHTHTHTHSTHTH",
-    # rz(pi/2^73)
-    "SXTHTHTHTHSTHTHTHSTHSTHSTHTHSTHSTHTHSTHTHTHTHTHTHTHSTHTHSTHTHSTHTHSTHTHTHSTHSTHTHSTHTHSTHSTHSTHSTHTHTHTHSTHTHSTHSTHSTHTHTHSTHTHTHTHTHSTHSTHTHSTHTHTHTHSTHTHSTHSTHSTHSTHSTHSTHTHTHTHSTHTHTHTHSTHTHSTHTHSTHSTHSTHSTHTHSTHSTHSTHSTHSTHSTHSTHTHTHSTHSTHTHSTHTHTHSTHTHTHTHTHTHSTHSTHTHTHSTHSTHTHTHTHSTHTHSTHTHSTHSTHSTHSTHTHSTHTHTHSTHSTHTHSTHSTHTHTHSTHSTHSTHTHSTHSTHSTHTHSTHSTHSTHTHTHSTHTHTHTHSTHTHSTHTHTHSTHSTHSTHTHSTHSTHTHTHSTHSTHTHSTHSTHTHSTHTHTHSTHSTHSTHTHSTHTHSTHSTHTHSTHTHTHTHTHTHSTHSTHTHSTHTHTHTHTHTHTHSTHSTHTHTHTHSTHTHTHTHSTHTHSTHTHSTHSTHTHTHTHSTHTHTHTHSTHSTHTHTHTHTHSTHSTHTHTHTHTHSTHSTHSTHTHTHTHTHTHTHTHSTHTHTHSTHTHSTHSTHTHSTHSTHSTHTHTHTHTHSTHTHSTHSTHSTHSTHSTHSTHSTHSTHTHSTHSTHSTHTHSTHSTHTHTHTHSTHSTHTHSTHSTHTHSTHTHSTHSTHTHSTHSTHTHSTHSTHTHTHSTHSTHTHSTHTHSTHTHTHSTHSTHTHSTHSTHTHSTHTHTHSTHTHSTHTHSTHSTHTHSTHTHTHSTHTHTHTHTHTHSTHSTHTHTHSTHSTHSTHSTHTHTHTHSTHTHSTHTHSTHTHSTHTHTHTHSTHSTHSTHTHSTHTHSTHSTHSTHSTHTHTHSTHSTHSTHTHTHTHSTHSTHSTHSTHTHSTHSTHTHTHSTHSTHSTHTHSTHTHTHSTHTHTHTHSTHTHTHTHSTHTHTHSTHTHSTHTHTHTHTHTHSTHSTHSTHSTHTHTHSTHSTHTHSTHS",
-    # rz(pi/2^74)
-    "HTHTHTHSTHTHSTHTHSTHSTHSTHTHSTHSTHSTHSTHSTHSTHSTHSTHSTHSTHTHSTHSTHSTHTHTHSTHSTHSTHSTHTHTHTHSTHSTHSTHSTHSTHSTHTHTHSTHTHTHSTHSTHSTHSTHTHTHTHTHTHTHTHTHSTHSTHSTHTHTHTHTHSTHTHSTHSTHTHTHSTHSTHTHTHTHTHTHTHSTHTHSTHSTHSTHSTHSTHTHTHTHTHSTHSTHSTHTHTHSTHTHSTHSTHTHTHTHTHSTHTHSTHSTHSTHSTHSTHSTHSTHTHTHTHSTHTHSTHTHSTHSTHTHSTHSTHTHTHSTHTHSTHTHSTHTHSTHSTHSTHTHSTHSTHSTHSTHTHSTHSTHSTHSTHTHTHSTHTHTHSTHSTHSTHTHTHSTHTHSTHSTHSTHSTHTHTHSTHTHTHSTHTHSTHSTHSTHTHTHTHSTHSTHTHTHTHTHSTHTHSTHTHSTHTHSTHTHTHTHTHSTHTHSTHSTHSTHTHTHSTHTHTHTHSTHTHSTHSTHSTHTHSTHTHSTHTHSTHTHSTHSTHSTHTHSTHSTHTHSTHSTHTHSTHTHTHTHSTHTHSTHTHTHTHSTHTHTHTHTHTHSTHSTHSTHSTHSTHTHSTHTHSTHTHTHSTHTHTHSTHSTHSTHSTHSTHTHSTHTHSTHTHTHSTHSTHTHTHSTHSTHTHSTHTHSTHTHTHTHSTHTHTHTHTHTHTHSTHSTHTHSTHTHTHTHSTHSTHTHSTHSTHSTHSTHSTHTHSTHTHTHTHTHTHTHSTHTHSTHTHSTHSTHTHTHTHTHTHSTHTHTHSTHSTHSTHSTHTHSTHTHSTHTHSTHSTHTHSTHSTHTHSTHSTHSTHTHTHTHTHTHTHTHTHTHTHSTHTHSTHSTHTHSTHTHSTHTHSTHSTHTHSTHSTHSTHTHTHSTHTHSTHTHSTHTHSTHTHTHSTHSTHTHSTHTHSTHSTHSTHSTHTHTHTHSTHTHSTHTHTHTHTHTHTHTHSTHTHTHTHTHTHTHTHTHTHTHSTHSTHTHSTHSTHTHS",
-    # rz(pi/2^75)
-    "SSSHSTHSTHTHTHTHTHSTHTHSTHSTHSTHSTHSTHTHSTHSTHSTHSTHTHTHSTHTHSTHSTHTHSTHTHTHSTHSTHTHTHTHTHTHSTHTHSTHTHTHTHTHSTHTHSTHSTHSTHTHSTHSTHTHTHSTHSTHSTHSTHTHTHTHSTHSTHSTHTHTHSTHSTHTHTHTHSTHSTHTHTHSTHTHSTHTHSTHTHTHTHTHTHTHSTHTHTHTHSTHTHTHSTHSTHSTHTHTHTHTHSTHTHTHSTHSTHTHSTHSTHTHTHSTHTHTHSTHSTHSTHSTHSTHTHTHSTHSTHTHSTHTHSTHSTHSTHSTHTHTHSTHTHTHTHSTHTHTHSTHSTHSTHSTHTHSTHSTHSTHSTHSTHSTHSTHSTHTHSTHTHTHSTHSTHTHTHSTHSTHSTHTHSTHSTHSTHTHSTHSTHTHTHTHTHSTHTHSTHTHTHTHTHSTHSTHSTHSTHTHSTHTHTHSTHTHSTHSTHTHTHSTHSTHSTHSTHSTHSTHSTHTHTHSTHSTHTHTHTHTHSTHSTHSTHSTHTHTHSTHTHTHTHSTHSTHTHSTHTHSTHTHSTHSTHTHTHSTHSTHTHSTHSTHTHSTHSTHTHSTHTHSTHSTHTHTHSTHSTHSTHTHTHTHTHTHTHSTHTHTHTHSTHTHTHTHTHSTHTHTHTHSTHTHSTHTHSTHSTHTHSTHSTHSTHTHTHSTHSTHSTHSTHSTHSTHTHTHTHTHSTHSTHTHSTHSTHSTHTHSTHSTHSTHTHTHTHTHTHSTHSTHTHSTHSTHSTHTHTHTHSTHSTHTHTHTHSTHSTHTHSTHSTHSTHTHSTHSTHTHTHSTHSTHSTHTHTHTHSTHSTHSTHSTHSTHSTHTHTHTHTHSTHSTHTHTHSTHSTHTHTHTHTHTHSTHTHTHTHSTHSTHSTHSTHSTHTHSTHSTHTHTHSTHTHSTHTHTHTHSTHSTHSTHSTHTHTHSTHSTHSTHTHTHTHTHSTHSTHTHTHTHTHSTHTHTHSTHTHTHSTHSTHSTHTHSTHSTHSTHSTHTHSTHTHTHTHTHTHSTHTHTHSTH",
-    # rz(pi/2^76)
-    "HSTHSTHTHTHSTHSTHSTHSTHSTHTHTHSTHSTHTHTHSTHSTHTHSTHSTHTHTHTHSTHTHSTHSTHSTHSTHSTHSTHTHTHSTHSTHSTHSTHTHSTHTHTHTHTHSTHSTHTHTHSTHTHTHSTHTHTHSTHTHTHTHTHSTHSTHTHSTHTHSTHSTHSTHTHTHTHTHTHTHTHSTHSTHTHSTHSTHTHTHTHSTHSTHSTHTHSTHSTHTHSTHSTHSTHTHSTHSTHTHSTHTHTHSTHSTHTHSTHSTHTHTHSTHTHTHTHTHSTHSTHTHSTHTHTHSTHTHTHSTHTHSTHTHSTHSTHSTHSTHTHTHSTHSTHSTHSTHSTHSTHSTHSTHSTHTHSTHTHTHTHTHSTHSTHTHTHSTHSTHTHSTHSTHSTHSTHSTHTHTHTHTHTHTHSTHSTHTHTHSTHTHSTHSTHTHSTHSTHSTHSTHSTHTHSTHTHSTHSTHSTHSTHTHTHTHTHTHTHTHTHTHTHTHSTHTHSTHTHTHTHTHSTHTHTHSTHSTHTHSTHSTHSTHSTHTHTHTHSTHSTHSTHSTHTHTHTHTHSTHTHTHSTHTHTHSTHTHSTHSTHTHSTHSTHSTHSTHTHTHSTHSTHSTHSTHSTHTHSTHTHTHSTHSTHTHTHTHTHTHSTHSTHSTHSTHSTHTHTHSTHTHTHSTHSTHTHTHSTHTHSTHSTHSTHTHTHTHSTHSTHTHSTHTHSTHSTHSTHTHTHTHSTHTHTHTHSTHTHTHSTHTHTHTHSTHTHSTHTHTHTHSTHSTHTHSTHTHTHTHSTHTHSTHTHSTHSTHTHTHTHSTHTHTHTHSTHSTHSTHSTHSTHSTHSTHTHTHSTHTHSTHTHTHTHSTHTHTHTHTHTHSTHSTHTHTHSTHTHSTHTHSTHSTHTHSTHSTHTHSTHSTHTHSTHTHTHTHTHTHTHSTHSTHSTHSTHTHSTHSTHSTHSTHTHSTHTHSTHTHSTHSTHTHSTHTHTHTHTHSTHSTHTHSTHTHTHTHSTHTHSTHSTHSTHTHTHSTHTHSTHTHTHSTHS",
-    # rz(pi/2^77)
-    "SSXTHTHSTHSTHSTHSTHTHTHSTHTHTHTHSTHTHTHTHSTHTHSTHSTHSTHSTHSTHTHSTHTHSTHSTHTHSTHSTHTHSTHSTHSTHTHTHTHSTHTHSTHTHSTHSTHTHSTHSTHSTHTHSTHSTHSTHSTHSTHTHTHSTHSTHTHSTHTHSTHSTHSTHTHTHTHTHSTHSTHTHSTHSTHSTHSTHSTHTHTHTHTHTHSTHTHTHTHTHSTHTHTHSTHSTHTHSTHTHSTHSTHSTHTHTHTHSTHTHSTHSTHSTHTHTHTHSTHTHSTHTHSTHSTHSTHSTHTHSTHSTHSTHTHTHSTHSTHTHSTHTHSTHSTHTHTHSTHSTHTHSTHTHSTHSTHSTHSTHSTHSTHTHSTHSTHSTHSTHSTHTHSTHTHTHTHSTHSTHTHTHSTHSTHTHSTHTHSTHSTHTHSTHSTHSTHSTHTHSTHTHTHSTHSTHSTHSTHSTHTHTHSTHSTHSTHSTHTHSTHSTHSTHTHTHTHTHSTHTHSTHSTHTHTHTHSTHTHTHTHSTHTHTHSTHTHSTHTHSTHSTHSTHSTHTHTHSTHTHSTHSTHSTHSTHSTHTHTHTHSTHSTHTHSTHSTHTHTHTHTHTHSTHSTHTHSTHSTHTHTHTHSTHSTHTHSTHTHTHTHTHSTHSTHSTHSTHSTHSTHTHSTHSTHSTHSTHSTHSTHTHSTHSTHTHSTHSTHTHSTHTHSTHTHSTHSTHSTHSTHTHSTHTHTHSTHSTHSTHSTHTHSTHTHTHTHTHTHTHSTHSTHSTHTHSTHTHSTHTHTHTHSTHSTHSTHTHSTHSTHSTHSTHSTHSTHTHTHTHTHTHTHTHTHSTHSTHSTHSTHTHSTHTHSTHSTHTHTHSTHTHSTHTHSTHTHSTHTHTHSTHTHSTHSTHTHSTHSTHTHSTHTHTHTHTHTHTHSTHTHTHTHSTHTHTHTHTHTHSTHSTHSTHTHTHTHSTHTHTHSTHSTHSTHSTHTHSTHTHSTHSTHTHSTHSTHTHSTHSTHSTHTHTHSTHSTHSTHSTHSTHTHSTHSTHTHSTHTHTHSTHSTHSTHTHTHSTHSTHSTHSTHTHSTHTH",
-    # rz(pi/2^78)
-    "SSHSTHTHSTHTHSTHSTHSTHSTHSTHSTHTHTHSTHTHTHSTHTHSTHTHTHSTHSTHSTHSTHSTHSTHSTHSTHTHSTHTHSTHSTHTHTHSTHTHTHSTHTHSTHSTHTHSTHTHSTHTHTHSTHSTHTHSTHSTHTHTHTHSTHSTHTHSTHSTHTHSTHTHSTHSTHTHSTHSTHTHSTHTHSTHSTHTHSTHTHSTHTHTHTHSTHTHTHSTHSTHTHTHTHTHTHTHTHTHSTHTHTHTHSTHTHSTHSTHTHTHSTHTHTHTHTHTHTHSTHSTHTHTHSTHSTHSTHTHTHSTHTHTHTHSTHTHSTHSTHSTHSTHTHTHSTHTHTHSTHTHSTHSTHTHTHSTHTHTHSTHSTHSTHTHTHTHSTHSTHSTHSTHSTHSTHTHTHTHSTHSTHTHSTHSTHTHSTHTHTHTHTHTHSTHTHSTHTHTHTHSTHTHTHSTHTHTHTHTHSTHTHSTHSTHTHSTHSTHSTHSTHSTHSTHTHTHSTHSTHSTHTHTHSTHSTHSTHTHSTHTHTHSTHSTHTHTHSTHSTHSTHTHSTHTHTHSTHSTHTHSTHSTHSTHTHTHTHTHSTHTHSTHTHTHSTHSTHSTHTHSTHSTHSTHSTHTHSTHSTHTHSTHSTHTHSTHSTHTHTHTHTHTHTHSTHSTHSTHTHTHTHTHTHTHSTHSTHTHSTHSTHTHSTHSTHSTHTHTHSTHTHSTHTHSTHSTHTHSTHTHSTHTHSTHSTHSTHTHSTHSTHTHTHSTHTHTHSTHSTHTHSTHSTHSTHSTHSTHTHSTHTHSTHTHTHSTHTHSTHSTHTHSTHTHTHSTHSTHSTHTHSTHTHTHSTHTHSTHSTHSTHSTHTHTHSTHTHTHTHSTHTHSTHSTHTHSTHTHSTHSTHSTHTHSTHSTHTHTHTHSTHSTHTHSTHSTHTHSTHTHTHSTHSTHTHSTHTHSTHTHSTHSTHTHTHSTHTHSTHTHSTHTHTHTHTHSTHTHTHSTHSTHSTHTHTHTHSTHSTHSTHSTHTHTHTHTHSTHSTHTHTHSTHSTHTHSTHSTHTHTHTHTHSTHTHST",
-    # rz(pi/2^79)
-    "XHTHTHTHTHTHSTHSTHSTHSTHTHSTHTHTHTHSTHSTHSTHTHTHSTHSTHTHSTHTHSTHSTHSTHTHSTHSTHSTHTHTHTHSTHTHSTHTHSTHSTHSTHSTHSTHTHTHTHSTHSTHSTHSTHSTHSTHSTHSTHSTHSTHTHTHTHSTHSTHTHSTHTHTHTHTHTHTHSTHSTHSTHTHTHTHTHTHSTHTHSTHSTHTHTHTHTHTHTHTHTHTHSTHTHSTHSTHTHTHSTHTHSTHSTHSTHSTHSTHSTHSTHSTHTHTHTHTHTHSTHSTHSTHSTHTHTHTHSTHSTHTHSTHSTHTHSTHTHSTHTHTHSTHTHTHTHSTHSTHSTHSTHSTHSTHSTHTHSTHSTHSTHTHSTHSTHSTHSTHSTHTHTHSTHTHTHTHSTHTHTHTHTHSTHSTHTHTHTHTHSTHTHTHTHTHTHTHTHTHTHTHTHSTHTHTHTHSTHSTHTHTHTHSTHSTHTHTHTHTHTHSTHSTHTHSTHTHSTHSTHSTHSTHTHTHSTHTHSTHTHTHTHSTHSTHTHTHSTHSTHTHTHSTHSTHTHSTHSTHSTHSTHTHSTHTHTHSTHSTHTHSTHTHSTHTHSTHSTHSTHTHTHSTHSTHTHSTHTHTHTHTHTHSTHSTHSTHTHSTHSTHSTHSTHTHSTHSTHTHTHTHTHTHSTHTHTHTHTHTHTHSTHSTHSTHTHSTHSTHSTHTHSTHTHSTHSTHTHSTHSTHTHTHTHTHSTHTHTHTHSTHTHTHSTHSTHTHSTHSTHSTHTHSTHTHSTHTHTHTHSTHTHSTHSTHTHSTHSTHTHTHTHTHSTHTHTHSTHTHTHSTHSTHSTHTHTHTHSTHTHTHSTHTHSTHTHTHTHSTHTHTHTHTHSTHSTHTHSTHSTHSTHSTHSTHTHTHSTHSTHTHSTHSTHSTHTHTHTHTHTHTHSTHTHTHTHSTHTHSTHTHTHSTHSTHTHSTHTHTHSTHTHSTHTHSTHTHSTHTHSTHTHSTHSTHTHTHSTHTHTHSTHTHTHTHSTHTHTHSTHTHSTHSTHSTHSTHSTHSTHSTHSTHTHST",
-    # rz(pi/2^80)
-    "SSXHTHSTHTHSTHSTHTHSTHTHSTHSTHSTHSTHTHTHTHSTHSTHSTHSTHTHSTHSTHSTHSTHTHTHSTHTHSTHTHTHTHSTHSTHSTHTHTHTHSTHTHTHSTHTHTHSTHTHTHTHTHTHTHSTHSTHTHTHTHSTHTHTHSTHSTHSTHTHSTHSTHSTHTHTHTHTHTHTHTHSTHSTHSTHTHSTHSTHTHTHTHTHTHSTHTHSTHSTHTHTHTHSTHTHTHSTHSTHSTHTHSTHTHSTHTHSTHSTHTHTHSTHSTHSTHTHSTHTHTHSTHSTHSTHTHSTHSTHTHTHSTHSTHSTHTHTHTHTHSTHTHSTHTHTHTHSTHTHSTHSTHTHTHSTHTHTHSTHTHSTHTHTHSTHTHSTHSTHTHTHSTHTHSTHTHSTHTHTHTHTHSTHTHSTHTHSTHSTHSTHTHTHTHTHSTHSTHTHSTHSTHTHTHSTHSTHTHTHSTHSTHTHTHTHSTHTHTHTHSTHTHTHSTHSTHSTHSTHSTHTHTHTHSTHSTHTHTHTHSTHSTHTHTHTHTHSTHTHSTHTHSTHTHSTHSTHTHTHSTHTHTHTHTHTHTHSTHTHSTHSTHSTHSTHTHTHTHTHSTHSTHSTHTHTHSTHSTHTHTHSTHTHSTHSTHTHSTHTHSTHSTHTHSTHSTHTHTHSTHSTHTHTHTHSTHSTHTHSTHSTHSTHTHTHSTHTHSTHSTHSTHTHTHSTHSTHSTHTHTHTHSTHTHSTHTHTHTHSTHTHTHTHSTHTHSTHTHTHTHSTHTHTHSTHTHTHTHSTHTHSTHTHTHSTHTHTHSTHSTHTHTHSTHTHSTHSTHTHSTHSTHSTHSTHTHTHSTHSTHTHSTHSTHTHSTHSTHTHTHTHTHSTHTHTHSTHSTHSTHSTHTHSTHSTHTHTHSTHTHSTHTHTHSTHTHTHSTHTHSTHTHSTHSTHTHSTHTHSTHSTHTHTHTHSTHTHSTHSTHSTHTHTHSTHSTHTHSTHSTHTHSTHTHTHSTHTHTHSTHSTHTHTHSTHSTHSTHTHTHTHSTHSTHTHSTHSTHTHSTHTHTHTHST",
-    # rz(pi/2^81)
-    "SSXTHSTHSTHSTHSTHTHTHTHSTHTHTHTHSTHSTHTHTHSTHSTHSTHSTHTHSTHSTHSTHTHSTHTHSTHTHTHSTHTHTHTHTHTHTHSTHTHTHTHSTHTHTHSTHSTHTHSTHSTHSTHSTHSTHTHTHSTHSTHSTHTHSTHTHTHTHSTHTHTHSTHSTHTHTHTHSTHTHTHTHTHSTHTHSTHSTHTHTHTHTHTHSTHTHTHSTHTHTHSTHTHTHTHTHTHSTHTHTHSTHTHSTHSTHTHSTHSTHTHTHSTHSTHTHTHTHSTHSTHTHSTHSTHTHTHSTHSTHSTHSTHTHTHSTHTHTHSTHSTHTHSTHSTHTHSTHSTHSTHTHSTHTHTHTHTHTHSTHTHSTHSTHTHSTHTHTHTHSTHSTHTHTHSTHTHTHSTHTHSTHSTHTHSTHSTHSTHSTHSTHTHTHTHSTHSTHSTHTHSTHTHSTHTHSTHTHSTHTHTHSTHTHTHTHSTHTHTHSTHSTHTHTHSTHSTHTHSTHTHTHSTHTHSTHTHTHSTHTHSTHSTHSTHTHTHSTHTHSTHTHSTHSTHSTHTHTHSTHSTHSTHTHSTHSTHTHTHTHSTHSTHSTHSTHTHSTHSTHTHTHSTHSTHTHSTHTHSTHSTHTHSTHTHTHSTHTHSTHTHSTHSTHTHTHSTHSTHTHSTHSTHTHSTHTHTHTHSTHTHTHSTHSTHTHSTHSTHTHTHSTHTHSTHSTHTHTHSTHTHTHSTHTHSTHSTHSTHTHTHSTHSTHSTHTHTHSTHTHSTHSTHTHTHTHSTHSTHTHTHSTHTHSTHSTHSTHSTHSTHTHSTHTHSTHSTHTHSTHTHTHSTHSTHTHSTHTHTHTHTHSTHTHSTHSTHSTHSTHTHTHTHSTHSTHTHSTHTHTHSTHSTHSTHTHTHTHSTHSTHSTHTHTHTHSTHTHTHTHSTHSTHSTHSTHSTHTHTHSTHSTHTHTHSTHSTHTHSTHTHSTHSTHTHSTHSTHSTHSTHSTHTHTHSTHSTHTHTHTHTHTHSTHSTHSTHSTHSTHSTHTHTHTHTHTHTHSTHTHSTHTHSTHSTHSTHTHTHSTH",
-    # rz(pi/2^82)
-    "STHSTHTHTHSTHTHTHTHTHSTHTHSTHTHTHTHSTHTHTHTHTHSTHTHTHSTHTHTHTHTHTHSTHSTHTHSTHSTHSTHTHSTHSTHTHSTHSTHTHTHSTHSTHSTHTHSTHSTHTHTHSTHTHSTHSTHTHTHSTHTHSTHTHSTHTHTHTHTHSTHSTHTHSTHSTHTHTHTHSTHTHTHTHSTHTHTHSTHTHTHTHTHSTHSTHSTHTHTHSTHSTHTHTHSTHTHTHSTHTHTHSTHTHTHSTHSTHTHTHTHSTHSTHTHTHSTHSTHTHSTHSTHTHSTHTHSTHSTHTHTHTHTHSTHTHTHTHSTHSTHTHTHSTHSTHSTHTHSTHTHTHSTHSTHSTHSTHSTHTHSTHSTHTHTHSTHTHSTHTHSTHSTHTHTHSTHTHTHTHTHTHTHTHSTHTHSTHTHSTHSTHTHTHTHSTHTHTHTHSTHTHTHTHSTHTHSTHTHTHSTHTHTHSTHSTHSTHTHSTHTHSTHSTHSTHSTHTHSTHSTHTHSTHTHTHTHSTHTHTHSTHSTHTHSTHTHSTHTHTHTHSTHSTHTHSTHTHTHSTHTHSTHSTHTHTHTHSTHTHTHTHSTHSTHTHSTHSTHSTHTHTHTHTHTHTHSTHSTHTHSTHSTHTHTHSTHSTHTHTHTHSTHSTHSTHTHTHSTHSTHTHTHTHTHTHTHTHSTHTHSTHSTHSTHSTHTHSTHTHTHTHTHTHSTHSTHTHTHSTHSTHSTHTHSTHTHTHSTHTHSTHTHSTHTHSTHTHTHSTHSTHTHTHTHSTHTHTHTHTHTHSTHSTHSTHTHSTHTHSTHSTHSTHSTHTHSTHTHSTHSTHSTHTHTHTHTHTHTHSTHSTHSTHTHTHTHSTHTHTHTHTHTHSTHTHSTHSTHTHSTHTHTHTHTHTHSTHSTHSTHSTHSTHSTHSTHSTHTHTHTHSTHTHSTHTHTHSTHSTHSTHSTHTHSTHTHTHSTHSTHSTHTHTHTHSTHTHTHSTHTHTHSTHTHSTHTHTHTHSTHTHTHTHSTHTHTHTHSTHTHSTHTHSTHTHSTHTHSTHSTHTHSTHSTH",
-    # rz(pi/2^83)
-    "SSSXHTHSTHTHSTHSTHTHTHTHTHTHTHSTHSTHSTHSTHSTHSTHSTHSTHTHTHTHTHSTHTHSTHSTHSTHTHTHSTHTHTHSTHSTHSTHTHTHTHSTHSTHSTHSTHTHTHSTHSTHSTHSTHSTHSTHTHTHSTHSTHTHTHSTHTHTHSTHTHTHTHTHTHTHTHSTHTHTHTHTHTHTHSTHSTHSTHSTHSTHSTHSTHSTHSTHTHSTHSTHTHSTHSTHSTHTHSTHTHSTHSTHTHSTHSTHSTHSTHSTHTHTHSTHSTHTHTHTHTHSTHTHTHSTHTHTHSTHSTHTHSTHSTHSTHSTHTHTHSTHSTHSTHSTHTHSTHSTHTHSTHTHTHTHSTHTHSTHTHSTHSTHTHSTHTHTHSTHSTHSTHSTHSTHTHSTHTHSTHTHSTHSTHTHSTHSTHSTHTHTHSTHTHTHSTHTHTHSTHTHTHTHSTHTHSTHTHTHSTHSTHSTHTHTHSTHTHSTHTHSTHSTHTHTHSTHSTHSTHTHSTHTHTHTHSTHSTHTHTHTHSTHTHSTHTHSTHSTHTHTHTHTHTHTHSTHSTHTHTHTHTHSTHTHTHTHSTHTHSTHTHTHTHSTHSTHTHTHTHSTHTHTHTHTHTHTHSTHTHSTHTHTHTHSTHSTHSTHSTHSTHTHTHTHSTHTHTHTHSTHTHSTHSTHTHSTHSTHSTHSTHTHTHTHSTHTHTHSTHSTHSTHTHSTHTHTHTHSTHTHSTHTHSTHTHTHTHTHSTHTHTHSTHSTHTHSTHSTHSTHSTHTHTHSTHTHTHTHTHTHSTHSTHTHTHSTHTHTHTHTHSTHTHSTHTHSTHTHSTHTHTHSTHSTHSTHSTHSTHSTHTHSTHSTHTHSTHTHSTHTHSTHTHSTHSTHTHSTHTHSTHSTHSTHTHSTHSTHSTHTHSTHTHTHSTHSTHSTHSTHTHTHTHSTHSTHSTHTHTHTHSTHTHSTHTHSTHSTHTHTHSTHTHTHSTHSTHTHTHTHTHTHSTHTHSTHSTHTHSTHTHSTHSTHTHSTHSTHSTHTHSTHSTHSTHSTHTHSTHSTHSTHTHTHTHTHSTHTHTHSTHTHTHSTH",
-    # rz(pi/2^84)
-    "XHTHSTHTHSTHSTHTHSTHTHSTHSTHTHSTHSTHTHSTHTHSTHSTHSTHTHTHTHTHSTHTHTHSTHSTHTHSTHTHTHSTHSTHSTHSTHTHTHSTHTHTHSTHTHSTHSTHTHTHSTHSTHTHSTHTHTHTHTHSTHTHSTHSTHTHSTHTHSTHTHTHSTHSTHTHSTHTHTHSTHTHSTHSTHSTHSTHSTHTHSTHTHSTHSTHTHTHSTHTHSTHTHTHSTHSTHTHSTHSTHTHTHTHSTHTHSTHSTHTHTHSTHSTHSTHSTHTHSTHSTHSTHSTHSTHTHTHSTHSTHTHTHSTHTHTHSTHTHSTHSTHSTHTHTHTHTHTHSTHTHTHSTHTHTHSTHSTHTHSTHSTHTHSTHSTHSTHSTHSTHSTHSTHTHSTHSTHTHTHSTHTHSTHTHTHSTHSTHSTHTHSTHSTHSTHSTHTHTHSTHSTHSTHSTHSTHSTHSTHSTHSTHTHSTHTHTHSTHTHSTHTHSTHSTHSTHTHSTHTHSTHSTHTHTHSTHSTHSTHTHSTHTHTHTHTHTHSTHTHSTHSTHSTHSTHSTHTHSTHTHTHSTHTHSTHSTHTHSTHSTHSTHTHTHSTHTHTHTHTHTHTHTHTHSTHTHTHTHTHTHSTHSTHTHTHSTHSTHSTHSTHTHSTHTHTHSTHSTHTHSTHSTHSTHTHTHSTHSTHTHTHTHSTHSTHSTHTHSTHTHSTHTHSTHTHTHTHTHSTHTHSTHSTHTHSTHSTHSTHTHTHSTHSTHTHSTHTHSTHSTHTHTHSTHSTHSTHTHTHSTHSTHSTHTHSTHTHTHSTHSTHSTHTHSTHSTHSTHTHTHSTHSTHTHTHSTHTHSTHTHSTHTHSTHTHTHTHTHSTHTHSTHSTHSTHSTHSTHSTHTHSTHSTHTHTHSTHTHTHSTHSTHTHSTHSTHSTHTHTHTHSTHSTHTHSTHTHSTHTHSTHTHSTHSTHTHTHTHTHTHSTHSTHSTHSTHSTHSTHTHTHTHSTHTHTHTHSTHTHSTHTHSTHTHSTHTHSTHSTHTHSTHSTHSTHSTHTHSTHTHSTHTHSTHSTHSTHSTHSTHSTHTHTHSTHSTHTHSTHSTHTHTHSTHSTHSTHS",
-    # rz(pi/2^85)
-    "SSTHTHTHTHTHSTHTHSTHTHTHTHSTHSTHTHSTHSTHSTHSTHTHTHTHSTHTHSTHTHSTHTHSTHTHSTHSTHSTHTHTHTHTHTHSTHSTHSTHSTHSTHSTHSTHSTHSTHSTHTHSTHSTHTHSTHSTHSTHTHTHTHSTHTHTHSTHSTHSTHTHTHSTHSTHSTHSTHTHTHSTHSTHSTHSTHSTHSTHTHSTHTHTHTHSTHSTHSTHTHSTHTHTHSTHTHSTHSTHSTHSTHSTHSTHTHTHSTHTHSTHTHSTHSTHSTHSTHSTHTHSTHSTHSTHTHSTHSTHTHSTHTHTHSTHTHTHTHSTHSTHSTHSTHTHSTHTHSTHTHTHTHSTHTHSTHSTHSTHSTHTHSTHTHSTHSTHSTHTHTHSTHSTHSTHSTHSTHTHSTHTHSTHTHTHSTHTHSTHTHTHSTHTHTHSTHSTHTHSTHSTHSTHSTHSTHSTHSTHTHTHTHTHSTHTHTHSTHTHSTHSTHTHSTHTHTHTHSTHSTHTHTHTHSTHSTHTHSTHSTHTHSTHSTHSTHTHSTHTHTHTHTHTHTHSTHTHTHSTHTHSTHSTHSTHSTHSTHTHTHSTHSTHSTHTHTHSTHTHTHTHSTHSTHTHSTHTHSTHTHSTHTHTHSTHSTHTHSTHSTHSTHTHSTHTHTHSTHTHTHSTHTHSTHSTHTHTHSTHSTHSTHTHSTHSTHSTHSTHTHTHTHTHSTHSTHSTHSTHSTHTHTHSTHTHTHTHTHTHTHSTHTHSTHTHTHSTHSTHTHTHTHSTHSTHTHTHTHTHTHTHTHSTHTHSTHSTHSTHTHTHSTHTHTHSTHSTHTHSTHTHSTHSTHSTHSTHSTHTHSTHSTHTHTHSTHTHSTHSTHSTHSTHTHSTHTHSTHTHTHSTHTHTHTHTHTHTHTHSTHTHTHTHSTHTHTHSTHSTHSTHSTHTHTHTHSTHSTHTHTHTHTHTHSTHSTHSTHTHTHTHTHSTHTHTHSTHTHTHSTHTHTHSTHSTHTHTHTHTHTHSTHTHSTHTHSTHSTHTHSTHSTHTHSTHSTHTHSTHSTHTHTHTHTHSTHTHTHTHTHSTHTHSTHSTHTHSTHSTHSTHTHSTHSTHTHTHTHSTH",
-    # rz(pi/2^86)
-    "XHTHTHSTHSTHSTHSTHTHTHTHTHTHTHSTHSTHSTHSTHTHSTHSTHTHSTHTHTHSTHSTHTHSTHSTHSTHSTHSTHTHSTHSTHTHTHSTHSTHSTHTHSTHTHSTHTHSTHTHTHTHTHTHTHTHSTHTHTHSTHTHTHTHSTHSTHSTHTHSTHSTHSTHSTHSTHSTHTHSTHSTHTHTHSTHSTHTHTHSTHTHSTHTHTHSTHSTHTHTHTHTHTHTHSTHSTHSTHTHTHSTHTHSTHSTHSTHSTHSTHSTHTHTHSTHTHTHTHTHTHSTHTHSTHTHTHSTHTHSTHSTHTHSTHSTHSTHSTHTHTHTHTHSTHSTHSTHSTHTHSTHTHSTHSTHTHSTHSTHTHTHTHSTHTHSTHSTHTHSTHSTHTHTHSTHTHTHTHTHSTHTHTHTHSTHTHTHTHSTHSTHTHTHSTHSTHSTHSTHSTHSTHSTHSTHTHTHTHTHTHTHSTHSTHSTHSTHTHTHTHTHSTHTHSTHSTHSTHSTHTHSTHTHTHTHTHSTHTHTHTHSTHSTHTHSTHTHTHTHTHSTHSTHSTHSTHTHSTHSTHSTHSTHSTHSTHSTHTHTHSTHTHSTHSTHSTHTHSTHSTHTHTHTHSTHSTHTHSTHTHTHSTHSTHTHTHTHSTHSTHTHSTHTHTHTHSTHTHTHSTHSTHTHTHSTHSTHTHTHTHSTHSTHSTHTHSTHSTHSTHTHSTHSTHSTHSTHSTHSTHSTHTHSTHSTHTHSTHSTHTHSTHTHSTHSTHSTHSTHTHTHTHSTHTHSTHTHSTHTHSTHSTHSTHSTHSTHSTHSTHSTHSTHSTHTHTHSTHSTHSTHSTHTHSTHTHSTHSTHTHTHSTHSTHSTHTHTHTHTHSTHSTHSTHTHTHSTHTHTHSTHTHSTHTHTHSTHTHSTHSTHSTHTHSTHTHTHTHSTHSTHSTHTHSTHSTHSTHSTHTHSTHSTHTHSTHTHTHTHSTHTHTHSTHTHSTHTHSTHTHSTHSTHSTHTHTHSTHTHTHTHSTHTHSTHSTHSTHTHSTHTHTHSTHTHTHSTHSTHSTHTHSTHTHTHTHSTHSTHTHTHTHSTHTHTHTHTHTHSTHTHTHTHSTHTHSTHSTHSTHSTHSTHSTHSTHS",
-    # rz(pi/2^87)
-    "SXHSTHSTHSTHTHTHTHSTHSTHTHTHSTHTHSTHTHSTHTHTHSTHTHTHTHSTHSTHSTHSTHSTHSTHSTHSTHTHSTHTHSTHTHSTHSTHSTHTHTHTHSTHTHTHTHSTHTHTHTHTHSTHTHSTHSTHTHTHSTHSTHSTHTHSTHSTHTHSTHTHSTHTHSTHTHSTHTHTHSTHSTHSTHSTHTHSTHTHTHTHSTHSTHTHSTHTHSTHSTHSTHTHTHTHSTHSTHSTHTHTHSTHSTHTHSTHTHTHTHTHSTHSTHSTHTHSTHTHSTHTHSTHSTHSTHSTHTHSTHTHTHTHTHSTHSTHTHTHSTHSTHSTHSTHSTHSTHSTHTHSTHSTHSTHTHSTHSTHTHTHTHSTHSTHTHTHTHTHSTHTHTHSTHSTHSTHTHTHSTHSTHSTHTHSTHSTHSTHTHSTHTHSTHTHSTHTHTHTHTHTHSTHTHTHTHSTHTHSTHTHSTHSTHSTHTHSTHTHTHTHSTHTHSTHSTHSTHTHSTHSTHTHTHSTHTHSTHSTHSTHTHSTHTHSTHSTHTHTHSTHTHSTHSTHSTHSTHSTHTHSTHSTHSTHSTHSTHTHTHSTHSTHSTHSTHSTHTHSTHTHSTHSTHSTHTHTHTHTHTHSTHSTHTHTHTHTHTHTHTHSTHTHTHTHTHTHTHTHSTHTHTHTHSTHTHSTHSTHTHSTHSTHTHTHSTHSTHTHTHTHSTHTHTHTHTHSTHTHSTHTHSTHTHTHTHSTHTHSTHTHTHSTHTHTHSTHSTHSTHSTHSTHSTHSTHSTHTHSTHSTHSTHSTHSTHSTHSTHTHTHTHTHSTHTHSTHTHSTHSTHSTHTHSTHSTHTHSTHSTHTHSTHTHSTHSTHTHSTHSTHTHTHTHSTHTHTHSTHTHTHSTHSTHSTHSTHTHTHTHTHSTHSTHSTHSTHSTHSTHTHTHTHTHTHSTHTHTHTHTHTHTHSTHTHTHSTHTHSTHSTHSTHSTHTHSTHTHTHTHSTHSTHTHTHTHSTHTHTHTHTHSTHSTHTHSTHSTHSTHSTHTHSTHTHTHSTHTHSTHTHTHSTHSTHSTHTHTHTHTHSTHTHSTHTHSTHTHTHTHTHTHTHSTHSTHTHSTH",
-    # rz(pi/2^88)
-    "SHTHSTHSTHTHSTHSTHTHTHTHTHTHTHSTHTHTHSTHSTHSTHSTHSTHTHSTHTHTHSTHSTHSTHTHTHTHTHSTHSTHTHSTHTHTHTHTHSTHTHSTHSTHTHSTHSTHTHTHTHTHSTHTHSTHSTHTHTHSTHSTHSTHTHTHTHTHSTHTHSTHTHSTHTHTHTHSTHSTHSTHSTHSTHTHSTHSTHSTHSTHSTHSTHTHSTHTHTHTHSTHSTHSTHSTHSTHTHTHSTHSTHTHTHSTHSTHSTHSTHTHTHTHSTHSTHSTHTHSTHSTHTHSTHTHSTHSTHSTHTHTHTHSTHSTHTHTHSTHTHTHSTHTHSTHSTHTHSTHTHSTHTHSTHTHSTHTHTHTHSTHSTHSTHTHSTHTHSTHTHTHTHSTHTHTHTHTHSTHTHTHTHTHTHTHSTHSTHTHSTHTHTHSTHTHSTHTHSTHTHTHTHSTHSTHSTHTHTHSTHTHSTHSTHTHSTHSTHTHSTHTHSTHSTHSTHTHSTHTHTHSTHSTHSTHTHTHSTHSTHTHSTHSTHTHTHSTHSTHSTHTHTHSTHSTHSTHTHTHSTHTHTHSTHTHTHSTHSTHTHTHSTHSTHTHTHTHTHTHTHTHSTHSTHTHSTHSTHTHSTHSTHTHSTHTHTHSTHTHTHSTHTHTHTHTHTHTHSTHTHSTHTHTHSTHTHTHTHTHSTHTHSTHTHTHTHSTHSTHSTHSTHTHSTHTHSTHTHTHSTHSTHSTHTHTHSTHTHTHTHTHTHTHTHTHTHTHSTHTHTHSTHTHTHSTHTHSTHTHTHSTHSTHSTHTHSTHSTHTHSTHSTHSTHSTHSTHTHSTHSTHTHTHTHTHSTHSTHSTHTHSTHSTHTHSTHSTHTHSTHSTHSTHSTHTHTHSTHTHTHSTHTHSTHTHTHSTHTHSTHSTHSTHSTHTHSTHSTHSTHSTHSTHTHTHSTHSTHTHSTHSTHSTHTHSTHSTHSTHTHTHTHSTHSTHSTHSTHTHTHSTHTHSTHSTHTHTHSTHTHSTHSTHSTHSTHTHSTHSTHSTHSTHSTHSTHTHSTHTHTHTHTHTHSTHTHTHTHTHTHTHTHTHSTHSTHTHTHTHSTHSTHSTH",
-    # rz(pi/2^89)
-    "SSSTHTHTHSTHSTHTHSTHTHSTHTHTHSTHTHSTHSTHSTHSTHTHSTHSTHTHTHTHSTHSTHSTHSTHSTHSTHSTHTHTHTHSTHSTHTHSTHSTHSTHSTHTHSTHTHTHSTHTHSTHSTHTHTHTHTHTHTHTHSTHTHTHSTHSTHTHSTHTHTHSTHTHSTHTHSTHTHSTHTHTHTHSTHTHTHTHTHSTHSTHSTHSTHSTHTHSTHTHTHSTHTHSTHSTHTHSTHTHSTHSTHSTHSTHTHTHTHSTHTHSTHTHTHTHTHSTHSTHSTHSTHTHSTHTHTHTHTHTHTHSTHTHTHTHTHSTHSTHTHTHSTHTHSTHTHSTHSTHTHSTHSTHTHTHSTHTHSTHSTHSTHSTHTHSTHSTHTHSTHTHSTHSTHTHSTHSTHSTHTHTHSTHSTHSTHSTHTHTHSTHTHSTHTHSTHSTHTHTHTHSTHSTHSTHSTHSTHSTHSTHTHSTHTHSTHTHSTHTHSTHSTHSTHTHTHSTHTHTHTHTHSTHTHSTHSTHSTHSTHTHSTHSTHTHTHSTHTHSTHSTHSTHSTHSTHSTHTHTHTHTHSTHSTHTHSTHTHSTHTHTHTHSTHTHTHSTHTHTHSTHSTHSTHSTHSTHTHTHSTHTHSTHSTHTHSTHSTHSTHSTHTHSTHTHSTHTHSTHSTHSTHSTHSTHSTHSTHTHSTHTHTHTHTHSTHSTHSTHTHTHSTHSTHTHTHTHTHTHSTHSTHTHTHSTHSTHTHSTHSTHTHTHTHTHTHTHTHTHTHTHSTHSTHTHSTHTHTHSTHSTHSTHSTHTHSTHTHSTHSTHSTHTHTHSTHSTHSTHTHSTHSTHSTHTHTHTHSTHTHSTHSTHTHSTHSTHSTHSTHTHSTHTHSTHTHTHSTHSTHSTHSTHSTHSTHSTHSTHSTHTHSTHSTHTHSTHTHSTHSTHTHSTHTHSTHTHTHSTHSTHTHSTHTHTHSTHSTHTHTHSTHSTHTHTHSTHTHSTHSTHSTHSTHTHSTHSTHTHSTHTHTHTHSTHSTHSTHSTHSTHTHTHTHSTHSTHSTHSTHSTHTHSTHSTHTHSTHTHTHTHSTHTHSTHTHSTHTHTHTHTHSTHSTHSTHTHTHTHSTHSTHSTHTHTHSTHTHTHSTHTHTH",
-    # rz(pi/2^90)
-    "SHSTHTHSTHTHSTHSTHTHTHTHTHTHTHSTHSTHSTHSTHSTHTHTHSTHTHSTHTHSTHSTHTHTHTHSTHSTHTHTHTHSTHSTHSTHTHTHTHTHSTHSTHSTHTHTHSTHTHTHTHTHSTHTHSTHSTHTHSTHSTHTHSTHSTHSTHTHSTHTHTHSTHTHTHTHSTHTHTHTHSTHTHTHTHSTHSTHTHTHSTHTHSTHTHTHSTHTHSTHSTHTHSTHSTHTHSTHTHSTHSTHTHTHTHSTHTHSTHTHSTHSTHSTHSTHSTHTHSTHTHTHTHTHTHTHSTHSTHSTHSTHSTHSTHSTHSTHSTHTHSTHTHTHSTHSTHSTHTHSTHTHSTHSTHTHTHTHSTHSTHTHSTHSTHTHTHTHSTHSTHTHSTHTHTHTHTHTHSTHSTHSTHTHTHTHTHSTHTHTHTHSTHSTHTHSTHTHSTHTHTHTHTHSTHTHTHTHSTHTHTHTHTHTHSTHTHTHTHSTHSTHTHTHSTHTHTHSTHTHTHSTHSTHTHTHSTHSTHTHSTHSTHSTHSTHSTHSTHSTHSTHTHSTHSTHSTHSTHTHTHTHTHSTHSTHTHSTHSTHTHTHSTHTHSTHSTHTHTHTHSTHTHTHSTHTHTHTHTHTHSTHSTHSTHTHSTHTHTHSTHTHSTHTHTHSTHTHTHTHSTHSTHSTHSTHTHTHSTHSTHTHTHTHTHSTHTHSTHSTHSTHSTHSTHTHSTHSTHTHSTHSTHSTHSTHSTHSTHTHSTHSTHSTHTHTHTHTHSTHTHTHTHSTHTHTHTHTHSTHTHSTHTHTHSTHTHSTHSTHTHSTHSTHTHSTHSTHTHSTHTHSTHTHSTHTHSTHSTHSTHTHTHSTHTHTHSTHSTHTHSTHTHTHSTHTHSTHTHTHSTHTHSTHTHSTHTHSTHTHTHSTHSTHTHSTHTHSTHSTHSTHTHTHTHTHSTHSTHSTHSTHTHSTHTHSTHTHTHSTHSTHSTHSTHSTHSTHSTHTHTHSTHSTHSTHSTHTHTHSTHTHTHSTHSTHSTHSTHSTHTHSTHTHTHTHSTHTHSTHSTHSTHTHTHSTHTHTHSTHSTHTHTHSTHSTHSTHTHSTHSTHSTHTHTHSTHTHSTHSTHTHSTHSTHTHTHSTH",
-    # rz(pi/2^91)
-    "SXTHTHTHTHTHTHSTHTHSTHTHSTHSTHSTHTHTHTHSTHTHSTHSTHTHTHSTHSTHTHSTHSTHTHTHSTHSTHTHSTHTHTHSTHTHSTHSTHSTHSTHTHSTHSTHSTHTHSTHSTHTHTHTHSTHSTHSTHSTHTHTHTHSTHSTHSTHSTHTHTHSTHTHTHTHSTHSTHTHSTHTHTHSTHSTHSTHSTHTHTHTHSTHSTHSTHTHTHTHTHTHSTHSTHTHSTHSTHTHSTHTHSTHTHTHSTHSTHTHSTHTHTHTHSTHTHSTHSTHSTHTHSTHSTHTHTHTHSTHSTHSTHSTHSTHSTHTHSTHSTHTHTHSTHSTHSTHSTHTHTHSTHSTHTHSTHTHTHSTHSTHTHSTHSTHTHSTHTHSTHSTHTHSTHTHTHSTHSTHSTHSTHTHTHTHSTHTHSTHSTHSTHSTHSTHSTHTHTHSTHSTHTHSTHTHSTHTHSTHSTHTHTHSTHTHSTHSTHSTHSTHTHTHSTHTHSTHSTHTHTHTHSTHSTHTHSTHSTHTHSTHTHTHSTHTHTHTHTHSTHTHTHSTHTHTHSTHTHSTHTHTHTHTHSTHSTHSTHSTHTHTHTHTHTHTHTHTHSTHSTHTHTHSTHSTHTHSTHSTHSTHTHTHSTHSTHTHTHTHTHTHSTHSTHTHTHSTHSTHSTHTHSTHSTHSTHSTHSTHTHTHSTHTHTHSTHSTHTHSTHTHSTHSTHSTHSTHSTHTHTHSTHTHTHSTHTHTHSTHSTHTHTHSTHTHTHSTHSTHTHTHSTHSTHTHTHTHTHTHTHTHSTHTHTHTHTHTHTHSTHTHSTHSTHSTHTHTHSTHTHTHSTHTHTHSTHTHTHTHTHSTHTHSTHTHSTHTHTHTHTHSTHTHSTHSTHTHSTHSTHSTHTHTHSTHTHTHSTHSTHTHTHTHSTHSTHTHSTHSTHSTHTHTHSTHTHTHTHSTHSTHSTHSTHTHSTHTHSTHTHTHTHTHSTHSTHTHSTHSTHTHTHTHSTHTHTHSTHTHTHSTHTHTHSTHSTHTHTHSTHSTHSTHTHTHTHTHSTHSTHTHTHTHTHSTHSTHTHSTHTHTHTHTHSTHTHTHTHTHSTHTHSTHSTHSTHTHSTHTHTHSTHSTHTHSTHTHTHS",
-    # rz(pi/2^92)
-    "SSSTHSTHSTHTHTHSTHTHSTHTHTHTHSTHSTHTHTHSTHSTHTHTHSTHTHTHTHSTHTHSTHSTHTHSTHSTHTHSTHTHTHSTHTHTHTHTHSTHTHSTHTHTHTHSTHSTHTHTHSTHTHSTHTHTHTHSTHTHTHTHSTHTHTHTHSTHSTHSTHSTHSTHTHTHTHSTHSTHTHTHSTHTHTHTHSTHTHSTHSTHSTHTHTHSTHSTHTHTHTHTHTHTHSTHTHTHSTHTHTHSTHTHSTHSTHSTHTHTHSTHTHTHSTHTHSTHSTHTHSTHTHSTHTHTHSTHSTHTHTHTHSTHTHTHSTHSTHSTHTHSTHTHTHTHTHTHTHTHTHSTHTHTHTHSTHSTHSTHSTHTHTHSTHTHSTHTHTHSTHTHTHTHTHSTHSTHSTHTHTHTHSTHTHTHSTHSTHSTHSTHSTHSTHSTHSTHSTHSTHTHTHSTHSTHSTHTHSTHSTHSTHTHSTHTHTHSTHSTHSTHSTHTHTHTHTHSTHTHTHSTHTHSTHSTHSTHTHTHTHTHTHSTHSTHSTHSTHTHTHSTHTHTHTHSTHTHSTHTHSTHSTHTHSTHSTHTHTHTHTHSTHSTHTHSTHSTHTHTHTHTHSTHTHTHTHTHSTHTHSTHSTHSTHSTHSTHSTHSTHSTHSTHTHSTHSTHTHTHSTHTHTHSTHSTHTHSTHTHTHTHSTHSTHTHTHSTHTHTHSTHTHTHTHTHSTHTHTHTHSTHTHTHTHTHTHTHSTHTHSTHTHTHTHTHSTHTHSTHTHSTHSTHTHSTHTHTHSTHSTHTHTHSTHSTHTHTHSTHTHSTHTHTHTHTHSTHSTHTHTHTHTHTHSTHTHSTHTHTHSTHSTHSTHTHTHTHTHSTHSTHTHSTHSTHSTHSTHTHTHTHTHTHTHSTHSTHTHTHSTHSTHTHTHTHTHSTHSTHSTHTHSTHTHSTHSTHSTHSTHTHSTHSTHSTHSTHSTHTHTHTHTHTHTHSTHTHTHTHTHSTHSTHSTHTHSTHSTHSTHSTHTHTHTHSTHTHSTHTHSTHSTHTHSTHSTHTHTHSTHTHSTHSTHSTHSTHTHSTHSTHSTHSTHTHTHSTHTHSTHTHSTHSTHTHSTHSTHSTHTHTH",
-    # rz(pi/2^93)
-    "SSXHSTHTHTHTHTHSTHTHSTHSTHSTHSTHSTHTHTHTHTHSTHTHTHSTHTHSTHSTHTHTHSTHSTHTHSTHSTHSTHTHSTHSTHSTHTHSTHTHTHSTHSTHSTHSTHTHTHTHSTHSTHTHTHSTHSTHTHTHSTHSTHTHSTHSTHSTHSTHSTHSTHSTHSTHSTHSTHSTHTHTHSTHTHSTHTHTHTHTHSTHTHSTHTHSTHSTHSTHTHSTHTHTHTHTHSTHSTHTHTHTHTHSTHTHSTHTHTHTHSTHSTHSTHSTHSTHSTHSTHTHSTHSTHSTHSTHTHTHSTHSTHTHTHSTHTHTHTHTHSTHSTHTHSTHSTHTHTHSTHTHSTHTHTHTHSTHSTHTHTHSTHTHTHTHTHSTHSTHTHSTHTHTHTHSTHTHSTHSTHTHTHSTHSTHTHTHSTHSTHSTHSTHSTHTHTHSTHTHSTHSTHSTHTHSTHSTHSTHSTHTHSTHTHSTHSTHTHTHTHTHTHTHTHSTHSTHSTHTHTHTHSTHTHTHSTHSTHSTHSTHSTHSTHTHSTHSTHSTHTHTHTHSTHSTHSTHSTHTHTHTHSTHSTHSTHTHSTHTHTHTHTHSTHTHTHSTHTHSTHTHSTHTHTHSTHSTHTHTHTHTHSTHSTHTHTHTHSTHSTHSTHSTHTHSTHTHSTHTHSTHSTHTHTHSTHSTHSTHTHTHTHSTHSTHTHSTHSTHSTHTHTHSTHTHSTHSTHSTHSTHSTHTHSTHTHTHSTHSTHSTHTHTHSTHSTHSTHTHTHSTHSTHSTHTHTHSTHSTHSTHSTHTHSTHTHSTHTHTHSTHSTHSTHSTHSTHTHTHTHSTHSTHTHSTHSTHTHSTHTHSTHSTHTHTHSTHSTHSTHTHSTHTHSTHTHTHTHSTHTHTHTHTHTHSTHTHSTHTHTHTHTHSTHTHTHSTHTHSTHSTHTHSTHSTHTHSTHSTHSTHTHTHSTHSTHTHSTHTHTHTHTHTHTHTHTHSTHSTHTHTHTHTHTHTHTHTHTHSTHSTHTHTHSTHTHTHTHSTHSTHTHTHSTHSTHTHTHTHTHTHTHSTHTHTHSTHSTHSTHTHTHTHTHTHSTHSTHTHSTHTHTHTHTHSTHTHTHSTHSTHTHSTHTHTHTHTHSTHTHTHS",
-    # rz(pi/2^94)
-    "SXHSTHSTHTHSTHTHSTHTHTHTHSTHSTHSTHSTHSTHTHTHTHSTHTHTHTHTHTHSTHTHSTHTHTHSTHTHSTHSTHTHTHSTHSTHTHSTHTHTHSTHTHTHTHSTHSTHTHTHSTHTHSTHTHTHTHSTHTHSTHSTHSTHSTHSTHTHSTHTHTHTHSTHSTHTHSTHSTHSTHTHTHSTHSTHTHSTHSTHSTHTHTHTHTHSTHTHSTHTHTHSTHSTHTHTHSTHSTHSTHTHSTHSTHSTHSTHTHTHTHSTHSTHTHTHSTHTHSTHTHTHTHSTHSTHSTHSTHSTHSTHSTHSTHTHSTHSTHSTHTHSTHSTHTHTHTHSTHTHSTHTHSTHTHSTHSTHTHSTHTHTHSTHTHTHTHSTHTHTHSTHTHSTHTHSTHTHSTHSTHTHTHSTHSTHSTHTHSTHSTHSTHSTHSTHSTHSTHSTHTHSTHTHSTHSTHTHSTHSTHSTHTHSTHTHSTHSTHTHTHTHSTHTHTHTHSTHTHSTHTHTHSTHTHTHSTHTHTHSTHTHTHTHTHTHTHSTHSTHSTHTHTHSTHSTHTHSTHSTHTHSTHTHTHTHSTHTHSTHSTHSTHSTHSTHSTHSTHTHSTHTHTHTHSTHSTHSTHTHSTHTHTHSTHTHSTHTHSTHSTHTHSTHSTHTHSTHSTHSTHSTHTHTHTHSTHSTHTHTHSTHTHSTHSTHTHTHTHTHTHTHSTHTHTHTHTHTHSTHTHTHTHSTHTHSTHTHSTHSTHSTHSTHTHSTHSTHSTHSTHTHSTHSTHSTHSTHSTHSTHSTHTHTHTHTHTHSTHSTHSTHSTHTHTHSTHSTHTHTHSTHSTHSTHSTHSTHTHSTHSTHSTHSTHTHTHSTHSTHSTHSTHTHSTHTHTHTHSTHTHTHTHSTHSTHSTHSTHSTHTHTHSTHSTHTHTHTHSTHTHSTHTHTHTHSTHTHSTHTHSTHSTHSTHTHTHSTHTHTHSTHSTHSTHTHSTHSTHSTHSTHSTHSTHSTHSTHTHTHTHTHTHSTHSTHSTHTHSTHSTHSTHSTHTHSTHSTHTHSTHSTHTHTHSTHTHTHTHSTHTHTHSTHTHSTHTHTHSTHSTHTHTHSTHTHSTHTHTHTHSTHTHSTHSTHTHSTHSTHTHSTHTHTHTHTHSTHTHTHSTHTHST",
-    # rz(pi/2^95)
-    "SSHTHSTHTHSTHTHSTHTHTHTHSTHTHSTHTHSTHTHTHSTHTHTHTHTHSTHTHTHSTHTHTHTHSTHTHTHTHTHSTHSTHSTHSTHTHSTHSTHSTHTHTHTHTHSTHSTHSTHTHTHTHSTHTHSTHSTHSTHSTHTHTHSTHSTHTHSTHTHSTHTHTHTHSTHSTHSTHTHSTHTHSTHTHSTHTHTHSTHSTHTHSTHTHTHSTHSTHSTHSTHTHSTHTHTHTHTHTHSTHTHSTHSTHTHSTHSTHSTHTHSTHTHTHTHTHSTHTHTHSTHSTHTHTHTHSTHTHSTHTHSTHTHSTHTHTHSTHSTHTHTHTHSTHSTHSTHTHSTHSTHTHSTHSTHTHTHTHSTHSTHTHSTHTHTHSTHTHTHSTHTHTHTHTHTHSTHTHTHTHSTHTHTHTHTHTHTHTHTHTHTHSTHTHSTHSTHSTHTHTHSTHTHSTHSTHTHSTHTHSTHTHSTHTHSTHTHTHTHTHTHTHSTHSTHTHTHSTHTHSTHSTHSTHTHTHSTHSTHSTHSTHTHSTHSTHTHTHTHTHSTHTHTHSTHTHSTHTHSTHTHTHTHSTHTHTHSTHSTHSTHSTHSTHTHSTHSTHTHSTHTHSTHSTHTHTHSTHSTHSTHSTHSTHSTHTHSTHTHSTHSTHTHTHSTHSTHSTHSTHSTHTHSTHSTHTHTHSTHTHSTHTHSTHSTHTHTHTHSTHTHSTHTHTHSTHTHTHSTHTHTHSTHSTHSTHTHTHSTHSTHSTHSTHSTHTHTHTHSTHSTHTHSTHTHTHTHSTHSTHSTHTHSTHSTHSTHSTHTHSTHSTHTHSTHSTHSTHSTHSTHTHTHTHSTHTHTHSTHTHTHTHSTHTHSTHTHSTHSTHSTHSTHSTHTHSTHSTHSTHTHSTHSTHTHTHSTHSTHTHSTHTHTHSTHSTHTHTHSTHSTHTHSTHSTHSTHSTHSTHTHSTHTHSTHSTHTHSTHSTHSTHSTHTHSTHTHSTHTHTHTHTHTHSTHTHSTHTHSTHTHTHSTHSTHSTHSTHTHTHTHSTHSTHSTHTHSTHSTHSTHSTHTHTHSTHTHSTHTHSTHSTHSTHTHTHTHTHTHSTHSTHTHSTHSTHTHTHSTHTHTHTHSTHTHSTHSTHTHTHTHTHTHTHSTHTHS",
-    # rz(pi/2^96)
-    "SSXHSTHSTHSTHTHSTHTHTHTHSTHTHSTHSTHSTHSTHTHSTHTHTHTHTHSTHTHSTHTHSTHTHTHSTHTHSTHTHSTHTHTHTHSTHSTHSTHSTHSTHSTHTHTHSTHSTHSTHSTHTHSTHSTHSTHSTHSTHTHSTHSTHTHTHSTHTHTHTHSTHSTHTHSTHSTHTHSTHSTHTHTHSTHSTHTHTHTHSTHSTHSTHSTHSTHTHTHTHTHSTHSTHTHTHSTHSTHTHSTHSTHTHTHTHSTHSTHTHTHTHTHSTHTHTHTHSTHSTHSTHSTHSTHSTHSTHSTHSTHSTHTHTHSTHTHTHTHSTHSTHSTHSTHTHSTHSTHSTHTHSTHTHTHTHTHSTHTHSTHTHTHTHSTHSTHSTHSTHTHSTHSTHSTHSTHSTHTHSTHSTHTHTHTHTHSTHSTHTHTHTHSTHSTHSTHTHSTHSTHTHTHSTHSTHSTHSTHSTHSTHSTHSTHSTHTHTHTHTHSTHTHSTHTHSTHSTHSTHTHSTHSTHSTHSTHTHSTHTHSTHTHTHSTHSTHTHSTHTHSTHTHTHTHSTHTHSTHTHTHSTHTHTHSTHTHSTHTHSTHTHSTHTHTHTHSTHSTHSTHTHSTHSTHSTHTHTHTHSTHSTHTHSTHSTHSTHSTHTHSTHTHTHTHSTHSTHTHTHSTHSTHSTHSTHSTHSTHTHTHTHSTHTHSTHTHSTHTHTHTHTHTHSTHSTHTHTHSTHTHSTHTHTHSTHTHSTHTHSTHSTHTHSTHSTHTHTHSTHTHTHTHSTHSTHSTHSTHTHTHTHSTHSTHTHSTHTHTHSTHSTHSTHTHTHSTHTHSTHTHTHTHSTHSTHTHSTHSTHTHTHTHSTHSTHSTHTHTHSTHTHTHTHSTHSTHTHTHSTHTHTHTHSTHSTHTHSTHTHTHSTHTHTHTHTHTHSTHSTHTHTHTHTHTHTHTHSTHTHSTHSTHSTHTHTHSTHTHTHSTHTHSTHTHTHTHTHTHTHSTHTHTHTHTHSTHSTHSTHSTHSTHTHTHTHTHSTHSTHTHTHSTHSTHTHSTHSTHSTHTHTHTHSTHSTHSTHSTHSTHSTHSTHSTHSTHSTHSTHTHTHTHSTHTHSTHTHSTHTHSTHSTHSTHSTHTHSTHTHSTHSTHSTHTHSTHSTHTHSTHTHSTHTHTHS",
-    # rz(pi/2^97)
-    "THSTHSTHTHSTHTHSTHSTHTHTHTHTHSTHTHTHTHTHSTHTHSTHTHSTHSTHSTHSTHSTHSTHSTHTHSTHSTHSTHTHSTHTHSTHSTHTHTHSTHSTHTHTHTHTHTHTHTHTHSTHTHTHTHSTHTHTHSTHSTHSTHTHSTHSTHSTHSTHSTHSTHTHSTHSTHTHSTHSTHSTHSTHSTHSTHSTHSTHTHSTHTHSTHSTHSTHSTHTHTHSTHSTHTHSTHTHTHTHSTHTHTHSTHTHTHSTHTHTHTHTHTHSTHTHTHTHTHTHTHTHTHTHTHTHSTHSTHSTHSTHSTHTHTHTHTHSTHSTHTHSTHTHTHSTHTHTHTHTHTHSTHSTHSTHTHTHTHSTHSTHSTHTHSTHTHTHSTHSTHSTHSTHTHSTHSTHTHTHTHSTHTHSTHSTHTHTHTHTHSTHTHTHTHSTHSTHSTHSTHSTHTHSTHTHTHTHSTHSTHTHTHSTHSTHTHTHTHTHSTHSTHTHTHSTHTHTHSTHSTHTHTHSTHTHSTHSTHSTHSTHSTHSTHTHSTHTHSTHTHSTHTHSTHSTHSTHSTHSTHSTHTHSTHSTHSTHTHTHSTHTHTHSTHSTHTHTHTHSTHTHSTHSTHSTHTHSTHTHTHTHTHSTHSTHTHTHSTHSTHTHTHTHSTHTHSTHTHTHSTHTHTHTHTHSTHTHTHTHTHTHSTHTHTHSTHTHTHSTHSTHTHSTHTHTHTHSTHSTHTHSTHSTHSTHTHTHSTHTHTHSTHTHSTHSTHTHTHTHTHTHSTHSTHSTHTHSTHTHTHTHSTHTHTHSTHTHTHSTHTHTHTHTHSTHSTHSTHTHSTHSTHSTHTHSTHTHTHSTHSTHSTHSTHSTHSTHTHSTHSTHSTHTHTHTHSTHTHSTHSTHSTHTHTHSTHTHTHSTHSTHTHTHTHSTHTHTHTHTHSTHTHSTHTHSTHSTHTHSTHSTHTHSTHSTHSTHSTHTHSTHSTHSTHSTHSTHSTHTHSTHSTHTHTHTHTHTHTHSTHSTHSTHTHSTHTHSTHSTHTHSTHSTHTHTHSTHSTHTHSTHTHSTHSTHTHTHTHTHTHTHTHSTHTHTHTHSTHTHTHSTHSTHSTHTHTHTHTHTHSTHTHSTHTHSTHSTHSTHTHSTHTHTHSTHSTHSTHSTHSTHS",
-    # rz(pi/2^98)
-    "THSTHTHSTHTHTHSTHSTHTHTHSTHSTHTHTHSTHTHSTHSTHTHTHSTHTHTHTHTHSTHTHTHTHTHSTHSTHSTHTHTHSTHSTHSTHTHTHTHSTHTHSTHSTHTHTHSTHSTHTHSTHSTHSTHSTHSTHSTHSTHTHSTHTHTHTHTHSTHTHSTHSTHSTHSTHTHSTHTHSTHSTHSTHTHTHTHSTHSTHSTHTHTHSTHSTHSTHTHTHSTHSTHSTHTHSTHTHTHTHSTHTHSTHSTHTHSTHSTHSTHSTHSTHSTHSTHTHTHSTHSTHSTHSTHSTHSTHTHTHSTHTHSTHTHTHTHSTHSTHSTHTHTHSTHSTHTHTHTHTHSTHTHTHTHTHSTHSTHSTHSTHTHTHTHSTHSTHTHTHSTHSTHTHTHTHTHSTHTHTHSTHSTHTHTHSTHSTHSTHTHSTHSTHTHTHTHTHTHTHSTHTHSTHSTHTHSTHSTHSTHTHTHSTHTHTHTHSTHTHSTHSTHTHTHSTHSTHTHTHTHSTHTHTHSTHSTHTHSTHTHSTHSTHSTHTHTHSTHTHSTHSTHSTHTHSTHSTHTHSTHSTHSTHSTHTHSTHTHTHSTHTHSTHTHSTHSTHTHTHSTHSTHTHSTHSTHTHSTHSTHTHTHTHSTHTHSTHTHTHTHSTHSTHTHTHSTHTHSTHTHTHTHSTHTHTHTHTHTHTHTHTHTHSTHSTHTHSTHSTHSTHTHTHSTHSTHTHSTHSTHSTHTHTHSTHTHTHSTHTHTHTHTHTHTHTHTHSTHSTHSTHTHTHTHTHTHTHTHTHTHSTHSTHTHSTHTHSTHSTHSTHTHSTHTHSTHSTHSTHTHSTHTHTHSTHTHSTHSTHSTHTHSTHTHSTHTHSTHSTHTHTHSTHSTHTHSTHTHTHTHTHSTHSTHSTHSTHTHTHTHTHSTHTHTHSTHSTHTHSTHSTHTHTHSTHSTHSTHTHTHSTHSTHTHSTHTHTHTHTHSTHTHTHSTHSTHSTHSTHTHSTHSTHSTHSTHSTHSTHTHTHTHTHSTHSTHSTHSTHTHTHTHSTHSTHTHTHSTHTHTHSTHSTHSTHSTHSTHTHTHTHTHSTHSTHTHSTHTHSTHTHSTHSTHSTHSTHTHSTHSTHSTHSTHSTHTHSTHTHTHSTHTHTHTHTHSTHTHSTHSTHTHSTH",
-    # rz(pi/2^99)
-    "SHSTHSTHTHTHSTHTHSTHTHSTHTHSTHTHTHTHTHSTHSTHSTHSTHTHSTHSTHTHSTHSTHSTHTHTHSTHTHSTHTHSTHTHTHTHSTHSTHSTHSTHSTHSTHSTHTHSTHTHTHSTHTHSTHSTHTHTHTHTHTHTHTHSTHSTHTHSTHTHTHSTHTHTHSTHSTHTHSTHSTHTHSTHSTHSTHTHTHTHTHSTHSTHTHSTHTHSTHSTHSTHTHTHTHTHTHTHTHTHTHSTHSTHSTHTHTHTHTHTHSTHTHTHSTHSTHTHSTHSTHTHSTHTHTHTHSTHTHSTHTHSTHSTHSTHSTHTHSTHTHTHTHSTHTHTHTHTHSTHTHTHSTHTHSTHTHSTHTHTHSTHTHTHTHSTHSTHSTHSTHTHSTHTHSTHTHSTHSTHTHSTHTHSTHSTHSTHSTHSTHTHTHSTHTHTHTHTHSTHSTHSTHTHSTHTHTHTHSTHSTHSTHSTHTHTHSTHTHSTHSTHSTHTHTHTHTHTHSTHTHTHSTHSTHSTHSTHTHTHSTHTHSTHTHSTHTHSTHTHTHTHTHTHTHTHSTHTHSTHTHTHTHSTHTHSTHSTHTHTHSTHSTHTHSTHSTHTHTHSTHSTHSTHTHTHSTHSTHTHTHSTHSTHTHTHTHSTHSTHTHTHSTHSTHTHTHSTHSTHTHTHSTHSTHSTHSTHSTHTHTHSTHTHSTHSTHTHSTHSTHTHSTHTHTHSTHSTHSTHSTHSTHSTHTHSTHSTHSTHTHTHTHTHTHSTHSTHTHTHSTHSTHSTHTHSTHTHSTHTHSTHTHTHSTHSTHTHSTHTHTHTHSTHSTHTHTHSTHTHSTHSTHSTHTHSTHTHSTHTHTHTHTHTHTHTHTHTHTHTHTHTHTHTHSTHTHSTHSTHTHSTHTHTHTHTHSTHTHSTHTHTHSTHTHTHTHSTHTHTHSTHSTHTHTHTHTHSTHSTHSTHSTHTHSTHSTHTHSTHTHSTHTHTHTHTHTHTHTHTHSTHSTHTHTHTHSTHSTHSTHTHTHSTHTHSTHSTHSTHTHTHSTHSTHSTHSTHSTHTHTHTHSTHSTHTHSTHSTHSTHTHTHSTHTHTHSTHSTHTHTHTHTHSTHTHSTHSTHTHTHTHTHSTHSTHSTHSTHSTHTHSTHTHSTHSTHSTHTHTHTHTHSTH",
-    # rz(pi/2^100)
-    "SSSHTHSTHSTHTHTHTHTHSTHSTHTHTHTHSTHTHSTHTHSTHTHTHTHTHTHSTHTHTHSTHSTHSTHSTHSTHSTHTHSTHTHTHSTHSTHSTHSTHSTHTHSTHSTHTHTHSTHSTHSTHTHTHSTHTHTHSTHSTHSTHSTHSTHTHTHSTHSTHTHTHSTHTHSTHSTHTHTHSTHTHTHSTHSTHSTHSTHTHSTHTHTHTHTHSTHTHTHTHTHTHTHTHSTHTHTHTHTHTHSTHSTHSTHSTHSTHSTHTHSTHTHSTHSTHTHSTHSTHTHSTHTHTHSTHSTHTHSTHSTHSTHTHSTHSTHTHTHTHSTHTHTHTHSTHTHSTHSTHSTHTHSTHSTHSTHSTHSTHSTHTHSTHTHTHSTHSTHSTHSTHSTHSTHSTHSTHSTHSTHSTHTHSTHSTHTHSTHSTHSTHTHTHSTHSTHTHSTHTHTHSTHTHSTHTHSTHTHSTHTHSTHSTHTHTHSTHTHSTHTHTHTHTHSTHTHTHTHTHTHSTHSTHTHSTHTHTHTHSTHSTHTHTHSTHTHSTHTHSTHTHTHSTHSTHTHTHTHSTHTHTHSTHTHTHTHSTHSTHTHSTHSTHSTHSTHTHTHTHTHSTHTHSTHTHSTHSTHTHTHSTHTHSTHTHTHTHTHSTHTHSTHTHSTHSTHSTHSTHSTHSTHTHSTHTHSTHTHSTHTHSTHTHTHSTHSTHSTHTHTHSTHSTHSTHSTHTHSTHSTHSTHTHSTHSTHSTHSTHTHTHSTHSTHTHSTHSTHSTHSTHSTHTHSTHSTHSTHTHSTHTHTHTHSTHSTHSTHSTHTHSTHSTHSTHSTHTHSTHSTHTHSTHSTHTHTHSTHSTHTHSTHTHTHSTHSTHSTHTHTHTHSTHTHTHSTHTHSTHTHTHTHTHTHTHTHTHTHSTHTHSTHTHSTHTHSTHTHTHTHTHSTHTHSTHTHTHTHTHTHTHTHSTHTHTHTHSTHSTHSTHTHTHSTHSTHSTHTHTHSTHTHSTHSTHSTHTHSTHTHTHTHSTHSTHSTHSTHSTHSTHTHSTHTHTHSTHSTHTHTHSTHSTHTHTHSTHSTHSTHSTHTHSTHTHTHTHTHSTHSTHTHSTHTHSTHSTHSTHTHSTHTHTHTHSTHTHTHTHSTHSTHTHTHTHTHTHTHTHTHSTHTHSTHTHTHTHSTHSTHSTHSTHSTH",
-    # rz(pi/2^101)
-    "SSSHSTHSTHSTHTHSTHSTHTHTHTHSTHTHTHSTHTHTHTHTHTHTHSTHTHTHSTHSTHTHTHTHTHSTHSTHSTHTHSTHTHTHTHTHTHTHTHSTHSTHTHSTHSTHSTHTHSTHSTHTHTHTHSTHTHTHSTHSTHSTHTHTHSTHTHSTHTHTHTHTHTHSTHSTHSTHSTHSTHSTHTHTHTHSTHSTHSTHTHSTHSTHSTHTHTHTHSTHSTHTHTHTHTHSTHTHSTHSTHTHTHTHTHTHSTHSTHSTHSTHTHSTHTHTHTHTHSTHSTHSTHTHSTHTHSTHTHSTHSTHTHTHTHTHTHSTHTHSTHSTHSTHSTHTHTHSTHTHTHSTHTHTHSTHTHSTHTHTHSTHTHTHSTHSTHTHSTHSTHSTHTHSTHTHSTHTHSTHTHSTHTHTHSTHSTHTHSTHSTHTHTHSTHSTHSTHTHSTHTHTHSTHSTHTHTHSTHSTHSTHTHSTHTHSTHSTHSTHTHTHSTHTHTHTHTHTHSTHSTHSTHSTHSTHSTHTHTHTHSTHTHTHSTHTHSTHSTHTHTHSTHSTHSTHTHTHTHSTHTHSTHSTHTHTHTHTHTHTHSTHSTHTHSTHTHSTHTHTHTHTHSTHSTHSTHSTHSTHSTHTHSTHSTHTHSTHSTHSTHSTHTHTHSTHTHSTHSTHSTHSTHTHTHSTHSTHTHTHSTHTHTHSTHSTHTHSTHSTHTHTHSTHTHSTHTHSTHTHSTHSTHSTHSTHTHSTHSTHSTHTHTHSTHSTHTHTHSTHTHTHTHTHSTHTHTHSTHSTHTHTHTHSTHSTHTHSTHSTHTHSTHTHSTHSTHTHTHTHSTHTHTHSTHTHSTHSTHTHTHSTHTHSTHTHTHSTHSTHTHSTHTHTHTHSTHTHTHSTHSTHTHTHTHTHSTHTHTHTHSTHSTHSTHSTHTHTHSTHSTHTHTHSTHTHSTHTHSTHSTHSTHSTHSTHTHSTHTHTHSTHTHSTHSTHTHSTHTHTHSTHSTHTHTHSTHSTHTHTHSTHTHSTHSTHSTHTHTHTHSTHSTHTHSTHTHSTHTHSTHTHSTHTHSTHTHSTHTHTHTHTHSTHSTHSTHSTHTHTHTHTHTHTHSTHTHTHTHTHSTHTHSTHTHTHSTHSTHTHTHSTHTHTHTHSTHSTHTHSTHTHTHSTH",
-    # rz(pi/2^102)
-    "XHSTHTHSTHTHSTHTHSTHTHTHSTHTHSTHSTHTHSTHSTHSTHSTHTHTHTHSTHTHTHSTHTHTHSTHSTHTHTHSTHTHSTHTHSTHTHSTHTHTHSTHTHSTHSTHTHSTHTHTHTHTHTHTHTHSTHTHSTHTHSTHSTHTHSTHTHTHTHSTHSTHSTHSTHTHTHTHSTHSTHTHSTHTHSTHTHSTHTHSTHSTHTHTHTHSTHSTHTHTHTHSTHSTHSTHSTHSTHSTHTHSTHTHTHSTHSTHSTHSTHTHTHSTHSTHTHSTHSTHSTHTHTHTHSTHTHTHTHSTHTHTHTHSTHTHSTHTHSTHTHSTHTHTHSTHSTHTHSTHSTHSTHTHSTHTHTHTHSTHTHTHTHTHSTHSTHTHTHSTHTHTHTHSTHTHTHTHSTHTHSTHSTHSTHTHSTHSTHTHTHSTHSTHSTHSTHTHSTHSTHSTHTHSTHTHSTHTHSTHSTHSTHSTHSTHSTHTHSTHTHSTHTHSTHTHSTHTHSTHSTHTHTHTHTHSTHSTHSTHTHSTHSTHSTHTHTHTHSTHTHSTHTHSTHSTHSTHSTHTHSTHSTHTHTHTHTHSTHTHSTHTHSTHSTHSTHTHSTHSTHTHTHSTHTHSTHTHSTHSTHSTHSTHSTHTHTHSTHSTHTHSTHSTHTHSTHTHTHSTHSTHTHTHTHSTHSTHSTHTHSTHSTHSTHTHSTHTHTHSTHTHSTHSTHTHTHSTHSTHTHTHTHTHTHTHTHTHTHTHSTHTHSTHTHSTHSTHSTHTHSTHTHTHSTHTHTHSTHSTHTHTHTHSTHSTHSTHTHTHTHTHSTHSTHTHSTHSTHTHTHSTHTHSTHSTHTHTHSTHSTHSTHSTHSTHSTHTHTHTHTHSTHSTHTHTHSTHSTHTHTHTHSTHSTHSTHSTHTHTHSTHTHTHTHSTHSTHSTHSTHTHSTHTHTHTHSTHSTHTHSTHSTHTHSTHTHSTHSTHSTHSTHTHSTHTHSTHSTHSTHSTHTHSTHTHSTHTHSTHSTHTHTHTHSTHSTHSTHTHSTHSTHSTHTHSTHSTHTHSTHSTHTHSTHSTHSTHTHSTHSTHTHSTHSTHSTHSTHSTHSTHSTHSTHTHTHTHTHSTHSTHSTHTHSTHSTHSTHTHTHSTHSTHSTHTHSTHSTHSTHTHSTHTHTHSTHSTHTHTHTHSTHSTHSTHSTHTHTHTHTHSTHSTHSTHS",
-    # rz(pi/2^103)
-    "SSHTHSTHTHTHSTHTHTHSTHSTHTHTHSTHSTHTHTHSTHTHSTHSTHTHSTHTHSTHTHTHTHSTHSTHTHSTHSTHSTHSTHSTHSTHSTHTHSTHSTHSTHSTHSTHTHTHSTHTHSTHTHSTHSTHTHTHSTHSTHTHTHTHSTHSTHTHSTHTHSTHSTHTHSTHTHTHTHTHSTHTHTHSTHSTHTHTHSTHTHTHSTHSTHTHSTHTHSTHSTHSTHSTHSTHTHSTHSTHSTHSTHTHSTHTHSTHSTHTHSTHSTHTHTHTHTHTHTHTHTHSTHTHSTHSTHSTHSTHSTHSTHTHTHSTHSTHSTHTHSTHTHTHTHSTHTHSTHSTHSTHSTHSTHSTHTHSTHSTHSTHSTHTHTHSTHTHTHTHTHTHTHSTHSTHTHTHTHTHSTHTHSTHSTHSTHSTHTHTHTHTHSTHTHSTHTHSTHSTHTHSTHTHSTHTHTHTHTHSTHSTHSTHTHTHSTHSTHTHTHSTHTHTHTHTHTHTHTHTHSTHSTHSTHSTHTHTHTHTHSTHTHTHTHSTHTHSTHTHTHTHTHTHSTHTHTHSTHTHTHSTHSTHTHSTHSTHSTHTHTHTHTHTHTHTHTHTHTHTHTHTHSTHTHTHTHSTHSTHTHTHTHTHTHSTHSTHTHSTHSTHTHTHSTHSTHTHTHSTHSTHTHSTHSTHTHSTHSTHTHSTHSTHTHSTHTHSTHTHSTHTHTHSTHSTHSTHSTHTHSTHSTHSTHTHSTHSTHTHTHTHTHSTHTHSTHTHTHSTHSTHSTHSTHSTHTHSTHTHSTHSTHSTHSTHSTHTHTHTHTHTHTHSTHTHTHTHSTHTHSTHTHTHSTHTHSTHTHTHTHTHSTHSTHSTHSTHSTHTHSTHTHSTHSTHTHSTHTHTHTHTHSTHSTHTHSTHTHSTHSTHTHSTHSTHSTHSTHSTHSTHTHTHTHTHSTHSTHTHSTHSTHTHTHTHSTHSTHSTHTHSTHTHSTHSTHSTHSTHTHSTHTHSTHTHSTHTHSTHTHTHSTHSTHTHSTHSTHSTHTHSTHTHTHSTHSTHSTHSTHSTHSTHSTHSTHTHSTHSTHTHSTHSTHSTHSTHTHTHSTHSTHSTHSTHTHSTHTHTHTHSTHTHSTHSTHSTHTHSTHSTHSTHSTHSTHTHTHSTHSTHSTHSTHTHTHSTHSTHTHTHSTHSTHSTHTHTHTHTHSTHTHTHTHTHS",
-    # rz(pi/2^104)
-    "SHSTHTHTHTHSTHTHTHSTHTHTHTHTHTHTHTHSTHSTHSTHTHSTHSTHSTHSTHTHTHSTHSTHTHTHTHSTHSTHSTHSTHTHSTHTHTHSTHSTHSTHSTHSTHTHSTHTHTHSTHTHSTHSTHTHTHTHTHSTHSTHSTHTHSTHSTHTHTHTHTHTHTHSTHSTHSTHTHSTHSTHSTHTHTHTHTHSTHTHSTHTHTHSTHSTHSTHTHTHSTHSTHTHTHSTHTHSTHTHTHSTHTHTHSTHSTHTHTHTHSTHTHSTHTHSTHSTHSTHTHTHSTHSTHSTHSTHSTHSTHTHSTHSTHSTHTHTHTHTHTHSTHTHSTHTHTHSTHSTHSTHTHTHTHSTHSTHTHTHTHSTHTHTHSTHTHTHSTHSTHSTHTHTHTHSTHSTHSTHSTHTHTHSTHTHSTHSTHTHSTHTHTHSTHTHTHTHSTHTHTHSTHSTHTHSTHSTHSTHSTHTHSTHTHTHSTHTHSTHTHSTHTHTHSTHTHTHTHTHTHTHTHTHTHSTHTHSTHSTHTHTHSTHTHTHTHSTHTHTHSTHTHTHSTHTHTHSTHSTHSTHTHTHSTHTHSTHTHSTHSTHSTHSTHTHTHTHSTHSTHTHTHTHTHSTHTHTHSTHSTHTHSTHTHSTHSTHTHSTHSTHTHSTHTHTHSTHTHTHTHSTHTHTHTHSTHSTHTHSTHTHSTHSTHSTHTHTHSTHSTHSTHTHSTHTHSTHSTHSTHSTHTHTHSTHTHTHTHTHTHSTHSTHSTHTHSTHTHSTHTHTHTHSTHSTHSTHTHTHSTHTHTHTHTHTHTHSTHSTHTHTHTHSTHTHSTHTHSTHTHTHTHSTHSTHSTHTHTHSTHSTHSTHTHTHTHSTHTHSTHSTHSTHSTHSTHSTHTHSTHTHSTHTHTHTHSTHTHSTHSTHSTHTHTHTHTHSTHSTHTHTHTHTHTHSTHSTHSTHTHTHTHSTHSTHSTHTHTHSTHSTHSTHSTHSTHSTHSTHTHTHSTHSTHTHTHTHSTHSTHSTHTHTHSTHTHSTHSTHSTHSTHSTHTHTHSTHTHTHTHSTHSTHSTHTHSTHSTHSTHSTHSTHSTHTHTHSTHSTHTHSTHSTHTHSTHSTHSTHTHTHSTHSTHTHTHTHSTHSTHSTHSTHTHSTHSTHTHSTHTHTHTHTHSTHSTHTHSTHSTHSTHSTH",
-    # rz(pi/2^105)
-    "SSSXHTHSTHSTHTHTHSTHTHSTHSTHSTHSTHTHSTHSTHTHTHTHTHTHTHTHTHSTHSTHTHTHTHTHSTHTHTHSTHSTHTHTHSTHTHTHTHSTHTHTHTHSTHTHTHTHSTHTHTHTHTHTHTHSTHTHTHSTHSTHTHSTHSTHTHSTHTHSTHSTHSTHSTHSTHSTHTHSTHSTHTHTHTHTHTHTHSTHTHTHTHSTHSTHTHSTHTHTHSTHSTHTHTHSTHTHTHSTHSTHTHTHTHTHTHSTHSTHTHSTHTHSTHSTHSTHTHSTHSTHSTHSTHTHTHSTHSTHSTHSTHTHTHTHSTHSTHTHSTHSTHSTHTHTHTHSTHSTHSTHTHSTHSTHTHTHTHSTHTHTHTHTHTHTHTHSTHTHSTHTHSTHTHTHTHTHSTHTHSTHTHTHSTHSTHTHSTHSTHSTHTHSTHTHSTHTHTHSTHSTHSTHSTHTHTHSTHSTHTHSTHSTHTHTHSTHSTHSTHTHTHTHSTHSTHSTHSTHTHSTHTHTHTHTHTHSTHTHSTHSTHTHTHTHSTHSTHTHSTHSTHSTHTHTHTHTHSTHSTHSTHTHSTHSTHTHSTHSTHSTHTHTHSTHTHSTHSTHTHTHTHSTHTHTHSTHSTHTHTHTHTHSTHSTHTHSTHSTHTHSTHSTHTHTHSTHSTHSTHTHSTHSTHSTHTHSTHSTHSTHTHTHSTHSTHSTHSTHSTHTHSTHSTHTHTHTHSTHSTHSTHSTHSTHTHTHSTHTHSTHTHTHTHSTHSTHTHTHSTHTHTHTHTHTHSTHTHTHSTHSTHSTHSTHSTHTHSTHSTHSTHSTHSTHSTHTHTHSTHSTHSTHTHSTHSTHSTHTHTHSTHTHTHSTHTHSTHSTHSTHSTHTHSTHSTHTHSTHTHTHTHSTHSTHTHSTHTHSTHTHSTHTHTHSTHSTHSTHTHSTHTHSTHSTHTHSTHTHSTHTHTHSTHTHTHSTHSTHSTHTHTHTHTHTHSTHSTHSTHTHSTHSTHTHSTHTHTHSTHSTHTHSTHTHTHTHSTHSTHSTHSTHSTHSTHSTHSTHTHTHSTHSTHTHSTHTHTHTHSTHSTHSTHSTHTHTHSTHTHTHTHSTHTHSTHSTHTHSTHTHTHTHSTHTHTHSTHTHSTHSTHSTHTHSTHSTHSTHSTHSTHSTHSTHTHSTHTHSTHTHTHTHTHSTHTHSTHSTHTHTHSTHTHTHSTHSTH",
-    # rz(pi/2^106)
-    "SSSXHTHTHTHTHTHSTHTHTHTHTHSTHSTHTHTHSTHSTHTHTHSTHTHTHTHTHTHSTHSTHTHTHTHTHTHSTHTHTHTHTHSTHSTHTHTHSTHSTHTHSTHTHSTHTHTHTHSTHTHSTHSTHSTHSTHTHSTHTHSTHSTHSTHSTHTHSTHSTHTHTHTHSTHSTHTHSTHSTHTHTHTHSTHTHTHSTHSTHSTHTHTHTHSTHSTHTHSTHSTHTHTHTHTHSTHTHTHTHTHTHSTHSTHSTHSTHSTHTHTHSTHSTHTHTHSTHTHTHSTHTHTHSTHTHTHTHSTHTHTHTHSTHSTHTHSTHTHSTHTHSTHTHTHTHSTHSTHTHSTHTHSTHTHTHSTHTHSTHSTHSTHSTHSTHSTHTHTHSTHSTHSTHTHSTHTHSTHSTHSTHSTHTHTHSTHSTHTHTHSTHTHTHSTHSTHSTHTHTHSTHTHTHTHTHSTHTHSTHSTHTHSTHSTHSTHTHTHTHSTHSTHTHSTHTHSTHSTHTHSTHTHTHSTHTHSTHTHTHSTHTHSTHSTHSTHTHTHSTHSTHTHTHTHTHSTHTHSTHTHSTHSTHSTHSTHTHSTHTHSTHTHTHSTHSTHTHSTHTHTHSTHTHTHSTHTHSTHSTHTHSTHTHSTHSTHSTHTHTHTHSTHSTHSTHTHTHTHSTHTHSTHSTHTHTHTHTHSTHTHSTHTHSTHTHTHSTHTHSTHTHSTHTHSTHTHTHSTHSTHSTHTHTHSTHSTHTHSTHTHSTHTHTHTHTHSTHSTHTHTHSTHTHTHTHTHTHSTHSTHTHSTHTHSTHSTHSTHTHSTHTHTHTHSTHSTHSTHTHSTHTHTHTHTHTHTHTHTHTHSTHSTHSTHSTHSTHSTHTHSTHSTHSTHSTHSTHTHTHSTHSTHTHSTHSTHSTHTHTHTHTHSTHSTHTHSTHTHTHTHTHSTHTHTHSTHSTHSTHTHTHTHTHSTHTHTHTHSTHTHTHSTHSTHSTHTHTHSTHTHTHSTHSTHSTHTHTHTHTHSTHTHTHSTHTHSTHSTHSTHSTHSTHSTHSTHSTHSTHTHSTHSTHSTHSTHSTHSTHSTHTHTHSTHTHSTHTHTHSTHSTHTHTHSTHSTHSTHTHSTHSTHTHSTHTHTHTHSTHSTHSTHTHSTHTHSTHSTHTHTHSTHSTHTHSTHSTHSTHSTHSTHTHTHSTHSTHTHTHTHTHTHSTHTHTHST",
-    # rz(pi/2^107)
-    "SSSTHSTHTHSTHTHTHTHSTHSTHSTHSTHSTHSTHTHSTHTHTHSTHTHTHTHTHTHSTHTHSTHSTHSTHTHTHTHSTHTHTHTHSTHTHSTHSTHTHSTHTHSTHSTHSTHSTHTHSTHTHSTHSTHTHSTHTHSTHSTHSTHSTHTHTHSTHTHTHSTHTHTHTHTHSTHTHSTHSTHSTHTHTHTHTHTHTHSTHSTHTHSTHSTHSTHTHTHSTHSTHSTHSTHTHSTHSTHSTHTHSTHTHTHSTHTHSTHSTHSTHSTHSTHSTHSTHTHSTHTHTHTHTHSTHSTHTHSTHSTHTHSTHTHSTHSTHSTHTHTHSTHTHTHSTHSTHSTHTHTHTHTHTHTHSTHTHTHSTHTHTHSTHSTHTHSTHSTHTHSTHSTHSTHSTHTHTHSTHSTHSTHSTHTHSTHTHTHTHTHSTHSTHTHSTHTHSTHSTHSTHSTHSTHSTHTHSTHTHTHTHSTHSTHSTHTHSTHSTHSTHTHSTHTHTHSTHSTHSTHTHSTHTHTHSTHTHSTHTHSTHTHTHTHTHTHTHTHTHTHSTHSTHSTHSTHTHTHSTHTHSTHTHSTHSTHSTHSTHSTHTHTHTHTHTHTHTHTHTHTHTHSTHSTHTHTHTHTHTHTHSTHTHTHTHSTHTHTHSTHSTHSTHSTHTHSTHTHSTHTHTHSTHSTHTHTHSTHSTHTHTHTHSTHTHTHSTHTHTHTHTHTHTHTHTHTHTHTHTHSTHSTHSTHTHSTHSTHTHSTHTHSTHTHTHSTHTHTHTHSTHTHTHTHSTHTHSTHTHTHTHSTHSTHSTHSTHTHTHSTHTHTHSTHSTHSTHTHSTHTHSTHTHSTHTHTHTHSTHSTHSTHTHSTHSTHTHSTHSTHSTHSTHSTHSTHTHSTHSTHTHSTHSTHTHSTHSTHSTHTHTHTHSTHTHSTHTHTHSTHSTHSTHTHTHTHTHSTHTHTHTHTHTHTHSTHSTHSTHSTHSTHSTHTHTHSTHTHSTHSTHSTHTHTHSTHTHTHTHTHTHTHSTHTHSTHTHSTHTHTHSTHSTHTHTHSTHSTHSTHSTHSTHSTHSTHSTHSTHTHTHSTHSTHSTHTHSTHTHTHTHSTHTHTHTHSTHSTHTHTHTHSTHSTHTHTHSTHSTHTHTHSTHSTHSTHTHTHSTHSTHTHTHTHSTHSTHSTHSTHTHSTHSTHSTHSTHSTHSTHTHSTHSTH",
-    # rz(pi/2^108)
-    "SSXHSTHSTHSTHTHTHSTHSTHTHTHTHSTHSTHTHTHTHTHSTHTHTHTHSTHTHTHTHSTHSTHTHTHSTHTHTHTHTHSTHSTHSTHTHTHSTHSTHTHSTHSTHSTHSTHSTHTHSTHTHSTHTHTHTHSTHSTHSTHTHTHTHSTHTHTHSTHTHSTHTHSTHTHSTHSTHSTHTHTHSTHTHSTHSTHSTHTHTHSTHTHTHSTHTHTHSTHTHTHSTHSTHSTHSTHTHTHTHSTHTHTHTHSTHTHSTHTHSTHSTHSTHTHTHSTHTHTHSTHTHTHSTHSTHSTHSTHSTHTHTHSTHSTHSTHTHTHTHSTHSTHTHSTHSTHSTHTHTHTHTHSTHSTHSTHTHTHSTHTHTHSTHSTHTHTHTHTHSTHTHTHTHSTHSTHSTHTHSTHTHTHSTHTHSTHTHTHSTHSTHTHTHSTHSTHTHTHSTHTHTHSTHTHTHTHTHTHSTHTHSTHTHTHTHSTHSTHSTHTHSTHSTHSTHTHSTHTHSTHSTHSTHTHSTHSTHTHTHTHSTHTHSTHSTHTHTHTHTHTHTHSTHTHSTHSTHTHSTHTHSTHSTHTHSTHTHTHTHSTHSTHSTHTHSTHTHSTHSTHSTHTHTHTHTHSTHSTHSTHSTHSTHTHTHSTHSTHTHSTHSTHSTHSTHSTHSTHSTHTHSTHTHTHTHSTHSTHSTHSTHSTHSTHTHSTHSTHSTHSTHSTHSTHTHSTHSTHTHTHTHSTHSTHSTHSTHSTHTHSTHSTHSTHTHTHTHSTHTHSTHTHSTHSTHTHTHTHTHSTHSTHTHSTHTHTHSTHSTHTHSTHTHTHTHTHTHTHTHTHTHSTHTHSTHSTHTHSTHSTHSTHSTHSTHTHSTHTHSTHSTHTHSTHSTHSTHSTHSTHTHTHTHSTHSTHSTHSTHTHSTHSTHSTHTHTHTHSTHSTHTHSTHSTHSTHTHTHTHTHTHTHTHTHSTHTHTHTHSTHTHSTHTHSTHTHTHSTHTHTHSTHSTHTHTHTHTHTHSTHTHSTHSTHTHSTHTHTHTHSTHSTHSTHSTHSTHSTHSTHTHTHSTHSTHTHTHSTHSTHTHSTHSTHTHSTHTHTHTHSTHTHSTHSTHTHTHSTHTHSTHTHTHTHSTHTHTHSTHSTHTHSTHSTHTHSTHSTHTHTHSTHTHTHSTHSTHSTHTHTHSTHSTHTHSTHTHSTHTHSTHSTHTHSTHSTHSTHSTHSTHSTHS",
-    # rz(pi/2^109)
-    "SSSXHSTHTHSTHTHTHTHTHSTHSTHSTHTHSTHSTHTHSTHTHTHSTHTHTHSTHSTHSTHSTHSTHTHTHTHTHTHSTHTHSTHTHSTHTHTHSTHSTHSTHTHSTHSTHSTHSTHTHTHTHTHSTHTHSTHSTHSTHSTHSTHTHSTHTHSTHTHSTHTHSTHTHSTHSTHSTHTHSTHSTHSTHSTHTHSTHTHTHTHSTHSTHSTHTHTHSTHTHTHSTHTHTHTHTHSTHTHTHTHSTHTHTHTHSTHSTHTHTHTHTHSTHTHSTHTHSTHSTHTHSTHTHSTHTHSTHSTHTHTHTHTHSTHSTHSTHSTHSTHSTHTHSTHSTHTHSTHSTHSTHSTHTHSTHTHSTHTHTHTHSTHSTHTHSTHTHTHTHSTHTHTHTHSTHTHTHTHTHTHTHSTHSTHTHTHSTHSTHTHTHSTHSTHTHSTHTHSTHTHSTHTHSTHSTHTHTHTHTHTHTHSTHTHSTHTHSTHTHSTHSTHTHTHSTHTHTHSTHTHSTHTHTHSTHSTHTHTHTHTHSTHTHSTHTHTHTHSTHTHSTHTHSTHSTHSTHSTHTHTHSTHTHSTHSTHSTHTHTHTHTHSTHSTHSTHSTHSTHSTHTHSTHTHSTHTHTHTHTHTHTHSTHSTHSTHSTHSTHTHTHTHSTHTHSTHTHTHSTHTHTHTHSTHTHTHTHTHSTHTHTHTHTHTHTHTHTHSTHSTHSTHTHSTHSTHSTHTHTHTHTHTHSTHTHTHTHSTHTHTHTHTHTHSTHTHSTHTHSTHSTHSTHTHSTHSTHTHSTHSTHTHTHSTHTHSTHSTHTHSTHTHTHTHSTHSTHSTHSTHTHTHTHTHTHSTHSTHTHSTHSTHTHSTHSTHTHSTHSTHTHTHTHTHSTHTHTHSTHTHSTHTHSTHSTHSTHTHSTHTHTHSTHSTHTHTHSTHSTHSTHTHTHTHTHTHSTHTHSTHSTHSTHTHTHSTHTHSTHSTHSTHTHSTHSTHTHSTHSTHTHSTHSTHSTHTHTHTHSTHTHSTHSTHSTHTHSTHSTHTHTHTHTHTHSTHTHSTHSTHSTHTHSTHSTHTHTHSTHTHTHSTHSTHTHTHTHSTHSTHTHSTHSTHSTHTHTHTHSTHTHTHTHTHTHSTHTHTHSTHSTHTHSTHSTHTHTHTHTHSTHTHTHSTHTHSTHSTHSTHTHSTHTHTHTHTHTHTHTHTHTHTHTHSTHTH",
-    # rz(pi/2^110)
-    "SXHSTHSTHTHSTHSTHSTHTHTHTHTHTHSTHSTHSTHSTHTHTHSTHSTHTHSTHSTHTHTHSTHTHTHSTHSTHSTHSTHTHTHTHSTHTHSTHTHTHTHSTHSTHSTHTHTHTHSTHSTHSTHTHTHTHTHSTHSTHTHTHSTHSTHTHTHSTHTHTHTHTHTHSTHTHSTHSTHTHSTHSTHSTHSTHTHTHTHTHTHSTHTHTHTHSTHSTHSTHTHSTHTHSTHSTHSTHTHTHTHTHTHSTHSTHTHSTHTHTHSTHTHTHTHSTHTHSTHSTHSTHSTHSTHSTHTHTHTHTHTHTHSTHTHSTHTHSTHTHTHSTHTHTHSTHSTHTHTHSTHSTHTHTHSTHTHTHSTHSTHSTHSTHTHTHTHSTHTHSTHTHTHSTHSTHTHSTHSTHSTHTHSTHTHSTHTHSTHSTHSTHSTHSTHTHSTHTHTHSTHSTHTHTHTHSTHTHTHSTHSTHSTHTHSTHTHTHSTHTHSTHSTHTHSTHSTHTHTHTHTHTHSTHSTHSTHTHSTHTHTHTHSTHTHSTHSTHSTHSTHSTHTHTHSTHTHTHSTHSTHSTHSTHSTHTHTHTHTHTHTHTHSTHTHSTHSTHTHSTHTHTHSTHTHSTHTHTHSTHSTHSTHSTHSTHTHTHTHTHTHTHSTHTHSTHSTHTHSTHTHSTHSTHTHSTHTHTHSTHTHSTHSTHTHTHTHSTHTHSTHSTHSTHTHSTHTHTHSTHSTHTHSTHSTHTHSTHTHSTHTHTHSTHTHTHTHTHSTHSTHSTHSTHSTHSTHTHTHSTHSTHSTHSTHSTHSTHTHTHSTHSTHTHSTHTHTHSTHSTHSTHSTHTHSTHTHTHSTHSTHTHSTHSTHTHSTHTHTHTHSTHTHTHSTHSTHSTHSTHSTHSTHTHSTHTHTHTHSTHSTHSTHSTHTHTHSTHSTHTHSTHTHTHSTHTHSTHSTHTHTHTHTHSTHSTHTHTHSTHSTHTHTHSTHTHSTHTHTHTHTHTHSTHSTHSTHTHSTHTHTHSTHSTHSTHTHSTHTHSTHSTHSTHSTHTHSTHSTHSTHTHSTHTHTHTHSTHSTHTHSTHSTHTHSTHTHSTHSTHSTHTHSTHTHTHTHTHSTHSTHTHSTHTHSTHTHSTHTHTHSTHSTHSTHSTHTHTHSTHTHTHTHTHSTHTHTHTHTHTHSTHTHSTHSTHTHSTHSTHSTHSTHSTHSTHSTHTHTH",
-    # rz(pi/2^111)
-    "SSHTHSTHSTHSTHSTHSTHTHSTHSTHSTHSTHTHTHTHSTHSTHSTHTHTHTHSTHSTHSTHTHSTHTHTHSTHSTHSTHTHSTHSTHTHTHSTHTHTHSTHSTHTHSTHSTHTHTHSTHSTHSTHSTHSTHSTHSTHSTHSTHSTHTHTHSTHTHSTHTHTHSTHTHSTHTHTHSTHSTHTHTHSTHTHSTHTHTHTHTHTHTHSTHTHSTHTHTHSTHTHSTHSTHTHSTHTHTHTHTHSTHSTHTHTHTHTHTHTHSTHTHTHSTHTHSTHTHTHTHSTHTHSTHTHSTHTHSTHTHSTHTHTHTHTHSTHTHTHSTHTHTHTHSTHSTHTHTHTHSTHSTHTHTHTHSTHTHSTHSTHSTHSTHSTHTHSTHSTHTHTHTHSTHTHTHTHTHSTHTHSTHTHTHTHSTHTHSTHSTHSTHTHTHSTHTHSTHTHSTHTHTHTHSTHTHTHTHTHTHTHTHTHTHTHTHSTHSTHSTHSTHSTHSTHSTHSTHTHTHSTHTHTHSTHTHSTHTHTHSTHSTHSTHSTHSTHTHTHTHTHSTHSTHSTHTHTHTHTHTHSTHSTHSTHTHTHSTHTHSTHTHSTHTHTHTHSTHTHSTHSTHTHSTHTHSTHSTHSTHSTHSTHTHTHTHSTHSTHTHTHTHTHTHSTHSTHSTHSTHSTHTHSTHSTHSTHTHSTHSTHTHTHSTHTHSTHSTHTHSTHTHTHSTHTHSTHTHSTHSTHTHTHTHTHTHSTHTHSTHSTHSTHSTHTHSTHSTHTHSTHSTHSTHSTHTHTHSTHSTHSTHSTHTHTHTHSTHTHSTHTHTHTHSTHTHTHTHSTHSTHSTHSTHSTHSTHTHSTHTHSTHTHTHSTHTHTHTHSTHSTHSTHSTHSTHSTHTHTHSTHSTHSTHTHTHTHSTHTHSTHSTHSTHTHTHSTHTHTHSTHTHSTHSTHSTHSTHTHSTHTHTHTHSTHTHTHTHSTHSTHSTHSTHSTHSTHSTHTHSTHSTHTHSTHTHSTHTHSTHSTHTHTHSTHTHTHSTHTHSTHSTHTHTHSTHSTHTHTHSTHSTHSTHTHSTHSTHTHTHSTHSTHTHTHTHSTHTHSTHSTHTHTHTHSTHSTHTHSTHTHTHSTHSTHSTHTHTHSTHSTHTHTHSTHTHTHSTHTHSTHTHSTHSTHTHSTHTHSTHTHTHSTHSTHTHSTHSTHSTHTHSTHSTHSTHSTHSTHTHSTHTHSTHTHTHTHTHS",
-    # rz(pi/2^112)
-    "SSSTHSTHSTHTHTHTHTHTHTHSTHSTHTHTHSTHSTHSTHTHTHSTHTHTHTHSTHTHSTHTHSTHTHSTHSTHSTHTHSTHSTHTHTHTHTHSTHTHSTHTHSTHTHTHSTHSTHTHSTHSTHTHSTHTHSTHSTHSTHTHSTHTHTHTHTHSTHTHSTHSTHTHSTHTHTHSTHTHTHTHTHTHTHSTHTHTHSTHSTHTHSTHTHTHTHTHSTHTHSTHSTHSTHTHTHTHTHSTHTHTHTHTHSTHTHSTHTHSTHTHSTHSTHSTHSTHTHTHTHSTHSTHTHSTHTHTHSTHSTHSTHTHSTHTHSTHSTHTHTHTHTHTHTHSTHTHTHSTHTHTHSTHSTHTHSTHTHSTHSTHSTHSTHSTHTHTHSTHTHSTHSTHSTHSTHSTHSTHSTHTHTHTHTHSTHTHSTHTHSTHSTHSTHSTHSTHTHSTHSTHTHTHTHTHTHSTHSTHTHSTHSTHSTHTHTHTHTHTHTHSTHTHSTHSTHTHSTHTHSTHTHTHSTHSTHSTHTHTHSTHTHSTHTHTHSTHSTHSTHTHTHSTHTHSTHTHSTHTHSTHSTHTHTHSTHSTHSTHTHTHSTHSTHTHTHTHTHTHSTHTHSTHTHSTHSTHSTHTHSTHTHTHTHSTHTHSTHSTHTHTHSTHSTHSTHTHTHSTHTHSTHTHTHSTHTHSTHTHSTHTHTHTHTHTHSTHSTHTHSTHSTHTHTHSTHSTHTHSTHTHSTHTHSTHTHTHSTHSTHTHSTHSTHTHTHSTHTHSTHSTHSTHTHTHSTHTHSTHTHTHTHTHSTHTHSTHTHTHSTHSTHSTHTHSTHTHSTHTHTHTHSTHTHTHTHTHTHSTHSTHTHSTHSTHSTHSTHTHSTHTHSTHSTHTHSTHSTHTHSTHTHSTHTHSTHTHSTHSTHTHTHTHTHSTHSTHTHSTHTHTHSTHTHTHSTHSTHTHTHTHTHSTHTHTHSTHSTHTHSTHTHTHSTHTHSTHTHSTHSTHSTHSTHTHSTHTHSTHTHSTHSTHSTHTHSTHTHTHTHTHSTHSTHSTHSTHTHSTHSTHTHSTHSTHTHTHSTHSTHSTHTHSTHSTHTHSTHSTHSTHTHTHSTHSTHSTHSTHSTHTHSTHTHTHSTHSTHTHTHSTHSTHSTHSTHSTHSTHSTHSTHSTHTHTHTHSTHSTHTHSTHTHSTHSTHSTHSTHSTHTHTHTHTHSTHTHSTHTHTHSTHTHSTHTHTHS",
-    # rz(pi/2^113)
-    "SSSXHSTHTHTHTHTHTHSTHSTHSTHSTHTHSTHSTHTHSTHTHTHSTHSTHSTHSTHSTHSTHSTHSTHSTHTHSTHTHTHTHSTHTHSTHSTHSTHSTHTHSTHSTHSTHTHTHTHSTHSTHSTHSTHTHSTHTHTHSTHTHTHTHSTHTHTHTHTHTHTHTHSTHTHSTHSTHTHSTHSTHTHTHTHTHSTHSTHSTHSTHSTHSTHTHTHSTHTHSTHTHTHTHTHSTHTHTHTHSTHSTHSTHSTHSTHTHSTHSTHSTHSTHTHSTHTHTHSTHTHSTHTHSTHSTHTHTHSTHTHTHTHTHTHSTHTHSTHTHTHTHSTHSTHSTHTHTHSTHTHSTHSTHSTHSTHSTHSTHTHTHSTHTHSTHSTHSTHSTHTHSTHSTHTHTHSTHTHTHTHTHSTHTHSTHTHTHTHSTHTHSTHSTHSTHSTHSTHTHSTHSTHTHSTHSTHTHSTHSTHTHTHTHTHTHSTHTHSTHTHSTHSTHSTHTHTHTHTHSTHTHTHTHSTHSTHSTHSTHSTHSTHTHTHSTHTHTHSTHTHTHSTHTHSTHTHTHSTHTHSTHTHSTHSTHSTHSTHTHSTHTHSTHSTHTHSTHSTHTHTHTHTHSTHTHTHSTHSTHTHTHTHTHSTHTHTHTHSTHSTHTHSTHSTHTHSTHTHSTHTHSTHTHTHTHTHSTHTHTHTHSTHTHTHTHTHSTHSTHSTHTHTHSTHSTHSTHTHSTHTHSTHSTHSTHSTHSTHSTHTHSTHSTHTHTHTHSTHTHSTHTHTHTHTHTHSTHSTHSTHSTHSTHTHTHSTHTHSTHSTHSTHSTHTHTHSTHSTHTHSTHTHTHSTHSTHSTHTHSTHTHSTHSTHSTHSTHTHSTHTHSTHTHTHTHSTHTHSTHTHSTHSTHTHSTHSTHSTHSTHTHTHSTHTHSTHTHTHTHSTHTHSTHSTHSTHSTHSTHSTHSTHTHSTHTHTHSTHSTHSTHSTHTHTHSTHSTHSTHTHSTHSTHTHTHSTHTHSTHSTHTHTHSTHTHTHSTHSTHSTHSTHTHTHSTHTHTHSTHSTHSTHTHTHTHTHTHTHSTHTHSTHTHTHSTHTHSTHSTHTHTHTHSTHTHTHTHSTHSTHTHSTHSTHTHTHSTHTHTHSTHTHTHSTHTHSTHTHSTHSTHTHTHSTHSTHSTHTHSTHSTHTHTHTHTHTHTHTHTHSTHTHSTHSTHSTHSTHSTHTHSTHTHSTHTHTHTHSTHTHTHTHTHTHTHSTH",
-    # rz(pi/2^114)
-    "SHTHTHTHTHSTHSTHTHSTHTHSTHTHTHSTHSTHTHTHTHSTHTHTHSTHSTHSTHTHSTHSTHSTHSTHSTHSTHSTHSTHSTHSTHSTHTHTHSTHTHSTHSTHSTHSTHTHSTHSTHTHTHTHTHSTHTHTHSTHSTHSTHSTHTHSTHSTHTHTHTHSTHSTHSTHSTHTHTHSTHSTHTHTHTHTHSTHTHSTHTHSTHSTHTHTHTHSTHSTHSTHTHTHSTHTHSTHTHSTHTHSTHTHTHTHTHSTHTHTHSTHTHTHSTHSTHTHSTHTHTHTHSTHTHTHTHTHSTHTHSTHTHSTHTHTHSTHTHTHTHSTHTHSTHSTHSTHSTHSTHSTHTHTHTHTHSTHSTHSTHTHSTHTHSTHSTHTHTHTHTHTHSTHSTHTHTHSTHTHTHTHTHTHSTHTHSTHTHSTHTHTHTHTHSTHTHTHTHSTHSTHSTHTHSTHSTHSTHTHSTHTHSTHTHTHSTHTHTHTHTHSTHTHTHTHSTHSTHTHTHTHTHTHSTHSTHTHSTHTHTHSTHSTHSTHTHSTHTHSTHSTHTHSTHTHTHTHSTHSTHTHTHTHTHSTHSTHTHSTHTHSTHTHTHSTHSTHTHTHSTHSTHTHTHSTHSTHSTHSTHSTHSTHTHTHTHTHSTHTHTHTHTHTHTHSTHTHSTHSTHTHTHTHTHTHTHTHTHTHSTHTHSTHSTHTHSTHTHTHSTHSTHSTHTHTHSTHSTHTHTHSTHSTHSTHTHSTHSTHTHSTHTHSTHSTHTHTHTHSTHTHSTHSTHSTHTHSTHTHSTHSTHTHSTHSTHSTHSTHTHTHTHTHSTHSTHTHSTHSTHTHSTHSTHTHSTHSTHSTHTHSTHTHTHSTHTHTHTHTHTHSTHSTHSTHSTHSTHSTHSTHSTHSTHTHSTHSTHSTHTHTHSTHTHSTHTHSTHTHTHTHSTHSTHSTHTHSTHSTHTHTHTHSTHTHTHSTHTHSTHTHSTHTHTHSTHSTHTHTHSTHSTHSTHSTHTHTHSTHSTHTHSTHTHSTHSTHTHTHTHSTHSTHSTHSTHSTHTHTHTHSTHSTHTHSTHSTHTHTHSTHTHSTHTHSTHTHTHSTHSTHTHTHTHSTHTHTHTHSTHSTHSTHTHTHSTHTHTHTHSTHTHSTHTHTHSTHSTHTHSTHSTHSTHTHSTHTHSTHTHSTHSTHSTHTHTHSTHTHTHSTHTHTHSTHSTHSTHTHSTHTHTHSTHTHTHTHTHSTHTHSTHTHTHTH",
-    # rz(pi/2^115)
-    "XHSTHSTHSTHTHTHSTHTHSTHTHSTHSTHSTHSTHTHTHTHSTHTHSTHTHTHSTHTHSTHTHSTHSTHTHTHTHTHSTHSTHSTHSTHSTHTHSTHSTHTHTHSTHSTHTHSTHTHTHTHSTHSTHTHTHTHSTHTHTHTHSTHSTHSTHTHTHSTHSTHSTHTHTHTHSTHSTHSTHTHSTHTHTHSTHSTHSTHSTHTHSTHTHSTHSTHSTHTHTHSTHTHTHTHTHTHSTHTHTHSTHSTHSTHTHTHTHSTHTHSTHTHTHSTHSTHSTHSTHSTHSTHSTHTHTHTHSTHSTHTHSTHTHSTHSTHTHSTHTHSTHSTHTHSTHTHSTHTHTHTHTHSTHSTHSTHTHSTHTHTHSTHTHTHTHSTHTHSTHSTHTHTHTHTHTHTHSTHTHTHSTHSTHTHSTHSTHSTHTHTHTHTHSTHSTHSTHSTHSTHSTHTHTHTHSTHTHSTHSTHSTHTHTHSTHTHTHSTHSTHTHTHSTHTHTHTHTHTHSTHSTHTHTHTHTHTHSTHSTHTHTHSTHSTHSTHSTHSTHSTHTHTHSTHTHSTHSTHTHTHSTHTHSTHSTHSTHSTHTHTHSTHSTHSTHTHTHTHSTHTHTHTHTHSTHSTHTHTHTHSTHTHTHTHSTHTHTHSTHSTHSTHTHSTHTHSTHTHTHSTHTHTHSTHTHTHSTHSTHTHTHTHSTHSTHSTHSTHSTHTHTHSTHSTHTHSTHTHSTHSTHTHSTHTHTHTHTHSTHTHSTHTHTHTHTHTHSTHSTHSTHSTHSTHTHSTHSTHTHTHTHTHTHSTHSTHTHSTHSTHSTHSTHSTHSTHTHTHSTHSTHSTHTHSTHTHSTHSTHTHTHTHTHSTHSTHTHTHSTHTHSTHTHTHSTHTHSTHTHTHTHSTHTHSTHTHTHTHTHSTHTHSTHSTHTHTHSTHSTHTHSTHSTHSTHSTHSTHSTHSTHSTHSTHSTHTHSTHTHSTHSTHSTHTHSTHSTHTHTHTHTHSTHSTHTHSTHTHSTHSTHSTHTHTHSTHSTHTHSTHSTHTHTHTHTHTHTHTHSTHSTHSTHSTHTHTHSTHSTHTHSTHTHTHSTHTHSTHTHTHSTHSTHSTHSTHTHSTHTHSTHTHTHTHSTHSTHSTHTHSTHTHSTHSTHSTHSTHTHSTHSTHTHSTHSTHSTHTHTHTHTHSTHSTHSTHSTHTHTHTHSTHTHTHSTHTHSTHTHTHTHTHSTHSTHSTHTHTHSTHTHTHSTHSTHSTHSTHSTHSTHS",
-    # rz(pi/2^116)
-    "SHSTHTHSTHSTHSTHTHSTHTHSTHTHTHTHSTHTHTHSTHSTHTHTHSTHSTHTHSTHTHSTHSTHTHSTHSTHTHSTHTHSTHTHTHTHTHTHSTHTHTHTHTHTHSTHSTHTHSTHTHSTHTHTHSTHTHSTHSTHSTHSTHSTHTHTHTHTHSTHTHSTHTHSTHTHSTHSTHTHSTHSTHSTHSTHTHSTHTHSTHSTHSTHTHSTHSTHTHSTHTHTHSTHTHSTHTHTHSTHTHSTHSTHSTHSTHSTHTHSTHSTHSTHTHTHTHTHSTHTHTHTHTHTHSTHTHSTHTHTHSTHTHSTHSTHTHSTHTHSTHSTHTHSTHSTHSTHSTHTHTHSTHSTHTHTHTHSTHTHTHTHSTHTHSTHTHSTHTHTHSTHTHSTHTHSTHTHTHSTHTHSTHSTHSTHTHTHSTHSTHTHSTHTHSTHSTHSTHTHTHTHSTHSTHSTHTHSTHSTHTHSTHTHTHSTHSTHTHTHSTHSTHSTHTHSTHTHTHSTHTHTHTHSTHSTHSTHSTHSTHSTHTHTHSTHSTHSTHTHTHSTHSTHSTHSTHSTHSTHTHTHTHTHSTHSTHSTHSTHSTHTHTHTHSTHSTHSTHSTHTHTHSTHSTHSTHTHTHTHSTHSTHSTHTHSTHSTHTHSTHTHTHSTHTHSTHTHSTHTHTHSTHSTHSTHSTHTHSTHSTHSTHSTHSTHTHTHSTHTHTHTHSTHTHTHSTHTHSTHTHTHSTHSTHTHTHSTHSTHTHTHTHSTHTHTHSTHTHTHSTHSTHTHSTHTHSTHTHTHSTHSTHSTHTHSTHTHSTHTHTHTHTHTHSTHTHSTHTHSTHSTHSTHTHSTHTHSTHTHSTHTHSTHSTHTHTHSTHSTHSTHSTHSTHTHSTHTHSTHTHSTHSTHSTHTHSTHTHTHTHTHSTHSTHTHSTHSTHTHTHSTHSTHSTHTHTHSTHSTHSTHSTHTHSTHSTHSTHSTHTHSTHSTHTHTHTHTHSTHSTHTHTHSTHTHSTHTHSTHTHSTHTHSTHTHSTHTHTHSTHTHTHSTHSTHSTHSTHSTHTHTHTHTHSTHSTHSTHSTHSTHSTHSTHTHTHTHTHSTHSTHTHSTHSTHSTHTHSTHSTHSTHSTHTHTHTHTHTHTHSTHSTHSTHTHTHTHTHTHTHSTHTHSTHTHSTHSTHSTHSTHSTHTHSTHTHSTHTHSTHSTHTHTHSTHTHTHTHTHSTHSTHSTHSTHTHTHTHSTHSTHSTHTHSTHSTHTHSTHSTHSTHTHSTHTHTHSTHSTH",
-    # rz(pi/2^117)
-    "SHTHSTHSTHSTHSTHSTHTHSTHTHTHTHTHSTHTHTHTHSTHSTHTHSTHTHTHSTHSTHSTHSTHSTHSTHTHSTHTHSTHTHSTHSTHSTHSTHSTHTHTHTHTHTHSTHTHTHTHTHSTHTHSTHTHTHSTHSTHSTHSTHSTHTHSTHSTHTHTHTHSTHSTHSTHTHTHTHSTHSTHSTHTHTHSTHTHSTHSTHTHTHSTHTHTHTHTHTHSTHSTHSTHSTHSTHSTHSTHTHSTHSTHTHSTHSTHSTHSTHSTHSTHSTHTHSTHTHSTHSTHSTHTHTHTHTHTHTHTHTHSTHSTHTHSTHTHTHSTHSTHTHSTHTHTHSTHSTHSTHTHTHSTHTHTHSTHSTHSTHSTHTHSTHSTHSTHTHSTHSTHTHSTHSTHTHSTHSTHTHSTHTHTHTHSTHSTHTHTHSTHTHTHTHTHTHTHSTHSTHSTHTHSTHSTHTHTHSTHSTHSTHSTHTHTHSTHTHTHTHTHSTHTHSTHTHSTHTHTHSTHTHTHSTHSTHTHTHSTHSTHSTHTHSTHSTHSTHSTHSTHTHSTHSTHTHTHTHSTHTHSTHSTHTHSTHSTHTHSTHTHTHTHSTHSTHSTHSTHTHSTHTHTHTHSTHTHTHTHTHSTHSTHTHTHSTHSTHSTHSTHTHSTHTHTHSTHSTHSTHSTHSTHTHSTHTHTHSTHSTHSTHTHTHTHSTHSTHTHSTHTHTHTHTHSTHSTHSTHSTHTHTHTHSTHTHTHTHSTHTHTHSTHSTHTHSTHSTHTHTHTHSTHTHSTHSTHSTHTHSTHSTHSTHTHSTHSTHSTHSTHTHSTHSTHTHTHTHSTHSTHTHTHTHSTHTHTHTHTHTHSTHSTHTHSTHSTHSTHTHSTHSTHTHTHTHTHTHTHSTHSTHTHSTHTHTHTHTHSTHTHSTHTHSTHTHTHSTHSTHSTHSTHTHSTHSTHTHSTHSTHSTHTHTHTHTHTHTHTHSTHTHSTHTHTHSTHTHSTHTHTHSTHTHTHSTHSTHSTHSTHSTHTHTHTHSTHSTHTHTHTHTHSTHSTHTHSTHTHTHSTHSTHTHTHTHSTHSTHTHSTHSTHSTHSTHTHTHSTHTHSTHTHTHSTHSTHTHSTHTHSTHTHSTHTHSTHSTHTHSTHSTHSTHTHTHSTHSTHSTHTHTHTHSTHTHTHTHTHTHTHTHTHSTHSTHTHSTHTHTHSTHTHSTHSTHSTHSTHTHTHTHTHTHTHTHTHTHTHTHTHTHTHTHSTHTHSTHSTHSTHSTHTH",
-    # rz(pi/2^118)
-    "SSSHSTHTHTHTHTHSTHSTHTHTHSTHTHTHSTHTHTHSTHTHTHSTHSTHTHTHSTHTHTHTHSTHTHTHTHSTHTHSTHTHTHSTHTHSTHSTHTHSTHSTHTHSTHTHSTHSTHSTHTHTHTHSTHSTHTHTHSTHSTHSTHTHSTHTHTHSTHSTHSTHSTHSTHSTHTHTHTHSTHSTHSTHSTHSTHTHTHTHSTHSTHSTHSTHTHTHSTHTHSTHTHSTHSTHSTHTHSTHTHSTHSTHTHTHSTHTHTHSTHSTHSTHTHSTHTHTHSTHSTHTHTHSTHTHSTHTHSTHTHSTHSTHSTHTHSTHSTHSTHSTHSTHSTHSTHSTHSTHTHTHSTHSTHSTHSTHSTHTHTHTHTHSTHTHTHTHTHSTHSTHSTHTHTHSTHSTHSTHSTHTHTHTHSTHTHSTHTHTHTHSTHTHSTHSTHTHSTHTHTHTHSTHSTHSTHTHTHTHTHSTHSTHSTHSTHTHSTHTHSTHSTHSTHSTHTHSTHSTHTHSTHTHTHSTHTHTHTHTHTHSTHSTHSTHSTHSTHSTHSTHTHSTHTHTHTHTHSTHSTHSTHSTHSTHTHSTHSTHSTHSTHTHTHTHTHSTHTHTHTHTHTHSTHSTHSTHSTHTHSTHSTHSTHTHTHSTHSTHSTHTHSTHTHTHSTHTHSTHTHTHTHSTHTHTHSTHTHSTHTHSTHTHTHTHTHSTHTHTHSTHSTHSTHSTHTHSTHSTHSTHTHTHSTHTHTHSTHSTHTHSTHTHSTHTHTHSTHSTHSTHTHSTHTHTHSTHSTHTHSTHSTHTHTHTHTHSTHTHTHTHTHSTHTHTHSTHSTHSTHTHSTHTHTHSTHTHSTHSTHTHSTHSTHSTHSTHTHSTHSTHTHTHTHSTHSTHTHSTHSTHTHTHTHTHTHSTHTHSTHSTHTHSTHTHTHSTHTHTHTHSTHTHSTHSTHTHSTHSTHSTHSTHTHSTHTHSTHSTHSTHSTHTHSTHSTHTHSTHSTHSTHSTHTHTHSTHTHTHTHTHTHTHTHSTHTHTHTHTHSTHTHTHSTHTHSTHTHSTHSTHTHSTHSTHTHTHSTHTHTHSTHTHTHTHSTHTHSTHTHSTHSTHSTHTHSTHTHTHSTHSTHTHTHSTHSTHSTHSTHSTHSTHTHSTHTHTHTHSTHSTHSTHSTHSTHSTHTHSTHTHSTHSTHSTHTHTHSTHTHTHTHSTHSTHTHTHTHTHTHSTHTHTHTHSTHTHSTHSTHSTHTHSTHTHTHSTHTHTHTHSTHSTHTHSTHSTHTH",
-    # rz(pi/2^119)
-    "SHSTHSTHSTHSTHTHSTHSTHTHSTHTHTHTHSTHSTHTHTHSTHTHSTHSTHTHTHSTHSTHSTHSTHSTHTHTHTHTHTHSTHTHSTHSTHTHTHSTHSTHTHSTHTHTHTHSTHTHSTHTHTHSTHSTHSTHTHSTHSTHTHSTHTHSTHTHSTHTHTHTHTHTHSTHTHTHSTHTHTHSTHSTHTHSTHSTHTHSTHTHTHSTHTHTHTHSTHSTHTHSTHSTHSTHTHTHSTHSTHTHTHSTHSTHSTHTHSTHSTHSTHTHTHTHTHSTHTHSTHTHTHSTHSTHSTHSTHSTHTHTHSTHTHTHSTHSTHSTHSTHTHTHTHSTHTHSTHTHSTHSTHTHTHSTHTHSTHTHTHSTHSTHTHSTHTHTHSTHTHTHSTHTHTHSTHSTHSTHSTHSTHSTHSTHSTHTHTHSTHSTHTHTHSTHSTHSTHTHTHTHTHTHSTHSTHSTHTHTHSTHSTHSTHSTHSTHTHTHTHSTHTHTHTHTHTHSTHSTHTHSTHTHTHSTHSTHTHTHSTHTHSTHSTHTHSTHTHSTHSTHTHSTHSTHTHTHTHTHSTHTHTHSTHTHSTHSTHSTHSTHSTHTHTHSTHSTHSTHSTHSTHSTHTHSTHSTHSTHTHSTHSTHTHTHTHTHTHTHSTHSTHSTHTHTHTHTHSTHSTHSTHTHTHTHTHSTHSTHTHSTHSTHTHSTHTHTHSTHSTHSTHSTHSTHTHTHSTHSTHTHSTHTHSTHSTHSTHTHSTHTHTHSTHSTHSTHTHSTHSTHSTHTHTHTHTHSTHSTHTHTHTHTHTHTHTHSTHTHSTHTHTHTHTHSTHTHSTHTHTHTHTHSTHSTHTHTHSTHSTHSTHSTHTHTHTHTHSTHTHTHSTHTHSTHTHTHTHTHTHTHSTHTHSTHSTHSTHSTHTHSTHTHTHSTHTHSTHSTHTHSTHTHTHTHTHTHSTHSTHTHTHSTHTHTHTHTHTHTHSTHTHTHTHTHTHTHSTHSTHTHSTHSTHSTHSTHTHTHSTHTHTHSTHTHTHTHTHSTHSTHSTHSTHTHTHTHTHTHTHSTHSTHTHSTHSTHTHTHSTHSTHSTHTHTHSTHSTHTHTHSTHTHSTHTHTHSTHSTHSTHSTHTHTHSTHTHTHSTHSTHTHSTHSTHSTHSTHTHTHSTHTHTHTHSTHSTHTHSTHTHSTHTHSTHTHSTHSTHTHTHTHTHTHTHTHTHTHSTHSTHSTHSTHTHSTHTHSTHSTHTHTHSTHSTHTHTHTHSTHSTHTH",
-    # rz(pi/2^120)
-    "SSSXHTHTHSTHTHTHSTHTHTHTHTHTHTHTHSTHTHSTHSTHSTHSTHTHTHTHSTHTHSTHTHSTHSTHTHSTHSTHSTHTHSTHTHSTHTHTHTHSTHSTHSTHSTHTHTHSTHTHSTHSTHSTHTHSTHTHSTHTHTHSTHSTHSTHSTHSTHSTHTHTHTHTHTHSTHSTHSTHTHTHSTHSTHTHTHSTHTHSTHSTHSTHTHSTHTHTHSTHTHTHSTHSTHTHSTHSTHSTHSTHTHTHTHTHTHSTHSTHTHTHTHSTHSTHTHTHSTHTHTHSTHTHTHSTHSTHTHSTHTHSTHSTHTHSTHSTHSTHSTHTHSTHTHTHTHSTHTHTHTHSTHTHSTHTHTHTHTHSTHSTHSTHTHSTHSTHTHSTHTHTHSTHSTHSTHSTHTHTHSTHTHSTHTHTHSTHSTHTHTHTHTHTHTHTHSTHSTHTHTHSTHSTHTHSTHSTHSTHSTHSTHSTHTHSTHSTHSTHTHSTHSTHSTHTHTHSTHSTHSTHTHTHSTHSTHTHSTHTHTHTHSTHSTHSTHTHTHTHSTHSTHTHSTHTHTHTHTHSTHTHTHTHSTHTHTHSTHSTHTHTHSTHSTHTHSTHSTHSTHSTHTHSTHSTHTHTHSTHTHTHSTHTHTHTHTHSTHSTHTHSTHTHTHSTHTHTHTHSTHTHSTHTHSTHSTHTHSTHTHSTHSTHSTHSTHSTHSTHSTHTHTHSTHSTHSTHSTHSTHTHTHSTHTHTHSTHTHTHSTHSTHSTHSTHTHSTHTHTHTHSTHTHSTHTHSTHTHSTHSTHSTHSTHSTHSTHSTHSTHSTHSTHTHSTHTHSTHSTHTHTHTHTHTHSTHTHTHTHSTHSTHSTHSTHSTHSTHSTHSTHSTHSTHSTHSTHSTHSTHSTHTHSTHTHTHTHSTHTHSTHTHSTHTHTHTHSTHSTHSTHTHSTHTHSTHTHTHSTHSTHSTHSTHSTHTHSTHTHSTHSTHSTHSTHTHSTHSTHTHTHTHTHTHTHSTHSTHSTHSTHSTHSTHSTHSTHSTHSTHSTHSTHTHTHSTHTHSTHSTHTHTHTHSTHTHTHTHTHSTHTHTHTHSTHTHTHTHTHSTHTHSTHTHSTHTHSTHSTHTHTHSTHSTHTHTHTHTHSTHSTHTHTHTHSTHTHTHSTHTHTHTHTHSTHSTHTHTHSTHSTHSTHSTHTHTHSTHTHTHSTHTHSTHSTHSTHSTHSTHTHTHTHSTHSTHTHSTHSTHSTHTHTHSTHTHTHTHTHSTHSTHTHSTHTHTHTH",
-    # rz(pi/2^121)
-    "STHSTHTHSTHSTHSTHTHSTHTHTHSTHTHTHSTHTHTHSTHTHTHTHSTHTHSTHSTHSTHTHSTHSTHSTHSTHTHSTHSTHSTHTHTHTHTHSTHTHTHTHTHSTHTHTHSTHSTHSTHSTHTHSTHSTHTHSTHTHSTHSTHTHTHTHTHSTHTHTHTHSTHSTHSTHSTHSTHTHSTHTHTHTHSTHTHTHTHSTHSTHTHTHSTHTHTHTHSTHTHTHSTHTHSTHSTHSTHSTHSTHSTHTHSTHTHTHTHTHTHSTHTHTHTHTHSTHTHSTHTHSTHTHTHTHSTHTHSTHSTHTHTHTHTHSTHSTHTHTHSTHSTHSTHSTHTHTHSTHTHSTHTHTHSTHTHSTHSTHTHTHSTHTHSTHTHSTHTHTHSTHTHSTHSTHSTHTHSTHSTHTHSTHTHTHSTHTHSTHSTHSTHTHSTHTHTHTHTHTHSTHTHSTHTHSTHTHTHSTHTHSTHSTHTHSTHSTHSTHSTHSTHSTHTHTHSTHTHSTHTHSTHSTHSTHTHTHTHSTHTHTHSTHSTHSTHTHSTHSTHSTHTHTHSTHSTHTHSTHTHSTHSTHTHSTHSTHTHSTHSTHTHTHSTHTHTHSTHSTHTHTHSTHTHSTHTHSTHSTHTHTHTHTHSTHTHSTHTHTHTHSTHSTHSTHTHSTHTHSTHTHTHTHTHSTHSTHTHTHSTHSTHSTHTHSTHTHSTHTHSTHSTHSTHTHTHSTHSTHSTHSTHSTHSTHSTHSTHTHSTHSTHSTHTHSTHTHSTHSTHSTHTHSTHSTHSTHSTHTHTHSTHSTHSTHTHTHTHSTHTHTHSTHTHSTHTHTHTHSTHTHSTHSTHTHSTHSTHTHTHSTHTHTHTHSTHSTHSTHSTHTHSTHTHSTHSTHTHSTHTHTHTHTHSTHSTHTHSTHSTHSTHTHTHTHSTHTHSTHSTHTHSTHSTHTHSTHTHSTHTHSTHSTHTHTHSTHTHSTHSTHTHTHTHSTHSTHSTHSTHTHTHSTHSTHTHSTHSTHTHTHTHSTHSTHTHSTHSTHTHSTHTHTHTHSTHSTHTHSTHSTHSTHSTHTHTHTHSTHSTHSTHSTHSTHSTHSTHTHSTHTHSTHTHTHTHSTHTHTHSTHTHSTHSTHTHTHSTHTHSTHTHTHTHTHTHTHTHSTHSTHTHTHTHSTHSTHSTHTHTHSTHTHTHSTHTHSTHTHTHTHTHTHSTHSTHTHSTHSTHTHSTHTHSTHTHTHTHTHTHSTHSTHSTHTHSTHTHSTHTHTHTHTHTHTHTHTHSTHTH",
-    # rz(pi/2^122)
-    "SXHSTHSTHTHSTHTHSTHSTHTHSTHSTHTHSTHTHTHTHSTHSTHTHSTHSTHTHSTHTHSTHTHSTHTHTHSTHSTHTHSTHSTHTHSTHTHSTHTHTHTHSTHSTHTHTHTHTHSTHSTHTHTHSTHSTHTHTHSTHTHSTHSTHSTHSTHTHSTHSTHSTHSTHSTHSTHTHSTHSTHSTHTHTHTHTHSTHSTHSTHSTHSTHTHTHTHTHTHSTHSTHSTHTHTHTHSTHTHTHSTHSTHSTHTHSTHTHTHSTHTHTHTHSTHTHSTHTHSTHSTHSTHTHTHSTHTHTHTHSTHSTHTHTHSTHTHTHTHTHSTHSTHTHSTHTHTHTHTHSTHTHTHTHTHTHTHSTHSTHTHTHTHTHTHSTHSTHTHTHSTHTHSTHSTHSTHSTHSTHTHTHTHTHSTHSTHTHTHSTHSTHTHSTHSTHTHTHTHSTHTHSTHSTHTHTHSTHTHTHSTHSTHSTHSTHSTHTHTHSTHSTHSTHSTHTHTHTHTHTHTHTHSTHTHTHSTHTHTHSTHTHTHSTHSTHTHSTHTHTHSTHTHSTHTHSTHTHTHSTHTHTHTHTHTHSTHTHTHTHSTHSTHTHTHTHSTHSTHSTHSTHSTHTHSTHTHTHSTHTHTHTHSTHTHSTHSTHSTHTHTHSTHTHTHTHSTHSTHSTHTHSTHSTHSTHTHSTHTHSTHSTHSTHSTHTHTHTHSTHTHTHTHTHTHSTHSTHSTHTHTHSTHTHSTHTHTHSTHTHTHSTHTHTHTHTHTHTHSTHTHSTHSTHSTHTHSTHTHTHTHTHTHTHSTHTHSTHSTHTHTHTHSTHTHSTHTHTHSTHTHTHTHSTHTHTHTHTHTHSTHSTHTHSTHTHTHSTHTHSTHSTHTHSTHTHSTHSTHSTHTHTHTHTHSTHSTHTHTHTHSTHTHSTHSTHTHTHSTHSTHTHTHTHTHTHTHTHSTHTHTHSTHSTHTHSTHSTHSTHSTHTHTHSTHSTHTHSTHTHTHTHTHSTHSTHTHTHTHTHTHTHSTHTHSTHSTHTHTHTHSTHTHSTHSTHTHSTHSTHSTHTHSTHSTHSTHSTHSTHTHTHTHTHSTHSTHSTHTHSTHTHSTHSTHTHSTHTHSTHSTHTHSTHSTHTHTHSTHSTHTHTHSTHSTHSTHTHTHSTHTHTHTHSTHTHTHSTHSTHTHSTHSTHTHSTHTHSTHSTHTHTHSTHTHSTHTHTHSTHTHTHSTHTHSTHSTHSTHSTHTHSTHSTHSTHSTHTHSTH",
-    # rz(pi/2^123)
-    "HSTHSTHSTHTHTHTHTHSTHSTHSTHSTHTHSTHTHTHTHTHTHTHSTHTHSTHTHTHTHSTHSTHSTHSTHSTHSTHSTHSTHTHTHTHTHSTHTHTHTHSTHTHSTHTHSTHSTHTHSTHTHSTHTHTHSTHSTHSTHTHSTHSTHTHSTHSTHSTHTHTHTHSTHTHTHSTHSTHTHTHSTHTHTHSTHTHSTHTHSTHTHSTHTHTHSTHSTHSTHSTHTHSTHTHSTHSTHSTHTHSTHTHTHSTHSTHSTHSTHTHSTHTHSTHTHTHTHTHTHSTHSTHTHSTHSTHTHSTHSTHTHSTHSTHSTHTHTHTHSTHTHTHTHSTHSTHSTHTHSTHTHTHSTHTHSTHSTHTHTHSTHSTHTHSTHSTHSTHSTHTHSTHTHTHSTHTHSTHSTHTHSTHSTHSTHSTHTHSTHSTHSTHSTHSTHTHSTHSTHSTHTHTHTHTHSTHTHSTHTHTHTHSTHTHSTHSTHTHSTHSTHTHTHSTHTHTHSTHTHSTHTHTHSTHTHSTHTHTHTHSTHSTHSTHSTHTHTHSTHTHTHSTHSTHTHSTHTHTHTHSTHSTHSTHSTHTHTHTHTHTHSTHSTHSTHSTHSTHSTHTHTHSTHSTHTHTHSTHTHSTHTHTHTHSTHTHSTHSTHTHTHTHTHSTHSTHSTHSTHSTHTHSTHSTHTHSTHSTHSTHTHSTHSTHSTHSTHSTHTHTHSTHSTHSTHTHTHSTHTHSTHTHTHSTHTHTHTHTHTHTHSTHTHTHTHSTHSTHSTHSTHTHTHSTHTHTHTHTHTHSTHSTHSTHSTHSTHTHTHTHSTHSTHSTHSTHSTHTHSTHTHSTHTHTHSTHSTHSTHTHSTHSTHTHSTHTHTHTHTHTHSTHSTHSTHTHTHTHTHSTHSTHTHTHTHSTHTHTHTHTHSTHTHSTHSTHTHTHTHSTHTHTHSTHTHTHTHTHSTHSTHSTHTHSTHSTHSTHSTHTHTHTHTHSTHTHTHTHTHTHSTHTHTHTHSTHSTHTHTHTHTHTHTHTHSTHTHTHTHSTHTHTHSTHTHTHSTHSTHTHTHSTHSTHSTHSTHTHSTHTHSTHTHSTHSTHSTHTHSTHTHSTHTHSTHTHSTHTHTHSTHSTHTHSTHTHTHTHSTHTHTHSTHTHTHTHSTHSTHTHSTHSTHSTHTHTHTHSTHTHTHTHSTHSTHTHSTHSTHTHTHSTHTHTHTHTHSTHTHTHSTHSTHSTHTHTHSTHSTHSTHTHSTHSTHTHTHSTHSTHSTHSTHTHTHSTHSTHSTHTHTHSTHTHS",
-    # rz(pi/2^124)
-    "SSXHSTHSTHSTHTHTHSTHSTHSTHTHTHTHTHSTHTHTHTHTHTHTHTHSTHTHSTHTHTHSTHTHSTHSTHTHTHSTHSTHTHSTHSTHTHSTHSTHSTHTHSTHSTHSTHTHSTHTHSTHTHSTHSTHTHSTHSTHTHTHSTHTHSTHTHSTHSTHSTHSTHTHTHSTHSTHSTHSTHTHSTHSTHSTHTHSTHTHTHTHSTHSTHSTHSTHSTHSTHSTHSTHSTHTHSTHSTHSTHTHSTHTHSTHTHTHTHTHSTHTHTHSTHSTHTHSTHTHSTHSTHTHTHSTHSTHSTHTHSTHTHTHTHSTHSTHTHSTHTHSTHTHSTHTHTHSTHTHSTHTHSTHTHSTHTHSTHSTHTHSTHSTHTHSTHTHTHTHSTHSTHTHSTHSTHSTHTHTHSTHSTHTHTHSTHSTHSTHTHSTHTHTHSTHSTHTHTHSTHSTHSTHTHTHSTHSTHTHTHSTHTHSTHSTHSTHTHSTHTHSTHTHSTHTHSTHTHSTHSTHSTHSTHTHSTHSTHSTHTHSTHSTHSTHSTHSTHSTHTHSTHSTHSTHTHSTHSTHSTHTHTHSTHTHTHSTHSTHTHTHSTHSTHSTHTHSTHSTHSTHSTHTHTHTHSTHSTHTHSTHSTHSTHTHTHSTHSTHTHSTHTHTHSTHTHTHTHTHTHTHTHSTHTHSTHSTHSTHTHTHSTHSTHSTHSTHTHTHSTHTHSTHSTHTHSTHTHTHTHTHSTHSTHTHTHTHTHSTHTHSTHTHSTHSTHTHSTHTHTHSTHTHTHSTHTHTHTHTHTHSTHTHSTHTHSTHTHSTHSTHTHTHTHSTHSTHTHTHTHSTHSTHTHTHSTHTHTHTHSTHTHSTHSTHTHTHTHTHTHTHTHTHTHSTHTHTHSTHTHSTHSTHSTHTHTHTHSTHTHSTHTHSTHSTHSTHTHTHSTHSTHSTHTHTHSTHTHTHTHSTHTHSTHSTHTHTHSTHTHTHSTHTHTHSTHSTHSTHTHSTHSTHTHSTHTHTHTHSTHSTHTHTHSTHSTHSTHTHSTHTHTHSTHSTHSTHTHSTHSTHSTHSTHSTHSTHSTHSTHTHSTHTHTHSTHSTHTHTHSTHSTHSTHSTHSTHSTHSTHTHSTHTHSTHTHSTHTHSTHSTHTHTHSTHTHTHSTHSTHSTHSTHSTHTHSTHTHTHSTHSTHSTHSTHSTHTHSTHTHTHTHSTHSTHTHSTHSTHSTHSTHSTHTHTHTHSTHTHSTHSTHSTHTHSTHSTHSTHSTHSTHSTHTHSTHTHSTHSTHSTHTHTHTHTHTHTHTHTHSTHSTHSTHTHTHSTHTHTHSTHTHS",
-    # rz(pi/2^125)
-    "SSTHTHTHTHSTHTHSTHTHTHSTHTHSTHSTHTHSTHSTHSTHSTHSTHTHTHTHTHSTHSTHTHTHTHTHTHSTHTHSTHSTHSTHSTHSTHTHTHTHSTHSTHSTHTHTHSTHTHSTHSTHTHTHSTHTHSTHTHSTHTHTHSTHSTHSTHTHTHSTHSTHSTHTHTHTHSTHSTHTHSTHTHSTHTHSTHTHTHSTHTHSTHSTHSTHTHSTHTHSTHTHSTHSTHSTHTHSTHTHSTHTHSTHTHTHTHSTHSTHTHTHSTHTHSTHSTHTHTHSTHTHSTHTHTHTHTHSTHTHSTHSTHSTHTHSTHSTHTHTHTHSTHSTHTHTHSTHSTHTHTHSTHSTHTHTHTHSTHTHTHTHTHSTHSTHSTHTHSTHSTHSTHSTHTHSTHTHTHSTHTHTHTHTHTHSTHTHTHTHTHSTHSTHTHTHSTHTHTHSTHSTHTHTHTHTHTHTHSTHSTHSTHTHSTHSTHSTHSTHSTHTHTHSTHTHTHTHTHTHSTHSTHTHSTHSTHSTHTHTHSTHTHSTHSTHSTHTHSTHSTHSTHSTHSTHSTHTHTHSTHTHSTHTHTHSTHTHSTHSTHTHTHTHTHSTHTHTHSTHTHSTHTHTHSTHSTHTHTHTHSTHTHTHSTHTHSTHSTHSTHSTHTHTHSTHTHSTHSTHTHSTHTHSTHSTHSTHSTHTHSTHTHTHSTHTHSTHSTHTHSTHSTHTHTHTHTHTHSTHTHTHTHSTHTHTHTHTHSTHSTHSTHSTHTHTHTHTHTHSTHTHSTHTHTHTHTHSTHTHTHSTHTHTHSTHTHTHTHSTHSTHTHTHSTHTHTHTHSTHSTHTHSTHTHSTHTHTHTHSTHSTHSTHTHSTHSTHSTHTHSTHTHTHSTHTHSTHTHSTHSTHTHTHSTHTHTHTHSTHSTHSTHTHTHTHSTHTHTHTHSTHTHSTHSTHTHSTHSTHSTHTHSTHTHSTHSTHSTHTHSTHTHSTHTHSTHSTHSTHTHTHSTHSTHSTHTHTHTHTHTHSTHTHSTHSTHTHSTHSTHTHSTHTHSTHTHTHTHTHTHTHSTHTHSTHSTHSTHTHTHTHSTHSTHTHTHSTHTHSTHTHTHSTHTHSTHTHSTHSTHTHSTHSTHTHTHTHSTHSTHTHSTHTHSTHTHTHTHSTHTHSTHTHTHTHSTHTHTHTHTHSTHSTHTHTHTHSTHTHSTHTHTHSTHSTHTHSTHTHSTHTHTHTHSTHTHSTHSTHSTHSTHSTHTHTHSTHSTHTHSTHSTHSTHTHTHTHSTHTHSTHSTHSTHSTHSTHSTH",
-    # rz(pi/2^126)
-    "SXHTHTHTHSTHSTHSTHSTHSTHTHSTHSTHTHSTHSTHTHSTHTHTHTHTHTHSTHSTHSTHTHSTHSTHTHSTHTHSTHSTHSTHSTHSTHTHSTHSTHTHSTHSTHTHTHTHSTHTHSTHTHTHTHSTHSTHTHSTHSTHTHTHTHSTHTHTHSTHSTHSTHTHSTHTHTHSTHSTHTHTHSTHTHSTHTHSTHTHSTHTHTHTHTHTHSTHSTHTHTHTHTHTHSTHSTHSTHTHSTHTHTHSTHTHTHSTHSTHSTHTHSTHSTHSTHSTHSTHSTHSTHSTHSTHTHSTHSTHTHSTHSTHSTHTHTHTHSTHSTHTHTHTHSTHTHSTHTHTHSTHSTHSTHTHTHTHSTHSTHTHSTHSTHSTHTHTHSTHTHTHSTHSTHSTHSTHSTHTHTHSTHTHSTHSTHTHTHTHSTHTHSTHTHTHSTHSTHSTHTHTHTHTHTHTHSTHSTHTHTHTHTHSTHSTHSTHSTHSTHTHSTHSTHSTHSTHTHSTHSTHSTHSTHTHSTHSTHTHSTHSTHSTHSTHSTHSTHTHSTHTHSTHTHSTHTHSTHSTHSTHSTHSTHTHTHSTHTHTHTHTHSTHSTHSTHTHSTHSTHSTHTHSTHSTHSTHSTHTHTHSTHSTHSTHTHSTHSTHSTHTHSTHTHSTHTHTHTHSTHTHTHTHSTHSTHSTHSTHTHSTHSTHTHSTHTHSTHSTHSTHTHSTHSTHTHSTHSTHTHSTHSTHTHSTHSTHTHSTHTHSTHTHTHSTHTHTHSTHTHSTHSTHTHTHTHSTHSTHSTHSTHTHSTHSTHTHTHSTHTHSTHSTHTHSTHTHSTHTHTHTHSTHSTHSTHTHSTHTHSTHTHTHSTHSTHSTHSTHSTHTHTHTHSTHSTHSTHSTHSTHSTHSTHTHTHSTHSTHTHSTHTHSTHTHSTHTHSTHTHTHTHTHTHSTHTHSTHTHSTHTHTHSTHSTHSTHTHSTHSTHTHTHSTHSTHSTHSTHSTHSTHSTHSTHTHTHSTHTHSTHTHTHSTHTHTHSTHTHTHTHTHTHSTHTHSTHSTHSTHSTHTHSTHTHTHTHSTHSTHSTHTHTHTHTHSTHSTHSTHTHSTHSTHSTHTHSTHTHTHSTHTHTHSTHSTHTHTHSTHSTHSTHTHTHSTHSTHSTHSTHTHTHTHSTHTHSTHTHTHTHTHSTHTHSTHSTHSTHTHTHSTHSTHSTHTHTHTHSTHTHTHTHTHTHTHSTHTHSTHTHSTHSTHTHTHTHTHSTHTHTHSTHSTHSTHTHTHSTHTHSTHTHSTHSTHSTHSTHSTHTHTHSTHTHSTHTHTHSTHTHTHSTHST",
-    # rz(pi/2^127)
-    "SSSXTHSTHTHSTHSTHTHSTHSTHTHSTHTHTHTHSTHTHTHSTHSTHTHSTHTHSTHTHTHTHSTHSTHSTHTHTHSTHTHTHSTHSTHTHSTHTHSTHTHSTHTHTHTHSTHSTHSTHSTHTHTHSTHSTHTHSTHSTHSTHTHTHTHSTHTHSTHSTHTHTHSTHTHSTHTHTHTHTHTHTHSTHSTHTHTHSTHSTHTHSTHSTHSTHTHSTHTHTHTHTHTHTHSTHTHTHSTHTHSTHSTHTHSTHSTHTHSTHTHTHTHSTHTHSTHTHTHTHSTHTHSTHTHSTHSTHTHSTHSTHSTHTHTHTHTHTHSTHSTHTHTHSTHTHTHSTHSTHTHTHTHTHTHSTHSTHTHTHSTHSTHSTHSTHSTHSTHTHSTHSTHTHTHTHTHSTHTHSTHTHSTHTHTHTHTHTHSTHTHSTHSTHTHSTHSTHSTHSTHSTHTHSTHTHTHSTHSTHSTHTHTHTHSTHTHSTHSTHTHTHSTHTHSTHSTHTHTHTHSTHTHSTHSTHTHSTHTHSTHSTHSTHSTHSTHTHTHTHTHTHSTHTHSTHSTHSTHTHTHSTHSTHTHTHTHTHTHTHSTHSTHTHSTHSTHTHTHTHSTHSTHTHTHSTHTHTHSTHSTHSTHTHSTHTHTHTHSTHTHSTHSTHSTHSTHSTHSTHTHTHTHSTHSTHTHSTHSTHSTHTHSTHSTHTHTHTHSTHTHSTHSTHSTHSTHTHTHSTHSTHSTHTHTHSTHTHSTHTHTHSTHTHSTHSTHTHTHTHTHSTHSTHSTHSTHTHSTHTHSTHSTHSTHTHTHTHSTHSTHTHTHTHSTHTHSTHSTHSTHTHTHTHSTHTHSTHSTHTHSTHTHTHTHTHTHTHSTHTHTHTHSTHTHTHTHSTHSTHTHSTHSTHTHTHSTHSTHSTHTHTHSTHSTHSTHSTHSTHTHTHSTHSTHTHSTHSTHSTHSTHSTHSTHSTHSTHSTHSTHTHTHTHTHSTHSTHSTHTHTHTHSTHSTHTHSTHTHTHSTHTHSTHTHTHSTHSTHSTHSTHSTHSTHSTHTHTHSTHTHTHTHTHSTHSTHTHSTHTHTHTHSTHSTHTHTHTHSTHSTHTHSTHSTHSTHSTHTHSTHSTHSTHSTHSTHSTHTHSTHSTHTHSTHSTHSTHSTHTHSTHSTHSTHSTHSTHSTHSTHTHTHTHSTHTHTHTHTHSTHTHTHSTHTHTHSTHSTHTHTHSTHTHTHTHSTHTHTHTHTHSTHTHTHTHTHSTHTHTHTHSTHTHTHSTHTHTHSTHSTHSTHSTHTHTHSTHSTHSTHTHTHTHSTH",
-    # rz(pi/2^128)
-    "SHTHSTHSTHTHSTHTHSTHTHTHSTHTHSTHSTHSTHTHSTHSTHTHSTHSTHSTHTHSTHSTHSTHTHSTHTHTHSTHTHTHTHTHSTHSTHSTHSTHSTHTHSTHSTHSTHTHTHTHTHTHSTHTHSTHSTHTHTHSTHSTHTHSTHSTHTHTHSTHTHSTHTHTHSTHTHSTHTHTHSTHSTHTHSTHSTHSTHSTHSTHSTHTHSTHSTHSTHTHTHTHSTHSTHSTHTHTHSTHSTHSTHSTHTHSTHTHTHSTHTHSTHSTHSTHSTHTHSTHSTHSTHTHTHTHTHTHSTHSTHSTHSTHTHSTHTHSTHTHSTHSTHSTHSTHTHTHTHSTHSTHSTHSTHTHTHTHSTHTHTHSTHSTHTHTHTHTHSTHTHSTHSTHTHSTHTHSTHSTHTHTHTHSTHSTHTHTHSTHTHSTHTHTHTHTHTHTHTHTHSTHSTHTHSTHSTHSTHTHSTHTHTHSTHTHSTHTHSTHTHTHTHSTHSTHSTHTHTHSTHTHTHTHTHSTHTHTHSTHSTHSTHTHSTHTHSTHTHSTHTHTHSTHSTHSTHSTHSTHTHTHSTHSTHSTHSTHSTHSTHTHSTHTHSTHSTHTHTHSTHSTHTHTHSTHTHTHTHTHSTHTHSTHTHTHTHSTHTHSTHSTHSTHSTHSTHTHTHTHTHTHTHTHTHTHSTHSTHSTHTHTHTHTHSTHTHSTHTHTHSTHSTHSTHTHSTHTHSTHTHTHSTHTHTHSTHSTHTHSTHTHSTHSTHSTHTHTHSTHSTHTHTHSTHSTHSTHTHSTHSTHSTHTHSTHSTHSTHTHTHTHTHSTHSTHTHTHSTHTHSTHTHTHSTHTHSTHSTHTHSTHTHTHSTHSTHTHTHSTHSTHTHSTHSTHSTHSTHTHSTHSTHTHSTHTHTHSTHTHTHTHTHTHTHSTHTHSTHSTHSTHTHTHTHTHTHTHTHTHTHTHSTHSTHTHTHTHSTHSTHTHSTHSTHSTHSTHTHSTHSTHSTHSTHTHSTHTHTHTHTHSTHSTHTHTHSTHTHTHTHSTHTHTHTHSTHSTHSTHSTHSTHSTHTHTHTHTHSTHTHTHSTHSTHSTHTHTHSTHSTHSTHSTHTHSTHSTHTHSTHTHTHTHTHTHSTHSTHTHSTHTHTHTHSTHSTHTHTHTHSTHSTHTHTHSTHSTHTHTHTHSTHTHTHSTHTHSTHSTHSTHSTHTHTHSTHTHTHTHSTHTHSTHTHTHSTHSTHSTHTHSTHTHSTHTHTHTHSTHSTHSTHSTHTHTHSTHTHSTHTHTHSTHTHTHTHTHTHSTHSTHSTHTH",
-    # rz(pi/2^129)
-    "XHSTHSTHTHTHSTHTHTHTHSTHTHSTHSTHSTHSTHSTHTHTHTHSTHSTHTHSTHSTHTHTHSTHSTHTHSTHTHSTHSTHTHSTHTHSTHSTHSTHSTHSTHTHSTHTHSTHTHSTHSTHSTHTHSTHSTHSTHTHSTHSTHSTHTHSTHTHTHTHSTHTHSTHSTHSTHTHSTHTHTHSTHTHSTHSTHSTHTHTHTHSTHSTHSTHSTHSTHTHSTHTHSTHTHSTHTHTHTHSTHSTHSTHTHTHTHTHTHTHSTHSTHSTHSTHTHSTHTHSTHTHTHTHTHSTHSTHTHSTHSTHSTHTHTHTHSTHTHSTHSTHSTHSTHTHTHTHSTHTHSTHSTHSTHTHTHTHTHTHTHTHTHTHSTHSTHTHSTHSTHSTHSTHSTHSTHTHSTHTHSTHSTHTHTHSTHTHSTHSTHSTHTHSTHTHSTHTHTHTHSTHTHSTHTHTHTHTHSTHSTHSTHTHSTHSTHTHSTHSTHSTHSTHSTHTHSTHTHSTHSTHSTHSTHSTHSTHSTHTHSTHSTHTHSTHSTHTHTHTHTHSTHTHSTHSTHSTHTHTHTHTHTHSTHSTHTHTHTHTHSTHTHTHSTHSTHSTHSTHTHSTHSTHSTHSTHSTHTHSTHSTHSTHTHTHTHSTHTHTHSTHTHSTHTHSTHTHTHSTHSTHTHTHSTHSTHSTHTHTHSTHSTHSTHTHSTHTHTHTHTHTHTHSTHSTHSTHTHTHSTHTHTHSTHTHSTHTHTHTHTHTHTHSTHSTHSTHSTHTHSTHSTHTHSTHSTHTHSTHTHTHSTHSTHSTHTHSTHSTHTHSTHSTHSTHSTHSTHTHSTHSTHTHTHTHTHSTHTHTHSTHTHTHSTHSTHSTHSTHTHSTHSTHTHTHTHTHSTHSTHTHTHTHSTHTHTHSTHTHTHSTHSTHTHSTHTHSTHSTHSTHTHSTHSTHSTHTHTHSTHTHSTHTHSTHTHSTHSTHSTHSTHSTHTHTHSTHTHSTHTHTHSTHSTHTHSTHTHTHSTHSTHSTHTHSTHTHSTHSTHSTHTHTHSTHTHSTHTHSTHSTHTHSTHSTHSTHSTHSTHSTHSTHSTHSTHSTHTHSTHSTHTHSTHSTHTHTHSTHTHTHSTHSTHTHSTHTHTHTHTHSTHTHTHSTHSTHSTHSTHTHTHTHSTHTHSTHTHSTHSTHSTHTHSTHSTHTHSTHTHTHTHSTHTHTHSTHSTHSTHTHSTHSTHSTHTHTHSTHSTHTHSTHTHSTHTHTHSTHSTHTHTHTHTHSTHTHSTHSTHTHTHTHTHSTHTHTHSTHSTHTHTHTHTHSTHTHSTHTHTHSTHSTHSTHTHSTHTHTHSTHSTHTHS",
-    # rz(pi/2^130)
-    "SHSTHTHSTHSTHTHSTHSTHTHSTHSTHSTHTHSTHTHTHSTHTHSTHTHTHTHTHSTHSTHTHSTHTHTHSTHSTHTHSTHSTHTHSTHSTHTHSTHSTHTHTHSTHTHSTHTHSTHSTHTHSTHSTHTHTHSTHSTHSTHTHSTHTHTHSTHSTHSTHTHSTHSTHTHTHSTHTHTHSTHSTHSTHSTHSTHTHTHSTHTHTHTHSTHSTHSTHSTHTHSTHTHTHTHTHSTHSTHSTHTHTHSTHSTHSTHTHTHTHSTHTHTHSTHTHSTHTHTHSTHTHSTHTHTHTHTHTHTHSTHSTHTHTHSTHSTHSTHTHSTHSTHTHTHTHTHTHSTHSTHSTHTHTHSTHTHSTHTHSTHSTHSTHSTHSTHTHSTHTHTHSTHSTHTHSTHTHSTHSTHSTHTHTHTHTHSTHSTHSTHTHTHSTHSTHSTHSTHTHSTHTHTHTHTHTHSTHSTHTHSTHSTHSTHSTHTHTHSTHSTHTHTHSTHSTHSTHSTHTHTHTHTHTHSTHSTHTHTHTHTHSTHTHTHSTHTHTHTHSTHSTHSTHTHTHSTHTHTHSTHSTHSTHSTHSTHSTHSTHTHTHSTHTHTHSTHSTHSTHTHTHTHTHTHSTHTHSTHTHSTHSTHTHTHSTHSTHTHSTHSTHSTHTHSTHSTHSTHTHSTHSTHTHSTHSTHTHTHTHTHSTHTHTHSTHSTHSTHSTHTHSTHTHSTHSTHTHTHSTHTHSTHSTHTHSTHSTHTHSTHSTHTHSTHSTHSTHSTHSTHTHTHTHTHTHTHTHTHSTHTHSTHTHSTHSTHSTHSTHSTHTHTHTHTHTHTHSTHTHTHSTHTHSTHTHTHSTHSTHSTHSTHSTHSTHTHTHTHSTHTHSTHSTHSTHSTHTHSTHTHSTHTHSTHTHTHTHSTHSTHSTHTHTHSTHTHTHSTHSTHSTHSTHSTHSTHTHTHSTHSTHTHSTHSTHSTHTHSTHTHTHTHSTHSTHTHSTHSTHSTHTHSTHSTHSTHTHTHTHSTHTHTHTHSTHSTHTHTHSTHTHSTHSTHSTHSTHSTHTHSTHSTHSTHTHSTHTHSTHTHSTHSTHSTHTHTHTHSTHTHSTHTHTHTHTHSTHTHSTHSTHTHTHTHTHTHTHSTHTHSTHTHTHTHTHSTHTHSTHTHTHTHSTHSTHTHSTHTHSTHSTHSTHTHSTHTHTHSTHTHTHSTHSTHSTHTHTHTHSTHTHTHSTHTHSTHTHTHSTHTHTHTHSTHTHTHSTHTHSTHTHSTHTHSTHSTHTHTHSTHSTHSTHTHSTHSTHSTHSTHTHSTHSTHTHTHSTH",
-    # rz(pi/2^131)
-    "SSHSTHSTHTHSTHTHTHSTHTHSTHSTHSTHSTHTHTHSTHTHTHTHTHSTHTHTHTHTHSTHSTHSTHSTHSTHTHTHSTHTHTHTHSTHTHTHSTHSTHTHTHSTHTHSTHTHSTHSTHTHTHTHSTHSTHTHSTHTHSTHSTHTHSTHTHSTHSTHTHTHSTHSTHTHSTHSTHTHSTHTHTHSTHTHTHSTHSTHTHSTHTHSTHTHSTHSTHTHSTHTHSTHTHSTHSTHSTHTHSTHTHSTHTHSTHTHSTHTHSTHSTHTHTHSTHSTHTHTHTHTHTHSTHTHSTHTHTHTHSTHTHTHTHSTHSTHTHSTHSTHSTHSTHSTHTHTHTHTHTHTHSTHSTHTHTHTHTHTHTHTHSTHSTHTHTHTHSTHSTHTHTHSTHTHTHTHTHTHTHTHSTHSTHSTHTHTHSTHTHSTHSTHSTHSTHSTHSTHTHSTHSTHSTHSTHTHSTHTHTHTHSTHTHSTHTHTHTHTHTHSTHSTHTHTHTHSTHTHTHSTHTHSTHSTHTHTHTHTHTHSTHTHSTHSTHSTHSTHSTHSTHTHTHSTHSTHTHSTHTHTHTHSTHTHSTHSTHTHSTHTHSTHSTHSTHTHSTHTHTHTHSTHSTHSTHTHTHTHTHTHTHTHTHTHTHSTHSTHSTHTHTHTHSTHSTHTHTHSTHTHTHTHTHSTHTHSTHTHTHSTHTHSTHSTHSTHSTHSTHTHSTHTHSTHTHTHSTHSTHSTHSTHSTHSTHTHTHSTHTHTHTHTHSTHTHTHTHSTHSTHTHSTHTHSTHTHSTHSTHTHTHTHTHTHTHSTHSTHTHSTHTHTHTHTHTHTHTHTHSTHTHTHSTHTHTHTHTHTHSTHSTHSTHTHSTHSTHTHTHTHSTHSTHTHTHTHTHSTHSTHSTHTHTHTHSTHSTHTHSTHTHTHTHTHSTHSTHTHSTHTHTHTHSTHTHSTHTHTHSTHSTHSTHTHSTHSTHTHTHSTHTHSTHTHSTHSTHTHSTHTHSTHSTHSTHTHSTHSTHTHSTHTHSTHSTHSTHTHTHTHTHSTHTHTHSTHSTHTHSTHSTHTHTHTHSTHSTHSTHSTHSTHTHSTHTHTHSTHTHSTHSTHTHTHSTHSTHTHTHSTHSTHSTHSTHTHTHSTHSTHTHSTHTHSTHSTHSTHTHTHSTHTHTHSTHSTHTHSTHTHSTHSTHTHTHSTHSTHTHTHSTHTHTHTHSTHTHSTHSTHTHTHSTHSTHSTHSTHTHSTHSTHTHTHTHTHSTHSTHTHTHSTHSTHSTHTHTHTHSTHSTHTHSTHSTHTHSTHSTHTHTHTHSTHSTHST",
-    # rz(pi/2^132)
-    "XHTHSTHTHTHSTHTHTHTHTHSTHTHSTHSTHSTHTHTHSTHSTHTHSTHSTHTHSTHSTHTHSTHSTHTHSTHSTHTHTHSTHTHSTHSTHTHTHTHSTHSTHTHTHSTHTHTHSTHTHSTHSTHTHSTHSTHTHTHTHSTHSTHTHSTHTHTHTHSTHSTHTHSTHTHTHSTHTHTHSTHSTHTHSTHSTHTHSTHSTHSTHSTHTHTHSTHTHSTHTHTHSTHTHTHSTHTHSTHSTHTHTHTHSTHSTHTHTHTHSTHSTHTHTHSTHTHTHTHTHSTHTHSTHTHTHSTHSTHSTHSTHTHTHSTHTHTHSTHTHTHTHTHTHTHSTHTHSTHSTHTHTHSTHSTHSTHSTHSTHSTHTHSTHSTHSTHSTHSTHTHTHSTHTHTHSTHTHSTHSTHSTHTHTHSTHTHSTHTHSTHSTHSTHSTHTHTHTHTHTHTHTHTHSTHSTHSTHTHSTHSTHTHSTHSTHTHSTHSTHSTHSTHSTHTHSTHTHSTHSTHTHTHSTHTHSTHTHSTHSTHSTHTHSTHSTHSTHTHTHSTHTHSTHSTHSTHSTHTHSTHTHSTHSTHTHSTHSTHTHSTHSTHSTHTHTHSTHTHSTHSTHTHTHSTHTHTHSTHSTHSTHTHSTHTHSTHTHSTHSTHSTHTHSTHTHTHSTHSTHTHSTHSTHTHTHSTHSTHSTHTHSTHSTHSTHTHTHSTHTHTHSTHSTHTHTHSTHTHSTHTHTHTHSTHTHTHSTHTHTHTHTHTHTHSTHTHTHSTHTHSTHSTHSTHTHTHTHTHTHTHSTHTHTHSTHSTHSTHTHSTHSTHSTHSTHSTHTHSTHTHSTHTHTHSTHSTHSTHTHSTHTHSTHTHTHSTHTHTHTHSTHSTHSTHSTHTHTHTHSTHSTHTHTHTHTHSTHSTHSTHSTHSTHTHTHTHSTHTHSTHSTHTHTHTHTHTHSTHSTHSTHSTHTHSTHTHTHTHTHSTHSTHSTHSTHTHSTHSTHTHSTHTHSTHTHSTHTHTHTHTHTHSTHTHSTHSTHTHSTHSTHSTHTHTHSTHTHSTHSTHTHTHSTHSTHTHSTHSTHTHTHTHTHSTHSTHTHTHSTHSTHSTHSTHSTHTHTHTHSTHSTHSTHSTHTHTHTHSTHSTHTHTHSTHTHTHSTHTHSTHTHSTHTHSTHTHTHTHSTHTHTHTHSTHSTHSTHSTHSTHSTHTHTHTHSTHSTHTHSTHSTHTHTHSTHSTHSTHSTHSTHTHTHTHSTHTHSTHTHTHSTHSTHSTHTHSTHSTHTHTHSTHSTHTHTHTHTHTHTHSTHTHSTHTHSTHTHTHTHSTHTHSTHTHSTHTHSTHTHSTHS",
-    # rz(pi/2^133)
-    "SSXHSTHSTHTHSTHSTHSTHSTHSTHTHTHSTHSTHSTHSTHSTHSTHSTHSTHSTHSTHTHSTHSTHTHTHTHTHTHSTHSTHTHSTHSTHTHTHSTHTHTHTHSTHTHSTHTHSTHTHSTHSTHSTHSTHSTHSTHTHTHTHTHSTHSTHSTHTHTHSTHTHSTHTHTHTHTHTHSTHSTHTHSTHTHTHTHSTHSTHSTHSTHTHTHTHTHTHSTHTHTHTHSTHSTHSTHTHSTHTHSTHSTHSTHTHSTHSTHTHTHSTHSTHSTHSTHSTHTHSTHTHTHSTHTHTHTHTHSTHTHSTHTHSTHSTHTHTHSTHTHTHTHSTHTHSTHSTHTHSTHTHTHTHSTHTHTHSTHSTHTHTHSTHSTHSTHSTHTHSTHSTHSTHTHTHTHTHSTHSTHTHSTHTHSTHSTHSTHTHTHTHSTHSTHTHTHTHSTHTHSTHTHTHSTHTHTHSTHSTHSTHSTHTHTHSTHSTHSTHSTHSTHTHSTHSTHTHSTHSTHTHSTHSTHSTHTHSTHSTHSTHTHTHTHSTHTHTHSTHSTHSTHTHSTHSTHTHTHTHSTHSTHSTHSTHSTHTHTHSTHTHSTHTHSTHTHSTHTHTHTHSTHSTHTHTHSTHTHTHSTHTHTHTHSTHSTHSTHTHSTHTHSTHSTHTHTHTHSTHTHTHTHTHSTHTHSTHSTHSTHTHSTHTHSTHTHSTHTHSTHTHTHSTHSTHTHSTHTHTHTHTHSTHSTHSTHTHSTHTHTHTHSTHTHSTHTHSTHSTHSTHSTHTHTHSTHTHTHSTHSTHSTHSTHSTHTHSTHTHTHSTHSTHTHTHTHTHTHTHTHTHTHTHTHSTHSTHTHSTHTHTHTHSTHSTHSTHTHTHSTHSTHSTHTHTHSTHTHTHSTHTHSTHTHTHTHSTHTHSTHSTHTHTHSTHSTHTHSTHSTHSTHTHSTHSTHTHSTHSTHSTHTHTHSTHSTHSTHTHSTHTHSTHTHTHTHTHTHSTHSTHTHSTHSTHTHTHTHTHTHTHSTHSTHSTHSTHSTHTHSTHTHTHSTHTHTHSTHTHTHSTHTHTHTHSTHTHSTHSTHTHTHTHTHTHSTHTHSTHTHTHTHTHSTHSTHTHSTHTHSTHTHSTHSTHTHTHSTHTHSTHTHSTHTHSTHSTHTHSTHSTHTHTHSTHTHSTHTHSTHTHTHTHSTHTHSTHSTHSTHSTHTHTHTHTHTHTHTHTHSTHSTHSTHTHSTHSTHTHSTHSTHTHSTHSTHSTHSTHSTHSTHTHTHSTHSTHSTHTHTHSTHTHSTHSTHSTHSTHTHTHSTHTHTHTHSTHTHTHTHSTHTHSTHSTHSTHSTHSTHTHTHTHTHSTHS",
-    # rz(pi/2^134)
-    "SXHTHSTHSTHTHSTHSTHSTHSTHTHSTHSTHSTHSTHTHTHTHTHSTHTHTHTHTHTHTHSTHTHTHTHTHSTHTHTHSTHTHTHTHSTHSTHSTHSTHSTHTHSTHSTHSTHTHTHTHTHSTHTHSTHTHSTHTHSTHSTHTHTHSTHSTHSTHTHTHTHTHSTHSTHSTHSTHSTHSTHSTHSTHTHTHTHTHSTHSTHTHSTHTHTHTHTHTHSTHTHTHSTHSTHTHSTHSTHTHTHSTHSTHTHTHTHTHSTHSTHSTHSTHTHSTHSTHSTHTHSTHTHTHSTHTHSTHTHTHSTHTHTHSTHTHTHTHSTHTHTHSTHTHTHSTHSTHTHSTHSTHSTHSTHSTHTHSTHSTHTHTHSTHTHTHTHSTHTHTHSTHTHSTHTHTHTHTHTHSTHSTHSTHTHTHSTHSTHSTHTHSTHSTHSTHSTHSTHTHTHSTHSTHSTHSTHTHSTHTHSTHTHSTHTHSTHTHSTHTHSTHTHTHSTHTHSTHTHTHTHTHSTHTHTHSTHSTHTHSTHSTHTHTHSTHSTHTHSTHSTHTHTHSTHTHSTHSTHTHTHSTHTHSTHTHSTHTHTHTHTHSTHSTHSTHSTHTHSTHSTHSTHSTHTHTHSTHSTHSTHTHTHTHSTHSTHSTHTHTHSTHTHSTHSTHTHSTHTHSTHSTHTHSTHSTHTHTHTHTHTHSTHTHSTHSTHTHTHSTHSTHSTHTHSTHTHTHSTHSTHTHSTHSTHSTHSTHSTHTHSTHTHTHSTHTHTHSTHSTHSTHTHTHSTHTHSTHSTHTHTHTHSTHSTHTHTHSTHSTHSTHTHTHTHTHTHSTHTHSTHTHSTHTHSTHSTHSTHTHTHSTHTHTHSTHTHSTHTHSTHSTHSTHTHSTHSTHSTHSTHTHSTHSTHSTHSTHSTHSTHTHSTHSTHTHSTHTHTHTHTHSTHSTHTHTHTHSTHTHSTHSTHTHTHTHTHSTHTHTHSTHSTHSTHSTHSTHSTHSTHSTHSTHSTHTHTHSTHTHTHSTHTHTHTHTHTHTHSTHTHTHTHTHTHTHSTHTHTHSTHSTHSTHSTHSTHSTHSTHTHTHSTHSTHTHSTHTHSTHTHSTHTHTHTHSTHSTHTHSTHTHTHSTHSTHSTHSTHTHTHSTHSTHTHTHTHSTHSTHSTHTHTHTHSTHSTHSTHSTHSTHSTHTHTHSTHSTHTHTHSTHTHTHTHTHTHTHTHSTHTHSTHSTHTHSTHSTHSTHSTHSTHTHSTHSTHSTHSTHSTHTHTHTHSTHTHSTHSTHSTHTHTHSTHSTHTHSTHTHTHTHSTHTHSTHTHSTHTHSTHTHSTHTHSTHTHTHSTHSTHTHSTHSTHSTHTHSTHSTHSTH",
-]
+
+import os
+from typing import List, Optional, Sequence, Union, overload
+
+DATA_FILE = "pi_over_2_to_the_n_rz_gate_approximations.txt"
+
+
+class LazyApproximationTable(Sequence[str]):
+    """Read-only list of the approximations, loaded from DATA_FILE on first use"""
+
+    def __init__(self) -> None:
+        self._sequences: Optional[List[str]] = None
+
+    def is_loaded(self) -> bool:
+        return self._sequences is not None
+
+    def _load(self) -> List[str]:
+        if self._sequences is None:
+            # Next to this module rather than through pkgutil, as lsqecc.gates is a namespace
+            # package
+            with open(os.path.join(os.path.dirname(__file__), DATA_FILE)) as file:
+                self._sequences = file.read().split()
+        return self._sequences
+
+    @overload
+    def __getitem__(self, n: int) -> str:
+        ...
+
+    @overload
+    def __getitem__(self, n: slice) -> List[str]:
+        ...
+
+    def __getitem__(self, n: Union[int, slice]) -> Union[str, List[str]]:
+        return self._load()[n]
+
+    def __len__(self) -> int:
+        return len(self._load())
+
+
+get_pi_over_2_to_the_n_rz_gate = LazyApproximationTable()
@@ -0,0 +1,152 @@
+"""
+Streaming tokenizer for the lightweight QASM parsers.
+
+Statements are read one line at a time from a string, a file object or a path and yielded as
+soon as their terminating semicolon is found, so the whole program is never held in memory. Paths
+of regular files are read through mmap, leaving the file contents to the page cache.
+"""
+
+import io
+import mmap
+import os
+import re
+import stat
+from dataclasses import dataclass, field
+from fractions import Fraction
+from typing import Iterable, Iterator, List, Optional, TextIO, Union
+
+from lsqecc.utils import QasmParseException
+
+# A str is the program itself, use a pathlib.Path to read from a file
+QasmSource = Union[str, "os.PathLike[str]", TextIO, Iterable[str]]
+
+# Statements the lightweight parsers accept but don't act on
+IGNORED_STATEMENTS = {"OPENQASM", "include", "barrier"}
+
+_statement_regex = re.compile(
+    r"([A-Za-z_][A-Za-z0-9_]*)\s*(?:\((?P<params>[^)]*)\))?\s*(?P<args>.*)"
+)
+_index_arg_regex = re.compile(r"[A-Za-z_][A-Za-z0-9_]*\s*\[\s*(\d+)\s*\]")
+_pi_over_n_regex = re.compile(r"pi/(\d+)")
+
+
+@dataclass
+class QasmStatement:
+    """A statement such as `crz(pi/2) q[0],q[1];`, split as name="crz", params="pi/2" and
+    args=["q[0]", "q[1]"]. line is the line the statement starts on, counting from 1.
+    """
+
+    name: str
+    params: Optional[str]
+    args: List[str] = field(default_factory=list)
+    line: int = 0
+
+    def error(self, message: str) -> QasmParseException:
+        return QasmParseException(f"Line {self.line}: {message}")
+
+    def index_arg(self, i: int) -> int:
+        """Qubit index of the i-th argument, e.g. 3 for `q[3]`"""
+        if i >= len(self.args):
+            raise self.error(f"{self.name} needs at least {i + 1} argument(s), got {self.args}")
+        match = _index_arg_regex.fullmatch(self.args[i])
+        if match is None:
+            raise self.error(f"Expected an indexed register argument, got {self.args[i]}")
+        return int(match.group(1))
+
+    def pi_over_n_param(self) -> Fraction:
+        """The parameter of e.g. `rz(pi/4)` as a fraction of pi"""
+        match = _pi_over_n_regex.fullmatch(self.params or "")
+        if match is None:
+            raise self.error(
+                f"Can only parse pi/n for n power of 2 angles as {self.name} args, "
+                f"got {self.name}({self.params})"
+            )
+        return Fraction(1, int(match.group(1)))
+
+
+def iter_mapped_lines(path: "Union[str, os.PathLike[str]]") -> Iterator[str]:
+    """Yield the lines of a UTF-8 text file, mapping it in memory instead of reading it. Pipes,
+    devices and anything else that can't be mapped are read a line at a time instead."""
+    with open(path, "rb") as file:
+        st = os.fstat(file.fileno())
+        mapped: Optional[mmap.mmap] = None
+        # Empty files can't be mapped
+        if stat.S_ISREG(st.st_mode) and st.st_size > 0:
+            try:
+                mapped = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+            except (ValueError, OSError):
+                pass
+        if mapped is None:
+            for line in file:
+                yield line.decode("utf-8")
+            return
+        with mapped:
+            for line in iter(mapped.readline, b""):
+                yield line.decode("utf-8")
+
+
+def _lines(source: QasmSource) -> Iterable[str]:
+    if isinstance(source, str):
+        return io.StringIO(source)
+    if isinstance(source, os.PathLike):
+        return iter_mapped_lines(source)
+    return source
+
+
+def _to_statement(text: str, line: int) -> QasmStatement:
+    match = _statement_regex.fullmatch(text)
+    if match is None:
+        raise QasmParseException(f"Line {line}: Cannot parse statement {text}")
+    params = match.group("params")
+    args_text = match.group("args").strip()
+    return QasmStatement(
+        name=match.group(1),
+        params=re.sub(r"\s+", "", params) if params is not None else None,
+        args=[arg.strip() for arg in args_text.split(",")] if args_text else [],
+        line=line,
+    )
+
+
+def iter_qasm_statements(source: QasmSource) -> Iterator[QasmStatement]:
+    """Yield the statements of a QASM program one at a time. Comments and whitespace, including
+    line breaks within a statement, are ignored.
+    """
+    pending: List[str] = []
+    start_line = 0
+    for line_number, line in enumerate(_lines(source), start=1):
+        line = line.split("//", 1)[0]
+        while line:
+            statement_end = line.find(";")
+            text = line if statement_end == -1 else line[:statement_end]
+            if text.strip():
+                if not pending:
+                    start_line = line_number
+                pending.append(text.strip())
+            if statement_end == -1:
+                break
+            if pending:
+                yield _to_statement(" ".join(pending), start_line)
+                pending = []
+            line = line[statement_end + 1 :]
+
+    if pending:
+        raise QasmParseException(f"Line {start_line}: Statement not terminated by ';'")
+
+
+def iter_gate_statements(qasm: QasmSource) -> Iterator[QasmStatement]:
+    """Yield the statements other than the qreg declaration and the ignored ones, checking that the
+    program declares exactly one qreg. The qreg must come before the gates it is used by.
+    """
+    qreg_count = 0
+    for statement in iter_qasm_statements(qasm):
+        if statement.name == "qreg":
+            qreg_count += 1
+            if qreg_count > 1:
+                raise statement.error(f"Need exactly one qreg, got {qreg_count}")
+            yield statement
+        elif statement.name not in IGNORED_STATEMENTS:
+            if qreg_count == 0:
+                raise statement.error("Need exactly one qreg, got 0")
+            yield statement
+    if qreg_count == 0:
+        raise QasmParseException("Need exactly one qreg, got 0")
@@ -18,10 +18,15 @@
 import copy
 from typing import List, TypeVar
 
+import numpy as np
+
 from lsqecc.pauli_rotations import PauliOpCircuit
 
 T = TypeVar("T")
 
+# Booleans of the anticommutation matrix kept at once by from_circuit_by_commutation
+_DEPENDENCY_WINDOW_CELLS = 1 << 24
+
 
 class DependencyGraph:
     """Class representing a dependency DAG. Experimental"""
@@ -66,9 +71,38 @@ class DependencyGraph:
         Build a dependency tree from a Pauli rotation circuit based on commutation.
 
         """
+        # Repeated ops become a single instance with a cached hash, for the visited sets
+        circuit = circuit.interned()
+        ops = circuit.ops
+        # Equal ops have equal commutation relations, so any index of a repeated op will do
+        op_index = dict((id(op), i) for i, op in enumerate(ops))
+        first_index = dict((id(op), i) for i, op in reversed(list(enumerate(ops))))
+
+        # The anticommutation matrix is computed a window of rows at a time. from_list compares
+        # each op, from the last to the first, with the ops after it, so the rows are needed from
+        # the last to the first too
+        rows_per_window = max(1, _DEPENDENCY_WINDOW_CELLS // max(1, len(ops)))
+        position = len(ops) - 1
+        window_start = window_stop = len(ops)
+        window = np.empty((0, len(ops)), dtype=bool)
+
         # This because new dependency is added between non-commuting operations
         def func(arg1, arg2):
-            return not PauliOpCircuit.are_commuting(arg1, arg2)
+            nonlocal position, window_start, window_stop, window
+            if ops[position] is not arg2:
+                if first_index[id(arg2)] > position:
+                    # Not compared in the order of from_list, start again from arg2
+                    position = op_index[id(arg2)]
+                else:
+                    # Walk down to the closest index of arg2. A repeated op is a single instance,
+                    # so this may stop short of the index from_list is at, on an equal row
+                    while ops[position] is not arg2:
+                        position -= 1
+            if not window_start <= position < window_stop:
+                window_stop = position + 1
+                window_start = max(0, window_stop - rows_per_window)
+                window = circuit.anticommutation_block(window_start, window_stop)
+            return window[position - window_start, op_index[id(arg1)]]
 
         return DependencyGraph.from_list(circuit.ops, func)
 
@@ -81,6 +115,10 @@ class DependencyGraph:
             input_list: list used to generate the graph
             comparing_function: function used for deciding dependency
              in the graph. New dependency is added when it returns True.
+             It is called as comparing_function(later, earlier), going
+             through the earlier elements from the last to the first,
+             from_circuit_by_commutation computes the comparisons a window
+             at a time in that order, other orders are slower.
 
         """
 
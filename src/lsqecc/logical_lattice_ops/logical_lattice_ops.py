@@ -26,6 +26,7 @@ from lsqecc.pauli_rotations import (
     Measurement,
     PauliOpCircuit,
     PauliOperator,
+    PauliOpStream,
     PauliProductOperation,
     PauliRotation,
 )
@@ -90,7 +91,10 @@ class MagicStateRequest(LogicalLatticeOperation):
 
 
 class LogicalLatticeComputation:
-    def __init__(self, circuit: PauliOpCircuit):
+    def __init__(self, circuit: Union[PauliOpCircuit, PauliOpStream]):
+        """Lower the circuit to logical lattice operations. When given a PauliOpStream, the ops are
+        read one at a time, so only the resulting operations are kept.
+        """
         self.circuit = circuit
         self.logical_qubit_uuid_map: Dict[int, uuid.UUID] = dict(
             [(j, uuid.uuid4()) for j in range(circuit.qubit_num)]
@@ -109,19 +113,20 @@ class LogicalLatticeComputation:
                 return self.circuit_to_patch_measurement(op)
             raise Exception("Unsupported PauliProductOperation " + repr(op))
 
-        operations_queue: Deque[Union[PauliRotation, LogicalLatticeOperation]] = deque(
-            map(to_lattice_operation, self.circuit.ops)
-        )
-
-        while len(operations_queue) > 0:
-            current_op = operations_queue.popleft()
-            if isinstance(current_op, PauliRotation):
-                rotations_composer = RotationsComposer(self)
-                operations_queue.extendleft(
-                    reversed(rotations_composer.expand_rotation(current_op))
-                )
-            else:
-                self.ops.append(current_op)
+        # Ops are lowered one at a time, the queue only holds the expansion of the current one
+        ops = self.circuit.ops if isinstance(self.circuit, PauliOpCircuit) else self.circuit
+        operations_queue: Deque[Union[PauliRotation, LogicalLatticeOperation]] = deque()
+        for op in ops:
+            operations_queue.append(to_lattice_operation(op))
+            while len(operations_queue) > 0:
+                current_op = operations_queue.popleft()
+                if isinstance(current_op, PauliRotation):
+                    rotations_composer = RotationsComposer(self)
+                    operations_queue.extendleft(
+                        reversed(rotations_composer.expand_rotation(current_op))
+                    )
+                else:
+                    self.ops.append(current_op)
 
     def circuit_to_patch_measurement(
         self, m: PauliProductOperation
@@ -289,6 +294,9 @@ class PiOverFourCorrectionCondition(coc.EvaluationCondition):
             out = not out
         return out
 
+    def get_dependencies(self) -> List[coc.ConditionalOperation]:
+        return [self.multi_body_measurement, self.ancilla_measurement]
+
 
 class PiOverEightCorrectionConditionPiOverFour(coc.EvaluationCondition):
     def __init__(self, multi_body_measurement: MultiBodyMeasurement, invert: bool):
@@ -307,6 +315,9 @@ class PiOverEightCorrectionConditionPiOverFour(coc.EvaluationCondition):
             out = not out
         return out
 
+    def get_dependencies(self) -> List[coc.ConditionalOperation]:
+        return [self.multi_body_measurement]
+
 
 class PiOverEightCorrectionConditionPiOverTwo(coc.EvaluationCondition):
     def __init__(self, ancilla_measurement: SinglePatchMeasurement):
@@ -320,3 +331,6 @@ class PiOverEightCorrectionConditionPiOverTwo(coc.EvaluationCondition):
             return True  # Always evaluate an op when no simulation is present
 
         return self.ancilla_measurement.get_outcome() == -1
+
+    def get_dependencies(self) -> List[coc.ConditionalOperation]:
+        return [self.ancilla_measurement]
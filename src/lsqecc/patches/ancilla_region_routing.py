@@ -17,10 +17,12 @@
 
 from __future__ import annotations
 
-from ast import literal_eval as make_tuple
-from typing import TYPE_CHECKING, Dict, List, Tuple
+import enum
+import warnings
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional, Tuple
 
 import igraph
+import numpy as np
 
 import lsqecc.patches.patches as patches
 
@@ -66,73 +68,213 @@ def get_pauli_op_listing(
     return operators_of_cells_in_patch[0] if len(operators_of_cells_in_patch) > 0 else None
 
 
-def make_graph_of_free_cells(lattice: patches.Lattice) -> igraph.Graph:
-    """The vertex labels are the coordinates as a string.
-    E.g. "(12,9)"
+class RoutingGraph:
+    """The cells of a layout as a grid graph, on which the ancilla regions are routed.
+
+    The cell (col, row) is the vertex row * cols + col. The graph is built once for the size of
+    the layout and reused for every routing in it: only the occupancy mask, which marks the cells
+    taken by patches, is loaded from the lattice each time. Routes go through the free cells,
+    entering and leaving the measured patches through the edges given to shortest_paths.
     """
-    g = igraph.Graph(directed=True)
-    for row in range(lattice.getRows()):
-        for col in range(lattice.getCols()):
-            g.add_vertex(str((col, row)))
-
-    nrows = lattice.getRows()
-    ncols = lattice.getCols()
-    for row in range(nrows):
-        for col in range(ncols):
-            for neighbour_col, neighbour_row in [
-                (col, row + 1),
-                (col, row - 1),
-                (col + 1, row),
-                (col - 1, row),
-            ]:
-                if (
-                    neighbour_col in range(ncols)
-                    and neighbour_row in range(nrows)
-                    and lattice.cellIsFree((col, row))
-                    and lattice.cellIsFree((neighbour_col, neighbour_row))
-                ):
-                    g.add_edges([(str((col, row)), str((neighbour_col, neighbour_row)))])
-
-    return g
-
-
-def add_directed_edges(
-    ancilla_search_graph: igraph.Graph,
+
+    def __init__(self, cols: int, rows: int):
+        self.cols = cols
+        self.rows = rows
+        self.occupied = np.zeros(cols * rows, dtype=bool)
+        # Every pair of neighbouring cells, in both directions
+        ids = np.arange(cols * rows).reshape(rows, cols)
+        pairs = np.concatenate(
+            [
+                np.stack([ids[:, :-1].ravel(), ids[:, 1:].ravel()], axis=1),
+                np.stack([ids[:-1, :].ravel(), ids[1:, :].ravel()], axis=1),
+            ]
+        )
+        self._grid_edges = np.concatenate([pairs, pairs[:, ::-1]])
+
+    @staticmethod
+    def for_lattice(lattice: patches.Lattice) -> RoutingGraph:
+        return RoutingGraph(lattice.getCols(), lattice.getRows())
+
+    def fits(self, lattice: patches.Lattice) -> bool:
+        return (self.cols, self.rows) == (lattice.getCols(), lattice.getRows())
+
+    def vertex(self, cell: Tuple[int, int]) -> int:
+        col, row = cell
+        return row * self.cols + col
+
+    def cell(self, vertex: int) -> Tuple[int, int]:
+        row, col = divmod(vertex, self.cols)
+        return col, row
+
+    def contains(self, cell: Tuple[int, int]) -> bool:
+        col, row = cell
+        return 0 <= col < self.cols and 0 <= row < self.rows
+
+    def clear_occupancy(self) -> None:
+        self.occupied.fill(False)
+
+    def occupy(self, cells: Iterable[Tuple[int, int]]) -> None:
+        vertices = [self.vertex(cell) for cell in cells if self.contains(cell)]
+        self.occupied[vertices] = True
+
+    def load_occupancy(self, lattice: patches.Lattice) -> None:
+        """Mask out the cells of the patches of the lattice, and only those"""
+        self.clear_occupancy()
+        self.occupy(cell for patch in lattice.patches for cell in patch.cells)
+
+    def free_cell_graph(self, extra_edges: List[Tuple[int, int]]) -> igraph.Graph:
+        """The graph joining all neighbouring free cells with edges in both directions, plus
+        extra_edges, built in one go"""
+        free = ~self.occupied
+        edges = self._grid_edges[free[self._grid_edges[:, 0]] & free[self._grid_edges[:, 1]]]
+        if extra_edges:
+            edges = np.concatenate([edges, np.array(extra_edges, dtype=edges.dtype)])
+        return igraph.Graph(n=self.cols * self.rows, edges=edges, directed=True)
+
+    def shortest_paths(
+        self, source: int, targets: List[int], extra_edges: List[Tuple[int, int]]
+    ) -> List[List[int]]:
+        """Shortest paths from source to each target, as lists of vertices. A path goes through
+        free vertices and extra_edges, in either direction. Unreachable targets get an empty
+        path.
+        """
+        graph = self.free_cell_graph(extra_edges)
+        with warnings.catch_warnings():
+            # Unreachable targets are reported by the caller
+            warnings.simplefilter("ignore", RuntimeWarning)
+            return graph.get_shortest_paths(source, targets, mode="all", output="vpath")
+
+
+def get_border_edges(
+    routing_graph: RoutingGraph,
     lattice: patches.Lattice,
     patch_pauli_operator_map: Dict[Tuple[int, int], PauliOperator],
-    source_patch_vertex: str,
-    tagret_patch_vertex: List[str],
-):
-    for j, patch in enumerate(lattice.patches):
-        patch_representative = str(patch.getRepresentative())
-
-        # Skip inactive patches
-        if (
-            patch_representative != source_patch_vertex
-            and patch_representative not in tagret_patch_vertex
-        ):
-            continue
-
-        # Add the directed edges
+) -> List[Tuple[int, int]]:
+    """The edges joining each measured patch, from its representative, to the cells across its
+    borders of the type of the measured operator. They point out of the first patch of the map,
+    the source, and into the others."""
+    border_edges = []
+    for j, (representative, operator) in enumerate(patch_pauli_operator_map.items()):
+        patch = lattice.getPatchOfCell(representative)
+        assert patch is not None
         # TODO add Y support
-        requested_edge_type = patches.PAULI_OPERATOR_TO_EDGE_MAP[
-            patch_pauli_operator_map[patch.getRepresentative()]
-        ]
+        requested_edge_type = patches.PAULI_OPERATOR_TO_EDGE_MAP[operator]
         for edge in patch.edges:
-            in_patch_neighbour = str(edge.cell)
-            free_lattice_neighbour = str(edge.getNeighbouringCell())
-
+            neighbour = edge.getNeighbouringCell()
             if (
                 edge.border_type == requested_edge_type
-                and free_lattice_neighbour in ancilla_search_graph.vs["name"]
+                and neighbour is not None
+                and routing_graph.contains(neighbour)
             ):
-                # Add the corresponding directed edge
-                if patch.getRepresentative() == source_patch_vertex:
-                    ancilla_search_graph.add_edge(patch_representative, in_patch_neighbour)
-                    ancilla_search_graph.add_edge(in_patch_neighbour, free_lattice_neighbour)
+                representative_vertex = routing_graph.vertex(representative)
+                in_patch_vertex = routing_graph.vertex(edge.cell)
+                neighbour_vertex = routing_graph.vertex(neighbour)
+                if j == 0:
+                    border_edges.append((representative_vertex, in_patch_vertex))
+                    border_edges.append((in_patch_vertex, neighbour_vertex))
                 else:
-                    ancilla_search_graph.add_edge(free_lattice_neighbour, in_patch_neighbour)
-                    ancilla_search_graph.add_edge(in_patch_neighbour, patch_representative)
+                    border_edges.append((neighbour_vertex, in_patch_vertex))
+                    border_edges.append((in_patch_vertex, representative_vertex))
+    return border_edges
+
+
+class RoutingStrategy(enum.Enum):
+    SHORTEST_PATHS = "ShortestPaths"
+    STEINER_TREE = "SteinerTree"
+
+
+class AncillaRegionRouter:
+    """Chooses the cells of the ancilla region joining the patches of a multi body measurement"""
+
+    def route(
+        self,
+        routing_graph: RoutingGraph,
+        source: int,
+        targets: List[int],
+        border_edges: List[Tuple[int, int]],
+    ) -> List[List[int]]:
+        """Paths from the source patch to each target patch, as lists of vertices of
+        routing_graph whose union is the ancilla region. The paths start and end at the
+        representatives of the patches and enter and leave them through border_edges, see
+        get_border_edges. Unreachable targets get an empty path.
+        """
+        raise NotImplementedError
+
+    @staticmethod
+    def make_router(routing_strategy: RoutingStrategy) -> AncillaRegionRouter:
+        if routing_strategy == RoutingStrategy.STEINER_TREE:
+            return SteinerTreeRouter()
+        else:
+            return ShortestPathsRouter()
+
+
+class ShortestPathsRouter(AncillaRegionRouter):
+    """A shortest path from the source to each target, found independently"""
+
+    def route(
+        self,
+        routing_graph: RoutingGraph,
+        source: int,
+        targets: List[int],
+        border_edges: List[Tuple[int, int]],
+    ) -> List[List[int]]:
+        return routing_graph.shortest_paths(source, targets, border_edges)
+
+
+class SteinerTreeRouter(AncillaRegionRouter):
+    """An approximate Steiner tree joining the patches through the free cells, grown with the
+    shortest path heuristic: starting from the source, the target nearest to the tree is joined
+    to it by a shortest path, until all of them are.
+
+    Branches only leave the tree from the source or from a free cell, and targets are only
+    entered, so that no path goes through a measured patch.
+    """
+
+    def route(
+        self,
+        routing_graph: RoutingGraph,
+        source: int,
+        targets: List[int],
+        border_edges: List[Tuple[int, int]],
+    ) -> List[List[int]]:
+        graph = routing_graph.free_cell_graph(border_edges)
+        # Joined to the vertices the tree can branch from, so that a single search from it finds
+        # the target nearest to the tree
+        root = graph.vcount()
+        graph.add_vertices(1)
+
+        tree_parents = {source: source}
+        branch_points = [source]
+        remaining = list(targets)
+        while remaining:
+            graph.add_edges([(root, vertex) for vertex in branch_points])
+            with warnings.catch_warnings():
+                # Unreachable targets are reported by the caller
+                warnings.simplefilter("ignore", RuntimeWarning)
+                paths = graph.get_shortest_paths(root, remaining, mode="out", output="vpath")
+            reachable = [(len(path), j) for j, path in enumerate(paths) if path]
+            if not reachable:
+                break
+            _, nearest = min(reachable)
+
+            branch = paths[nearest][1:]  # Without the root
+            for parent, vertex in zip(branch, branch[1:]):
+                tree_parents.setdefault(vertex, parent)
+            branch_points = [
+                vertex for vertex in branch[1:-1] if not routing_graph.occupied[vertex]
+            ]
+            del remaining[nearest]
+
+        tree_paths = []
+        for target in targets:
+            path: List[int] = []
+            if target in tree_parents:
+                path.append(target)
+                while path[-1] != source:
+                    path.append(tree_parents[path[-1]])
+                path.reverse()
+            tree_paths.append(path)
+        return tree_paths
 
 
 def add_ancilla_region_to_lattice_from_paths(
@@ -161,7 +303,7 @@ def add_ancilla_region_to_lattice_from_paths(
         if len(path) > 2:
             for prev_cell, curr_cell, next_cell in zip(path[:-2], path[1:-1], path[2:]):
                 if lattice.cellIsFree(curr_cell):
-                    lattice.patches.append(
+                    lattice.addPatch(
                         patches.Patch(patches.PatchType.Ancilla, None, [curr_cell], [])
                     )
 
@@ -187,10 +329,17 @@ def add_ancilla_region_to_lattice_from_paths(
 
 
 def compute_ancilla_region_cells(
-    lattice: patches.Lattice, patch_pauli_operator_map: Dict[Tuple[int, int], PauliOperator]
+    lattice: patches.Lattice,
+    patch_pauli_operator_map: Dict[Tuple[int, int], PauliOperator],
+    routing_graph: Optional[RoutingGraph] = None,
+    router: Optional[AncillaRegionRouter] = None,
 ) -> None:
     """Compute which cells of the lattice are occupied by the ancilla region to perform
     the multibody measurement specified by the dict of operators.
+
+    Pass the routing graph of a previous call on a lattice of the same size to reuse it, see
+    RoutingGraph. Its occupancy is left marking the cells of the lattice, ancilla region included.
+    The router defaults to a ShortestPathsRouter.
     """
 
     assert all(
@@ -200,29 +349,30 @@ def compute_ancilla_region_cells(
         )
     )
 
-    # Join all neighbouring free cells with bi directional edges along the lattice
-    g = make_graph_of_free_cells(lattice)
+    if routing_graph is None or not routing_graph.fits(lattice):
+        routing_graph = RoutingGraph.for_lattice(lattice)
+    routing_graph.load_occupancy(lattice)
 
-    active_qubits = list(map(str, patch_pauli_operator_map.keys()))
+    active_qubits = [routing_graph.vertex(cell) for cell in patch_pauli_operator_map.keys()]
 
     # For path finding purposes separate take one qubit to be the source
     # and the others to be the targets
-    source_qubit: str = active_qubits[0]
-    target_qubits: List[str] = active_qubits[1:]
-
-    # Connect the active patches each with a single directed edge
-    # along the border of the desired operator
-    add_directed_edges(g, lattice, patch_pauli_operator_map, source_qubit, target_qubits)
+    source_qubit = active_qubits[0]
+    target_qubits = active_qubits[1:]
 
     # Now find the paths that join al the patches through the desired operators
-    shortest_paths_raw = g.get_shortest_paths(
-        source_qubit, target_qubits, mode="all", output="vpath"
+    if router is None:
+        router = ShortestPathsRouter()
+    vertex_paths = router.route(
+        routing_graph,
+        source_qubit,
+        target_qubits,
+        get_border_edges(routing_graph, lattice, patch_pauli_operator_map),
     )
-    shortest_paths = [
-        [make_tuple(g.vs[v_idx]["name"]) for v_idx in path] for path in shortest_paths_raw
-    ]
 
-    if len(shortest_paths) < 1 or len(shortest_paths) == 1 and len(shortest_paths[0]) == 0:
+    if len(vertex_paths) < 1 or any(len(path) == 0 for path in vertex_paths):
         raise AncillaRegionRoutingException
 
-    add_ancilla_region_to_lattice_from_paths(lattice, shortest_paths)
+    paths = [[routing_graph.cell(vertex) for vertex in path] for path in vertex_paths]
+    add_ancilla_region_to_lattice_from_paths(lattice, paths)
+    routing_graph.occupy(cell for path in paths for cell in path)
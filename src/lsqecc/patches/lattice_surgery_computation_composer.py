@@ -18,7 +18,7 @@
 import copy
 import enum
 import uuid
-from typing import Dict, List, Optional, Tuple, cast
+from typing import Dict, List, Optional, Set, Tuple, cast
 
 import lsqecc.logical_lattice_ops.logical_lattice_ops as llops
 import lsqecc.patches.patches as patches
@@ -151,20 +151,26 @@ class SimplePreDistilledStatesLayoutInitializer(LayoutInitializer):
         return self.lattice
 
     def addRightDistillery(self):
-        self.lattice.patches.append(
+        self.lattice.addPatch(
             LayoutInitializer.simpleRightFacingDistillery((self.lattice.getCols(), 0))
         )
 
 
 class LatticeSurgeryComputation:
     def __init__(
-        self, logical_computation: llops.LogicalLatticeComputation, layout_type: LayoutType
+        self,
+        logical_computation: llops.LogicalLatticeComputation,
+        layout_type: LayoutType,
+        routing_strategy: ancilla_region_routing.RoutingStrategy = (
+            ancilla_region_routing.RoutingStrategy.SHORTEST_PATHS
+        ),
     ):
         """
         Layout arguments:
             - Simple: n_logical_qubits: int
         """
         self.logical_computation = logical_computation
+        self.router = ancilla_region_routing.AncillaRegionRouter.make_router(routing_strategy)
 
         if layout_type != LayoutType.SimplePreDistilledStates:
             raise NotImplementedError("Layout Type not supported: " + layout_type.value)
@@ -185,25 +191,89 @@ class LatticeSurgeryComputation:
         logical_computation: llops.LogicalLatticeComputation,
         layout_type: LayoutType,
         simulation_type: lps.SimulatorType = lps.SimulatorType.FULL_STATE_VECTOR,
+        routing_strategy: ancilla_region_routing.RoutingStrategy = (
+            ancilla_region_routing.RoutingStrategy.SHORTEST_PATHS
+        ),
+        pack_time_slices: bool = False,
     ):
-        comp = LatticeSurgeryComputation(logical_computation, layout_type)
+        """Lay out the computation, each evaluating op in its own time slice unless
+        pack_time_slices, see _add_packed_time_slices."""
+        comp = LatticeSurgeryComputation(logical_computation, layout_type, routing_strategy)
         sim = lps.PatchSimulator.make_simulator(simulation_type, logical_computation)
 
         with comp.timestep() as blank_slice:
             cast(object, blank_slice)  # no-op
 
-        for logical_op in comp.logical_computation.ops:
-            if logical_op.does_evaluate():
-                with comp.timestep() as slice:
-                    slice.addLogicalOperation(logical_op)
-                    sim.apply_logical_operation(logical_op)
-                    slice.set_separable_states(sim)
+        if pack_time_slices:
+            comp._add_packed_time_slices(sim)
+        else:
+            for logical_op in comp.logical_computation.ops:
+                if logical_op.does_evaluate():
+                    with comp.timestep() as slice:
+                        slice.addLogicalOperation(logical_op)
+                        sim.apply_logical_operation(logical_op)
+                        slice.set_separable_states(sim)
 
         # Display the sates in the final slice
         comp.composer.set_separable_states(sim)
 
         return comp
 
+    def _add_packed_time_slices(self, sim: lps.PatchSimulator):
+        """Greedily put consecutive evaluating ops in the same time slice. An op starts a new
+        slice if it acts on a patch an op of the slice acts on, if it is conditional on the
+        outcome of an op of the slice, or if there is no room left for its ancilla region or
+        ancilla patch.
+        """
+        slice_patches: Set[uuid.UUID] = set()
+        slice_ops: Set[int] = set()  # ids
+
+        def end_time_slice():
+            with self.timestep():
+                pass
+            slice_patches.clear()
+            slice_ops.clear()
+
+        def depends_on_slice(logical_op: llops.LogicalLatticeOperation) -> bool:
+            condition = logical_op.get_condition()
+            if condition is None:
+                return False
+            dependencies = condition.get_dependencies()
+            return dependencies is None or any(id(op) in slice_ops for op in dependencies)
+
+        for logical_op in self.logical_computation.ops:
+            if not logical_op.does_evaluate():
+                continue
+
+            operating_patches = set(logical_op.get_operating_patches())
+            if slice_ops and (
+                not operating_patches.isdisjoint(slice_patches)
+                or depends_on_slice(logical_op)
+                or (
+                    isinstance(logical_op, llops.AncillaQubitPatchInitialization)
+                    and self.composer.getAncillaLocation() is None
+                )
+            ):
+                end_time_slice()
+
+            try:
+                self.composer.addLogicalOperation(logical_op)
+            except ancilla_region_routing.AncillaRegionRoutingException:
+                if not slice_ops:
+                    raise
+                # Route it again around the patches alone, the lattice is left as it was
+                self.composer.lattice().logical_ops.pop()
+                end_time_slice()
+                self.composer.addLogicalOperation(logical_op)
+
+            sim.apply_logical_operation(logical_op)
+            self.composer.set_separable_states(sim)
+            slice_patches |= operating_patches
+            slice_ops.add(id(logical_op))
+
+        if slice_ops:
+            end_time_slice()
+
     def _initialize_layout(self, initializer: LayoutInitializer):
         self.composer = LatticeSurgeryComputationComposer(self, initializer.get_layout())
         self.num_y_ancillas = initializer.num_y_ancillas()
@@ -212,7 +282,8 @@ class LatticeSurgeryComputation:
         for j, quuid in self.logical_computation.logical_qubit_uuid_map.items():
             cell = initializer.map_qubit_to_cell(j)
             self.logical_qubits.append(cell)
-            self.composer.lattice().getPatchOfCell(cell).set_uuid(quuid)
+            lattice = self.composer.lattice()
+            lattice.setPatchUuid(lattice.getPatchOfCell(cell), quuid)
 
     def _init_simple_magic_state_array(
         self, num_magic_states: int
@@ -221,7 +292,7 @@ class LatticeSurgeryComputation:
         self.magic_state_queue: List[Tuple[int, int]] = []
         for j in range(start_magic_state_array, start_magic_state_array + num_magic_states):
             magic_state_pos = (j + 1, 0)
-            self.composer.lattice().patches.append(
+            self.composer.lattice().addPatch(
                 LayoutInitializer.rotatedSingleSquarePatch(
                     magic_state_pos,
                     patches.PatchType.DistillationQubit,
@@ -264,7 +335,7 @@ class LatticeSurgeryComputation:
         patch = self.composer.lattice().getPatchOfCell(cell)
         if patch is None:
             raise RuntimeError("Invalid cell in magic state queue " + str(cell))
-        patch.set_uuid(patch_uuid)
+        self.composer.lattice().setPatchUuid(patch, patch_uuid)
         return patch
 
     def get_t_count(self):
@@ -275,12 +346,14 @@ class LatticeSurgeryComputationComposer:
     def __init__(self, computation: LatticeSurgeryComputation, initial_layout: patches.Lattice):
         self.computation = computation
         self.qubit_patch_slices: List[patches.Lattice] = [initial_layout]  # initialize lattice here
+        # Reused by the multi body measurements while the size of the lattice doesn't change
+        self.routing_graph: Optional[ancilla_region_routing.RoutingGraph] = None
 
     def lattice(self):
         return self.qubit_patch_slices[-1]
 
     def addPatch(self, patch: patches.Patch):
-        self.lattice().patches.append(patch)
+        self.lattice().addPatch(patch)
 
     def addSquareAncilla(
         self, patch_state: qs.QubitState, patch_uuid: Optional[uuid.UUID] = None
@@ -322,8 +395,11 @@ class LatticeSurgeryComputationComposer:
                     "Only X and Y operators are supported in multibody mesurement, got " + repr(v)
                 )
 
+        lattice = self.lattice()
+        if self.routing_graph is None or not self.routing_graph.fits(lattice):
+            self.routing_graph = ancilla_region_routing.RoutingGraph.for_lattice(lattice)
         ancilla_region_routing.compute_ancilla_region_cells(
-            self.qubit_patch_slices[-1], cell_pauli_operator_map
+            lattice, cell_pauli_operator_map, self.routing_graph, self.computation.router
         )
 
     def applyPauliOperator(self, cell_of_patch: Tuple[int, int], operator: patches.PauliOperator):
@@ -342,24 +418,22 @@ class LatticeSurgeryComputationComposer:
                         edge.cell
                     ).state = qs.DefaultSymbolicStates.UnknownState
 
-        def is_not_ancilla(patch):
-            return patch.patch_type != patches.PatchType.Ancilla
+        def is_ancilla(patch):
+            return patch.patch_type == patches.PatchType.Ancilla
 
-        self.qubit_patch_slices[-1].patches = list(filter(is_not_ancilla, self.lattice().patches))
+        self.lattice().removePatchesIf(is_ancilla)
 
     def clearActiveStates(self):
         # Make measured patches disappear
-        def patch_stays(patch: patches.Patch) -> bool:
-            if (
+        def patch_disappears(patch: patches.Patch) -> bool:
+            return (
                 patch.state is not None
                 and isinstance(patch.state, qs.ActiveState)
                 and patch.state.activity.activity_type == qs.ActivityType.Measurement
                 and self.computation.is_ancilla_location(patch.getRepresentative())
-            ):
-                return False
-            return True
+            )
 
-        self.lattice().patches = list(filter(patch_stays, self.lattice().patches))
+        self.lattice().removePatchesIf(patch_disappears)
 
         # Clear other activity
         for patch in self.lattice().patches:
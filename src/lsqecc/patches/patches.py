@@ -17,10 +17,21 @@
 
 from __future__ import annotations
 
-import itertools
 import uuid
 from enum import Enum
-from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
+from typing import (
+    TYPE_CHECKING,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    MutableSequence,
+    Optional,
+    Tuple,
+    Union,
+    overload,
+)
 
 from lsqecc.pauli_rotations import PauliOperator
 
@@ -171,23 +182,162 @@ class Patch:
         self.patch_uuid = patch_uuid
 
 
+class LatticePatches(MutableSequence[Patch]):
+    """The patches of a Lattice, in the order they were added. A list-like view: changing it
+    through append, insert, del, item assignment, remove, etc. keeps the lattice's indexes up to
+    date. Compares equal to any sequence of the same patches, e.g. a list."""
+
+    def __init__(self, lattice: Lattice):
+        self._lattice = lattice
+
+    def __len__(self) -> int:
+        return len(self._lattice._patches)
+
+    @overload
+    def __getitem__(self, index: int) -> Patch:
+        ...
+
+    @overload
+    def __getitem__(self, index: slice) -> List[Patch]:
+        ...
+
+    def __getitem__(self, index):
+        return self._lattice._patches[index]
+
+    @overload
+    def __setitem__(self, index: int, patch: Patch) -> None:
+        ...
+
+    @overload
+    def __setitem__(self, index: slice, patches: Iterable[Patch]) -> None:
+        ...
+
+    def __setitem__(self, index, patch):
+        if isinstance(index, slice):
+            new_patches = list(self._lattice._patches)
+            new_patches[index] = patch
+            self._lattice.patches = new_patches
+            return
+        old_patch = self._lattice._patches[index]
+        self._lattice._check_cells_free(patch, replacing=old_patch)
+        self._lattice._unindex(old_patch)
+        self._lattice._patches[index] = patch
+        self._lattice._index(patch)
+
+    def __delitem__(self, index: Union[int, slice]) -> None:
+        removed = self._lattice._patches[index]
+        del self._lattice._patches[index]
+        for patch in removed if isinstance(removed, list) else [removed]:
+            self._lattice._unindex(patch)
+
+    def insert(self, index: int, patch: Patch) -> None:
+        self._lattice._check_cells_free(patch)
+        self._lattice._patches.insert(index, patch)
+        self._lattice._index(patch)
+
+    def __iter__(self) -> Iterator[Patch]:
+        return iter(self._lattice._patches)
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, (LatticePatches, list, tuple)):
+            return list(self) == list(other)
+        return NotImplemented
+
+    __hash__ = None  # type: ignore
+
+    def __repr__(self) -> str:
+        return repr(self._lattice._patches)
+
+
 class Lattice:
+    """The patches laid out on the lattice, indexed by cell and by uuid.
+
+    patches is a list-like view that keeps the indexes up to date when it is changed or assigned
+    to, as do addPatch, removePatch, removePatchesIf, setPatchUuid and clear. Patches can't
+    overlap.
+    """
+
     def __init__(self, patches: List[Patch], min_rows: int, min_cols: int):
-        self.patches = patches
         self.min_rows = min_rows
         self.min_cols = min_cols
         self.logical_ops: List[LogicalLatticeOperation] = []
+        self.patches = patches
+
+    @property
+    def patches(self) -> MutableSequence[Patch]:
+        return LatticePatches(self)
+
+    @patches.setter
+    def patches(self, patches: MutableSequence[Patch]) -> None:
+        # Copied first, as it may be the view of this lattice, e.g. with patches += [...]
+        new_patches = list(patches)
+        self._patches: List[Patch] = []
+        self._patch_of_cell: Dict[Tuple[int, int], Patch] = {}
+        self._patch_of_uuid: Dict[uuid.UUID, Patch] = {}
+        # One more than the largest (col, row) of a cell, None until recomputed after a removal
+        self._coord_bounds: Optional[Tuple[int, int]] = (0, 0)
+        for patch in new_patches:
+            self.addPatch(patch)
+
+    def addPatch(self, patch: Patch) -> None:
+        self._check_cells_free(patch)
+        self._patches.append(patch)
+        self._index(patch)
+
+    def _check_cells_free(self, patch: Patch, replacing: Optional[Patch] = None) -> None:
+        for cell in patch.cells:
+            occupant = self._patch_of_cell.get(cell)
+            if occupant is not None and occupant is not replacing:
+                raise ValueError(f"Cell {cell} is already occupied by another patch")
+
+    def _index(self, patch: Patch) -> None:
+        for cell in patch.cells:
+            self._patch_of_cell[cell] = patch
+        if patch.patch_uuid is not None:
+            self._patch_of_uuid.setdefault(patch.patch_uuid, patch)
+        if self._coord_bounds is not None:
+            cols, rows = self._coord_bounds
+            for col, row in patch.cells:
+                cols, rows = max(cols, col + 1), max(rows, row + 1)
+            self._coord_bounds = (cols, rows)
+
+    def _unindex(self, patch: Patch) -> None:
+        for cell in patch.cells:
+            del self._patch_of_cell[cell]
+        self._drop_uuid(patch)
+        self._coord_bounds = None
+
+    def _drop_uuid(self, patch: Patch) -> None:
+        if patch.patch_uuid is not None and self._patch_of_uuid.get(patch.patch_uuid) is patch:
+            # Another patch with the same uuid is found again by getPatchByUuid
+            del self._patch_of_uuid[patch.patch_uuid]
+
+    def removePatch(self, patch: Patch) -> None:
+        self._patches.remove(patch)
+        self._unindex(patch)
+
+    def removePatchesIf(self, predicate: Callable[[Patch], bool]) -> None:
+        kept = []
+        for patch in self._patches:
+            if predicate(patch):
+                self._unindex(patch)
+            else:
+                kept.append(patch)
+        self._patches = kept
+
+    def setPatchUuid(self, patch: Patch, patch_uuid: uuid.UUID) -> None:
+        self._drop_uuid(patch)
+        patch.set_uuid(patch_uuid)
+        self._patch_of_uuid.setdefault(patch_uuid, patch)
 
     def getMaxCoord(self, coord_type: CoordType) -> int:
-        all_coords = list(
-            itertools.chain.from_iterable(
-                map(lambda patch: patch.getCoordList(coord_type), self.patches)
-            )
-        )
+        if self._coord_bounds is None:
+            cols, rows = 0, 0
+            for col, row in self._patch_of_cell:
+                cols, rows = max(cols, col + 1), max(rows, row + 1)
+            self._coord_bounds = (cols, rows)
         lower_bound = self.min_rows if coord_type == CoordType.Row else self.min_cols
-
-        max_coords = max(all_coords) if len(all_coords) else 0
-        return max(1 + max_coords, lower_bound)
+        return max(self._coord_bounds[coord_type.value], lower_bound, 1)
 
     def getCols(self):
         return self.getMaxCoord(CoordType.Col)
@@ -199,14 +349,10 @@ class Lattice:
         self.patches = []
 
     def getPatchOfCell(self, target: Tuple[int, int]) -> Optional[Patch]:
-        for patch in self.patches:
-            for cell in patch.cells:
-                if cell == target:
-                    return patch
-        return None
+        return self._patch_of_cell.get(target)
 
     def cellIsFree(self, target: Tuple[int, int]):
-        return self.getPatchOfCell(target) is None
+        return target not in self._patch_of_cell
 
     def getPatchRepresentative(self, cell: Tuple[int, int]):
         maybe_patch = self.getPatchOfCell(cell)
@@ -217,10 +363,17 @@ class Lattice:
         return maybe_patch.patch_type if maybe_patch is not None else None
 
     def getPatchByUuid(self, patch_uuid: uuid.UUID) -> Optional[Patch]:
-        for p in self.patches:
-            if p.patch_uuid is not None and p.patch_uuid == patch_uuid:
-                return p
-        return None
+        patch = self._patch_of_uuid.get(patch_uuid)
+        if patch is None or patch.patch_uuid != patch_uuid:
+            # Not indexed, or indexed before a Patch.set_uuid: the uuid may still have been set on
+            # a patch with Patch.set_uuid rather than setPatchUuid, or belong to a duplicate of a
+            # removed patch
+            patch = next((p for p in self._patches if p.patch_uuid == patch_uuid), None)
+            if patch is not None:
+                self._patch_of_uuid[patch_uuid] = patch
+            else:
+                self._patch_of_uuid.pop(patch_uuid, None)
+        return patch
 
 
 def get_border_orientation(subject: Tuple[int, int], neighbour: Tuple[int, int]):
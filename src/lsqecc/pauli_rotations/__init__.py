@@ -16,4 +16,12 @@
 # USA
 
 from .circuit import PauliOpCircuit
-from .rotation import Measurement, PauliOperator, PauliProductOperation, PauliRotation
+from .clifford_tableau import CliffordTableau
+from .rotation import (
+    Measurement,
+    PauliOperator,
+    PauliOpInternTable,
+    PauliProductOperation,
+    PauliRotation,
+)
+from .stream import PauliOpStream
@@ -0,0 +1,182 @@
+# Copyright (C) 2020-2021 - George Watkins and Alex Nguyen
+#
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or (at your option) any later version.
+#
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public
+# License along with this library; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301
+# USA
+
+"""Binary file format for PauliOpCircuit.
+
+All integers are little endian and every section starts at a multiple of 8 bytes:
+
+- Header: MAGIC, the format version (uint32), the length of the circuit name in bytes
+  (uint32), the number of qubits, of ops and of distinct rotation amounts (uint64 each).
+- The circuit name in UTF-8.
+- Angle table: a (numerator, denominator) pair of int64 for each distinct rotation amount.
+- Op flags: one uint8 per op, see FLAG_MEASUREMENT and FLAG_NEGATIVE.
+- Angle indices: one int32 per op, indexing the angle table for rotations and -1 for
+  measurements.
+- X bitplane then Z bitplane: for each op, the bitmask on ceil(qubits / 8) bytes.
+
+Files are read into (or mapped as) a single NumPy buffer that the sections are views of.
+"""
+
+import os
+import struct
+from fractions import Fraction
+from typing import TYPE_CHECKING, BinaryIO, Dict, List, Union
+
+import numpy as np
+
+from .rotation import Measurement, PauliProductOperation, PauliRotation
+
+if TYPE_CHECKING:
+    from .circuit import PauliOpCircuit
+
+MAGIC = b"LSQECCPC"
+FORMAT_VERSION = 1
+
+FLAG_MEASUREMENT = 1
+FLAG_NEGATIVE = 2
+
+_header = struct.Struct("<8sIIQQQ")
+
+PathType = Union[str, "os.PathLike[str]"]
+
+
+def _padding(size: int) -> bytes:
+    return bytes(-size % 8)
+
+
+def _bitplane(masks: List[int], row_bytes: int) -> bytes:
+    return b"".join(mask.to_bytes(row_bytes, "little") for mask in masks)
+
+
+def write_circuit(circuit: "PauliOpCircuit", file: BinaryIO) -> None:
+    """Write circuit to a binary file object, see the module documentation for the layout"""
+    angles: Dict[Fraction, int] = {}
+    flags = np.zeros(len(circuit.ops), dtype=np.uint8)
+    angle_indices = np.full(len(circuit.ops), -1, dtype="<i4")
+    for i, op in enumerate(circuit.ops):
+        if op.qubit_num != circuit.qubit_num:
+            raise ValueError(f"Op {i} has {op.qubit_num} qubits, the circuit {circuit.qubit_num}")
+        if not isinstance(op, (PauliRotation, Measurement)):
+            raise ValueError(f"Cannot save op {i} of type {type(op)}")
+        if op.is_conditional():
+            raise ValueError(f"Cannot save conditional op {i}: {op}")
+        if isinstance(op, Measurement):
+            flags[i] = FLAG_MEASUREMENT | (FLAG_NEGATIVE if op.isNegative else 0)
+        else:
+            angle_indices[i] = angles.setdefault(op.rotation_amount, len(angles))
+
+    try:
+        angle_table = np.array(
+            [(angle.numerator, angle.denominator) for angle in angles], dtype="<i8"
+        ).reshape(len(angles), 2)
+    except OverflowError:
+        raise ValueError("Rotation amounts must have 64 bit numerators and denominators")
+
+    name = circuit.name.encode("utf-8")
+    row_bytes = (circuit.qubit_num + 7) // 8
+    sections = [
+        _header.pack(
+            MAGIC, FORMAT_VERSION, len(name), circuit.qubit_num, len(circuit.ops), len(angles)
+        ),
+        name,
+        angle_table.tobytes(),
+        flags.tobytes(),
+        angle_indices.tobytes(),
+        _bitplane([op.x_bits for op in circuit.ops], row_bytes),
+        _bitplane([op.z_bits for op in circuit.ops], row_bytes),
+    ]
+    for section in sections:
+        file.write(section)
+        file.write(_padding(len(section)))
+
+
+def save_circuit(circuit: "PauliOpCircuit", path: PathType) -> None:
+    with open(path, "wb") as file:
+        write_circuit(circuit, file)
+
+
+def _bitplane_to_masks(plane: np.ndarray, count: int, row_bytes: int) -> List[int]:
+    data = plane.tobytes()
+    return [
+        int.from_bytes(data[i * row_bytes : (i + 1) * row_bytes], "little") for i in range(count)
+    ]
+
+
+def circuit_from_buffer(buffer: np.ndarray) -> "PauliOpCircuit":
+    """Build a circuit from the bytes of a file, as a one dimensional uint8 array"""
+    from .circuit import PauliOpCircuit
+
+    if buffer.size < _header.size:
+        raise ValueError("Not a PauliOpCircuit file: too short")
+    magic, version, name_len, qubit_num, op_count, angle_count = _header.unpack(
+        buffer[: _header.size].tobytes()
+    )
+    if magic != MAGIC:
+        raise ValueError("Not a PauliOpCircuit file: wrong magic number")
+    if version != FORMAT_VERSION:
+        raise ValueError(f"Unsupported PauliOpCircuit file version {version}")
+
+    row_bytes = (qubit_num + 7) // 8
+    offset = _header.size
+
+    def section(size: int) -> np.ndarray:
+        nonlocal offset
+        if offset + size > buffer.size:
+            raise ValueError("Not a PauliOpCircuit file: truncated")
+        view = buffer[offset : offset + size]
+        offset += size + (-size % 8)
+        return view
+
+    name = section(name_len).tobytes().decode("utf-8")
+    angle_table = section(16 * angle_count).view("<i8").reshape(angle_count, 2)
+    flags = section(op_count)
+    angle_indices_offset = offset
+    angle_indices = section(4 * op_count).view("<i4")
+    x_masks = _bitplane_to_masks(section(op_count * row_bytes), op_count, row_bytes)
+    z_masks = _bitplane_to_masks(section(op_count * row_bytes), op_count, row_bytes)
+
+    angles = [Fraction(int(n), int(d)) for n, d in angle_table]
+    ops: List[PauliProductOperation] = []
+    for i, (flag, angle_index, x_bits, z_bits) in enumerate(
+        zip(flags.tolist(), angle_indices.tolist(), x_masks, z_masks)
+    ):
+        if flag & FLAG_MEASUREMENT:
+            ops.append(Measurement.from_bits(qubit_num, x_bits, z_bits, bool(flag & FLAG_NEGATIVE)))
+        else:
+            if not 0 <= angle_index < angle_count:
+                raise ValueError(
+                    f"Not a PauliOpCircuit file: angle index {angle_index} of op {i}, at byte "
+                    f"{angle_indices_offset + 4 * i}, is not in the table of {angle_count} angles"
+                )
+            ops.append(PauliRotation.from_bits(qubit_num, x_bits, z_bits, angles[angle_index]))
+
+    circuit = PauliOpCircuit(qubit_num, name)
+    circuit.ops = ops
+    return circuit
+
+
+def load_circuit(path: PathType, memory_map: bool = True) -> "PauliOpCircuit":
+    """Load a circuit saved by save_circuit.
+
+    Args:
+        memory_map: Map the file with numpy.memmap rather than reading it with numpy.fromfile.
+    """
+    if os.path.getsize(path) == 0:
+        raise ValueError("Not a PauliOpCircuit file: empty")
+    if memory_map:
+        return circuit_from_buffer(np.memmap(path, dtype=np.uint8, mode="r"))
+    return circuit_from_buffer(np.fromfile(path, dtype=np.uint8))
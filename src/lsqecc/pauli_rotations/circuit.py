@@ -17,14 +17,51 @@
 
 import copy
 import enum
+import os
 from fractions import Fraction
-from typing import List, Optional, Sequence, Tuple, cast
-
-import pyzx as zx
-
-from lsqecc.utils import QasmParseException, phase_frac_to_latex
-
-from .rotation import Measurement, PauliOperator, PauliProductOperation, PauliRotation
+from typing import (
+    TYPE_CHECKING,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+    cast,
+)
+
+import numpy as np
+
+from lsqecc.gates.qasm_tokenizer import QasmSource, iter_gate_statements
+from lsqecc.utils import phase_frac_to_latex
+
+from .clifford_tableau import bits_to_packed_table, bits_to_table
+from .rotation import (
+    Measurement,
+    PauliOperator,
+    PauliOpInternTable,
+    PauliProductOperation,
+    PauliRotation,
+    symplectic_product_phase,
+)
+from .stream import PauliOpStream, litinski_transformed_ops
+
+if TYPE_CHECKING:
+    import pyzx as zx
+
+# Bytes of bitmask products computed at once by anticommutation_block
+_ANTICOMMUTATION_WINDOW_BYTES = 1 << 22
+# Whether each byte has an odd number of ones
+_BYTE_PARITY = np.array([bin(byte).count("1") % 2 for byte in range(256)], dtype=bool)
+
+
+def _to_words(packed_table: np.ndarray) -> np.ndarray:
+    """View the rows of a packed bit table as uint64 words, padding them with zero bytes"""
+    padding = -packed_table.shape[1] % 8
+    padded = np.pad(packed_table, ((0, 0), (0, padding)))
+    return np.ascontiguousarray(padded).view(np.uint64)
 
 
 class PauliOpCircuit(object):
@@ -61,7 +98,12 @@ class PauliOpCircuit(object):
         return not self.__eq__(other)
 
     def copy(self) -> "PauliOpCircuit":
-        return copy.deepcopy(self)
+        """Return a circuit with the same ops. The ops themselves are shared, see
+        PauliProductOperation.
+        """
+        c = PauliOpCircuit(self.qubit_num, self.name)
+        c.ops = list(self.ops)
+        return c
 
     def add_pauli_block(self, new_block: PauliProductOperation, index: int = None) -> None:
         """Add a rotation to the circuit
@@ -108,81 +150,57 @@ class PauliOpCircuit(object):
         self.add_pauli_block(new_rotation, index)
 
     def apply_transformation(self, start_index: int = 0) -> None:
-        """Apply Litinski's Transformation"""
-
-        quarter_rotation = list()
-        circuit_has_measurements: bool = self.circuit_has_measurements()
-        # Build a stack of pi/4 rotations
-
-        for i in range(start_index, len(self)):
-            if isinstance(self.ops[i], PauliRotation):
-                if cast(PauliRotation, self.ops[i]).rotation_amount in {
-                    Fraction(1, 4),
-                    Fraction(-1, 4),
-                }:
-                    quarter_rotation.append(i)
-
-        # Moving all pi/4 rotations towards the end of the circuit
-        # and removing them afterwards
-        while quarter_rotation:
-            index = quarter_rotation.pop()
-            while index + 1 < len(self):
-                self.swap_adjacent_blocks(index)
-                index += 1
-            if circuit_has_measurements:
-                self.ops.pop()
+        """Apply Litinski's Transformation
 
-    def to_y_free_equivalent(self) -> "PauliOpCircuit":
-        """Return a Y-operator-free copy of the current circuit."""
-        y_free_circuit = PauliOpCircuit(self.qubit_num, self.name)
+        All pi/4 rotations from start_index onwards are moved towards the end of the circuit, and
+        removed afterwards if the circuit has measurements. Rather than swapping blocks one at a
+        time, the pi/4 rotations met so far are absorbed into a CliffordTableau, through which the
+        ops following them are conjugated in batches. See litinski_transformed_ops.
+        """
+        self.ops[start_index:] = litinski_transformed_ops(
+            self.qubit_num,
+            self.ops[start_index:],
+            drop_quarter_rotations=self.circuit_has_measurements(),
+        )
 
-        for block in self.ops:
-            y_free_circuit.ops.extend(block.to_y_free_equivalent())
+    def stream(self) -> PauliOpStream:
+        """Return a stream over the ops of the circuit, to chain passes without building the
+        intermediate circuits.
+        """
+        return PauliOpStream.from_circuit(self)
 
-        return y_free_circuit
+    def to_y_free_equivalent(self) -> "PauliOpCircuit":
+        """Return a Y-operator-free copy of the current circuit."""
+        return self.stream().to_y_free_equivalent().to_circuit()
 
     def get_basic_form(self) -> "PauliOpCircuit":
         """
         Returns a circuit where all pauli rotations are either by pi/2, pi/4 or pi/8
         """
-        ret_circuit = PauliOpCircuit(self.qubit_num, self.name)
-        for op in self.ops:
-            if isinstance(op, Measurement):
-                ret_circuit.add_pauli_block(op)
-            else:
-                assert isinstance(op, PauliRotation)
-                for new_op in op.to_basic_form_decomposition():
-                    ret_circuit.add_pauli_block(new_op)
-        return ret_circuit
+        return self.stream().get_basic_form().to_circuit()
 
     def group_rotations_with_the_same_axis(self):
-        ret_circuit = PauliOpCircuit(self.qubit_num, self.name)
+        return self.stream().group_rotations_with_the_same_axis().to_circuit()
 
-        accumulator: Optional[PauliRotation] = None
+    def interned(self, table: Optional[PauliOpInternTable] = None) -> "PauliOpCircuit":
+        """Return a copy of the circuit where equal ops are the same read-only instance, see
+        PauliOpInternTable.
+        """
+        return self.stream().interned(table).to_circuit()
 
-        for op in self.ops:
-            if isinstance(op, PauliRotation):
-                if accumulator is None:
-                    accumulator = copy.deepcopy(op)
-                else:
-                    if op.ops_list == accumulator.ops_list:
-                        accumulator.rotation_amount += op.rotation_amount
-                    else:
-                        ret_circuit.add_pauli_block(accumulator)
-                        accumulator = copy.deepcopy(op)
-
-            elif isinstance(accumulator, Measurement):
-                if accumulator is not None:
-                    ret_circuit.add_pauli_block(accumulator)
-                    accumulator = None
-                ret_circuit.add_pauli_block(op)
-            else:
-                raise Exception(f"Not expecting: {op}")
+    def save(self, path: Union[str, "os.PathLike[str]"]) -> None:
+        """Save the circuit in the binary format of lsqecc.pauli_rotations.binary_format.
+        Conditional ops can't be saved."""
+        from .binary_format import save_circuit
 
-        if accumulator is not None:
-            ret_circuit.add_pauli_block(accumulator)
+        save_circuit(self, path)
 
-        return ret_circuit
+    @staticmethod
+    def load(path: Union[str, "os.PathLike[str]"], memory_map: bool = True) -> "PauliOpCircuit":
+        """Load a circuit written by save, mapping the file in memory unless memory_map is False"""
+        from .binary_format import load_circuit
+
+        return load_circuit(path, memory_map)
 
     def _swap_adjacent_commuting_blocks(self, index: int) -> None:
         """
@@ -211,32 +229,25 @@ class PauliOpCircuit(object):
         if PauliOpCircuit.are_commuting(self.ops[index], self.ops[next_block]):
             raise Exception("The blocks to be swapped must anti-commute!")
 
-        product_of_coefficients = complex(1)
+        first, second = self.ops[index], copy.copy(self.ops[next_block])
 
-        for i in range(self.qubit_num):
-            new_op = PauliOperator.multiply_operators(
-                self.ops[index].get_op(i), self.ops[next_block].get_op(i)
-            )
-
-            self.ops[next_block].change_single_op(i, new_op[1])
-            product_of_coefficients *= new_op[0]
-
-        # Flip the phase if product of coefficients is negative
+        # The product of the two blocks is i^k times the Pauli product with the XORed bitmasks
         # Product of coefficients will always be either i or -i (see issues #28 for proof)
-        product_of_coefficients *= 1j
-        if isinstance(self.ops[next_block], Measurement):
-            if product_of_coefficients.real < 0:
-                measurement = cast(Measurement, self.ops[next_block])
-                measurement.isNegative = not measurement.isNegative
+        k = symplectic_product_phase(first.x_bits, first.z_bits, second.x_bits, second.z_bits)
+        second.x_bits ^= first.x_bits
+        second.z_bits ^= first.z_bits
+
+        # Flip the phase if i times the product of coefficients is negative, i.e. if it is i
+        flip_sign = k == 1
+        if isinstance(second, Measurement):
+            if flip_sign:
+                second.isNegative = not second.isNegative
 
         else:
-            cast(PauliRotation, self.ops[next_block]).rotation_amount *= (
-                -1 if product_of_coefficients.real < 0 else 1
-            )
+            cast(PauliRotation, second).rotation_amount *= -1 if flip_sign else 1
 
-        temp = self.ops[index]
-        self.ops[index] = self.ops[next_block]
-        self.ops[next_block] = temp
+        self.ops[index] = second
+        self.ops[next_block] = first
 
     def swap_adjacent_blocks(self, index: int) -> None:
         """
@@ -282,8 +293,6 @@ class PauliOpCircuit(object):
         if block1.qubit_num != block2.qubit_num:
             raise Exception("Blocks must have same number of qubits")
 
-        ret_val = 1
-
         # Use the fact that:
         # P*Q = (P_1 otimes ... otimes P_n)*(Q_1 otimes ... otimes Q_n)
         #     = (P_1*Q_1 otimes ... otimes P_n*Q_n)
@@ -296,20 +305,87 @@ class PauliOpCircuit(object):
         #     Q*P = (c_1*Q_1*P_1 otimes...otimes c_n*Q_n*P_n)
         #     = (c_1*...*c_n)*P*Q
         #
-        # The loop below computes (c_1*...*c_n) in ret_val
+        # c_j is -1 exactly when x1_j*z2_j + z1_j*x2_j is odd, so (c_1*...*c_n) is given by the
+        # parity of the symplectic product of the bitmasks
 
-        for i in range(block1.qubit_num):
-            ret_val *= 1 if PauliOperator.are_commuting(block1.get_op(i), block2.get_op(i)) else -1
+        return not block1.anticommutes_with(block2)
 
-        return ret_val > 0
+    def bit_tables(
+        self, start: int = 0, stop: Optional[int] = None
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Unpack the X and Z bitmasks of the ops in self.ops[start:stop] into two
+        (number of ops) x (number of qubits) tables of zeros and ones.
+        """
+        ops = self.ops[start:stop]
+        return (
+            bits_to_table([op.x_bits for op in ops], self.qubit_num),
+            bits_to_table([op.z_bits for op in ops], self.qubit_num),
+        )
+
+    def packed_bit_tables(
+        self, start: int = 0, stop: Optional[int] = None
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """The X and Z bitmasks of the ops in self.ops[start:stop] as two uint8 tables, one row
+        of bytes per op, see bits_to_packed_table.
+        """
+        ops = self.ops[start:stop]
+        return (
+            bits_to_packed_table([op.x_bits for op in ops], self.qubit_num),
+            bits_to_packed_table([op.z_bits for op in ops], self.qubit_num),
+        )
+
+    def anticommutation_block(
+        self,
+        row_start: int = 0,
+        row_stop: Optional[int] = None,
+        column_start: int = 0,
+        column_stop: Optional[int] = None,
+    ) -> np.ndarray:
+        """Boolean matrix A such that A[i, j] is True if the i-th op of
+        self.ops[row_start:row_stop] and the j-th op of self.ops[column_start:column_stop]
+        anti-commute.
+
+        The rows are computed a window at a time, so that besides the result only the bitmasks,
+        packed in 64 bit words, and a few MB of temporaries are allocated.
+        """
+        row_x, row_z = map(_to_words, self.packed_bit_tables(row_start, row_stop))
+        column_x, column_z = map(_to_words, self.packed_bit_tables(column_start, column_stop))
+        block = np.empty((len(row_x), len(column_x)), dtype=bool)
+        window = max(1, _ANTICOMMUTATION_WINDOW_BYTES // max(1, column_x.nbytes))
+        for start in range(0, len(row_x), window):
+            x = row_x[start : start + window, np.newaxis, :]
+            z = row_z[start : start + window, np.newaxis, :]
+            # The symplectic product of two ops is odd when the words x1 & z2 ^ z1 & x2 have an
+            # odd number of ones in total, i.e. when their XOR has an odd number of ones
+            words = np.bitwise_xor.reduce(np.bitwise_xor(x & column_z, z & column_x), axis=2)
+            for shift in (32, 16, 8):
+                words ^= words >> np.uint64(shift)
+            block[start : start + window] = _BYTE_PARITY[words & np.uint64(0xFF)]
+        return block
+
+    def anticommutation_matrix(self, start: int = 0, stop: Optional[int] = None) -> np.ndarray:
+        """Boolean matrix A such that A[i, j] is True if the i-th and the j-th op of
+        self.ops[start:stop] anti-commute.
+
+        The result has a boolean per pair of ops, so on very long circuits use start and stop,
+        or anticommutation_block, to only compute it for a window of ops.
+        """
+        return self.anticommutation_block(start, stop, start, stop)
+
+    def commutation_matrix(self, start: int = 0, stop: Optional[int] = None) -> np.ndarray:
+        """Boolean matrix C such that C[i, j] is True if the i-th and the j-th op of
+        self.ops[start:stop] commute. See anticommutation_matrix.
+        """
+        return ~self.anticommutation_matrix(start, stop)
 
     @staticmethod
-    def load_from_pyzx(circuit: zx.Circuit) -> "PauliOpCircuit":
+    def load_from_pyzx(circuit: "zx.Circuit") -> "PauliOpCircuit":
         """Generate circuit from PyZX Circuit
 
         Returns:
             circuit: PyZX Circuit
         """
+        import pyzx as zx
 
         X = PauliOperator.X
         Z = PauliOperator.Z
@@ -346,92 +422,57 @@ class PauliOpCircuit(object):
         return ret_circ
 
     @staticmethod
-    def _manual_parse_from_reversible_qasm(qasm: str) -> "PauliOpCircuit":
-        """Read circuit from qiskit gate by gate. Assumes no measurements and no comments"""
+    def _manual_parse_from_reversible_qasm(qasm: QasmSource) -> "PauliOpCircuit":
+        """Read circuit from qiskit gate by gate, from a string or a file object. Assumes no
+        measurements"""
 
         Z = PauliOperator.Z
 
-        def get_index_arg(qreg_arg: str):
-            return int(qreg_arg.split("[")[1].split("]")[0])
-
-        def split_instruciton_and_args(line: str) -> Tuple[str, List[str]]:
-            if " " not in line:
-                return line, []
-            return line.split(" ")[0], line.split(" ")[1].split(",")
-
-        instructions: List[Tuple[str, List[str]]] = list(
-            map(split_instruciton_and_args, qasm.split(";\n"))
-        )
-
-        qregs = list(filter(lambda line: line[0] == "qreg", instructions))
-        if len(qregs) != 1:
-            raise QasmParseException(f"Need exactly one qreg, got {len(qregs)}")
-        qreg_name, qreg_args = qregs[0]
-        num_qubits = get_index_arg(qreg_args[0])
-
-        # For now discard TODO check that they are used correctly
-        instructions = list(
-            filter(
-                lambda line: line[0] not in {"OPENQASM", "include", "barrier", "qreg"}, instructions
-            )
-        )
+        statements = iter_gate_statements(qasm)
+        qreg = next(statements)
+        if qreg.name != "qreg":
+            raise qreg.error("The qreg must be declared before the gates")
+        num_qubits = qreg.index_arg(0)
 
         ret_circ = PauliOpCircuit(num_qubits)
 
-        for instruction, args in instructions:
-
-            if instruction == "h":
+        for statement in statements:
+            instruction = statement.name
+            if statement.params is None and instruction in PauliOpCircuit._manual_parse_gates:
                 ret_circ.add_pauli_blocks(
-                    PauliRotation.from_hadamard_gate(num_qubits, get_index_arg(args[0]))
-                )
-            elif instruction == "x":
-                ret_circ.add_pauli_blocks(
-                    PauliRotation.from_x_gate(num_qubits, get_index_arg(args[0]))
-                )
-            elif instruction == "s":
-                ret_circ.add_pauli_blocks(
-                    PauliRotation.from_s_gate(num_qubits, get_index_arg(args[0]))
-                )
-            elif instruction == "t":
-                ret_circ.add_pauli_blocks(
-                    PauliRotation.from_t_gate(num_qubits, get_index_arg(args[0]))
-                )
-            elif instruction[0:2] == "rz":
-                if instruction[2:6] != "(pi/":
-                    raise QasmParseException(
-                        f"Can only parse pi/n for n power of 2 angles as rz args, "
-                        f"got {instruction}"
+                    PauliOpCircuit._manual_parse_gates[instruction](
+                        num_qubits, statement.index_arg(0)
                     )
-                phase_pi_frac_den = int(instruction[6:].split(")")[0])
-                ret_circ.add_pauli_blocks(
+                )
+            elif instruction == "rz":
+                ret_circ.add_pauli_block(
                     PauliRotation.from_r_gate(
-                        num_qubits, get_index_arg(args[0]), Z, Fraction(1, phase_pi_frac_den)
+                        num_qubits, statement.index_arg(0), Z, statement.pi_over_n_param()
                     )
                 )
-            elif instruction[0:3] == "crz":
-                if instruction[3:7] != "(pi/":
-                    raise QasmParseException(
-                        f"Can only parse pi/n for n power of 2 angles as rz args, "
-                        f"got {instruction}"
-                    )
-                phase_pi_frac_den = int(instruction[7:].split(")")[0])
+            elif instruction == "crz":
                 ret_circ.add_pauli_blocks(
                     PauliRotation.from_crz_gate(
                         num_qubits,
-                        get_index_arg(args[0]),
-                        get_index_arg(args[1]),
-                        Fraction(1, phase_pi_frac_den),
+                        statement.index_arg(0),
+                        statement.index_arg(1),
+                        statement.pi_over_n_param(),
                     )
                 )
-            elif not instruction and not args:
-                pass
             else:
-                raise QasmParseException(
-                    f"Instruction {instruction} with args {args} not implemented"
+                raise statement.error(
+                    f"Instruction {instruction} with args {statement.args} not implemented"
                 )
 
         return ret_circ
 
+    _manual_parse_gates: Dict[str, Callable[[int, int], List[PauliRotation]]] = {
+        "h": PauliRotation.from_hadamard_gate,
+        "x": lambda num_qubits, qubit: [PauliRotation.from_x_gate(num_qubits, qubit)],
+        "s": lambda num_qubits, qubit: [PauliRotation.from_s_gate(num_qubits, qubit)],
+        "t": lambda num_qubits, qubit: [PauliRotation.from_t_gate(num_qubits, qubit)],
+    }
+
     @staticmethod
     def from_list(pauli_op_list: List[PauliProductOperation]):
         c = PauliOpCircuit(pauli_op_list[0].qubit_num)
@@ -451,6 +492,8 @@ class PauliOpCircuit(object):
         """Load a string as if it were a QASM circuit. Only supports reversible circuits."""
 
         if decomposer == PauliOpCircuit.DecomposerType.PyZX:
+            import pyzx as zx
+
             pyzx_circ = zx.Circuit.from_qasm(qasm_string)
             return PauliOpCircuit.load_from_pyzx(pyzx_circ)
         else:
@@ -458,10 +501,22 @@ class PauliOpCircuit(object):
 
     @staticmethod
     def join(lhs: "PauliOpCircuit", rhs: "PauliOpCircuit") -> "PauliOpCircuit":
-        if lhs.qubit_num != rhs.qubit_num:
-            raise Exception("The two circuits joined must have the same number of qubits!")
-        c = lhs.copy()
-        c.ops.extend(rhs.ops)
+        return PauliOpCircuit.join_all([lhs, rhs])
+
+    @staticmethod
+    def join_all(circuits: Iterable["PauliOpCircuit"]) -> "PauliOpCircuit":
+        """Concatenate the circuits in order, in time linear in the total number of ops, unlike
+        repeated joins. The name is taken from the first circuit and the ops are shared.
+        """
+        circuits_iter = iter(circuits)
+        first = next(circuits_iter, None)
+        if first is None:
+            raise Exception("Need at least one circuit to join")
+        c = first.copy()
+        for circuit in circuits_iter:
+            if circuit.qubit_num != c.qubit_num:
+                raise Exception("The circuits joined must have the same number of qubits!")
+            c.ops.extend(circuit.ops)
         return c
 
     def count_rotations_by(self, rotation_amount: Fraction) -> int:
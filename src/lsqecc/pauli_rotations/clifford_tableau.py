@@ -0,0 +1,241 @@
+# Copyright (C) 2020-2021 - George Watkins and Alex Nguyen
+#
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or (at your option) any later version.
+#
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public
+# License along with this library; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301
+# USA
+
+import copy
+from fractions import Fraction
+from typing import List, Optional, Sequence, Tuple, TypeVar, cast
+
+import numpy as np
+
+from .rotation import (
+    Measurement,
+    PauliProductOperation,
+    PauliRotation,
+    iter_set_bits,
+    popcount,
+    symplectic_product_phase,
+)
+
+T = TypeVar("T", bound=PauliProductOperation)
+
+
+def bits_to_packed_table(masks: Sequence[int], qubit_num: int) -> np.ndarray:
+    """Write a sequence of bitmasks as a (len(masks)) x (bytes in qubit_num bits) uint8 table,
+    least significant byte first"""
+    n_bytes = (qubit_num + 7) // 8
+    return np.frombuffer(
+        b"".join(mask.to_bytes(n_bytes, "little") for mask in masks), dtype=np.uint8
+    ).reshape(len(masks), n_bytes)
+
+
+def bits_to_table(masks: Sequence[int], qubit_num: int) -> np.ndarray:
+    """Unpack a sequence of bitmasks into a (len(masks)) x (qubit_num) table of zeros and ones"""
+    packed = bits_to_packed_table(masks, qubit_num)
+    return np.unpackbits(packed, axis=1, count=qubit_num, bitorder="little")
+
+
+def table_to_bits(table: np.ndarray) -> List[int]:
+    """Inverse of bits_to_table"""
+    packed = np.packbits(table.astype(np.uint8), axis=1, bitorder="little")
+    return [int.from_bytes(row.tobytes(), "little") for row in packed]
+
+
+def _matmul_mod2(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    # Entries are bounded by the inner dimension, so float32 products are exact up to 2^24 terms
+    # and can go through BLAS
+    return (a.astype(np.float32) @ b.astype(np.float32)).astype(np.int64) & 1
+
+
+# A Pauli product given as X bitmask, Z bitmask and sign bit (i.e. (-1)^sign)
+SignedPauliBits = Tuple[int, int, int]
+
+
+class CliffordTableau:
+    """A Clifford unitary C, represented by the images C^dagger P C of the generators X_j and Z_j
+    of the Pauli group, for each qubit j.
+
+    Each image is stored as X and Z bitmasks (with Y having both bits set) and a sign bit. Pauli
+    rotations by pi/4 and pi/2 can be absorbed into the tableau, which can then conjugate
+    PauliProductOperations. Batches of ops are conjugated at once through NumPy bit arrays of the
+    tableau, see bit_arrays, while single ops go through the bitmasks directly.
+
+    Conjugating by C^dagger . C is what happens to an op B when the Cliffords in C are commuted
+    past it from before to after it: (C then B) = (C^dagger B C then C).
+    """
+
+    # Below this many ops, conjugating them one by one through the bitmasks is faster
+    bulk_conjugation_threshold = 64
+
+    def __init__(self, qubit_num: int):
+        self.qubit_num = qubit_num
+        self.x_images: List[SignedPauliBits] = [(1 << j, 0, 0) for j in range(qubit_num)]
+        self.z_images: List[SignedPauliBits] = [(0, 1 << j, 0) for j in range(qubit_num)]
+        self._is_identity = True
+        self._bit_arrays: Optional[Tuple[np.ndarray, np.ndarray, np.ndarray]] = None
+        self._phase_tables: Optional[Tuple[np.ndarray, np.ndarray]] = None
+
+    def is_identity(self) -> bool:
+        return self._is_identity
+
+    def bit_arrays(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """The tableau as (2 * qubit_num) x qubit_num X and Z bit arrays and a vector of sign bits.
+        Row 2j holds the image of X_j and row 2j+1 the image of Z_j.
+        """
+        if self._bit_arrays is None:
+            rows = [image for pair in zip(self.x_images, self.z_images) for image in pair]
+            self._bit_arrays = (
+                bits_to_table([x for x, _, _ in rows], self.qubit_num),
+                bits_to_table([z for _, z, _ in rows], self.qubit_num),
+                np.array([sign for _, _, sign in rows], dtype=np.uint8),
+            )
+        return self._bit_arrays
+
+    def conjugate_bits(self, x_bits: int, z_bits: int) -> SignedPauliBits:
+        """Image of the Hermitian Pauli product with the given bitmasks"""
+        if self._is_identity:
+            return x_bits, z_bits, 0
+
+        # Write the product as i^(number of Ys) * prod_j X_j^x_j Z_j^z_j and multiply the
+        # images, keeping track of the power of i in k
+        acc_x, acc_z = 0, 0
+        k = popcount(x_bits & z_bits)
+        for j in iter_set_bits(x_bits | z_bits):
+            for bits, images in ((x_bits, self.x_images), (z_bits, self.z_images)):
+                if (bits >> j) & 1:
+                    img_x, img_z, img_sign = images[j]
+                    k += 2 * img_sign + symplectic_product_phase(acc_x, acc_z, img_x, img_z)
+                    acc_x ^= img_x
+                    acc_z ^= img_z
+        # Images of Hermitian products are Hermitian, so k is even
+        return acc_x, acc_z, (k % 4) // 2
+
+    def conjugate_bit_tables(
+        self, x: np.ndarray, z: np.ndarray
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Conjugate a batch of Hermitian Pauli products, given as (number of products) x
+        (number of qubits) X and Z bit tables.
+
+        Returns:
+            The X and Z bit tables of the images and, for each of them, a sign bit (1 when the
+            image comes with a minus sign).
+        """
+        if self._is_identity:
+            return x, z, np.zeros(x.shape[0], dtype=np.uint8)
+
+        tableau_x, tableau_z, tableau_signs = self.bit_arrays()
+        if self._phase_tables is None:
+            # Write each row as i^(x.z) X^x Z^z. Then moving the Zs of earlier factors past the
+            # Xs of later ones gives a sign (-1)^(z_s . x_t) for each pair of rows s < t
+            row_phases = 2 * tableau_signs.astype(np.int64) + np.sum(
+                tableau_x.astype(np.int64) & tableau_z, axis=1
+            )
+            reordering = np.triu(_matmul_mod2(tableau_z, tableau_x.T), k=1)
+            self._phase_tables = (row_phases, reordering)
+        row_phases, reordering = self._phase_tables
+
+        # Each product is i^(number of Ys) * prod_j X_j^x_j Z_j^z_j, select the rows of the factors
+        selection = np.empty((x.shape[0], 2 * self.qubit_num), dtype=np.int64)
+        selection[:, 0::2] = x
+        selection[:, 1::2] = z
+
+        new_x = _matmul_mod2(selection, tableau_x)
+        new_z = _matmul_mod2(selection, tableau_z)
+
+        # The final X^x Z^z is i^(-x.z) times the Hermitian product
+        k = (
+            np.sum(x.astype(np.int64) & z, axis=1)
+            + selection @ row_phases
+            + 2 * np.sum(_matmul_mod2(selection, reordering) & selection, axis=1)
+            - np.sum(new_x & new_z, axis=1)
+        )
+        # Images of Hermitian products are Hermitian, so k is even
+        return new_x.astype(np.uint8), new_z.astype(np.uint8), ((k % 4) // 2).astype(np.uint8)
+
+    def conjugate_ops(self, ops: Sequence[T]) -> List[T]:
+        """Return the ops conjugated by the tableau, as new ops unless the tableau is the
+        identity."""
+        if self._is_identity:
+            return list(ops)
+
+        if len(ops) < CliffordTableau.bulk_conjugation_threshold:
+            images = [self.conjugate_bits(op.x_bits, op.z_bits) for op in ops]
+        else:
+            x, z, signs = self.conjugate_bit_tables(
+                bits_to_table([op.x_bits for op in ops], self.qubit_num),
+                bits_to_table([op.z_bits for op in ops], self.qubit_num),
+            )
+            images = list(zip(table_to_bits(x), table_to_bits(z), signs))
+
+        new_ops = []
+        for op, (x_bits, z_bits, sign) in zip(ops, images):
+            new_op = copy.copy(op)
+            new_op.x_bits = x_bits
+            new_op.z_bits = z_bits
+            if sign:
+                if isinstance(new_op, Measurement):
+                    new_op.isNegative = not new_op.isNegative
+                else:
+                    cast(PauliRotation, new_op).rotation_amount *= -1
+            new_ops.append(new_op)
+        return new_ops
+
+    def conjugate(self, op: T) -> T:
+        """Return op conjugated by the tableau, see conjugate_ops."""
+        return self.conjugate_ops([op])[0]
+
+    def absorb_rotation(self, rotation: PauliRotation) -> None:
+        """Append a Clifford Pauli rotation, so that the tableau applies C and then the rotation.
+
+        Ops conjugated by the tableau afterwards are first conjugated by the rotation and then by
+        the Clifford absorbed before.
+        """
+        self.absorb_pauli_rotation_bits(rotation.x_bits, rotation.z_bits, rotation.rotation_amount)
+
+    def absorb_pauli_rotation_bits(
+        self, x_bits: int, z_bits: int, rotation_amount: Fraction
+    ) -> None:
+        """See absorb_rotation. The rotation is exp(-i * pi * rotation_amount * P), with P the
+        Pauli product with bitmasks x_bits and z_bits, and rotation_amount a multiple of 1/4.
+        """
+        # exp(-i*pi*P) = -I, so only the amount mod 1 matters up to a global phase
+        if (rotation_amount * 4).denominator != 1:
+            raise ValueError(f"Not a Clifford rotation: {rotation_amount}")
+        quarter_turns = (rotation_amount * 4).numerator % 4
+        if quarter_turns == 0 or (x_bits | z_bits) == 0:
+            return
+
+        p_x, p_z, p_sign = self.conjugate_bits(x_bits, z_bits)
+        # X_j (resp. Z_j) anti-commutes with P exactly when P has a Z (resp. X) component on j
+        for images, anticommuting in ((self.x_images, z_bits), (self.z_images, x_bits)):
+            for j in iter_set_bits(anticommuting):
+                img_x, img_z, img_sign = images[j]
+                if quarter_turns == 2:
+                    # P^dagger G P = -G
+                    images[j] = (img_x, img_z, img_sign ^ 1)
+                else:
+                    # exp(i*pi/4*P) G exp(-i*pi/4*P) = i*P*G, and -i*P*G for the opposite
+                    # rotation. The row becomes the image of that product
+                    k = (
+                        (1 if quarter_turns == 1 else 3)
+                        + 2 * (p_sign + img_sign)
+                        + symplectic_product_phase(p_x, p_z, img_x, img_z)
+                    )
+                    images[j] = (p_x ^ img_x, p_z ^ img_z, (k % 4) // 2)
+
+        self._is_identity = False
+        self._bit_arrays = None
+        self._phase_tables = None
@@ -16,11 +16,23 @@
 # USA
 
 import copy
+import functools
 import math
 from abc import ABC, abstractmethod
 from enum import Enum
 from fractions import Fraction
-from typing import Dict, List, Tuple
+from typing import (
+    Dict,
+    Hashable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    TypeVar,
+    cast,
+    overload,
+)
 
 import lsqecc.simulation.conditional_operation_control as coc
 from lsqecc.gates.compress_rotation_approximations import partition_gate_sequence
@@ -32,7 +44,7 @@ from lsqecc.utils import decompose_pi_fraction, is_power_of_two, phase_frac_to_l
 
 # Wrap as a singleton
 class CachedRotationApproximations:
-    instance: List[str] = get_pi_over_2_to_the_n_rz_gate
+    instance: Sequence[str] = get_pi_over_2_to_the_n_rz_gate
 
     @staticmethod
     def get_pi_over_2_to_the_n_rz_gate(n: int) -> str:
@@ -41,6 +53,49 @@ class CachedRotationApproximations:
         """
         return CachedRotationApproximations.instance[n]
 
+    @staticmethod
+    @functools.lru_cache(maxsize=256)
+    def get_rotation_template(
+        n: int, axis: "PauliOperator", compress_rotations: bool
+    ) -> Tuple[Tuple[int, int, Fraction], ...]:
+        """The single qubit rotations approximating a pi/2^(n+1) rotation about axis (X or Z),
+        as (x bit, z bit, rotation amount) triples that don't depend on the qubit. See
+        PauliRotation.to_basic_form_approximation.
+        """
+        approximation_gates = CachedRotationApproximations.get_pi_over_2_to_the_n_rz_gate(n)
+        if axis == PauliOperator.X:
+            approximation_gates = "H" + approximation_gates + "H"
+
+        gate_sequence: Sequence[str] = approximation_gates
+        if compress_rotations:
+            gate_sequence = partition_gate_sequence(approximation_gates)
+
+        # The rotations of the corresponding from_*_gate constructors, on qubit 0
+        x_rotation, z_rotation = (1, 0), (0, 1)
+        template: List[Tuple[int, int, Fraction]] = []
+        for gate in gate_sequence:
+            if gate == "S":
+                template.append((*z_rotation, Fraction(1, 4)))
+            elif gate == "T":
+                template.append((*z_rotation, Fraction(1, 8)))
+            elif gate == "X":
+                template.append((*x_rotation, Fraction(1, 2)))
+            elif gate == "H":
+                template.extend(
+                    (*rotation, Fraction(1, 4)) for rotation in (z_rotation, x_rotation, z_rotation)
+                )
+            elif len(gate) > 1:
+                is_x = gate.startswith("H") and gate.endswith("H")
+                template.append(
+                    (
+                        *(x_rotation if is_x else z_rotation),
+                        PauliRotation.count_s_and_t_to_phase(gate) / 2,
+                    )
+                )
+            else:
+                raise Exception(f"Cannot decompose gate: {gate}")
+        return tuple(template)
+
 
 class PauliOperator(Enum):
     """
@@ -104,10 +159,173 @@ _PauliOperator_anticommute_tbl: Dict[
 }
 
 
+_PauliOperator_to_bits: Dict["PauliOperator", Tuple[int, int]] = {
+    PauliOperator.I: (0, 0),
+    PauliOperator.X: (1, 0),
+    PauliOperator.Y: (1, 1),
+    PauliOperator.Z: (0, 1),
+}
+
+_PauliOperator_from_bits: Dict[Tuple[int, int], "PauliOperator"] = dict(
+    (bits, op) for op, bits in _PauliOperator_to_bits.items()
+)
+
+
+def ops_list_to_bits(ops: Sequence["PauliOperator"]) -> Tuple[int, int]:
+    """X and Z bitmasks of a dense list of operators, one per qubit"""
+    x_bits, z_bits = 0, 0
+    for i, op in enumerate(ops):
+        if not isinstance(op, PauliOperator):
+            raise TypeError("Cannot add type", type(op), "to circuit")
+        x, z = _PauliOperator_to_bits[op]
+        x_bits |= x << i
+        z_bits |= z << i
+    return x_bits, z_bits
+
+
+def ops_map_to_bits(qubit_num: int, ops_map: Dict[int, "PauliOperator"]) -> Tuple[int, int]:
+    """X and Z bitmasks of a sparse map of qubit -> operator, in time linear in the size of the
+    map. Qubits missing from the map have the identity. Like with change_single_op, negative
+    qubit indices count from the end.
+    """
+    x_bits, z_bits = 0, 0
+    for qubit, op in ops_map.items():
+        if not isinstance(op, PauliOperator):
+            raise TypeError("Cannot add type", type(op), "to circuit")
+        if -qubit_num <= qubit < 0:
+            qubit += qubit_num
+        if not 0 <= qubit < qubit_num:
+            raise IndexError(f"Qubit index {qubit} out of range for {qubit_num} qubits")
+        x, z = _PauliOperator_to_bits[op]
+        x_bits |= x << qubit
+        z_bits |= z << qubit
+    return x_bits, z_bits
+
+
+def popcount(n: int) -> int:
+    return bin(n).count("1")
+
+
+def iter_set_bits(n: int) -> Iterator[int]:
+    """Yield the indices of the bits set in n, from the least significant one."""
+    while n:
+        lowest = n & -n
+        yield lowest.bit_length() - 1
+        n ^= lowest
+
+
+def symplectic_anticommute(x1: int, z1: int, x2: int, z2: int) -> bool:
+    """Returns True if the Pauli products given as X and Z bitmasks anti-commute."""
+    return popcount((x1 & z2) ^ (z1 & x2)) & 1 == 1
+
+
+def symplectic_product_phase(x1: int, z1: int, x2: int, z2: int) -> int:
+    """Given two Pauli products P1 and P2 as X and Z bitmasks, return k such that
+    P1*P2 = i^k * P3, where P3 is the Pauli product with bitmasks (x1^x2, z1^z2).
+
+    Y is taken to be i*X*Z, so that every Pauli product represented by the bitmasks is Hermitian.
+    """
+    y1, x1_only, z1_only = x1 & z1, x1 & ~z1, z1 & ~x1
+    y2, x2_only, z2_only = x2 & z2, x2 & ~z2, z2 & ~x2
+    k = (
+        popcount(y1 & z2_only)  # YZ = iX
+        - popcount(y1 & x2_only)  # YX = -iZ
+        + popcount(x1_only & y2)  # XY = iZ
+        - popcount(x1_only & z2_only)  # XZ = -iY
+        + popcount(z1_only & x2_only)  # ZX = iY
+        - popcount(z1_only & y2)  # ZY = -iX
+    )
+    return k % 4
+
+
+class PauliOpsView(Sequence["PauliOperator"]):
+    """The operators on each qubit of a PauliProductOperation, read from and written to its
+    bitmasks. Compares equal to any sequence of the same operators, e.g. a list."""
+
+    def __init__(self, op: "PauliProductOperation"):
+        self._op = op
+
+    def __len__(self) -> int:
+        return self._op.qubit_num
+
+    @overload
+    def __getitem__(self, qubit: int) -> "PauliOperator":
+        ...
+
+    @overload
+    def __getitem__(self, qubits: slice) -> List["PauliOperator"]:
+        ...
+
+    def __getitem__(self, qubit):
+        if isinstance(qubit, slice):
+            return list(self)[qubit]
+        return self._op.get_op(qubit)
+
+    def __setitem__(self, qubit: int, new_op: "PauliOperator") -> None:
+        self._op.change_single_op(qubit, new_op)
+
+    def __iter__(self) -> Iterator["PauliOperator"]:
+        x_bits, z_bits = self._op.x_bits, self._op.z_bits
+        for i in range(self._op.qubit_num):
+            yield _PauliOperator_from_bits[((x_bits >> i) & 1, (z_bits >> i) & 1)]
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, (PauliOpsView, list, tuple)):
+            return list(self) == list(other)
+        return NotImplemented
+
+    __hash__ = None  # type: ignore
+
+    def __repr__(self) -> str:
+        return repr(list(self))
+
+
 class PauliProductOperation(ABC):
+    """Base class for operations defined by a Pauli product spanning all the qubits of a circuit.
+
+    The Pauli product is stored in the symplectic representation: bit j of x_bits (resp. z_bits)
+    is set when the operator on qubit j has an X (resp. Z) component, so Y sets both. The sign of
+    the product is carried by the subclasses (rotation amount and isNegative respectively).
+    ops_list, get_op and change_single_op are views on the bitmasks. Python ints only store as many
+    words as the highest set bit needs, and the bitwise operations behind commutation and products
+    work a word of 64 qubits at a time. So the representation is sparse enough for wide, low-weight
+    products and get_ops_map, from_ops_map and weight cost little even with thousands of qubits.
+
+    All the attributes are immutable values except the condition of conditional ops, so copy.copy
+    gives an independent op sharing its condition, and copy.deepcopy one with a copy of the
+    condition. Once an op is in a circuit it is shared by the circuits copied or derived from it:
+    the passes never modify it in place but replace it with a modified copy, and so should callers.
+
+    Ops handed out by a PauliOpInternTable enforce this: they are read-only, their hash is cached
+    and intern_id numbers them within their table. Copies of them are ordinary ops again.
+    """
+
     def __init__(self, no_of_qubit: int):
         self.qubit_num: int = no_of_qubit
-        self.ops_list: List[PauliOperator] = [PauliOperator("I") for i in range(no_of_qubit)]
+        self.x_bits: int = 0
+        self.z_bits: int = 0
+
+    # Set on the ops handed out by a PauliOpInternTable
+    intern_id: Optional[int] = None
+
+    def __copy__(self):
+        new_op = object.__new__(type(self))
+        new_op.__dict__.update(self.__dict__)
+        return new_op
+
+    def __deepcopy__(self, memo):
+        new_op = self.__copy__()
+        memo[id(self)] = new_op
+        if "condition" in self.__dict__:
+            new_op.__dict__["condition"] = copy.deepcopy(self.__dict__["condition"], memo)
+        return new_op
+
+    def value_key(self) -> Hashable:
+        """The values op == other compares, as a hashable key"""
+        raise NotImplementedError
+
+    def __hash__(self) -> int:
+        return hash(self.value_key())
 
     @abstractmethod
     def __str__(self) -> str:
@@ -125,13 +343,34 @@ class PauliProductOperation(ABC):
 
     @abstractmethod
     def to_latex(self) -> str:
-        return_str = f"({self.ops_list[0]}"
+        ops_list = self.ops_list
+        return_str = f"({ops_list[0]}"
         if self.qubit_num > 1:
-            for i in range(1, len(self.ops_list)):
-                return_str += r" \otimes" + " " + str(self.ops_list[i])
+            for i in range(1, len(ops_list)):
+                return_str += r" \otimes" + " " + str(ops_list[i])
         return_str += ")"
         return return_str
 
+    @property
+    def ops_list(self) -> PauliOpsView:
+        """The operators on each qubit. Assigning to an item changes the operation, as
+        change_single_op does, and a whole new list can be assigned too.
+        """
+        return PauliOpsView(self)
+
+    @ops_list.setter
+    def ops_list(self, new_ops: Sequence[PauliOperator]) -> None:
+        if len(new_ops) != self.qubit_num:
+            raise Exception("Amount of qubits do not match.")
+        self.x_bits, self.z_bits = ops_list_to_bits(new_ops)
+
+    def _check_qubit_index(self, qubit: int) -> int:
+        if qubit < 0:
+            qubit += self.qubit_num
+        if not 0 <= qubit < self.qubit_num:
+            raise IndexError(f"Qubit index {qubit} out of range for {self.qubit_num} qubits")
+        return qubit
+
     def change_single_op(self, qubit: int, new_op: PauliOperator) -> None:
         """Modify a Pauli Operator
 
@@ -143,7 +382,11 @@ class PauliProductOperation(ABC):
         if not isinstance(new_op, PauliOperator):
             raise TypeError("Cannot add type", type(new_op), "to circuit")
 
-        self.ops_list[qubit] = new_op
+        qubit = self._check_qubit_index(qubit)
+        x, z = _PauliOperator_to_bits[new_op]
+        mask = 1 << qubit
+        self.x_bits = (self.x_bits | mask) if x else (self.x_bits & ~mask)
+        self.z_bits = (self.z_bits | mask) if z else (self.z_bits & ~mask)
 
     def get_op(self, qubit: int) -> PauliOperator:
         """Return the current operator of qubit i.
@@ -154,57 +397,56 @@ class PauliProductOperation(ABC):
         Returns:
             PauliOperator: Pauli operator of targeted qubit.
         """
-        return self.ops_list[qubit]
+        qubit = self._check_qubit_index(qubit)
+        return _PauliOperator_from_bits[((self.x_bits >> qubit) & 1, (self.z_bits >> qubit) & 1)]
 
     def get_ops_map(self) -> Dict[int, PauliOperator]:
         """ "
         Return a map of qubit_n -> operator
         """
         return dict(
-            [
-                (qn, self.ops_list[qn])
-                for qn in range(self.qubit_num)
-                if self.ops_list[qn] != PauliOperator.I
-            ]
+            (qn, _PauliOperator_from_bits[((self.x_bits >> qn) & 1, (self.z_bits >> qn) & 1)])
+            for qn in iter_set_bits(self.x_bits | self.z_bits)
         )
 
+    def weight(self) -> int:
+        """Number of qubits with an operator other than the identity"""
+        return popcount(self.x_bits | self.z_bits)
+
+    def anticommutes_with(self, other: "PauliProductOperation") -> bool:
+        return symplectic_anticommute(self.x_bits, self.z_bits, other.x_bits, other.z_bits)
+
     def to_y_free_equivalent(self):
         """Return the equivalent of current block but without Y operator."""
-        y_op_indices = list()
-        y_free_block = copy.deepcopy(self)
-
-        # Find Y operators and modify them into X operators
-        for index, operator in enumerate(self.ops_list):
-            if operator == PauliOperator.Y:
-                y_op_indices.append(index)
-                y_free_block.ops_list[index] = PauliOperator.X
+        y_bits = self.x_bits & self.z_bits
+        if not y_bits:
+            return [self]
 
-        if not y_op_indices:
-            return [y_free_block]
+        # Modify the Y operators into X operators
+        y_free_block = copy.copy(self)
+        y_free_block.z_bits &= ~y_bits
 
+        y_op_indices = list(iter_set_bits(y_bits))
         left_rotations = list()
         right_rotations = list()
         if len(y_op_indices) % 2 == 0:
             # For even numbers of Y operators, add 2 additional pi/4 rotations (one on each side)
             first_y_operator = y_op_indices.pop(0)
-            new_rotation_ops = [
-                PauliOperator.Z if i == first_y_operator else PauliOperator.I
-                for i in range(self.qubit_num)
-            ]
-            left_rotations.append(PauliRotation.from_list(new_rotation_ops, Fraction(1, 4)))
-            right_rotations.append(PauliRotation.from_list(new_rotation_ops, Fraction(-1, 4)))
-
-        new_rotation_ops = [
-            PauliOperator.Z if i in y_op_indices else PauliOperator.I for i in range(self.qubit_num)
-        ]
+            left_rotations.append(
+                PauliRotation.from_bits(self.qubit_num, 0, 1 << first_y_operator, Fraction(1, 4))
+            )
+            right_rotations.append(
+                PauliRotation.from_bits(self.qubit_num, 0, 1 << first_y_operator, Fraction(-1, 4))
+            )
+            y_bits &= ~(1 << first_y_operator)
 
-        left_rotations.append(PauliRotation.from_list(new_rotation_ops, Fraction(1, 4)))
-        right_rotations.append(PauliRotation.from_list(new_rotation_ops, Fraction(-1, 4)))
+        left_rotations.append(PauliRotation.from_bits(self.qubit_num, 0, y_bits, Fraction(1, 4)))
+        right_rotations.append(PauliRotation.from_bits(self.qubit_num, 0, y_bits, Fraction(-1, 4)))
 
         return left_rotations + [y_free_block] + right_rotations
 
     def has_y(self):
-        return any(op == PauliOperator.Y for op in self.ops_list)
+        return self.x_bits & self.z_bits != 0
 
 
 class PauliRotation(PauliProductOperation, coc.ConditionalOperation):
@@ -226,14 +468,19 @@ class PauliRotation(PauliProductOperation, coc.ConditionalOperation):
         return f"{self.rotation_amount}: {self.ops_list}"
 
     def __eq__(self, other) -> bool:
-        return (
+        return self is other or (
             isinstance(other, PauliRotation)
             and self.rotation_amount == other.rotation_amount
-            and self.ops_list == other.ops_list
+            and self.qubit_num == other.qubit_num
+            and self.x_bits == other.x_bits
+            and self.z_bits == other.z_bits
         )
 
+    def value_key(self) -> Hashable:
+        return (self.rotation_amount, self.qubit_num, self.x_bits, self.z_bits)
+
     def __hash__(self) -> int:
-        return hash(hash(self.rotation_amount) + hash(tuple(self.ops_list)))
+        return super().__hash__()
 
     def to_basic_form_approximation(
         self, compress_rotations: bool = False
@@ -245,40 +492,22 @@ class PauliRotation(PauliProductOperation, coc.ConditionalOperation):
                 f"Can only approximate pi/2^n rotations, got {self.rotation_amount.denominator}"
             )
 
-        approximation_gates = CachedRotationApproximations.get_pi_over_2_to_the_n_rz_gate(
-            # -1 because of the theta/2 convention of the rz gate
-            int(math.log2(self.rotation_amount.denominator))
-            - 1
-        )
-        axis_list = list(filter(lambda op: op != PauliOperator.I, self.ops_list))
-        if len(axis_list) != 1:
+        # -1 because of the theta/2 convention of the rz gate
+        n = int(math.log2(self.rotation_amount.denominator)) - 1
+        ops_map = self.get_ops_map()
+        if len(ops_map) != 1:
             raise Exception("Can only approximate single qubit rotations")
-        axis = axis_list[0]
+        qubit_idx, axis = next(iter(ops_map.items()))
 
-        if axis == PauliOperator.X:
-            approximation_gates = "H" + approximation_gates + "H"
-        elif axis == PauliOperator.Z:
-            pass
-        else:
+        if axis not in {PauliOperator.X, PauliOperator.Z}:
             raise Exception(f"Unsupported axis of rotation {axis}")
 
-        if compress_rotations:
-            approximation_gates = partition_gate_sequence(approximation_gates)
-        rotations = []
-        qubit_idx = self.ops_list.index(axis)
-        for gate in approximation_gates:
-            if gate == "S":
-                rotations.append(PauliRotation.from_s_gate(self.qubit_num, qubit_idx))
-            elif gate == "T":
-                rotations.append(PauliRotation.from_t_gate(self.qubit_num, qubit_idx))
-            elif gate == "X":
-                rotations.append(PauliRotation.from_x_gate(self.qubit_num, qubit_idx))
-            elif gate == "H":
-                rotations.extend(PauliRotation.from_hadamard_gate(self.qubit_num, qubit_idx))
-            elif len(gate) > 1:
-                rotations.append(PauliRotation.from_gate_string(self.qubit_num, qubit_idx, gate))
-            else:
-                raise Exception(f"Cannot decompose gate: {gate}")
+        # Repeated rotations, e.g. from QFTs, only retarget the cached template to their qubit
+        template = CachedRotationApproximations.get_rotation_template(n, axis, compress_rotations)
+        rotations = [
+            PauliRotation.from_bits(self.qubit_num, x << qubit_idx, z << qubit_idx, rotation_amount)
+            for x, z, rotation_amount in template
+        ]
 
         # Note that it might be possible to simplify these a little further
         return rotations
@@ -302,7 +531,7 @@ class PauliRotation(PauliProductOperation, coc.ConditionalOperation):
             for unit_rotation_amount in fractions_with_unit_numerator:
                 # Discard rotations by pi because they have no effect
                 if unit_rotation_amount.denominator != 1:
-                    new_rotation = copy.deepcopy(self)
+                    new_rotation = copy.copy(self)
                     new_rotation.rotation_amount = unit_rotation_amount
                     output_rotations.append(new_rotation)
             return output_rotations
@@ -317,9 +546,20 @@ class PauliRotation(PauliProductOperation, coc.ConditionalOperation):
         if not pauli_ops:
             raise ValueError("Cannot create PauliRotation from empty list")
 
-        r = PauliRotation(len(pauli_ops), rotation)
-        for i, op in enumerate(pauli_ops):
-            r.change_single_op(i, op)
+        return PauliRotation.from_bits(len(pauli_ops), *ops_list_to_bits(pauli_ops), rotation)
+
+    @staticmethod
+    def from_ops_map(
+        num_qubits: int, ops_map: Dict[int, PauliOperator], rotation: Fraction
+    ) -> "PauliRotation":
+        """Create a rotation from the operators on the qubits it acts on, all others having I"""
+        return PauliRotation.from_bits(num_qubits, *ops_map_to_bits(num_qubits, ops_map), rotation)
+
+    @staticmethod
+    def from_bits(num_qubits: int, x_bits: int, z_bits: int, rotation: Fraction) -> "PauliRotation":
+        r = PauliRotation(num_qubits, rotation)
+        r.x_bits = x_bits
+        r.z_bits = z_bits
         return r
 
     @staticmethod
@@ -343,11 +583,8 @@ class PauliRotation(PauliProductOperation, coc.ConditionalOperation):
     def from_r_gate(num_qubits: int, target_qubit: int, phase_type: PauliOperator, phase: Fraction):
         """Note that the convention for rz and rx is different from our pauli rotation convention.
         So an rz(theta) is theta/2 Z rotation in our formalism"""
-        return PauliRotation.from_list(
-            [PauliOperator.I] * target_qubit
-            + [phase_type]
-            + [PauliOperator.I] * (num_qubits - target_qubit - 1),
-            rotation=phase / 2,
+        return PauliRotation.from_ops_map(
+            num_qubits, {target_qubit: phase_type}, rotation=phase / 2
         )
 
     @staticmethod
@@ -374,31 +611,31 @@ class PauliRotation(PauliProductOperation, coc.ConditionalOperation):
     def from_cnot_gate(
         num_qubits: int, control_qubit: int, target_qubit: int
     ) -> List["PauliRotation"]:
-        entangling_op = PauliRotation(num_qubits, Fraction(1, 4))
-        correct_control = PauliRotation(num_qubits, Fraction(-1, 4))
-        correct_target = PauliRotation(num_qubits, Fraction(-1, 4))
-        entangling_op.change_single_op(control_qubit, PauliOperator.Z)
-        entangling_op.change_single_op(target_qubit, PauliOperator.X)
-
-        correct_control.change_single_op(control_qubit, PauliOperator.Z)
-        correct_target.change_single_op(target_qubit, PauliOperator.X)
-
-        return [entangling_op, correct_control, correct_target]
+        Z = PauliOperator.Z
+        return [
+            PauliRotation.from_ops_map(
+                num_qubits, {control_qubit: Z, target_qubit: PauliOperator.X}, Fraction(1, 4)
+            ),
+            PauliRotation.from_ops_map(num_qubits, {control_qubit: Z}, Fraction(-1, 4)),
+            PauliRotation.from_ops_map(
+                num_qubits, {target_qubit: PauliOperator.X}, Fraction(-1, 4)
+            ),
+        ]
 
     @staticmethod
     def from_cz_gate(
         num_qubits: int, control_qubit: int, target_qubit: int
     ) -> List["PauliRotation"]:
-        entangling_op = PauliRotation(num_qubits, Fraction(1, 4))
-        correct_control = PauliRotation(num_qubits, Fraction(-1, 4))
-        correct_target = PauliRotation(num_qubits, Fraction(-1, 4))
-        entangling_op.change_single_op(control_qubit, PauliOperator.Z)
-        entangling_op.change_single_op(target_qubit, PauliOperator.Z)
-
-        correct_control.change_single_op(control_qubit, PauliOperator.Z)
-        correct_target.change_single_op(target_qubit, PauliOperator.Z)
-
-        return [entangling_op, correct_control, correct_target]
+        Z = PauliOperator.Z
+        return [
+            PauliRotation.from_ops_map(
+                num_qubits, {control_qubit: Z, target_qubit: PauliOperator.Z}, Fraction(1, 4)
+            ),
+            PauliRotation.from_ops_map(num_qubits, {control_qubit: Z}, Fraction(-1, 4)),
+            PauliRotation.from_ops_map(
+                num_qubits, {target_qubit: PauliOperator.Z}, Fraction(-1, 4)
+            ),
+        ]
 
     @staticmethod
     def from_crz_gate(
@@ -442,14 +679,19 @@ class Measurement(PauliProductOperation, coc.ConditionalOperation):
         return f"{sign}M: {self.ops_list}"
 
     def __eq__(self, other) -> bool:
-        return (
+        return self is other or (
             isinstance(other, Measurement)
             and self.isNegative == other.isNegative
-            and self.ops_list == other.ops_list
+            and self.qubit_num == other.qubit_num
+            and self.x_bits == other.x_bits
+            and self.z_bits == other.z_bits
         )
 
+    def value_key(self) -> Hashable:
+        return (self.isNegative, self.qubit_num, self.x_bits, self.z_bits)
+
     def __hash__(self) -> int:
-        return hash(hash(self.isNegative) + hash(tuple(self.ops_list)))
+        return super().__hash__()
 
     def to_latex(self) -> str:
         return_str = super().to_latex()
@@ -461,8 +703,99 @@ class Measurement(PauliProductOperation, coc.ConditionalOperation):
         if not pauli_ops:
             raise ValueError("Cannot create PauliRotation from empty list")
 
-        m = Measurement(len(pauli_ops), isNegative)
-        for i, op in enumerate(pauli_ops):
-            m.change_single_op(i, op)
+        return Measurement.from_bits(len(pauli_ops), *ops_list_to_bits(pauli_ops), isNegative)
+
+    @staticmethod
+    def from_ops_map(
+        num_qubits: int, ops_map: Dict[int, PauliOperator], isNegative: bool = False
+    ) -> "Measurement":
+        """Create a measurement from the operators on the qubits it acts on, all others having I"""
+        return Measurement.from_bits(num_qubits, *ops_map_to_bits(num_qubits, ops_map), isNegative)
 
+    @staticmethod
+    def from_bits(
+        num_qubits: int, x_bits: int, z_bits: int, isNegative: bool = False
+    ) -> "Measurement":
+        m = Measurement(num_qubits, isNegative)
+        m.x_bits = x_bits
+        m.z_bits = z_bits
         return m
+
+
+T = TypeVar("T", bound=PauliProductOperation)
+
+
+class _InternedOp:
+    """Mixin for the read-only ops of a PauliOpInternTable. Copies are of the plain class again."""
+
+    _plain_class: type
+    _hash: int
+
+    def __setattr__(self, name, value) -> None:
+        raise AttributeError(f"Cannot set {name} on an interned op, modify a copy instead")
+
+    def __hash__(self) -> int:
+        return self._hash
+
+    def __copy__(self):
+        new_op = object.__new__(self._plain_class)
+        new_op.__dict__.update(self.__dict__)
+        del new_op.__dict__["intern_id"]
+        del new_op.__dict__["_hash"]
+        return new_op
+
+
+class _InternedPauliRotation(_InternedOp, PauliRotation):
+    _plain_class = PauliRotation
+
+
+class _InternedMeasurement(_InternedOp, Measurement):
+    _plain_class = Measurement
+
+
+_interned_classes: Dict[type, type] = {
+    PauliRotation: _InternedPauliRotation,
+    Measurement: _InternedMeasurement,
+}
+
+
+class PauliOpInternTable:
+    """Hands out a single canonical, read-only instance for each distinct op, so that repeated ops
+    share memory and compare by identity. Each canonical op gets its index in the table as
+    intern_id, and its hash is computed once.
+
+    Conditional ops are not interned, because equal ops may have different conditions.
+    """
+
+    def __init__(self) -> None:
+        self._canonical_ops: Dict[Tuple[type, Hashable], PauliProductOperation] = dict()
+        self._ops_by_id: List[PauliProductOperation] = list()
+
+    def __len__(self) -> int:
+        return len(self._ops_by_id)
+
+    def __getitem__(self, intern_id: int) -> PauliProductOperation:
+        return self._ops_by_id[intern_id]
+
+    def intern(self, op: T) -> T:
+        if (
+            op.intern_id is not None
+            and op.intern_id < len(self._ops_by_id)
+            and self._ops_by_id[op.intern_id] is op
+        ):
+            return op
+        if isinstance(op, coc.ConditionalOperation) and op.is_conditional():
+            return op
+
+        value_key = op.value_key()
+        plain_class: type = getattr(op, "_plain_class", type(op))
+        key = (plain_class, value_key)
+        canonical = self._canonical_ops.get(key)
+        if canonical is None:
+            canonical = cast(PauliProductOperation, object.__new__(_interned_classes[plain_class]))
+            canonical.__dict__.update(op.__dict__)
+            canonical.__dict__["_hash"] = hash(value_key)
+            canonical.__dict__["intern_id"] = len(self._ops_by_id)
+            self._canonical_ops[key] = canonical
+            self._ops_by_id.append(canonical)
+        return cast(T, canonical)
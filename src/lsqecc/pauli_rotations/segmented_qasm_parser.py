@@ -15,27 +15,61 @@
 # Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301
 # USA
 
-import functools
+import math
+import os
 import re
-from typing import List, Union, cast
+from concurrent.futures import ProcessPoolExecutor
+from fractions import Fraction
+from typing import Iterator, List, Optional, Union, cast
 
 import qiskit.qasm
 import qiskit.qasm.node
 import qiskit.qasm.node.node
 
-from . import Measurement, PauliOpCircuit, PauliOperator
+from . import (
+    Measurement,
+    PauliOpCircuit,
+    PauliOperator,
+    PauliOpStream,
+    PauliProductOperation,
+    PauliRotation,
+)
 
 
-def parse_str(qasm_str: str) -> PauliOpCircuit:
+def parse_str(
+    qasm_str: str, parallel: bool = False, max_workers: Optional[int] = None
+) -> PauliOpCircuit:
     """Read a string containing QASM (currently supports only OPENQASM 2.0) into a circuit.
 
     Supports all gates from the standard library also supported by PyZX, measurements and barriers.
     Barriers have the effect of breaking reversible sections to be passed to pyzx.
+
+    Args:
+        parallel: Convert the reversible sections in a pool of max_workers processes (by default
+            one per CPU). Worth it when there are many sections, e.g. with many measurements.
     """
-    parser = _SegmentedQASMParser(qasm_str)
+    parser = _SegmentedQASMParser(qasm_str, parallel, max_workers)
     return parser.get_circuit()
 
 
+def stream_str(
+    qasm_str: str, parallel: bool = False, max_workers: Optional[int] = None
+) -> PauliOpStream:
+    """Like parse_str, but the segments are only converted to Pauli ops as the stream is read."""
+    parser = _SegmentedQASMParser(qasm_str, parallel, max_workers)
+    return parser.get_stream()
+
+
+def _reversible_qasm_to_circuit(qasm: str) -> PauliOpCircuit:
+    # Feeding the QASM directly to pyzx qould cause it to complain because the gates, being
+    # generated directly from the AST, have extra parentheses pyzx doesn't like. So we feeding it
+    # back to qiskit we remove those extra parentheses
+    # TODO try avoid this step by going directly to circuit
+    c = qiskit.QuantumCircuit.from_qasm_str(qasm)
+
+    return PauliOpCircuit.load_reversible_from_qasm_string(c.qasm())
+
+
 class _SegmentedQASMParser:
     # Certain nodes constitute a single segment, others can be in the same one as long as they are
     # Reversible
@@ -47,8 +81,21 @@ class _SegmentedQASMParser:
     ]
     individual_segment_node_types = {"if", "measure"}
     measurement_operator = PauliOperator.Z
-
-    def __init__(self, qasm_circuit: str):
+    # Phase gates lowered directly from the AST, with the axis and phase pyzx gives them
+    lowered_phase_gates = {
+        "x": (PauliOperator.X, Fraction(1)),
+        "z": (PauliOperator.Z, Fraction(1)),
+        "s": (PauliOperator.Z, Fraction(1, 2)),
+        "sdg": (PauliOperator.Z, Fraction(-1, 2)),
+        "t": (PauliOperator.Z, Fraction(1, 4)),
+        "tdg": (PauliOperator.Z, Fraction(-1, 4)),
+    }
+
+    def __init__(
+        self, qasm_circuit: str, parallel: bool = False, max_workers: Optional[int] = None
+    ):
+        self.parallel = parallel
+        self.max_workers = max_workers
         ast = _QASMASTSegmenter.ast_from_str(qasm_circuit)
 
         _SegmentedQASMParser.accept_format_version(ast)
@@ -62,12 +109,45 @@ class _SegmentedQASMParser:
             raise Exception("Program must have exactly one quantum register")
         self.qreg = cast(qiskit.qasm.node.qreg.Qreg, quantum_registers[0])
 
-        segments = _QASMASTSegmenter.ast_to_segments(ast)
-        sub_circuits = map(self.segment_to_circuit, segments)
-        self.circuit = functools.reduce(PauliOpCircuit.join, sub_circuits)
+        self.segments = _QASMASTSegmenter.ast_to_segments(ast)
+
+    def iter_ops(self) -> Iterator[PauliProductOperation]:
+        if not self.parallel:
+            for segment in self.segments:
+                yield from self.segment_to_circuit(segment).ops
+            return
+
+        # Only the reversible segments that can't be lowered directly are worth sending to other
+        # processes, as QASM text since the AST nodes don't pickle. The results come back in order
+        lowered_segments = [
+            self.lower_reversible_segment(segment) if isinstance(segment, List) else None
+            for segment in self.segments
+        ]
+        reversible_qasms = [
+            self.reversible_segment_to_qasm(segment)
+            for segment, lowered in zip(self.segments, lowered_segments)
+            if isinstance(segment, List) and lowered is None
+        ]
+        workers = self.max_workers or os.cpu_count() or 1
+        with ProcessPoolExecutor(workers) as executor:
+            # Batch the segments to amortize the inter-process communication
+            chunksize = max(1, len(reversible_qasms) // (4 * workers))
+            reversible_circuits = executor.map(
+                _reversible_qasm_to_circuit, reversible_qasms, chunksize=chunksize
+            )
+            for segment, lowered in zip(self.segments, lowered_segments):
+                if lowered is not None:
+                    yield from lowered.ops
+                elif isinstance(segment, List):
+                    yield from next(reversible_circuits).ops
+                else:
+                    yield from self.segment_to_circuit(segment).ops
+
+    def get_stream(self) -> PauliOpStream:
+        return PauliOpStream(self.num_qubits(), self.iter_ops())
 
     def get_circuit(self) -> PauliOpCircuit:
-        return self.circuit
+        return self.get_stream().to_circuit()
 
     def segment_to_circuit(self, segment: Segment):
         if isinstance(segment, List):
@@ -79,21 +159,75 @@ class _SegmentedQASMParser:
         else:
             raise Exception("Unsupported QASM node type " + segment.type)
 
-    def reversible_segment_to_circuit(
-        self, segment: List[qiskit.qasm.node.node.Node]
-    ) -> PauliOpCircuit:
+    def reversible_segment_to_qasm(self, segment: List[qiskit.qasm.node.node.Node]) -> str:
         gates_as_qasm = qiskit.qasm.node.Program(segment).qasm()
 
-        text_qasm_program_wrapper = (
+        return (
             "OPENQASM 2.0;\n" + 'include "qelib1.inc";\n' + self.qreg.qasm() + "\n" + gates_as_qasm
         )
-        # Feeding text_qasm_program_wrapper directly to pyzx qould cause it to complain because
-        # gates_as_qasm, being generated directly from the AST, has extra parentheses pyzx doesn't
-        # like. So we feeding it back to qiskit we remove those extra parentheses
-        # TODO try avoid this step by going directly to circuit
-        c = qiskit.QuantumCircuit.from_qasm_str(text_qasm_program_wrapper)
 
-        return PauliOpCircuit.load_reversible_from_qasm_string(c.qasm())
+    def reversible_segment_to_circuit(
+        self, segment: List[qiskit.qasm.node.node.Node]
+    ) -> PauliOpCircuit:
+        lowered = self.lower_reversible_segment(segment)
+        if lowered is not None:
+            return lowered
+        return _reversible_qasm_to_circuit(self.reversible_segment_to_qasm(segment))
+
+    def lower_reversible_segment(
+        self, segment: List[qiskit.qasm.node.node.Node]
+    ) -> Optional[PauliOpCircuit]:
+        """Convert the segment straight from the AST, giving the same rotations as the round trip
+        through qiskit and pyzx, except that gates stay in program order and angles keep their full
+        precision. Returns None if the segment has gates that need the round trip.
+        """
+        c = PauliOpCircuit(self.num_qubits())
+        for node in segment:
+            rotations = self.lower_gate(node)
+            if rotations is None:
+                return None
+            c.ops.extend(rotations)
+        return c
+
+    def lower_gate(self, node: qiskit.qasm.node.node.Node) -> Optional[List[PauliRotation]]:
+        """The rotations pyzx would give for the gate, or None if it isn't one handled here"""
+        if not isinstance(node, qiskit.qasm.node.CustomUnitary):
+            return None
+        # Gates broadcast over whole registers are left to the round trip
+        if not all(isinstance(bit, qiskit.qasm.node.IndexedId) for bit in node.bitlist.children):
+            return None
+        qubits: List[int] = [bit.index for bit in node.bitlist.children]
+        num_qubits = self.num_qubits()
+        X = PauliOperator.X
+        Z = PauliOperator.Z
+
+        if node.name in _SegmentedQASMParser.lowered_phase_gates and len(qubits) == 1:
+            axis, phase = _SegmentedQASMParser.lowered_phase_gates[node.name]
+            return [PauliRotation.from_r_gate(num_qubits, qubits[0], axis, phase)]
+        if node.name == "h" and len(qubits) == 1:
+            return PauliRotation.from_hadamard_gate(num_qubits, qubits[0])
+        if node.name == "cx" and len(qubits) == 2:
+            return PauliRotation.from_cnot_gate(num_qubits, qubits[0], qubits[1])
+        if node.name == "cz" and len(qubits) == 2:
+            return PauliRotation.from_cz_gate(num_qubits, qubits[0], qubits[1])
+        if node.name in {"rz", "rx"} and len(qubits) == 1 and node.arguments is not None:
+            arg_phase = _SegmentedQASMParser.lower_phase_arg(node.arguments.children[0])
+            if arg_phase is None:
+                return None
+            axis = Z if node.name == "rz" else X
+            return [PauliRotation.from_r_gate(num_qubits, qubits[0], axis, arg_phase)]
+        return None
+
+    @staticmethod
+    def lower_phase_arg(expression: qiskit.qasm.node.node.Node) -> Optional[Fraction]:
+        """The angle as a multiple of pi, rounded like pyzx does. Only dyadic multiples are
+        accepted, the only ones the rest of the compiler handles. For others the round trip is
+        kept, so that errors are reported the same way.
+        """
+        phase = Fraction(expression.sym() / math.pi).limit_denominator(100000000)
+        if phase.denominator & (phase.denominator - 1) != 0:
+            return None
+        return phase
 
     def if_node_to_circuit(self, node: qiskit.qasm.node.if_.If):
         raise NotImplementedError  # TODO
@@ -0,0 +1,195 @@
+# Copyright (C) 2020-2021 - George Watkins and Alex Nguyen
+#
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or (at your option) any later version.
+#
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public
+# License along with this library; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301
+# USA
+
+import copy
+from fractions import Fraction
+from typing import TYPE_CHECKING, Iterable, Iterator, List, Optional
+
+from .clifford_tableau import CliffordTableau
+from .rotation import (
+    Measurement,
+    PauliOpInternTable,
+    PauliProductOperation,
+    PauliRotation,
+)
+
+if TYPE_CHECKING:
+    from .circuit import PauliOpCircuit
+
+# Number of ops conjugated together by litinski_transformed_ops while no pi/4 rotation comes up
+TRANSFORM_WINDOW = 1024
+
+
+def y_free_ops(ops: Iterable[PauliProductOperation]) -> Iterator[PauliProductOperation]:
+    """Lazy version of PauliOpCircuit.to_y_free_equivalent"""
+    for op in ops:
+        yield from op.to_y_free_equivalent()
+
+
+def basic_form_ops(ops: Iterable[PauliProductOperation]) -> Iterator[PauliProductOperation]:
+    """Lazy version of PauliOpCircuit.get_basic_form"""
+    for op in ops:
+        if isinstance(op, Measurement):
+            yield op
+        else:
+            assert isinstance(op, PauliRotation)
+            yield from op.to_basic_form_decomposition()
+
+
+def grouped_rotation_ops(ops: Iterable[PauliProductOperation]) -> Iterator[PauliProductOperation]:
+    """Lazy version of PauliOpCircuit.group_rotations_with_the_same_axis"""
+    accumulator: Optional[PauliRotation] = None
+
+    for op in ops:
+        if isinstance(op, PauliRotation):
+            if accumulator is None:
+                accumulator = copy.copy(op)
+            else:
+                if (op.x_bits, op.z_bits) == (accumulator.x_bits, accumulator.z_bits):
+                    accumulator.rotation_amount += op.rotation_amount
+                else:
+                    yield accumulator
+                    accumulator = copy.copy(op)
+
+        elif isinstance(accumulator, Measurement):
+            if accumulator is not None:
+                yield accumulator
+                accumulator = None
+            yield op
+        else:
+            raise Exception(f"Not expecting: {op}")
+
+    if accumulator is not None:
+        yield accumulator
+
+
+def interned_ops(
+    ops: Iterable[PauliProductOperation], table: PauliOpInternTable
+) -> Iterator[PauliProductOperation]:
+    """Replace each op by its canonical instance in table"""
+    for op in ops:
+        yield table.intern(op)
+
+
+def litinski_transformed_ops(
+    qubit_num: int,
+    ops: Iterable[PauliProductOperation],
+    drop_quarter_rotations: Optional[bool] = None,
+) -> Iterator[PauliProductOperation]:
+    """Lazy version of PauliOpCircuit.apply_transformation
+
+    The ops other than pi/4 rotations come out as soon as the next pi/4 rotation, or
+    TRANSFORM_WINDOW further ops, have been read. The pi/4 rotations themselves are only yielded
+    at the end, so they are the only ops held for the whole stream.
+
+    Args:
+        drop_quarter_rotations: Whether to discard the pi/4 rotations once moved to the end. By
+            default they are discarded if the stream has measurements.
+    """
+    frame = CliffordTableau(qubit_num)
+    quarter_rotations: List[PauliProductOperation] = list()
+    pending_ops: List[PauliProductOperation] = list()
+    has_measurements = False
+
+    for op in ops:
+        has_measurements = has_measurements or isinstance(op, Measurement)
+        pending_ops.append(op)
+        if isinstance(op, PauliRotation) and op.rotation_amount in {
+            Fraction(1, 4),
+            Fraction(-1, 4),
+        }:
+            # The ops since the last pi/4 rotation, this one included, all go through the
+            # same frame
+            *conjugated_ops, conjugated_rotation = frame.conjugate_ops(pending_ops)
+            yield from conjugated_ops
+            quarter_rotations.append(conjugated_rotation)
+            pending_ops = []
+
+            # _swap_adjacent_anticommuting_blocks turns an anti-commuting block B into i*P*B
+            # whatever the sign of the pi/4 rotation P, hence the fixed rotation amount
+            frame.absorb_pauli_rotation_bits(op.x_bits, op.z_bits, Fraction(1, 4))
+        elif len(pending_ops) >= TRANSFORM_WINDOW:
+            yield from frame.conjugate_ops(pending_ops)
+            pending_ops = []
+    yield from frame.conjugate_ops(pending_ops)
+
+    if drop_quarter_rotations is None:
+        drop_quarter_rotations = has_measurements
+
+    # The last pi/4 rotation reaches the end of the circuit first
+    if not drop_quarter_rotations:
+        yield from reversed(quarter_rotations)
+
+
+class PauliOpStream:
+    """A circuit whose ops are produced on demand, for passes that only need to see them in order.
+
+    The passes return new streams chaining generators, so nothing is computed until the stream is
+    iterated and a stream can only be iterated once. Use to_circuit to keep all the ops.
+    """
+
+    def __init__(
+        self, qubit_num: int, ops: Iterable[PauliProductOperation], name: str = ""
+    ) -> None:
+        self.qubit_num: int = qubit_num
+        self.name: str = name
+        self._ops: Iterator[PauliProductOperation] = iter(ops)
+
+    def __str__(self) -> str:
+        return f"PauliOpStream {self.name}: {self.qubit_num} qubit(s)"
+
+    def __repr__(self) -> str:
+        return str(self)
+
+    def __iter__(self) -> Iterator[PauliProductOperation]:
+        return self._ops
+
+    @staticmethod
+    def from_circuit(circuit: "PauliOpCircuit") -> "PauliOpStream":
+        return PauliOpStream(circuit.qubit_num, circuit.ops, circuit.name)
+
+    def to_circuit(self) -> "PauliOpCircuit":
+        from .circuit import PauliOpCircuit
+
+        circuit = PauliOpCircuit(self.qubit_num, self.name)
+        circuit.ops.extend(self)
+        return circuit
+
+    def _chain(self, ops: Iterable[PauliProductOperation]) -> "PauliOpStream":
+        return PauliOpStream(self.qubit_num, ops, self.name)
+
+    def to_y_free_equivalent(self) -> "PauliOpStream":
+        return self._chain(y_free_ops(self))
+
+    def get_basic_form(self) -> "PauliOpStream":
+        return self._chain(basic_form_ops(self))
+
+    def group_rotations_with_the_same_axis(self) -> "PauliOpStream":
+        return self._chain(grouped_rotation_ops(self))
+
+    def interned(self, table: Optional[PauliOpInternTable] = None) -> "PauliOpStream":
+        """Replace the ops by canonical instances, see PauliOpInternTable. A new table is used
+        unless one is given."""
+        return self._chain(interned_ops(self, table if table is not None else PauliOpInternTable()))
+
+    def apply_transformation(
+        self, drop_quarter_rotations: Optional[bool] = None
+    ) -> "PauliOpStream":
+        """Apply Litinski's Transformation. Unlike PauliOpCircuit.apply_transformation this returns
+        a new stream. See litinski_transformed_ops.
+        """
+        return self._chain(litinski_transformed_ops(self.qubit_num, self, drop_quarter_rotations))
@@ -0,0 +1,280 @@
+# Copyright (C) 2020-2021 - George Watkins and Alex Nguyen
+#
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or (at your option) any later version.
+#
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public
+# License along with this library; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301
+# USA
+
+"""Compile many circuits at once, in a pool of worker processes.
+
+Run ``lsqecc compile --help`` for the command line interface.
+"""
+
+import argparse
+import os
+import pathlib
+import sys
+import time
+import traceback
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from typing import Iterable, Iterator, List, Optional, Sequence, Tuple, Union
+
+import lsqecc.patches.ancilla_region_routing as ancilla_region_routing
+import lsqecc.simulation.logical_patch_state_simulation as lssim
+
+from .compilation_cache import CompilationCache
+from .compilation_pipeline import (
+    DEFAULT_REPORT_LEVEL,
+    CompilationPipeline,
+    GUISlice,
+    ReportLevel,
+    StageRecord,
+)
+
+# A QASM program, or a pathlib.Path to a file holding one
+CircuitSource = Union[str, "os.PathLike[str]"]
+
+
+@dataclass
+class BatchResult:
+    """The outcome of compiling the index-th circuit of a batch"""
+
+    index: int
+    name: str  # The path of the circuit file, or "circuit <index>" for QASM strings
+    slices: Optional[List[GUISlice]] = None
+    compilation_text: Optional[str] = None
+    error: Optional[str] = None  # The traceback, if the compilation failed
+    wall_time: float = 0
+    records: List[StageRecord] = field(default_factory=list)
+
+    def succeeded(self) -> bool:
+        return self.error is None
+
+
+@dataclass
+class _BatchOptions:
+    apply_litinski_transform: bool
+    simulation_type: lssim.SimulatorType
+    report_level: ReportLevel
+    with_slices: bool
+    cache_directory: Optional[str]
+    routing_strategy: ancilla_region_routing.RoutingStrategy
+    pack_time_slices: bool
+
+
+def _warm_up() -> None:
+    """Import the compiler's dependencies (qiskit, pyzx, igraph) once per worker, before the
+    first circuit comes in"""
+    # The pipeline modules only import pyzx where it is used
+    import igraph  # noqa: F401
+    import pyzx  # noqa: F401
+    import qiskit  # noqa: F401
+
+    import lsqecc.pipeline.compilation_pipeline  # noqa: F401
+    import lsqecc.simulation.logical_patch_state_simulation  # noqa: F401
+
+
+def _name(index: int, source: CircuitSource) -> str:
+    return os.fspath(source) if isinstance(source, os.PathLike) else f"circuit {index}"
+
+
+def _compile_one(index: int, source: CircuitSource, options: _BatchOptions) -> BatchResult:
+    result = BatchResult(index, _name(index, source))
+    pipeline: Optional[CompilationPipeline] = None
+    start = time.perf_counter()
+    try:
+        if isinstance(source, os.PathLike):
+            with open(source) as file:
+                qasm = file.read()
+        else:
+            qasm = source
+
+        cache = (
+            CompilationCache(options.cache_directory)
+            if options.cache_directory is not None
+            else None
+        )
+        pipeline = CompilationPipeline(
+            qasm,
+            options.apply_litinski_transform,
+            simulation_type=options.simulation_type,
+            cache=cache,
+            routing_strategy=options.routing_strategy,
+            pack_time_slices=options.pack_time_slices,
+        )
+        result.compilation_text = pipeline.compilation_text(options.report_level)
+        if options.with_slices:
+            result.slices = pipeline.slices()
+    except Exception:
+        result.error = traceback.format_exc()
+    if pipeline is not None:
+        # Up to the stage that failed, if any
+        result.records = pipeline.records
+    result.wall_time = time.perf_counter() - start
+    return result
+
+
+def compile_many(
+    circuits: Iterable[CircuitSource],
+    apply_litinski_transform: bool = True,
+    simulation_type: lssim.SimulatorType = lssim.SimulatorType.FULL_STATE_VECTOR,
+    report_level: ReportLevel = DEFAULT_REPORT_LEVEL,
+    with_slices: bool = True,
+    cache_directory: Optional[Union[str, "os.PathLike[str]"]] = None,
+    max_workers: Optional[int] = None,
+    routing_strategy: ancilla_region_routing.RoutingStrategy = (
+        ancilla_region_routing.RoutingStrategy.SHORTEST_PATHS
+    ),
+    pack_time_slices: bool = False,
+) -> Iterator[BatchResult]:
+    """Compile each circuit as compile_str would, yielding the results as they are ready.
+
+    Circuits are given as QASM strings or as pathlib.Paths, which are read by the workers. A
+    circuit failing to compile gives a result with the error instead of stopping the batch.
+
+    Args:
+        with_slices: Lay out the computations and return their slices. Without them, only the
+            stages needed for the compilation text are run.
+        cache_directory: Directory of a CompilationCache shared by the workers.
+        max_workers: Number of worker processes, by default one per CPU. With 1, the circuits
+            are compiled in this process, in order.
+        routing_strategy, pack_time_slices: See CompilationPipeline.
+    """
+    options = _BatchOptions(
+        apply_litinski_transform,
+        simulation_type,
+        report_level,
+        with_slices,
+        os.fspath(cache_directory) if cache_directory is not None else None,
+        routing_strategy,
+        pack_time_slices,
+    )
+    workers = max_workers or os.cpu_count() or 1
+    if workers == 1:
+        for index, source in enumerate(circuits):
+            yield _compile_one(index, source, options)
+        return
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=_warm_up) as executor:
+        futures = {
+            executor.submit(_compile_one, index, source, options): (index, source)
+            for index, source in enumerate(circuits)
+        }
+        for future in as_completed(futures):
+            try:
+                yield future.result()
+            except Exception:
+                # The worker died, e.g. killed for running out of memory
+                index, source = futures[future]
+                yield BatchResult(index, _name(index, source), error=traceback.format_exc())
+
+
+def _parse_args(argv: Optional[Sequence[str]], prog: Optional[str]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        prog=prog,
+        description="Compile QASM files in parallel, reporting the failures without stopping.",
+    )
+    parser.add_argument("files", nargs="+", type=pathlib.Path, help="QASM files to compile")
+    parser.add_argument(
+        "--no-litinski-transform",
+        dest="apply_litinski_transform",
+        action="store_false",
+        help="Don't apply the Litinski transform",
+    )
+    parser.add_argument(
+        "--simulation",
+        choices=[simulator.value for simulator in lssim.SimulatorType],
+        default=lssim.SimulatorType.NOOP.value,
+        help="Simulator run during the layout (default: %(default)s, while compile_many "
+        f"defaults to {lssim.SimulatorType.FULL_STATE_VECTOR.value})",
+    )
+    parser.add_argument(
+        "--routing",
+        choices=[strategy.value for strategy in ancilla_region_routing.RoutingStrategy],
+        default=ancilla_region_routing.RoutingStrategy.SHORTEST_PATHS.value,
+        help="How the ancilla regions are routed (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--pack-slices",
+        action="store_true",
+        help="Put independent operations in the same time slice when they fit",
+    )
+    parser.add_argument(
+        "--report-level",
+        choices=[level.value for level in ReportLevel],
+        default=DEFAULT_REPORT_LEVEL.value,
+        help="What the compilation texts contain (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--no-slices",
+        dest="with_slices",
+        action="store_false",
+        help="Stop before laying out the computations",
+    )
+    parser.add_argument(
+        "--cache-dir",
+        nargs="?",
+        const=CompilationCache.default_directory(),
+        help="Directory to cache the compilation stages in, by default (without a value) "
+        f"{CompilationCache.default_directory()}. Entries are unpickled when loaded, so don't use "
+        "a directory that others can write to",
+    )
+    parser.add_argument("--workers", type=int, help="Worker processes (default: one per CPU)")
+    parser.add_argument(
+        "--output-dir",
+        type=pathlib.Path,
+        help="Write the compilation text of each file there, as <file name>.txt",
+    )
+    return parser.parse_args(argv)
+
+
+def _summary(result: BatchResult) -> Tuple[str, str]:
+    if result.succeeded():
+        slices = f", {len(result.slices)} slice(s)" if result.slices is not None else ""
+        return f"{result.name}: compiled in {result.wall_time:.2f}s{slices}", ""
+    assert result.error is not None
+    return f"{result.name}: failed, {result.error.strip().splitlines()[-1]}", result.error
+
+
+def main(argv: Optional[Sequence[str]] = None, prog: Optional[str] = None) -> int:
+    """Command line interface of compile_many. Returns the number of circuits that failed."""
+    args = _parse_args(argv, prog)
+    if args.output_dir is not None:
+        args.output_dir.mkdir(parents=True, exist_ok=True)
+
+    failures = 0
+    for result in compile_many(
+        args.files,
+        apply_litinski_transform=args.apply_litinski_transform,
+        simulation_type=lssim.SimulatorType(args.simulation),
+        report_level=ReportLevel(args.report_level),
+        with_slices=args.with_slices,
+        cache_directory=args.cache_dir,
+        max_workers=args.workers,
+        routing_strategy=ancilla_region_routing.RoutingStrategy(args.routing),
+        pack_time_slices=args.pack_slices,
+    ):
+        line, details = _summary(result)
+        print(line, flush=True)
+        if not result.succeeded():
+            failures += 1
+            print(details, file=sys.stderr)
+        elif args.output_dir is not None and result.compilation_text is not None:
+            output_file = args.output_dir / (pathlib.Path(result.name).name + ".txt")
+            output_file.write_text(result.compilation_text)
+    return failures
+
+
+if __name__ == "__main__":
+    sys.exit(min(main(), 1))
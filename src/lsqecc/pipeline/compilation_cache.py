@@ -0,0 +1,139 @@
+# Copyright (C) 2020-2021 - George Watkins and Alex Nguyen
+#
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or (at your option) any later version.
+#
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public
+# License along with this library; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301
+# USA
+
+import collections
+import hashlib
+import os
+import pickle
+import tempfile
+from typing import Callable, Hashable, Optional, OrderedDict, Tuple, TypeVar, Union
+
+T = TypeVar("T")
+
+# Bump when the output of a compilation stage changes, so that stale entries are not reused
+CACHE_VERSION = 2
+
+
+def normalize_qasm(qasm: str) -> str:
+    """Drop the comments, blank lines and indentation, which don't change the circuit"""
+    lines = (line.split("//", 1)[0].strip() for line in qasm.splitlines())
+    return "\n".join(line for line in lines if line)
+
+
+class CompilationCache:
+    """Cache of the intermediate results of the compilation pipeline, keyed by a hash of the
+    normalized circuit, the name of the stage and the options it depends on.
+
+    Entries are stored pickled, so every lookup returns fresh objects that the caller is free to
+    modify. The most recently used entries are kept in memory and, if a directory is given, all
+    of them are also written there to be shared between processes and runs.
+
+    Loading an entry unpickles it, which can run arbitrary code: only use a directory that no one
+    else can write to, such as default_directory(). Directories the cache creates are only
+    accessible to the current user.
+    """
+
+    def __init__(
+        self,
+        directory: Optional[Union[str, "os.PathLike[str]"]] = None,
+        max_memory_entries: int = 64,
+    ):
+        self.directory = directory
+        self.max_memory_entries = max_memory_entries
+        self._memory: OrderedDict[str, bytes] = collections.OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        if directory is not None:
+            os.makedirs(directory, mode=0o700, exist_ok=True)
+
+    @staticmethod
+    def default_directory() -> str:
+        """lsqecc in the user's cache directory, $XDG_CACHE_HOME or ~/.cache"""
+        cache_home = os.environ.get("XDG_CACHE_HOME") or os.path.join(
+            os.path.expanduser("~"), ".cache"
+        )
+        return os.path.join(cache_home, "lsqecc")
+
+    @staticmethod
+    def circuit_hash(qasm: str) -> str:
+        return hashlib.sha256(normalize_qasm(qasm).encode("utf-8")).hexdigest()
+
+    @staticmethod
+    def key(circuit_hash: str, stage: str, options: Tuple[Hashable, ...] = ()) -> str:
+        return hashlib.sha256(
+            repr((CACHE_VERSION, circuit_hash, stage, options)).encode("utf-8")
+        ).hexdigest()
+
+    def _path(self, key: str) -> str:
+        assert self.directory is not None
+        return os.path.join(self.directory, key + ".pickle")
+
+    def _remember(self, key: str, data: bytes) -> None:
+        self._memory[key] = data
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_memory_entries:
+            self._memory.popitem(last=False)
+
+    def _load(self, key: str) -> Optional[bytes]:
+        if key in self._memory:
+            self._memory.move_to_end(key)
+            return self._memory[key]
+        if self.directory is not None:
+            try:
+                with open(self._path(key), "rb") as file:
+                    data = file.read()
+            except FileNotFoundError:
+                return None
+            self._remember(key, data)
+            return data
+        return None
+
+    def _store(self, key: str, data: bytes) -> None:
+        self._remember(key, data)
+        if self.directory is not None:
+            # Write to a temporary file first so that concurrent readers never see partial entries
+            fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+            with os.fdopen(fd, "wb") as file:
+                file.write(data)
+            os.replace(tmp_path, self._path(key))
+
+    def get_or_compute(
+        self,
+        circuit_hash: str,
+        stage: str,
+        options: Tuple[Hashable, ...],
+        compute: Callable[[], T],
+    ) -> T:
+        """Return the cached result of the stage, or compute and store it"""
+        key = CompilationCache.key(circuit_hash, stage, options)
+        data = self._load(key)
+        if data is not None:
+            self.hits += 1
+            return pickle.loads(data)
+
+        self.misses += 1
+        value = compute()
+        self._store(key, pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL))
+        return value
+
+    def clear(self) -> None:
+        """Forget the entries kept in memory, and delete those on disk"""
+        self._memory.clear()
+        if self.directory is not None:
+            for file_name in os.listdir(self.directory):
+                if file_name.endswith(".pickle"):
+                    os.remove(os.path.join(self.directory, file_name))
@@ -0,0 +1,293 @@
+# Copyright (C) 2020-2021 - George Watkins and Alex Nguyen
+#
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or (at your option) any later version.
+#
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public
+# License along with this library; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301
+# USA
+
+import enum
+import time
+import tracemalloc
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Hashable, List, Optional, Tuple, TypeVar, cast
+
+import lsqecc.lattice_array.visual_array_cell as vac
+import lsqecc.logical_lattice_ops.logical_lattice_ops as llops
+import lsqecc.patches.ancilla_region_routing as ancilla_region_routing
+import lsqecc.patches.lattice_surgery_computation_composer as lscc
+import lsqecc.pauli_rotations.segmented_qasm_parser as segmented_qasm_parser
+import lsqecc.simulation.logical_patch_state_simulation as lssim
+from lsqecc import utils
+from lsqecc.lattice_array import sparse_lattice_to_array
+from lsqecc.pauli_rotations import PauliOpCircuit
+
+from .compilation_cache import CompilationCache
+
+GUISlice = List[List[Optional[vac.VisualArrayCell]]]  # 2D array of cells
+
+T = TypeVar("T")
+
+
+class ReportLevel(enum.Enum):
+    """What goes in the compilation text besides the resource estimate"""
+
+    ESTIMATE = "estimate"
+    # The circuit drawings after parsing and after the Litinski transform, which take about as
+    # long as the compilation on large circuits
+    CIRCUITS = "circuits"
+
+
+# Report level of CompilationPipeline, compile_str and compile_many: the drawings are opt-in
+DEFAULT_REPORT_LEVEL = ReportLevel.ESTIMATE
+
+
+@dataclass
+class StageRecord:
+    """What running a stage of a CompilationPipeline took"""
+
+    name: str
+    wall_time: float  # seconds, not counting the stages it had to run first
+    op_count: Optional[int] = None  # ops, LLOPs or slices coming out of the stage
+    # Most bytes allocated at once on top of those allocated before the stage, when tracked. This
+    # includes the stages it had to run first
+    peak_memory: Optional[int] = None
+    from_cache: bool = False
+
+
+class CompilationPipeline:
+    """The stages compile_str goes through, each of which can be called on its own.
+
+    Calling a stage runs the stages it needs that have not run yet, so stopping after any of them
+    skips the rest, e.g. estimate doesn't lay out the computation. Each stage that runs appends a
+    StageRecord to records. With a cache, all stages but make_computation are looked up before
+    being computed, see CompilationCache.
+    """
+
+    def __init__(
+        self,
+        qasm_circuit: str,
+        apply_litinski_transform: bool = True,
+        simulation_type: lssim.SimulatorType = lssim.SimulatorType.FULL_STATE_VECTOR,
+        cache: Optional[CompilationCache] = None,
+        track_memory: bool = False,
+        routing_strategy: ancilla_region_routing.RoutingStrategy = (
+            ancilla_region_routing.RoutingStrategy.SHORTEST_PATHS
+        ),
+        pack_time_slices: bool = False,
+    ):
+        """
+        Args:
+            track_memory: Record the peak memory of each stage with tracemalloc, which slows the
+                stages down severalfold.
+            routing_strategy: How the ancilla regions of multi body measurements are laid out,
+                see AncillaRegionRouter.
+            pack_time_slices: Put independent ops in the same time slice when they fit, see
+                LatticeSurgeryComputation.make_computation.
+        """
+        self.qasm_circuit = qasm_circuit
+        self.apply_litinski_transform = apply_litinski_transform
+        self.simulation_type = simulation_type
+        self.cache = cache
+        self.track_memory = track_memory
+        self.routing_strategy = routing_strategy
+        self.pack_time_slices = pack_time_slices
+        self.records: List[StageRecord] = []
+        self._results: Dict[str, Any] = {}
+        self._nested_stage_times: List[float] = []
+        self._circuit_hash = (
+            CompilationCache.circuit_hash(qasm_circuit) if cache is not None else ""
+        )
+
+    def _stage(
+        self,
+        name: str,
+        compute: Callable[[], T],
+        options: Tuple[Hashable, ...] = (),
+        count: Optional[Callable[[Any], int]] = None,
+        cacheable: bool = True,
+    ) -> T:
+        if name in self._results:
+            return cast(T, self._results[name])
+
+        from_cache = False
+
+        def compute_once() -> T:
+            nonlocal from_cache
+            from_cache = False
+            return compute()
+
+        started_tracing = self.track_memory and not tracemalloc.is_tracing()
+        if started_tracing:
+            tracemalloc.start()
+        memory_before = tracemalloc.get_traced_memory()[0] if self.track_memory else 0
+        self._nested_stage_times.append(0.0)
+        start = time.perf_counter()
+
+        if self.cache is not None and cacheable:
+            from_cache = True
+            result = self.cache.get_or_compute(self._circuit_hash, name, options, compute_once)
+        else:
+            result = compute()
+
+        elapsed = time.perf_counter() - start
+        # The stages run from this one are recorded separately
+        wall_time = elapsed - self._nested_stage_times.pop()
+        if self._nested_stage_times:
+            self._nested_stage_times[-1] += elapsed
+        peak_memory = None
+        if self.track_memory:
+            peak_memory = max(0, tracemalloc.get_traced_memory()[1] - memory_before)
+        if started_tracing:
+            tracemalloc.stop()
+
+        self.records.append(
+            StageRecord(
+                name=name,
+                wall_time=wall_time,
+                op_count=count(result) if count is not None else None,
+                peak_memory=peak_memory,
+                from_cache=from_cache,
+            )
+        )
+        self._results[name] = result
+        return result
+
+    def parse(self) -> PauliOpCircuit:
+        return self._stage(
+            "parse", lambda: segmented_qasm_parser.parse_str(self.qasm_circuit), count=len
+        )
+
+    def render_input(self) -> str:
+        def render() -> str:
+            import qiskit.visualization as qkvis
+            from qiskit import circuit as qkcirc
+
+            text = "Input Circuit:\n"
+            text += qkvis.circuit_drawer(
+                qkcirc.QuantumCircuit.from_qasm_str(self.qasm_circuit)
+            ).single_string()
+            text += "\nCircuit as Pauli rotations:\n"
+            text += self.parse().render_ascii()
+            return text
+
+        return self._stage("render_input", render)
+
+    def remove_y(self) -> PauliOpCircuit:
+        # TODO add user flag
+        return self._stage("remove_y", lambda: self.parse().to_y_free_equivalent(), count=len)
+
+    def litinski_transform(self) -> PauliOpCircuit:
+        def transform() -> PauliOpCircuit:
+            circuit = self.remove_y().copy()
+            circuit.apply_transformation()
+            return circuit.to_y_free_equivalent()
+
+        return self._stage("litinski_transform", transform, count=len)
+
+    def transformed_circuit(self) -> PauliOpCircuit:
+        """The circuit lowered to LLOPs, i.e. after the Litinski transform if it is applied"""
+        if self.apply_litinski_transform:
+            return self.litinski_transform()
+        return self.remove_y()
+
+    def render_transformed(self) -> str:
+        return self._stage(
+            "render_transformed",
+            lambda: "\nCircuit after the Litinski Transform:\n"
+            + self.litinski_transform().render_ascii(),
+        )
+
+    def logical_computation(self) -> llops.LogicalLatticeComputation:
+        return self._stage(
+            "llops",
+            lambda: llops.LogicalLatticeComputation(self.transformed_circuit()),
+            options=(self.apply_litinski_transform,),
+            count=lambda computation: len(computation.ops),
+        )
+
+    def make_computation(self) -> lscc.LatticeSurgeryComputation:
+        return self._stage(
+            "make_computation",
+            lambda: lscc.LatticeSurgeryComputation.make_computation(
+                self.logical_computation(),
+                lscc.LayoutType.SimplePreDistilledStates,
+                simulation_type=self.simulation_type,
+                routing_strategy=self.routing_strategy,
+                pack_time_slices=self.pack_time_slices,
+            ),
+            count=lambda computation: len(computation.composer.getSlices()),
+            cacheable=False,
+        )
+
+    def estimate(self) -> Optional[Any]:
+        """Resources estimated from the LLOPs, see llops_resource_estimator"""
+        # Imported here as it needs the opensurgery submodule
+        from lsqecc.resource_estimation import llops_resource_estimator
+
+        return self._stage(
+            "estimate",
+            lambda: llops_resource_estimator.estimate(self.logical_computation()),
+            options=(self.apply_litinski_transform,),
+        )
+
+    def slices(self) -> List[GUISlice]:
+        return self._stage(
+            "slices",
+            lambda: list(
+                map(sparse_lattice_to_array, self.make_computation().composer.getSlices())
+            ),
+            options=(
+                self.apply_litinski_transform,
+                self.simulation_type,
+                self.routing_strategy,
+                self.pack_time_slices,
+            ),
+            count=len,
+        )
+
+    def compilation_text(self, report_level: ReportLevel = DEFAULT_REPORT_LEVEL) -> str:
+        """The text of the circuit as processed in various stages. The renders are only made
+        if report_level asks for them."""
+        text = ""
+        if report_level == ReportLevel.CIRCUITS:
+            text += self.render_input()
+            if self.apply_litinski_transform:
+                text += self.render_transformed()
+
+        # TODO| when compilation stages are supported, remove the 'Circuit|' from the text
+        estimate = self.estimate()
+        if estimate is not None:
+            text += (
+                "\nCircuit. Estimated resources needed for computation:\n"
+                + utils.dataclass_render_ascii(estimate)
+            )
+        return text
+
+    def run(self, report_level: ReportLevel = DEFAULT_REPORT_LEVEL) -> Tuple[List[GUISlice], str]:
+        """Run all the stages needed for report_level, returning what compile_str does"""
+        compilation_text = self.compilation_text(report_level)
+        return self.slices(), compilation_text
+
+    def render_records(self) -> str:
+        """The records as a table, one stage per line"""
+        lines = []
+        for record in self.records:
+            line = f"{record.name:>20}: {record.wall_time:9.3f}s"
+            if record.op_count is not None:
+                line += f", {record.op_count} op(s)"
+            if record.peak_memory is not None:
+                line += f", peak {record.peak_memory / 2**20:.1f} MiB"
+            if record.from_cache:
+                line += ", from cache"
+            lines.append(line)
+        return "\n".join(lines)
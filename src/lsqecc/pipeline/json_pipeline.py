@@ -17,10 +17,12 @@
 
 import enum
 import json
+from typing import Optional
 
 import lsqecc.lattice_array.visual_array_cell as vac
 
-from .lattice_surgery_compilation_pipeline import compile_str
+from .compilation_cache import CompilationCache
+from .lattice_surgery_compilation_pipeline import ReportLevel, compile_str
 
 
 class JsonResponse:
@@ -50,7 +52,7 @@ class _SliceArrayJSONEncoder(json.JSONEncoder):
         return obj
 
 
-def handle(json_request: str) -> JsonResponse:
+def handle(json_request: str, cache: Optional[CompilationCache] = None) -> JsonResponse:
     """
     @param json_request:
     Accepts a string containing request for compilation in JSON format. Currently the only supported
@@ -58,9 +60,14 @@ def handle(json_request: str) -> JsonResponse:
     {
        circuit : "A string containing a QASM circuit",
        circuit_source : "str", // in the future this will support "file"
-       apply_litinski_transform : true | false.
+       apply_litinski_transform : true | false,
+       report_level : "circuits" | "estimate", // defaults to "circuits", the circuit drawings
+                                               // are left out of compilation_text with "estimate"
     }
 
+    @param cache:
+    Passed on to compile_str, so that repeated requests for the same circuit are served from it.
+
     @return:
     a json containing the following JSON
     {
@@ -77,7 +84,14 @@ def handle(json_request: str) -> JsonResponse:
             else True
         )
 
-        slices, compilation_text = compile_str(request_data["circuit"], apply_litinski_transform)
+        report_level = ReportLevel(request_data.get("report_level", ReportLevel.CIRCUITS.value))
+
+        slices, compilation_text = compile_str(
+            request_data["circuit"],
+            apply_litinski_transform,
+            cache=cache,
+            report_level=report_level,
+        )
         respnse_body = {"slices": slices, "compilation_text": compilation_text}
 
         return JsonResponse(200, _SliceArrayJSONEncoder().encode(respnse_body))
@@ -17,32 +17,38 @@
 
 from typing import List, Optional, Tuple
 
-import qiskit.visualization as qkvis
-from qiskit import circuit as qkcirc
-
-import lsqecc.lattice_array.visual_array_cell as vac
-import lsqecc.logical_lattice_ops.logical_lattice_ops as llops
-import lsqecc.patches.lattice_surgery_computation_composer as lscc
-import lsqecc.pauli_rotations.segmented_qasm_parser as segmented_qasm_parser
 import lsqecc.simulation.logical_patch_state_simulation as lssim
-from lsqecc import utils
-from lsqecc.lattice_array import sparse_lattice_to_array
-from lsqecc.resource_estimation import llops_resource_estimator
 
-GUISlice = List[List[Optional[vac.VisualArrayCell]]]  # 2D array of cells
+from .compilation_cache import CompilationCache
+from .compilation_pipeline import (
+    DEFAULT_REPORT_LEVEL,
+    CompilationPipeline,
+    GUISlice,
+    ReportLevel,
+)
 
-__all__ = ["compile_file", "GUISlice"]
+__all__ = ["compile_file", "GUISlice", "ReportLevel"]
 
 
 def compile_file(
     circuit_file_name: str,
     apply_litinski_transform: bool = True,
     simulation_type: lssim.SimulatorType = lssim.SimulatorType.FULL_STATE_VECTOR,
+    cache: Optional[CompilationCache] = None,
+    report_level: ReportLevel = DEFAULT_REPORT_LEVEL,
 ) -> Tuple[List[GUISlice], str]:
-    """DEPRECATED. compile_str"""
+    """DEPRECATED. compile_str
+
+    The whole file is read, as the segmented parser and the input circuit drawing need the QASM
+    text. Use GatesCircuit.from_qasm with a pathlib.Path to parse large files gate by gate.
+    """
     with open(circuit_file_name) as input_file:
         return compile_str(
-            input_file.read(), apply_litinski_transform, simulation_type=simulation_type
+            input_file.read(),
+            apply_litinski_transform,
+            simulation_type=simulation_type,
+            cache=cache,
+            report_level=report_level,
         )
 
 
@@ -50,42 +56,14 @@ def compile_str(
     qasm_circuit: str,
     apply_litinski_transform: bool = True,
     simulation_type: lssim.SimulatorType = lssim.SimulatorType.FULL_STATE_VECTOR,
+    cache: Optional[CompilationCache] = None,
+    report_level: ReportLevel = DEFAULT_REPORT_LEVEL,
 ) -> Tuple[List[GUISlice], str]:
-    """Returns gui slices and the text of the circuit as processed in various stages"""
-    composer_class = lscc.LatticeSurgeryComputation
-    layout_types = lscc.LayoutType
-
-    input_circuit = segmented_qasm_parser.parse_str(qasm_circuit)
-
-    compilation_text = "Input Circuit:\n"
-
-    compilation_text += qkvis.circuit_drawer(
-        qkcirc.QuantumCircuit.from_qasm_str(qasm_circuit)
-    ).single_string()
-
-    compilation_text += "\nCircuit as Pauli rotations:\n"
-    compilation_text += input_circuit.render_ascii()
-
-    # TODO add user flag
-    input_circuit = input_circuit.to_y_free_equivalent()
-
-    if apply_litinski_transform:
-        input_circuit.apply_transformation()
-        input_circuit = input_circuit.to_y_free_equivalent()
-        compilation_text += "\nCircuit after the Litinski Transform:\n"
-        compilation_text += input_circuit.render_ascii()
-
-    logical_computation = llops.LogicalLatticeComputation(input_circuit)
-    lsc = composer_class.make_computation(
-        logical_computation, layout_types.SimplePreDistilledStates, simulation_type=simulation_type
-    )
-
-    # TODO| when compilation stages are supported, remove the 'Circuit|' from the text
-    estimate = llops_resource_estimator.estimate(lsc)
-    if estimate is not None:
-        compilation_text += (
-            "\nCircuit. Estimated resources needed for computation:\n"
-            + utils.dataclass_render_ascii(estimate)
-        )
-
-    return list(map(sparse_lattice_to_array, lsc.composer.getSlices())), compilation_text
+    """Returns gui slices and the text of the circuit as processed in various stages. The circuit
+    drawings are only included with report_level ReportLevel.CIRCUITS.
+
+    See CompilationPipeline to run, time or cache the stages separately.
+    """
+    return CompilationPipeline(
+        qasm_circuit, apply_litinski_transform, simulation_type=simulation_type, cache=cache
+    ).run(report_level)
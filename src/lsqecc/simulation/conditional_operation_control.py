@@ -15,7 +15,7 @@
 # Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301
 # USA
 
-from typing import Optional
+from typing import List, Optional
 
 
 class HasPauliEigenvalueOutcome:
@@ -43,6 +43,10 @@ class EvaluationCondition:
     def does_evaluate(self):
         raise NotImplementedError
 
+    def get_dependencies(self) -> Optional[List["ConditionalOperation"]]:
+        """The operations whose outcomes the condition is on, or None if they are not known"""
+        return None
+
 
 class ConditionalOperation:
     """Mixin for objects representing operations conditional on outcomes. Uses instances
@@ -14,27 +14,34 @@
 # License along with this library; if not, write to the Free Software
 # Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301
 # USA
+from __future__ import annotations
+
 import enum
 import itertools
 import math
 import random
 import uuid
 from collections import deque
-from typing import Dict, Iterable, List, Optional, Tuple, TypeVar, cast
-
-import qiskit.opflow as qkop
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional, Tuple, TypeVar, cast
 
 import lsqecc.logical_lattice_ops.logical_lattice_ops as llops
-import lsqecc.simulation.qiskit_opflow_utils as qkutil
 from lsqecc.pauli_rotations import PauliOperator
-from lsqecc.simulation.lazy_tensor_op import LazyTensorOp, tensor_list
 
 from .qubit_state import DefaultSymbolicStates, SymbolicState
 
+# qiskit.opflow is only needed when simulating, so the simulators import it on first use and
+# NoOp runs (e.g. resource estimation) don't pay for loading it
+if TYPE_CHECKING:
+    import qiskit.opflow as qkop
+
+    from lsqecc.simulation.lazy_tensor_op import LazyTensorOp
+
 
 class ConvertersToQiskit:
     @staticmethod
     def pauli_op(op: PauliOperator) -> Optional[qkop.OperatorBase]:
+        import qiskit.opflow as qkop
+
         known_map: Dict[PauliOperator, qkop.OperatorBase] = {
             PauliOperator.I: qkop.I,
             PauliOperator.X: qkop.X,
@@ -45,6 +52,8 @@ class ConvertersToQiskit:
 
     @staticmethod
     def symbolic_state(s: SymbolicState) -> qkop.StateFn:
+        import qiskit.opflow as qkop
+
         zero_ampl, one_ampl = DefaultSymbolicStates.get_amplitudes(s)
         return zero_ampl * qkop.Zero + one_ampl * qkop.One
 
@@ -53,6 +62,8 @@ def circuit_apply_op_to_qubit(
     circ: qkop.OperatorBase, op: qkop.OperatorBase, idx: int
 ) -> qkop.CircuitOp:
     """Take a local operator (applied to a single qubit) and apply it to the given circuit."""
+    import qiskit.opflow as qkop
+
     identity_padded_op = op
     # TODO check that this actually has to be reversed
     if circ.num_qubits - idx - 1 > 0:
@@ -71,6 +82,8 @@ class ProjectiveMeasurement:
 
     @staticmethod
     def borns_rule(projector: qkop.OperatorBase, state: qkop.OperatorBase) -> float:
+        import qiskit.opflow as qkop
+
         # https://qiskit.org/documentation/tutorials/operators/01_operator_flow.html#listop
         def compute_states(s):
             return s.to_matrix_op().eval()
@@ -81,6 +94,8 @@ class ProjectiveMeasurement:
     def compute_outcome_state(
         projector: qkop.OperatorBase, state_before_measurement: qkop.OperatorBase
     ) -> Tuple[qkop.DictStateFn, float]:
+        import qiskit.opflow as qkop
+
         prob = ProjectiveMeasurement.borns_rule(projector, state_before_measurement)
         assert prob.imag < 10 ** (-8)
         prob = prob.real
@@ -99,6 +114,8 @@ class ProjectiveMeasurement:
     def get_projectors_from_pauli_observable(
         pauli_observable: qkop.OperatorBase,
     ) -> Tuple[qkop.OperatorBase, qkop.OperatorBase]:
+        import qiskit.opflow as qkop
+
         eye = qkop.I ^ pauli_observable.num_qubits
         return (eye + pauli_observable) / 2, (eye - pauli_observable) / 2
 
@@ -106,6 +123,8 @@ class ProjectiveMeasurement:
     def pauli_product_measurement_distribution(
         pauli_observable: qkop.OperatorBase, state: qkop.OperatorBase
     ) -> List[Tuple[BinaryMeasurementOutcome, float]]:
+        import qiskit.opflow as qkop
+
         p_plus, p_minus = ProjectiveMeasurement.get_projectors_from_pauli_observable(
             pauli_observable
         )
@@ -218,6 +237,8 @@ class FullStateVectorPatchSimulator(PatchSimulator):
     def _make_initial_logical_state(self) -> qkop.DictStateFn:
         """Every patch, when initialized, is considered a new logical qubit.
         So all patch initializations and magic state requests are handled ahead of time"""
+        from lsqecc.simulation.lazy_tensor_op import tensor_list
+
         initial_ancilla_states: Dict[uuid.UUID, SymbolicState] = dict()
 
         def add_initial_ancilla_state(quuid, symbolic_state):
@@ -243,6 +264,9 @@ class FullStateVectorPatchSimulator(PatchSimulator):
 
     def apply_logical_operation(self, logical_op: llops.LogicalLatticeOperation):
         """Update the logical state"""
+        import qiskit.opflow as qkop
+
+        from lsqecc.simulation.lazy_tensor_op import tensor_list
 
         if not logical_op.does_evaluate():
             raise Exception(
@@ -292,6 +316,8 @@ class FullStateVectorPatchSimulator(PatchSimulator):
             logical_op.set_outcome(outcome.corresponding_eigenvalue)
 
     def get_separable_states(self) -> Dict[uuid.UUID, Optional[qkop.DictStateFn]]:
+        import lsqecc.simulation.qiskit_opflow_utils as qkutil
+
         separable_states_by_index: Dict[
             int, qkop.DictStateFn
         ] = qkutil.StateSeparator.get_separable_qubits(self.logical_state)
@@ -312,6 +338,8 @@ class LazyTensorPatchSimulator(PatchSimulator):
     def _make_initial_logical_state(self) -> LazyTensorOp[qkop.StateFn]:
         """Every patch, when initialized, is considered a new logical qubit.
         So all patch initializations and magic state requests are handled ahead of time"""
+        from lsqecc.simulation.lazy_tensor_op import LazyTensorOp
+
         initial_ancilla_states: Dict[uuid.UUID, SymbolicState] = dict()
 
         def add_initial_ancilla_state(quuid, symbolic_state):
@@ -337,6 +365,7 @@ class LazyTensorPatchSimulator(PatchSimulator):
 
     def apply_logical_operation(self, logical_op: llops.LogicalLatticeOperation):
         """Update the logical state"""
+        import qiskit.opflow as qkop
 
         if not logical_op.does_evaluate():
             raise Exception(
@@ -375,7 +404,7 @@ class LazyTensorPatchSimulator(PatchSimulator):
                 ConvertersToQiskit.pauli_op(logical_op.pauli_matrix),
                 idx_within_operand,
             )
-            self.logical_state.ops[operand_idx] = cast(qkop.StateFn, symbolic_state.eval())
+            self.logical_state.ops[operand_idx] = cast("qkop.StateFn", symbolic_state.eval())
 
         elif isinstance(logical_op, llops.MultiBodyMeasurement):
             # Prepare the state by moving all involved operands to the front
@@ -455,6 +484,7 @@ class LazyTensorPatchSimulator(PatchSimulator):
         self.logical_state.merge_the_first_n_operands(n_operands - 1)
 
     def get_separable_states(self) -> Dict[uuid.UUID, qkop.DictStateFn]:
+        import lsqecc.simulation.qiskit_opflow_utils as qkutil
 
         separable_states: Dict[uuid.UUID, qkop.DictStateFn] = {}
 
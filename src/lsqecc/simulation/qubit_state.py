@@ -21,11 +21,9 @@ import cmath
 import enum
 from typing import TYPE_CHECKING, Optional, Tuple
 
-import qiskit.opflow as qkop
-
-import lsqecc.simulation.qiskit_opflow_utils as qkutil
-
 if TYPE_CHECKING:
+    import qiskit.opflow as qkop
+
     from lsqecc.pauli_rotations import PauliOperator
 
 
@@ -164,6 +162,9 @@ class DefaultSymbolicStates:
 
     @staticmethod
     def from_state_fn(state: qkop.StateFn) -> SymbolicState:
+        # qiskit is only needed when simulating, so it is imported on first use
+        import lsqecc.simulation.qiskit_opflow_utils as qkutil
+
         alpha, beta = qkutil.to_vector(state)
         return DefaultSymbolicStates.from_amplitudes(alpha, beta)
 
@@ -0,0 +1,126 @@
+# Copyright (C) 2020-2021 - George Watkins and Alex Nguyen
+#
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or (at your option) any later version.
+#
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public
+# License along with this library; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301
+# USA
+
+import subprocess
+import sys
+
+import pytest
+
+from lsqecc import cli
+
+QASM = """OPENQASM 2.0;
+include "qelib1.inc";
+qreg q[2];
+h q[0];
+crz(pi/2) q[0],q[1];
+"""
+
+
+def imported_modules(code: str, top_level: bool = True) -> set:
+    output = subprocess.run(
+        [sys.executable, "-c", f"{code}\nimport sys\nprint(' '.join(sys.modules))"],
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout
+    return {name.split(".")[0] if top_level else name for name in output.split()}
+
+
+def test_usage(capsys):
+    assert cli.main(["--help"]) == 0
+    out = capsys.readouterr().out
+    for command in cli.COMMANDS:
+        assert command in out
+
+    assert cli.main(["not-a-command"]) == 2
+
+
+def test_help_does_not_import_dependencies():
+    modules = imported_modules("from lsqecc import cli\ncli.main(['--help'])")
+    assert not modules & {"qiskit", "pyzx", "igraph", "numpy"}
+
+
+def test_emit_instructions(tmp_path, capsys):
+    path = tmp_path / "circuit.qasm"
+    path.write_text(QASM)
+    assert cli.main(["emit-instructions", str(path)]) == 0
+    out = capsys.readouterr().out
+    assert out.startswith("HGate 0\n")
+
+    assert cli.main(["emit-instructions", str(path), "-o", str(tmp_path / "out.txt")]) == 0
+    assert (tmp_path / "out.txt").read_text() == out
+
+
+def test_emit_instructions_does_not_import_qiskit(tmp_path):
+    path = tmp_path / "circuit.qasm"
+    path.write_text(QASM)
+    modules = imported_modules(
+        f"from lsqecc import cli\ncli.main(['emit-instructions', {str(path)!r}])"
+    )
+    assert not modules & {"qiskit", "pyzx", "igraph"}
+
+
+def test_benchmark(tmp_path, capsys):
+    path = tmp_path / "circuit.qasm"
+    path.write_text(QASM.replace("crz(pi/2) q[0],q[1]", "t q[1]"))
+    assert cli.main(["benchmark", str(path), "--until", "logical_computation"]) == 0
+    out = capsys.readouterr().out
+    assert "llops" in out
+    assert "make_computation" not in out
+
+
+def test_benchmark_reports_failures(tmp_path, capsys):
+    bad, good = tmp_path / "bad.qasm", tmp_path / "good.qasm"
+    bad.write_text("qreg q[1]; not_a_gate q[0];")
+    good.write_text(QASM.replace("crz(pi/2) q[0],q[1]", "t q[1]"))
+    assert cli.main(["benchmark", str(bad), str(good), "--until", "logical_computation"]) == 1
+    out = capsys.readouterr().out
+    assert f"{bad}: failed after" in out
+    assert "llops" in out.split(f"{good}:")[1]
+
+
+def test_benchmark_without_simulation_does_not_import_opflow(tmp_path):
+    path = tmp_path / "circuit.qasm"
+    path.write_text(QASM.replace("crz(pi/2) q[0],q[1]", "t q[1]"))
+    modules = imported_modules(
+        f"from lsqecc import cli\ncli.main(['benchmark', {str(path)!r}])", top_level=False
+    )
+    assert "qiskit.opflow" not in modules
+
+
+def test_estimate_reports_failures(tmp_path, capsys):
+    bad, good = tmp_path / "bad.qasm", tmp_path / "good.qasm"
+    bad.write_text("qreg q[1]; not_a_gate q[0];")
+    good.write_text(QASM)
+    assert cli.main(["estimate", str(bad), str(good)]) == 1
+    out = capsys.readouterr().out
+    assert f"{bad}: failed" in out
+    # Estimated, or failed too if the opensurgery submodule is missing
+    assert f"{good}:" in out
+
+
+@pytest.mark.parametrize(
+    "argv",
+    [
+        ["benchmark", "--until", "nowhere"],
+        ["benchmark", "circuit.qasm", "--simulation", "nothing"],
+        ["benchmark", "circuit.qasm", "--routing", "nowhere"],
+    ],
+)
+def test_bad_arguments(argv):
+    with pytest.raises(SystemExit):
+        cli.main(argv)
@@ -66,3 +66,10 @@ class TestGateToCircuit:
             ),
             "circuit_with_approx.txt",
         )
+
+    def test_from_qasm_path(self, tmp_path):
+        path = tmp_path / "circuit.qasm"
+        path.write_text(EXAMPLE_CIRCUIT_NEEDING_APPROX)
+        assert GatesCircuit.from_qasm(path) == GatesCircuit.from_qasm(
+            EXAMPLE_CIRCUIT_NEEDING_APPROX
+        )
@@ -0,0 +1,31 @@
+import subprocess
+import sys
+
+from lsqecc.gates.pi_over_2_to_the_n_rz_gate_approximations import (
+    LazyApproximationTable,
+    get_pi_over_2_to_the_n_rz_gate,
+)
+
+
+def test_table():
+    assert len(get_pi_over_2_to_the_n_rz_gate) == 135
+    assert get_pi_over_2_to_the_n_rz_gate[:3] == ["SS", "S", "T"]
+    assert get_pi_over_2_to_the_n_rz_gate[-1].startswith("SXHTHSTHSTHTHSTHSTHS")
+    assert all(set(sequence) <= set("HSTX") for sequence in get_pi_over_2_to_the_n_rz_gate)
+
+
+def test_loaded_on_first_use():
+    table = LazyApproximationTable()
+    assert not table.is_loaded()
+    assert table[1] == "S"
+    assert table.is_loaded()
+
+
+def test_not_loaded_on_import():
+    code = (
+        "import lsqecc.pauli_rotations, lsqecc.gates.approximate\n"
+        "from lsqecc.gates.pi_over_2_to_the_n_rz_gate_approximations import "
+        "get_pi_over_2_to_the_n_rz_gate\n"
+        "assert not get_pi_over_2_to_the_n_rz_gate.is_loaded()\n"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)
@@ -0,0 +1,94 @@
+import io
+import os
+import pathlib
+import threading
+from fractions import Fraction
+
+import pytest
+
+from lsqecc.gates import gates
+from lsqecc.gates.parse import parse_gates_circuit
+from lsqecc.gates.qasm_tokenizer import (
+    QasmStatement,
+    iter_gate_statements,
+    iter_qasm_statements,
+)
+from lsqecc.utils import QasmParseException
+
+
+def test_statements():
+    qasm = """OPENQASM 2.0; // header
+include "qelib1.inc";
+qreg q[2];
+crz( pi / 4 ) q[0],
+    q[1]; h q[1];
+"""
+    assert list(iter_qasm_statements(qasm)) == [
+        QasmStatement("OPENQASM", None, ["2.0"], 1),
+        QasmStatement("include", None, ['"qelib1.inc"'], 2),
+        QasmStatement("qreg", None, ["q[2]"], 3),
+        QasmStatement("crz", "pi/4", ["q[0]", "q[1]"], 4),
+        QasmStatement("h", None, ["q[1]"], 5),
+    ]
+
+
+def test_statements_from_file_object():
+    qasm = "qreg q[1];\nh q[0];\n"
+    assert list(iter_qasm_statements(io.StringIO(qasm))) == list(iter_qasm_statements(qasm))
+
+
+def test_statement_helpers():
+    statement = QasmStatement("rz", "pi/8", ["q[3]"], 7)
+    assert statement.index_arg(0) == 3
+    assert statement.pi_over_n_param() == Fraction(1, 8)
+    with pytest.raises(QasmParseException, match="Line 7"):
+        statement.index_arg(1)
+    with pytest.raises(QasmParseException, match="Line 7"):
+        QasmStatement("rz", "0.3", ["q[0]"], 7).pi_over_n_param()
+
+
+def test_unterminated_statement():
+    with pytest.raises(QasmParseException, match="Line 2"):
+        list(iter_qasm_statements("qreg q[1];\nh q[0]\n"))
+
+
+@pytest.mark.parametrize(
+    "qasm, line",
+    [
+        ("h q[0];\nqreg q[1];", "Line 1"),
+        ("qreg q[1];\nqreg r[1];", "Line 2"),
+        ("OPENQASM 2.0;", "got 0"),
+    ],
+)
+def test_gate_statements_need_one_qreg(qasm, line):
+    with pytest.raises(QasmParseException, match=line):
+        list(iter_gate_statements(qasm))
+
+
+def test_parse_gates_circuit_from_file_object():
+    qasm = io.StringIO("OPENQASM 2.0;\nqreg q[2];\nh q[0];\ncrz(pi/2) q[0],q[1];\n")
+    assert parse_gates_circuit(qasm) == [
+        gates.H(0),
+        gates.CRZ(control_qubit=0, target_qubit=1, phase=Fraction(1, 2)),
+    ]
+
+
+@pytest.mark.parametrize("contents", ["", "qreg q[2];\nh q[0];\ncrz(pi/2)\nq[0],q[1];"])
+def test_statements_from_path(tmp_path, contents):
+    path = tmp_path / "circuit.qasm"
+    path.write_text(contents)
+    assert list(iter_qasm_statements(path)) == list(iter_qasm_statements(contents))
+
+
+@pytest.mark.skipif(not hasattr(os, "mkfifo"), reason="Needs named pipes")
+def test_statements_from_pipe(tmp_path):
+    contents = "qreg q[2];\nh q[0];\ncrz(pi/2)\nq[0],q[1];"
+    path = tmp_path / "circuit.qasm"
+    os.mkfifo(path)
+    # Opening either end of the pipe blocks until the other one is opened
+    writer = threading.Thread(target=pathlib.Path(path).write_text, args=(contents,))
+    writer.start()
+    try:
+        assert list(iter_qasm_statements(path)) == list(iter_qasm_statements(contents))
+    finally:
+        writer.join()
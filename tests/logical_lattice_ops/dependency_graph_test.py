@@ -15,10 +15,12 @@
 # Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301
 # USA
 
+import random
 from fractions import Fraction
 
 import pytest
 
+import lsqecc.logical_lattice_ops.dependency_graph as dependency_graph
 from lsqecc.logical_lattice_ops.dependency_graph import DependencyGraph
 from lsqecc.pauli_rotations import PauliOpCircuit, PauliOperator, PauliRotation
 
@@ -156,3 +158,39 @@ class TestDependencyGraph:
         assert node2.op == sample_circuit.ops[2]
         assert node4.op == sample_circuit.ops[4]
         assert node5.op == sample_circuit.ops[5]
+
+    def test_from_circuit_by_commutation_windows(self, monkeypatch):
+        """A few rows of the anticommutation matrix at a time, on a circuit with repeated ops"""
+        rng = random.Random(0)
+        paulis = [PauliOperator.I, PauliOperator.X, PauliOperator.Y, PauliOperator.Z]
+        pool = [[rng.choice(paulis) for _ in range(3)] for _ in range(6)]
+        c = PauliOpCircuit(3)
+        for _ in range(40):
+            c.add_pauli_block(PauliRotation.from_list(rng.choice(pool), Fraction(1, 8)))
+
+        monkeypatch.setattr(dependency_graph, "_DEPENDENCY_WINDOW_CELLS", 3 * len(c))
+        graph = DependencyGraph.from_circuit_by_commutation(c)
+        expected = DependencyGraph.from_list(
+            c.ops, lambda arg1, arg2: not PauliOpCircuit.are_commuting(arg1, arg2)
+        )
+        assert graph.generate_edge_list() == expected.generate_edge_list()
+
+    def test_from_circuit_by_commutation_any_order(self, monkeypatch):
+        """The comparing function gives the right answers when not called in from_list's order"""
+        rng = random.Random(1)
+        paulis = [PauliOperator.I, PauliOperator.X, PauliOperator.Y, PauliOperator.Z]
+        c = PauliOpCircuit(3)
+        for _ in range(30):
+            ops = [rng.choice(paulis) for _ in range(3)]
+            c.add_pauli_block(PauliRotation.from_list(ops, Fraction(1, 8)))
+
+        def shuffled_from_list(input_list, comparing_function):
+            pairs = [(a, b) for a in input_list for b in input_list]
+            rng.shuffle(pairs)
+            for a, b in pairs:
+                assert comparing_function(a, b) == (not PauliOpCircuit.are_commuting(a, b))
+            return DependencyGraph()
+
+        monkeypatch.setattr(dependency_graph, "_DEPENDENCY_WINDOW_CELLS", 4 * len(c))
+        monkeypatch.setattr(DependencyGraph, "from_list", staticmethod(shuffled_from_list))
+        DependencyGraph.from_circuit_by_commutation(c)
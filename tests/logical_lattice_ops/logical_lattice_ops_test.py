@@ -131,6 +131,29 @@ class TestLogicalLatticeComputation:
         logical_computation = LogicalLatticeComputation(input)
         assert logical_computation.count_magic_states() == expected
 
+    def test_from_stream(self):
+        with open("assets/demo_circuits/nontrivial_state.qasm") as input_file:
+            qasm = input_file.read()
+        from_circuit = LogicalLatticeComputation(segmented_qasm_parser.parse_str(qasm))
+        from_stream = LogicalLatticeComputation(segmented_qasm_parser.stream_str(qasm))
+        assert from_stream.num_logical_qubits() == from_circuit.num_logical_qubits()
+        assert from_stream.count_magic_states() == from_circuit.count_magic_states()
+        assert list(map(type, from_stream.ops)) == list(map(type, from_circuit.ops))
+
+    def test_condition_dependencies(self):
+        circuit = PauliOpCircuit(2)
+        circuit.add_pauli_block(PauliRotation.from_list([Z, X], Fraction(1, 4)))
+        circuit.add_pauli_block(PauliRotation.from_list([X, Z], Fraction(1, 8)))
+        ops = LogicalLatticeComputation(circuit).ops
+
+        conditioned = [op for op in ops if op.get_condition() is not None]
+        assert conditioned
+        for op in conditioned:
+            dependencies = op.get_condition().get_dependencies()
+            assert dependencies
+            # The measurements come before the corrections conditioned on them
+            assert all(ops.index(dependency) < ops.index(op) for dependency in dependencies)
+
     @pytest.mark.parametrize(
         "circuit, measurement", generate_tests_circuit_to_single_patch_measurement()
     )
@@ -0,0 +1,183 @@
+# Copyright (C) 2020-2021 - George Watkins and Alex Nguyen
+#
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or (at your option) any later version.
+#
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public
+# License along with this library; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301
+# USA
+
+import copy
+
+import pytest
+
+from lsqecc.patches import patches
+from lsqecc.patches.ancilla_region_routing import (
+    AncillaRegionRouter,
+    AncillaRegionRoutingException,
+    RoutingGraph,
+    RoutingStrategy,
+    ShortestPathsRouter,
+    SteinerTreeRouter,
+    compute_ancilla_region_cells,
+    get_border_edges,
+)
+from lsqecc.patches.lattice_surgery_computation_composer import LayoutInitializer
+from lsqecc.pauli_rotations import PauliOperator
+
+
+def make_lattice(num_qubits: int) -> patches.Lattice:
+    return patches.Lattice(
+        [LayoutInitializer.singleSquarePatch((2 * j, 0)) for j in range(num_qubits)], 3, 0
+    )
+
+
+def ancilla_cells(lattice: patches.Lattice):
+    return sorted(
+        cell
+        for patch in lattice.patches
+        if patch.patch_type == patches.PatchType.Ancilla
+        for cell in patch.cells
+    )
+
+
+def test_vertex_ids():
+    graph = RoutingGraph(4, 3)
+    assert graph.vertex((3, 1)) == 7
+    assert graph.cell(7) == (3, 1)
+    assert graph.contains((3, 2))
+    assert not graph.contains((4, 0))
+    assert not graph.contains((0, -1))
+
+
+def test_occupancy():
+    lattice = make_lattice(2)
+    graph = RoutingGraph.for_lattice(lattice)
+    assert graph.fits(lattice)
+    graph.load_occupancy(lattice)
+    assert graph.occupied.nonzero()[0].tolist() == [0, 2]
+
+    graph.occupy([(1, 1)])
+    graph.load_occupancy(lattice)
+    assert graph.occupied.nonzero()[0].tolist() == [0, 2]
+    graph.clear_occupancy()
+    assert not graph.occupied.any()
+
+
+def test_free_cell_graph():
+    graph = RoutingGraph(3, 2)
+    assert graph.free_cell_graph([]).ecount() == 2 * 7
+
+    graph.occupy([(1, 0)])
+    free_cell_graph = graph.free_cell_graph([(1, 4)])
+    assert free_cell_graph.vcount() == 6
+    assert sorted(free_cell_graph.get_edgelist()) == [
+        (0, 3),
+        (1, 4),
+        (2, 5),
+        (3, 0),
+        (3, 4),
+        (4, 3),
+        (4, 5),
+        (5, 2),
+        (5, 4),
+    ]
+
+
+def test_shortest_paths():
+    graph = RoutingGraph(3, 2)
+    graph.occupy([(1, 0)])
+    paths = graph.shortest_paths(0, [2, 1], [(1, 4)])
+    assert [[graph.cell(vertex) for vertex in path] for path in paths] == [
+        [(0, 0), (0, 1), (1, 1), (2, 1), (2, 0)],
+        [(0, 0), (0, 1), (1, 1), (1, 0)],
+    ]
+
+    graph.occupy([(1, 1)])
+    assert graph.shortest_paths(0, [2], []) == [[]]
+
+
+def test_route_two_patches():
+    lattice = make_lattice(3)
+    compute_ancilla_region_cells(lattice, {(0, 0): PauliOperator.Z, (4, 0): PauliOperator.Z})
+    assert ancilla_cells(lattice) == [(1, 0), (1, 1), (2, 1), (3, 0), (3, 1)]
+
+
+def test_reuse_routing_graph():
+    lattice = make_lattice(3)
+    graph = RoutingGraph.for_lattice(lattice)
+    first, second = copy.deepcopy(lattice), copy.deepcopy(lattice)
+    compute_ancilla_region_cells(first, {(0, 0): PauliOperator.Z, (4, 0): PauliOperator.Z}, graph)
+    compute_ancilla_region_cells(second, {(2, 0): PauliOperator.Z, (4, 0): PauliOperator.Z}, graph)
+    assert ancilla_cells(second) == [(3, 0)]
+    assert graph.occupied[graph.vertex((3, 0))]
+    assert not graph.occupied[graph.vertex((2, 1))]
+
+
+def test_unreachable():
+    lattice = make_lattice(2)
+    # The top and bottom borders are X borders, and there is no room above
+    lattice.addPatch(patches.Patch(patches.PatchType.Ancilla, None, [(0, 1), (1, 1), (2, 1)], []))
+    with pytest.raises(AncillaRegionRoutingException):
+        compute_ancilla_region_cells(lattice, {(0, 0): PauliOperator.X, (2, 0): PauliOperator.X})
+
+
+def make_grid_lattice() -> patches.Lattice:
+    return patches.Lattice(
+        [
+            LayoutInitializer.singleSquarePatch((3 * col + 1, 3 * row + 1))
+            for row in range(3)
+            for col in range(3)
+        ],
+        9,
+        9,
+    )
+
+
+def test_make_router():
+    assert isinstance(
+        AncillaRegionRouter.make_router(RoutingStrategy.SHORTEST_PATHS), ShortestPathsRouter
+    )
+    assert isinstance(
+        AncillaRegionRouter.make_router(RoutingStrategy.STEINER_TREE), SteinerTreeRouter
+    )
+
+
+def test_steiner_tree_shares_cells():
+    operators = {cell: PauliOperator.Z for cell in [(1, 1), (4, 1), (1, 4)]}
+
+    shortest_paths = make_grid_lattice()
+    compute_ancilla_region_cells(shortest_paths, operators, router=ShortestPathsRouter())
+    assert len(ancilla_cells(shortest_paths)) == 6
+
+    steiner_tree = make_grid_lattice()
+    compute_ancilla_region_cells(steiner_tree, operators, router=SteinerTreeRouter())
+    assert ancilla_cells(steiner_tree) == [(2, 1), (2, 2), (2, 3), (2, 4), (3, 1)]
+
+
+def test_steiner_tree_paths():
+    lattice = make_lattice(3)
+    graph = RoutingGraph.for_lattice(lattice)
+    graph.load_occupancy(lattice)
+    operators = {(0, 0): PauliOperator.Z, (2, 0): PauliOperator.Z, (4, 0): PauliOperator.Z}
+    border_edges = get_border_edges(graph, lattice, operators)
+    source, first, second = (graph.vertex(cell) for cell in operators)
+
+    paths = SteinerTreeRouter().route(graph, source, [second, first], border_edges)
+    cell_paths = [[graph.cell(vertex) for vertex in path] for path in paths]
+    # The second patch is not crossed to reach the third
+    assert cell_paths == [
+        [(0, 0), (1, 0), (1, 1), (2, 1), (3, 1), (3, 0), (4, 0)],
+        [(0, 0), (1, 0), (2, 0)],
+    ]
+
+    graph.occupy([(1, 1)])
+    assert SteinerTreeRouter().route(graph, source, [second, first], border_edges)[0] == []
@@ -0,0 +1,110 @@
+# Copyright (C) 2020-2021 - George Watkins and Alex Nguyen
+#
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or (at your option) any later version.
+#
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public
+# License along with this library; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301
+# USA
+
+import lsqecc.logical_lattice_ops.logical_lattice_ops as llops
+import lsqecc.patches.lattice_surgery_computation_composer as lscc
+from lsqecc.patches import patches
+from lsqecc.patches.ancilla_region_routing import AncillaRegionRoutingException
+from lsqecc.pauli_rotations import segmented_qasm_parser
+from lsqecc.simulation.logical_patch_state_simulation import SimulatorType
+
+QASM = """OPENQASM 2.0;
+include "qelib1.inc";
+qreg q[3];
+h q[0];
+t q[1];
+h q[1];
+s q[2];
+t q[0];
+"""
+
+
+def make_computation(pack_time_slices: bool) -> lscc.LatticeSurgeryComputation:
+    logical_computation = llops.LogicalLatticeComputation(
+        segmented_qasm_parser.parse_str(QASM).to_y_free_equivalent()
+    )
+    return lscc.LatticeSurgeryComputation.make_computation(
+        logical_computation,
+        lscc.LayoutType.SimplePreDistilledStates,
+        simulation_type=SimulatorType.NOOP,
+        pack_time_slices=pack_time_slices,
+    )
+
+
+def test_pack_time_slices():
+    unpacked = make_computation(False).composer.getSlices()
+    packed_computation = make_computation(True)
+    packed = packed_computation.composer.getSlices()
+    assert len(packed) < len(unpacked)
+
+    # The evaluating ops, in order
+    assert [op for s in packed for op in s.logical_ops] == [
+        op for op in packed_computation.logical_computation.ops if op.does_evaluate()
+    ]
+
+    for s in packed:
+        operating_patches = [patch for op in s.logical_ops for patch in op.get_operating_patches()]
+        assert len(operating_patches) == len(set(operating_patches))
+
+        # Corrections are never in the slice of the measurements they are conditioned on
+        ids = {id(op) for op in s.logical_ops}
+        for op in s.logical_ops:
+            condition = op.get_condition()
+            if condition is not None:
+                dependencies = condition.get_dependencies()
+                assert dependencies is not None
+                assert not any(id(dependency) in ids for dependency in dependencies)
+
+
+def layout(lattice: patches.Lattice) -> list:
+    return [
+        (
+            patch.patch_type,
+            patch.cells,
+            patch.state.ket_repr() if patch.state is not None else None,
+            [(edge.cell, edge.orientation, edge.border_type) for edge in patch.edges],
+        )
+        for patch in lattice.patches
+    ]
+
+
+def test_pack_time_slices_routing_failure(monkeypatch):
+    add_logical_operation = lscc.LatticeSurgeryComputationComposer.addLogicalOperation
+    failed = []
+
+    def fail_once_in_a_filled_slice(composer, logical_op):
+        if not failed and composer.lattice().logical_ops:
+            failed.append((logical_op, layout(composer.lattice())))
+            # Like the router, fail after recording the op but before changing the lattice
+            composer.lattice().logical_ops.append(logical_op)
+            raise AncillaRegionRoutingException("No room for the ancilla region")
+        add_logical_operation(composer, logical_op)
+
+    monkeypatch.setattr(
+        lscc.LatticeSurgeryComputationComposer, "addLogicalOperation", fail_once_in_a_filled_slice
+    )
+    packed = make_computation(True).composer.getSlices()
+
+    assert failed
+    failed_op, layout_before_failure = failed[0]
+    index = next(i for i, s in enumerate(packed) if any(op is failed_op for op in s.logical_ops))
+    # Alone in a new slice, as the next op acts on the ancilla it initializes
+    assert [id(op) for op in packed[index].logical_ops] == [id(failed_op)]
+    # The slice it failed in kept its other ops and its lattice as they were
+    assert packed[index - 1].logical_ops
+    assert all(op is not failed_op for op in packed[index - 1].logical_ops)
+    assert layout(packed[index - 1]) == layout_before_failure
@@ -0,0 +1,142 @@
+# Copyright (C) 2020-2021 - George Watkins and Alex Nguyen
+#
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or (at your option) any later version.
+#
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public
+# License along with this library; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301
+# USA
+
+import uuid
+
+import pytest
+
+from lsqecc.patches.patches import CoordType, Lattice, Patch, PatchType
+
+
+def square(cell, patch_type=PatchType.Qubit, patch_uuid=None):
+    return Patch(patch_type, None, [cell], [], patch_uuid)
+
+
+def test_cell_index():
+    big = Patch(PatchType.DistillationQubit, None, [(4, 0), (5, 0), (4, 1), (5, 1)], [])
+    lattice = Lattice([square((0, 0)), big], 3, 0)
+
+    assert lattice.getPatchOfCell((5, 1)) is big
+    assert lattice.getPatchRepresentative((5, 1)) == (4, 0)
+    assert lattice.patchTypeOfCell((4, 1)) == PatchType.DistillationQubit
+    assert lattice.cellIsFree((2, 0))
+    assert lattice.getPatchRepresentative((2, 0)) == (2, 0)
+    assert (lattice.getCols(), lattice.getRows()) == (6, 3)
+
+    lattice.removePatch(big)
+    assert lattice.cellIsFree((5, 1))
+    assert lattice.patches == [lattice.getPatchOfCell((0, 0))]
+    assert (lattice.getCols(), lattice.getRows()) == (1, 3)
+
+    lattice.clear()
+    assert lattice.patches == []
+    assert lattice.cellIsFree((0, 0))
+    assert lattice.getMaxCoord(CoordType.Col) == 1
+
+
+def test_remove_patches_if():
+    lattice = Lattice([square((0, 0)), square((1, 0), PatchType.Ancilla), square((2, 0))], 0, 0)
+    lattice.removePatchesIf(lambda patch: patch.patch_type == PatchType.Ancilla)
+
+    assert [patch.cells for patch in lattice.patches] == [[(0, 0)], [(2, 0)]]
+    assert lattice.cellIsFree((1, 0))
+    assert lattice.getCols() == 3
+
+
+def test_overlapping_patches():
+    lattice = Lattice([square((0, 0))], 0, 0)
+    with pytest.raises(ValueError):
+        lattice.addPatch(square((0, 0)))
+    assert len(lattice.patches) == 1
+
+
+def test_uuid_index():
+    first, second = uuid.uuid4(), uuid.uuid4()
+    patch = square((0, 0), patch_uuid=first)
+    lattice = Lattice([patch, square((1, 0))], 0, 0)
+    assert lattice.getPatchByUuid(first) is patch
+
+    lattice.setPatchUuid(patch, second)
+    assert lattice.getPatchByUuid(first) is None
+    assert lattice.getPatchByUuid(second) is patch
+
+    # Setting the uuid on the patch directly is picked up when the index entry is stale
+    other = lattice.getPatchOfCell((1, 0))
+    assert other is not None
+    other.set_uuid(second)
+    patch.set_uuid(first)
+    assert lattice.getPatchByUuid(second) is other
+
+    # A duplicate uuid is found again once the patch indexed under it is removed
+    duplicate = square((2, 0), patch_uuid=second)
+    lattice.addPatch(duplicate)
+    lattice.removePatch(other)
+    assert lattice.getPatchByUuid(second) is duplicate
+
+    lattice.removePatch(duplicate)
+    assert lattice.getPatchByUuid(second) is None
+    assert lattice.getPatchByUuid(uuid.uuid4()) is None
+
+
+def test_uuid_set_on_patch_after_adding():
+    patch_uuid = uuid.uuid4()
+    patch = square((0, 0))
+    lattice = Lattice([patch], 0, 0)
+    assert lattice.getPatchByUuid(patch_uuid) is None
+
+    patch.set_uuid(patch_uuid)
+    assert lattice.getPatchByUuid(patch_uuid) is patch
+
+
+def test_patches_view():
+    first, second, third = square((0, 0)), square((1, 0)), square((2, 0))
+    lattice = Lattice([first], 0, 0)
+
+    lattice.patches.append(second)
+    assert lattice.patches == [first, second]
+    assert lattice.getPatchOfCell((1, 0)) is second
+    assert lattice.getCols() == 2
+
+    lattice.patches.insert(0, third)
+    assert lattice.patches == [third, first, second]
+    with pytest.raises(ValueError):
+        lattice.patches.append(square((0, 0)))
+    assert len(lattice.patches) == 3
+
+    del lattice.patches[0]
+    assert lattice.cellIsFree((2, 0))
+    assert lattice.getCols() == 2
+
+    replacement = square((0, 0), patch_uuid=uuid.uuid4())
+    lattice.patches[0] = replacement
+    assert lattice.getPatchOfCell((0, 0)) is replacement
+    assert lattice.getPatchByUuid(replacement.patch_uuid) is replacement
+
+    lattice.patches.remove(second)
+    assert lattice.patches == [replacement]
+    assert lattice.cellIsFree((1, 0))
+
+    lattice.patches += [second]
+    assert lattice.patches == [replacement, second]
+    assert not lattice.cellIsFree((1, 0))
+
+
+def test_assign_patches():
+    lattice = Lattice([square((0, 0))], 0, 0)
+    lattice.patches = [square((1, 0))]
+    assert lattice.cellIsFree((0, 0))
+    assert not lattice.cellIsFree((1, 0))
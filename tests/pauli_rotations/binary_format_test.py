@@ -0,0 +1,112 @@
+# Copyright (C) 2020-2021 - George Watkins and Alex Nguyen
+#
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or (at your option) any later version.
+#
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public
+# License along with this library; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301
+# USA
+
+from fractions import Fraction
+
+import pytest
+
+import lsqecc.pauli_rotations.binary_format as binary_format
+from lsqecc.pauli_rotations import (
+    Measurement,
+    PauliOpCircuit,
+    PauliOperator,
+    PauliRotation,
+)
+from lsqecc.simulation.conditional_operation_control import EvaluationCondition
+
+from .circuit_test import make_random_circuit
+
+X = PauliOperator.X
+Y = PauliOperator.Y
+Z = PauliOperator.Z
+
+
+@pytest.mark.parametrize("memory_map", [True, False])
+@pytest.mark.parametrize("qubit_num", [1, 9, 70])
+def test_round_trip(tmp_path, qubit_num, memory_map):
+    circuit = make_random_circuit(qubit_num, 40, seed=qubit_num)
+    circuit.name = "round trip ✓"
+    circuit.add_pauli_block(PauliRotation.from_bits(qubit_num, 1, 1, Fraction(-3, 10**9)))
+    circuit.add_pauli_block(Measurement.from_bits(qubit_num, 0, 1, isNegative=True))
+    circuit.save(tmp_path / "circuit.bin")
+
+    loaded = PauliOpCircuit.load(tmp_path / "circuit.bin", memory_map)
+    assert loaded == circuit
+    assert loaded.name == circuit.name
+    assert [type(op) for op in loaded.ops] == [type(op) for op in circuit.ops]
+
+
+def test_empty_circuit(tmp_path):
+    PauliOpCircuit(3).save(tmp_path / "circuit.bin")
+    assert PauliOpCircuit.load(tmp_path / "circuit.bin") == PauliOpCircuit(3)
+
+
+def test_layout(tmp_path):
+    circuit = PauliOpCircuit(2)
+    circuit.add_pauli_block(PauliRotation.from_list([X, Y], Fraction(1, 8)))
+    circuit.add_pauli_block(Measurement.from_list([Z, X], isNegative=True))
+    circuit.add_pauli_block(PauliRotation.from_list([Y, Y], Fraction(1, 8)))
+    circuit.save(tmp_path / "circuit.bin")
+
+    data = (tmp_path / "circuit.bin").read_bytes()
+    assert data[:8] == binary_format.MAGIC
+    assert len(data) % 8 == 0
+    # Header, one angle, then flags, angle indices and the two bitplanes padded to 8 bytes each
+    assert len(data) == 40 + 16 + 8 + 16 + 8 + 8
+
+
+def test_conditional_ops_are_rejected(tmp_path):
+    circuit = PauliOpCircuit(1)
+    m = Measurement.from_list([Z])
+    m.set_condition(EvaluationCondition())
+    circuit.add_pauli_block(m)
+    with pytest.raises(ValueError):
+        circuit.save(tmp_path / "circuit.bin")
+
+
+@pytest.mark.parametrize(
+    "contents", [b"", b"not a circuit", binary_format.MAGIC + bytes(32), b"LSQECCPC\x01"]
+)
+def test_load_invalid_file(tmp_path, contents):
+    (tmp_path / "circuit.bin").write_bytes(contents)
+    with pytest.raises(ValueError):
+        PauliOpCircuit.load(tmp_path / "circuit.bin")
+
+
+def test_load_truncated_file(tmp_path):
+    make_random_circuit(5, 10, seed=0).save(tmp_path / "circuit.bin")
+    data = (tmp_path / "circuit.bin").read_bytes()
+    (tmp_path / "circuit.bin").write_bytes(data[:-8])
+    with pytest.raises(ValueError, match="truncated"):
+        PauliOpCircuit.load(tmp_path / "circuit.bin")
+
+
+@pytest.mark.parametrize("angle_index", [-1, 1, 2**31 - 1])
+def test_load_corrupt_angle_index(tmp_path, angle_index):
+    circuit = PauliOpCircuit(2)
+    circuit.add_pauli_block(PauliRotation.from_list([X, Y], Fraction(1, 8)))
+    circuit.add_pauli_block(Measurement.from_list([Z, X]))
+    circuit.add_pauli_block(PauliRotation.from_list([Y, Y], Fraction(1, 8)))
+    circuit.save(tmp_path / "circuit.bin")
+
+    data = bytearray((tmp_path / "circuit.bin").read_bytes())
+    # The angle index of the last op, after the header, the angle and the flags
+    offset = 40 + 16 + 8 + 2 * 4
+    data[offset : offset + 4] = angle_index.to_bytes(4, "little", signed=True)
+    (tmp_path / "circuit.bin").write_bytes(bytes(data))
+    with pytest.raises(ValueError, match=f"op 2, at byte {offset}"):
+        PauliOpCircuit.load(tmp_path / "circuit.bin")
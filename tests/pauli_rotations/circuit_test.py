@@ -1,8 +1,13 @@
+import functools
+import itertools
+import random
 from fractions import Fraction
 from typing import List
 
+import numpy as np
 import pytest
 
+import lsqecc.pauli_rotations.circuit as circuit_module
 from lsqecc.pauli_rotations.circuit import PauliOpCircuit, PauliOperator, PauliRotation
 from lsqecc.pauli_rotations.rotation import Measurement, PauliProductOperation
 
@@ -64,11 +69,89 @@ def test_are_commuting_diferent_qubit_num():
         PauliOpCircuit.are_commuting(block1, block2)
 
 
+def make_random_circuit(qubit_num: int, length: int, seed: int) -> PauliOpCircuit:
+    rng = random.Random(seed)
+    c = PauliOpCircuit(qubit_num)
+    for _ in range(length):
+        ops = [rng.choice([I, X, Y, Z]) for _ in range(qubit_num)]
+        if rng.random() < 0.2:
+            c.add_pauli_block(Measurement.from_list(ops, rng.random() < 0.5))
+        else:
+            angle = rng.choice([Fraction(1, 4), Fraction(-1, 4), Fraction(1, 8), Fraction(1, 2)])
+            c.add_pauli_block(PauliRotation.from_list(ops, angle))
+    return c
+
+
+@pytest.mark.parametrize("qubit_num", [1, 5, 70])
+def test_commutation_matrix(qubit_num):
+    c = make_random_circuit(qubit_num, 30, seed=qubit_num)
+    commutation = c.commutation_matrix()
+    anticommutation = c.anticommutation_matrix()
+
+    assert commutation.shape == (30, 30)
+    for i, j in itertools.product(range(30), repeat=2):
+        assert commutation[i, j] == PauliOpCircuit.are_commuting(c.ops[i], c.ops[j])
+        assert anticommutation[i, j] != commutation[i, j]
+
+
+def test_anticommutation_block(monkeypatch):
+    c = make_random_circuit(20, 25, seed=1)
+    # A couple of rows at a time
+    monkeypatch.setattr(circuit_module, "_ANTICOMMUTATION_WINDOW_BYTES", 2 * 23 * 8)
+    block = c.anticommutation_block(4, 11, 2, 25)
+    assert block.shape == (7, 23)
+    assert np.array_equal(block, c.anticommutation_matrix()[4:11, 2:25])
+    assert c.anticommutation_block(0, 0).shape == (0, 25)
+
+
+def test_commutation_matrix_window():
+    c = make_random_circuit(6, 20, seed=0)
+    assert np.array_equal(c.commutation_matrix(5, 12), c.commutation_matrix()[5:12, 5:12])
+    assert c.commutation_matrix(3, 3).shape == (0, 0)
+
+
 # @pytest.mark.parametrize("input, expected", generate_tests_apply_transformation())
 # def test_apply_transformation(input, expected):
 #     assert input.apply_transformation() == expected
 
 
+def apply_transformation_by_swaps(circuit: PauliOpCircuit, start_index: int = 0) -> None:
+    """Reference Litinski transform moving pi/4 rotations one adjacent swap at a time"""
+    quarter_rotations = [
+        i
+        for i in range(start_index, len(circuit))
+        if isinstance(circuit.ops[i], PauliRotation)
+        and circuit.ops[i].rotation_amount in {Fraction(1, 4), Fraction(-1, 4)}
+    ]
+    circuit_has_measurements = circuit.circuit_has_measurements()
+    while quarter_rotations:
+        index = quarter_rotations.pop()
+        while index + 1 < len(circuit):
+            circuit.swap_adjacent_blocks(index)
+            index += 1
+        if circuit_has_measurements:
+            circuit.ops.pop()
+
+
+@pytest.mark.parametrize(
+    "qubit_num, length, seed, start_index",
+    [(1, 10, 0, 0), (2, 12, 1, 0), (4, 40, 2, 0), (4, 40, 3, 7), (9, 60, 4, 0), (70, 25, 5, 3)],
+)
+@pytest.mark.parametrize("with_measurements", [True, False])
+def test_apply_transformation_matches_swaps(
+    qubit_num, length, seed, start_index, with_measurements
+):
+    circuit = make_random_circuit(qubit_num, length, seed)
+    if not with_measurements:
+        circuit.ops = [op for op in circuit.ops if not isinstance(op, Measurement)]
+    expected = circuit.copy()
+    apply_transformation_by_swaps(expected, start_index)
+
+    circuit.apply_transformation(start_index)
+    assert circuit == expected
+    assert [type(op) for op in circuit.ops] == [type(op) for op in expected.ops]
+
+
 @pytest.mark.parametrize("circuit1, circuit2, expected", generate_tests_join_same_qubit_num())
 def test_join_same_qubit_num(circuit1, circuit2, expected):
     assert PauliOpCircuit.join(circuit1, circuit2) == expected
@@ -80,6 +163,47 @@ def test_join_different_qubit_num(circuit1, circuit2):
         PauliOpCircuit.join(circuit1, circuit2)
 
 
+def test_join_all():
+    circuits = [make_random_circuit(3, length, seed=length) for length in range(1, 6)]
+    joined = PauliOpCircuit.join_all(circuits)
+    assert joined == functools.reduce(PauliOpCircuit.join, circuits)
+    assert len(joined) == 15
+    assert len(circuits[0]) == 1
+    with pytest.raises(Exception):
+        PauliOpCircuit.join_all([])
+    with pytest.raises(Exception):
+        PauliOpCircuit.join_all(circuits + [PauliOpCircuit(2)])
+
+
+def test_copy_shares_ops():
+    circuit = make_random_circuit(3, 10, seed=0)
+    copied = circuit.copy()
+    assert copied == circuit
+    assert all(a is b for a, b in zip(copied.ops, circuit.ops))
+    copied.ops.pop()
+    assert len(circuit) == 10
+
+
+def test_interned():
+    circuit = make_random_circuit(2, 100, seed=0)
+    interned = circuit.interned()
+    assert interned == circuit
+    assert len(set(map(id, interned.ops))) == len(set(circuit.ops))
+    interned.apply_transformation()
+    circuit.apply_transformation()
+    assert interned == circuit
+
+
+def test_swap_does_not_modify_shared_ops():
+    circuit = PauliOpCircuit.from_list(
+        [PauliRotation.from_list([X], Fraction(1, 4)), Measurement.from_list([Z])]
+    )
+    copied = circuit.copy()
+    copied.swap_adjacent_blocks(0)
+    assert copied.ops[0] == Measurement.from_list([Y])
+    assert circuit.ops[1] == Measurement.from_list([Z])
+
+
 @pytest.mark.parametrize("circuit, fraction, expected", generate_tests_count_rotations_by())
 def test_count_rotations_by(circuit, fraction, expected):
     assert circuit.count_rotations_by(fraction) == expected
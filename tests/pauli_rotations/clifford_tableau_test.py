@@ -0,0 +1,131 @@
+# Copyright (C) 2020-2021 - George Watkins and Alex Nguyen
+#
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or (at your option) any later version.
+#
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public
+# License along with this library; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301
+# USA
+
+import functools
+import itertools
+import random
+from fractions import Fraction
+
+import numpy as np
+import pytest
+
+from lsqecc.pauli_rotations import Measurement, PauliOperator, PauliRotation
+from lsqecc.pauli_rotations.clifford_tableau import (
+    CliffordTableau,
+    bits_to_table,
+    table_to_bits,
+)
+
+I = PauliOperator.I  # noqa: E741
+X = PauliOperator.X
+Y = PauliOperator.Y
+Z = PauliOperator.Z
+
+_matrices = {
+    I: np.eye(2),
+    X: np.array([[0, 1], [1, 0]]),
+    Y: np.array([[0, -1j], [1j, 0]]),
+    Z: np.array([[1, 0], [0, -1]]),
+}
+
+
+def to_matrix(ops):
+    return functools.reduce(np.kron, [_matrices[op] for op in ops])
+
+
+def rotation_matrix(rotation: PauliRotation):
+    angle = np.pi * float(rotation.rotation_amount)
+    p = to_matrix(rotation.ops_list)
+    return np.cos(angle) * np.eye(p.shape[0]) - 1j * np.sin(angle) * p
+
+
+def test_bits_to_table_round_trip():
+    masks = [0, 1, 0b1011, (1 << 69) | 5]
+    table = bits_to_table(masks, 70)
+    assert table.shape == (4, 70)
+    assert list(table[2, :5]) == [1, 1, 0, 1, 0]
+    assert table_to_bits(table) == masks
+
+
+def test_identity():
+    tableau = CliffordTableau(3)
+    assert tableau.is_identity()
+    m = Measurement.from_list([X, Y, Z], True)
+    conjugated = tableau.conjugate(m)
+    assert conjugated is m
+
+
+@pytest.mark.parametrize("seed", range(10))
+def test_conjugation_matches_matrices(seed):
+    rng = random.Random(seed)
+    qubit_num = 3
+    tableau = CliffordTableau(qubit_num)
+    clifford = np.eye(2**qubit_num)
+    for _ in range(4):
+        rotation = PauliRotation.from_list(
+            [rng.choice([I, X, Y, Z]) for _ in range(qubit_num)],
+            rng.choice([Fraction(1, 4), Fraction(-1, 4), Fraction(1, 2), Fraction(3, 4)]),
+        )
+        tableau.absorb_rotation(rotation)
+        clifford = rotation_matrix(rotation) @ clifford
+
+    for ops in itertools.product([I, X, Y, Z], repeat=qubit_num):
+        conjugated = tableau.conjugate(PauliRotation.from_list(list(ops), Fraction(1, 8)))
+        sign = 1 if conjugated.rotation_amount > 0 else -1
+        assert np.allclose(
+            clifford.conj().T @ to_matrix(ops) @ clifford,
+            sign * to_matrix(conjugated.ops_list),
+        )
+
+
+def test_bit_arrays_layout():
+    tableau = CliffordTableau(2)
+    tableau.absorb_rotation(PauliRotation.from_list([I, Z], Fraction(1, 2)))
+    x, z, signs = tableau.bit_arrays()
+    assert x.tolist() == [[1, 0], [0, 0], [0, 1], [0, 0]]
+    assert z.tolist() == [[0, 0], [1, 0], [0, 0], [0, 1]]
+    assert signs.tolist() == [0, 0, 1, 0]
+
+
+@pytest.mark.parametrize("qubit_num", [1, 4, 70])
+def test_bulk_conjugation_matches_single_ops(qubit_num):
+    rng = random.Random(qubit_num)
+    tableau = CliffordTableau(qubit_num)
+    for _ in range(3 * qubit_num):
+        tableau.absorb_pauli_rotation_bits(
+            rng.getrandbits(qubit_num),
+            rng.getrandbits(qubit_num),
+            rng.choice([Fraction(1, 4), Fraction(-1, 4), Fraction(1, 2)]),
+        )
+    ops = [
+        Measurement.from_bits(qubit_num, rng.getrandbits(qubit_num), rng.getrandbits(qubit_num))
+        for _ in range(2 * CliffordTableau.bulk_conjugation_threshold)
+    ]
+    assert tableau.conjugate_ops(ops) == [tableau.conjugate(op) for op in ops]
+
+
+def test_conjugate_ops_flips_measurements():
+    tableau = CliffordTableau(1)
+    tableau.absorb_rotation(PauliRotation.from_list([Z], Fraction(1, 2)))
+    assert tableau.conjugate_ops(
+        [Measurement.from_list([X]), Measurement.from_list([Y], True), Measurement.from_list([Z])]
+    ) == [Measurement.from_list([X], True), Measurement.from_list([Y]), Measurement.from_list([Z])]
+
+
+def test_absorb_non_clifford_rotation():
+    with pytest.raises(ValueError):
+        CliffordTableau(2).absorb_rotation(PauliRotation.from_list([X, Z], Fraction(1, 8)))
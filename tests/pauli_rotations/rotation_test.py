@@ -15,6 +15,9 @@
 # Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301
 # USA
 
+import copy
+import itertools
+import pickle
 from fractions import Fraction
 from typing import List
 
@@ -23,9 +26,17 @@ import pytest
 from lsqecc.pauli_rotations import (
     Measurement,
     PauliOperator,
+    PauliOpInternTable,
     PauliProductOperation,
     PauliRotation,
 )
+from lsqecc.pauli_rotations.rotation import (
+    CachedRotationApproximations,
+    iter_set_bits,
+    symplectic_anticommute,
+    symplectic_product_phase,
+)
+from lsqecc.simulation.conditional_operation_control import EvaluationCondition
 
 I = PauliOperator.I  # noqa: E741
 X = PauliOperator.X
@@ -251,6 +262,23 @@ class TestPauliRotation:
     def test_to_basic_form_approximation(self, rotation: PauliRotation, snapshot):
         snapshot.assert_match(repr(rotation.to_basic_form_approximation()), "list_repr.txt")
 
+    @pytest.mark.parametrize("axis", [X, Z])
+    @pytest.mark.parametrize("compress_rotations", [False, True])
+    def test_to_basic_form_approximation_retargets_template(self, axis, compress_rotations):
+        get_template = CachedRotationApproximations.get_rotation_template
+        on_first = PauliRotation.from_list([axis, I, I], Fraction(1, 64))
+        on_last = PauliRotation.from_list([I, I, axis], Fraction(1, 64))
+
+        first_rotations = on_first.to_basic_form_approximation(compress_rotations)
+        hits = get_template.cache_info().hits
+        last_rotations = on_last.to_basic_form_approximation(compress_rotations)
+        assert get_template.cache_info().hits == hits + 1
+
+        assert len(first_rotations) == len(last_rotations)
+        for r1, r2 in zip(first_rotations, last_rotations):
+            assert r1.rotation_amount == r2.rotation_amount
+            assert r1.ops_list == list(reversed(r2.ops_list))
+
     def test_to_basic_form_arbitrary_angle(self):
         with pytest.raises(Exception):
             PauliRotation.from_list([X], Fraction(1, 3)).to_basic_form_approximation()
@@ -708,6 +736,24 @@ class TestMeasurement:
 class TestPauliProductOperation:
     """Test for methods share by both Measurements and PauliRotation"""
 
+    def test_copy_condition(self):
+        condition = EvaluationCondition()
+        m = Measurement.from_list([X, Z])
+        m.set_condition(condition)
+        other = Measurement.from_list([Z, Z])
+        other.set_condition(condition)
+
+        assert copy.copy(m).get_condition() is condition
+        deep = copy.deepcopy(m)
+        assert deep == m
+        assert isinstance(deep.get_condition(), EvaluationCondition)
+        assert deep.get_condition() is not condition
+
+        # Ops sharing a condition still share the copy of it
+        deep_m, deep_other = copy.deepcopy([m, other])
+        assert deep_m.get_condition() is deep_other.get_condition()
+        assert deep_m.get_condition() is not condition
+
     def test_change_single_op(self):
         r = PauliRotation(5, Fraction(1, 4))
         r.change_single_op(3, X)
@@ -736,6 +782,42 @@ class TestPauliProductOperation:
         m = Measurement.from_list([X, Z, I, X, I, Z])
         assert m.get_ops_map() == {0: X, 1: Z, 3: X, 5: Z}
 
+    def test_ops_list_is_a_view(self):
+        r = PauliRotation.from_list([X, Z, I, Y], Fraction(1, 8))
+        assert (r.x_bits, r.z_bits) == (0b1001, 0b1010)
+        r.ops_list[0] = Z
+        assert r.get_op(0) == Z
+        assert (r.x_bits, r.z_bits) == (0b1000, 0b1011)
+        assert r.ops_list == [Z, Z, I, Y]
+        assert r.ops_list[1:3] == [Z, I]
+        assert str(r.ops_list) == str([Z, Z, I, Y])
+        r.ops_list = [Z, Z, X, I]
+        assert r == PauliRotation.from_list([Z, Z, X, I], Fraction(1, 8))
+        with pytest.raises(IndexError):
+            r.ops_list[4] = X
+
+    def test_ops_list_setter_wrong_length(self):
+        r = PauliRotation(3, Fraction(1, 8))
+        with pytest.raises(Exception):
+            r.ops_list = [X, Z]
+
+    def test_from_bits(self):
+        assert Measurement.from_bits(3, 0b011, 0b110, True) == Measurement.from_list(
+            [X, Y, Z], True
+        )
+
+    def test_from_ops_map(self):
+        assert Measurement.from_ops_map(4, {1: X, 3: Y}, True) == Measurement.from_list(
+            [I, X, I, Y], True
+        )
+        r = PauliRotation.from_ops_map(2000, {1500: Z, -1: X}, Fraction(1, 8))
+        assert r.get_ops_map() == {1500: Z, 1999: X}
+        assert r.weight() == 2
+        with pytest.raises(IndexError):
+            PauliRotation.from_ops_map(3, {3: Z}, Fraction(1, 8))
+        with pytest.raises(TypeError):
+            Measurement.from_ops_map(3, {0: "Z"})
+
     def test_pauli_product_op_init(self):
         # Should not be able to initialize an instance of PauliProductOperation
         with pytest.raises(TypeError):
@@ -774,3 +856,77 @@ class TestPauliOperator:
     def test_multiply_operators_non_commuting(self, input, expected):
         assert PauliOperator.multiply_operators(*input) == (1j, expected)
         assert PauliOperator.multiply_operators(*reversed(input)) == (-1j, expected)
+
+
+def test_iter_set_bits():
+    assert list(iter_set_bits(0)) == []
+    assert list(iter_set_bits(0b101001)) == [0, 3, 5]
+    assert list(iter_set_bits(1 << 600)) == [600]
+
+
+@pytest.mark.parametrize(
+    "ops1, ops2", itertools.product(itertools.product([I, X, Y, Z], repeat=2), repeat=2)
+)
+def test_symplectic_helpers_match_operator_tables(ops1, ops2):
+    r1 = PauliRotation.from_list(list(ops1), Fraction(1, 4))
+    r2 = PauliRotation.from_list(list(ops2), Fraction(1, 4))
+
+    expected_coefficient = complex(1)
+    expected_anticommute = False
+    for a, b in zip(ops1, ops2):
+        expected_coefficient *= PauliOperator.multiply_operators(a, b)[0]
+        expected_anticommute ^= not PauliOperator.are_commuting(a, b)
+
+    k = symplectic_product_phase(r1.x_bits, r1.z_bits, r2.x_bits, r2.z_bits)
+    assert 1j**k == expected_coefficient
+    assert symplectic_anticommute(r1.x_bits, r1.z_bits, r2.x_bits, r2.z_bits) == (
+        expected_anticommute
+    )
+
+
+class TestPauliOpInternTable:
+    def test_intern(self):
+        table = PauliOpInternTable()
+        r = PauliRotation.from_list([X, Z], Fraction(1, 8))
+        interned = table.intern(r)
+        assert interned == r and interned is not r
+        assert table.intern(PauliRotation.from_list([X, Z], Fraction(1, 8))) is interned
+        assert table.intern(interned) is interned
+        assert hash(interned) == hash(r)
+        assert isinstance(interned, PauliRotation)
+
+        m = table.intern(Measurement.from_list([X, Z]))
+        assert m == Measurement.from_list([X, Z])
+        assert table.intern(PauliRotation.from_list([X, Z], Fraction(-1, 8))) is not interned
+        assert len(table) == 3
+        assert (interned.intern_id, m.intern_id) == (0, 1)
+        assert table[1] is m
+
+    def test_interned_ops_are_read_only(self):
+        interned = PauliOpInternTable().intern(PauliRotation.from_list([X, Z], Fraction(1, 8)))
+        with pytest.raises(AttributeError):
+            interned.rotation_amount = Fraction(1, 4)
+        with pytest.raises(AttributeError):
+            interned.change_single_op(0, Y)
+
+        for c in [copy.copy(interned), copy.deepcopy(interned)]:
+            assert type(c) is PauliRotation and c.intern_id is None
+            c.change_single_op(0, Y)
+            assert c.ops_list == [Y, Z]
+        assert interned.ops_list == [X, Z]
+
+        unpickled = pickle.loads(pickle.dumps(interned))
+        assert unpickled == interned
+
+    def test_conditional_ops_are_not_interned(self):
+        r = PauliRotation.from_list([X], Fraction(1, 8))
+        r.set_condition(object())
+        assert PauliOpInternTable().intern(r) is r
+
+    def test_other_table(self):
+        interned = PauliOpInternTable().intern(Measurement.from_list([Z], True))
+        table = PauliOpInternTable()
+        table.intern(Measurement.from_list([X]))
+        reinterned = table.intern(interned)
+        assert reinterned is not interned and reinterned == interned
+        assert reinterned.intern_id == 1
@@ -0,0 +1,100 @@
+# Copyright (C) 2020-2021 - George Watkins and Alex Nguyen
+#
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or (at your option) any later version.
+#
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public
+# License along with this library; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301
+# USA
+
+from fractions import Fraction
+from typing import Dict, List
+
+import pytest
+
+import lsqecc.pauli_rotations.segmented_qasm_parser as segmented_qasm_parser
+from lsqecc.pauli_rotations import (
+    Measurement,
+    PauliOpCircuit,
+    PauliOperator,
+    PauliProductOperation,
+    PauliRotation,
+)
+
+I = PauliOperator.I  # noqa: E741
+X = PauliOperator.X
+Z = PauliOperator.Z
+
+QASM_HEADER = 'OPENQASM 2.0;\ninclude "qelib1.inc";\nqreg q[3];\n'
+
+
+def measured_circuit_qasm(num_segments: int) -> str:
+    lines = ["OPENQASM 2.0;", 'include "qelib1.inc";', "qreg q[3];", "creg c[3];"]
+    for i in range(num_segments):
+        lines += [f"h q[{i % 3}];", f"cx q[{i % 3}],q[{(i + 1) % 3}];", "t q[2];"]
+        lines.append(f"measure q[{i % 3}] -> c[{i % 3}];")
+    return "\n".join(lines) + "\n"
+
+
+@pytest.mark.parametrize("max_workers", [1, 2])
+def test_parallel_matches_sequential(max_workers):
+    qasm = measured_circuit_qasm(12)
+    sequential = segmented_qasm_parser.parse_str(qasm)
+    parallel = segmented_qasm_parser.parse_str(qasm, parallel=True, max_workers=max_workers)
+    assert parallel == sequential
+    assert sum(isinstance(op, Measurement) for op in parallel.ops) == 12
+
+
+def ops_by_qubit(circuit: PauliOpCircuit) -> Dict[int, List[PauliProductOperation]]:
+    """The ops acting on each qubit, which identify the circuit up to reordering ops acting on
+    disjoint qubits, as qiskit does when round tripping"""
+    return dict(
+        (qubit, [op for op in circuit.ops if qubit in op.get_ops_map()])
+        for qubit in range(circuit.qubit_num)
+    )
+
+
+@pytest.mark.parametrize(
+    "gates, lowered",
+    [
+        ("h q[0];\nx q[1];\nz q[2];\ns q[0];\nsdg q[1];\nt q[2];\ntdg q[0];", True),
+        ("cx q[0],q[2];\ncz q[2],q[1];\ncx q[1],q[0];", True),
+        ("rz(pi/4) q[0];\nrx(-3*pi/8) q[1];\nrz(2*pi) q[2];\nrz(0) q[0];", True),
+        ("rz(pi/64) q[0];\nh q[0];\nrx(-pi/128) q[0];", True),
+        ("h q[0];\nrz(0.3) q[1];", False),
+        ("h q[0];\nccx q[0],q[1],q[2];", False),
+        ("x q;", False),
+    ],
+)
+def test_lowering_matches_round_trip(gates, lowered):
+    parser = segmented_qasm_parser._SegmentedQASMParser(QASM_HEADER + gates + "\n")
+    (segment,) = parser.segments
+    round_trip = segmented_qasm_parser._reversible_qasm_to_circuit(
+        parser.reversible_segment_to_qasm(segment)
+    )
+    circuit = parser.get_circuit()
+    if lowered:
+        assert parser.lower_reversible_segment(segment) is not None
+        assert ops_by_qubit(circuit) == ops_by_qubit(round_trip)
+    else:
+        assert parser.lower_reversible_segment(segment) is None
+        assert circuit == round_trip
+
+
+def test_lowering_keeps_angle_precision():
+    # The round trip prints these angles with too few digits to get the exact fraction back
+    circuit = segmented_qasm_parser.parse_str(
+        QASM_HEADER + "rx(pi*5/1024) q[1];\nrz(-0.7853981633974483) q[2];\n"
+    )
+    assert circuit.ops == [
+        PauliRotation.from_list([I, X, I], Fraction(5, 2048)),
+        PauliRotation.from_list([I, I, Z], Fraction(-1, 8)),
+    ]
@@ -0,0 +1,98 @@
+# Copyright (C) 2020-2021 - George Watkins and Alex Nguyen
+#
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or (at your option) any later version.
+#
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public
+# License along with this library; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301
+# USA
+
+from fractions import Fraction
+
+import pytest
+
+import lsqecc.pauli_rotations.segmented_qasm_parser as segmented_qasm_parser
+import lsqecc.pauli_rotations.stream as stream
+from lsqecc.pauli_rotations import (
+    Measurement,
+    PauliOpCircuit,
+    PauliOperator,
+    PauliOpStream,
+    PauliRotation,
+)
+
+from .circuit_test import make_random_circuit
+
+I = PauliOperator.I  # noqa: E741
+X = PauliOperator.X
+Y = PauliOperator.Y
+Z = PauliOperator.Z
+
+
+def rotations_only(circuit: PauliOpCircuit) -> PauliOpCircuit:
+    return PauliOpCircuit.from_list([op for op in circuit.ops if isinstance(op, PauliRotation)])
+
+
+def test_stream_is_lazy():
+    def ops():
+        yield PauliRotation.from_list([X, Y], Fraction(1, 8))
+        raise AssertionError("Read too far")
+
+    s = PauliOpStream(2, ops()).to_y_free_equivalent().get_basic_form()
+    assert isinstance(next(iter(s)), PauliRotation)
+
+
+def test_stream_single_pass():
+    s = make_random_circuit(3, 10, seed=0).stream()
+    assert len(s.to_circuit()) == 10
+    assert len(s.to_circuit()) == 0
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_passes_match_circuit(seed):
+    c = make_random_circuit(4, 40, seed)
+    assert c.stream().to_y_free_equivalent().to_circuit() == c.to_y_free_equivalent()
+    assert c.stream().get_basic_form().to_circuit() == c.get_basic_form()
+
+    r = rotations_only(c)
+    assert (
+        r.stream().group_rotations_with_the_same_axis().to_circuit()
+        == r.group_rotations_with_the_same_axis()
+    )
+
+
+@pytest.mark.parametrize("seed", range(5))
+@pytest.mark.parametrize("window", [1, 3, 1024])
+def test_transformation_matches_circuit(monkeypatch, seed, window):
+    monkeypatch.setattr(stream, "TRANSFORM_WINDOW", window)
+    c = make_random_circuit(4, 40, seed)
+    transformed = c.stream().apply_transformation().to_circuit()
+    c.apply_transformation()
+    assert transformed == c
+
+
+def test_transformation_drops_quarter_rotations_after_measurement():
+    ops = [
+        PauliRotation.from_list([X, I], Fraction(1, 4)),
+        Measurement.from_list([I, Z]),
+    ]
+    assert len(PauliOpStream(2, ops).apply_transformation().to_circuit()) == 1
+    assert len(PauliOpStream(2, ops[:1]).apply_transformation().to_circuit()) == 1
+    assert len(PauliOpStream(2, ops).apply_transformation(False).to_circuit()) == 2
+
+
+def test_parser_stream_matches_circuit():
+    with open("assets/demo_circuits/nontrivial_state.qasm") as input_file:
+        qasm = input_file.read()
+    s = segmented_qasm_parser.stream_str(qasm)
+    c = segmented_qasm_parser.parse_str(qasm)
+    assert s.qubit_num == c.qubit_num
+    assert s.to_circuit() == c
@@ -0,0 +1,108 @@
+# Copyright (C) 2020-2021 - George Watkins and Alex Nguyen
+#
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or (at your option) any later version.
+#
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public
+# License along with this library; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301
+# USA
+
+import subprocess
+import sys
+
+import pytest
+
+from lsqecc.pipeline import batch_compilation
+from lsqecc.pipeline.compilation_pipeline import CompilationPipeline, ReportLevel
+from lsqecc.simulation.logical_patch_state_simulation import SimulatorType
+
+QASM = """OPENQASM 2.0;
+include "qelib1.inc";
+qreg q[2];
+h q[0];
+t q[1];
+"""
+
+
+@pytest.fixture(autouse=True)
+def no_estimate(monkeypatch):
+    # The estimator needs the opensurgery submodule. Workers are forked, so they see the patch
+    monkeypatch.setattr(CompilationPipeline, "estimate", lambda self: None)
+
+
+@pytest.mark.parametrize("max_workers", [1, 2])
+def test_compile_many(tmp_path, max_workers):
+    path = tmp_path / "circuit.qasm"
+    path.write_text(QASM.replace("t q[1]", "s q[1]"))
+    results = list(
+        batch_compilation.compile_many(
+            [QASM, "not QASM", path],
+            simulation_type=SimulatorType.NOOP,
+            report_level=ReportLevel.CIRCUITS,
+            max_workers=max_workers,
+        )
+    )
+    results.sort(key=lambda result: result.index)
+
+    assert [result.name for result in results] == ["circuit 0", "circuit 1", str(path)]
+    assert [result.succeeded() for result in results] == [True, False, True]
+    assert results[1].slices is None
+    assert "Input Circuit" in results[0].compilation_text
+    assert results[2].slices is not None
+    assert [record.name for record in results[2].records][-1] == "slices"
+
+
+def test_without_slices():
+    (result,) = batch_compilation.compile_many([QASM], with_slices=False, max_workers=1)
+    assert result.succeeded()
+    assert result.slices is None
+    assert "make_computation" not in [record.name for record in result.records]
+
+
+def test_main(tmp_path, capsys):
+    good, bad = tmp_path / "good.qasm", tmp_path / "bad.qasm"
+    good.write_text(QASM)
+    bad.write_text("qreg q[1]; not_a_gate q[0];")
+    output_dir = tmp_path / "out"
+
+    failures = batch_compilation.main(
+        [
+            str(good),
+            str(bad),
+            "--workers",
+            "1",
+            "--output-dir",
+            str(output_dir),
+            "--routing",
+            "SteinerTree",
+            "--pack-slices",
+        ]
+    )
+
+    assert failures == 1
+    assert (output_dir / "good.qasm.txt").exists()
+    assert not (output_dir / "bad.qasm.txt").exists()
+    out = capsys.readouterr().out
+    assert f"{good}: compiled" in out
+    assert f"{bad}: failed" in out
+
+
+def test_warm_up_imports_dependencies():
+    code = (
+        "from lsqecc.pipeline import batch_compilation\n"
+        "batch_compilation._warm_up()\n"
+        "import sys\n"
+        "print(' '.join(sys.modules))"
+    )
+    output = subprocess.run(
+        [sys.executable, "-c", code], check=True, capture_output=True, text=True
+    ).stdout
+    assert {"qiskit", "pyzx", "igraph"} <= set(output.split())
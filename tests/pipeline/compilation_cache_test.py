@@ -0,0 +1,89 @@
+# Copyright (C) 2020-2021 - George Watkins and Alex Nguyen
+#
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or (at your option) any later version.
+#
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public
+# License along with this library; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301
+# USA
+
+import os
+import stat
+
+from lsqecc.pipeline.compilation_cache import CompilationCache, normalize_qasm
+
+QASM = """OPENQASM 2.0;
+include "qelib1.inc";
+qreg q[2];
+h q[0];
+"""
+
+
+def test_normalize_qasm():
+    assert normalize_qasm("  // header\nqreg q[2];  \n\n  h q[0]; // comment\n") == (
+        "qreg q[2];\nh q[0];"
+    )
+    assert CompilationCache.circuit_hash(QASM) == CompilationCache.circuit_hash(
+        "// same circuit\n" + QASM.replace("\n", "\n\n")
+    )
+    assert CompilationCache.circuit_hash(QASM) != CompilationCache.circuit_hash(
+        QASM.replace("q[0]", "q[1]")
+    )
+
+
+def test_get_or_compute():
+    cache = CompilationCache()
+    circuit_hash = CompilationCache.circuit_hash(QASM)
+    calls = []
+
+    def compute():
+        calls.append(None)
+        return {"ops": [1, 2]}
+
+    first = cache.get_or_compute(circuit_hash, "parse", (), compute)
+    first["ops"].append(3)
+    assert cache.get_or_compute(circuit_hash, "parse", (), compute) == {"ops": [1, 2]}
+    assert len(calls) == 1
+
+    cache.get_or_compute(circuit_hash, "parse", (True,), compute)
+    cache.get_or_compute(circuit_hash, "transform", (), compute)
+    assert len(calls) == 3
+    assert (cache.hits, cache.misses) == (1, 3)
+
+
+def test_memory_entries_are_bounded():
+    cache = CompilationCache(max_memory_entries=2)
+    for stage in ["a", "b", "c"]:
+        cache.get_or_compute("hash", stage, (), lambda: stage)
+    cache.get_or_compute("hash", "a", (), lambda: "recomputed")
+    assert (cache.hits, cache.misses) == (0, 4)
+
+
+def test_disk_cache(tmp_path):
+    CompilationCache(tmp_path).get_or_compute("hash", "parse", (), lambda: "parsed")
+    cache = CompilationCache(tmp_path)
+    assert cache.get_or_compute("hash", "parse", (), lambda: "recomputed") == "parsed"
+    assert cache.hits == 1
+
+    cache.clear()
+    assert list(tmp_path.iterdir()) == []
+    assert cache.get_or_compute("hash", "parse", (), lambda: "recomputed") == "recomputed"
+
+
+def test_default_directory(monkeypatch, tmp_path):
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+    directory = CompilationCache.default_directory()
+    assert directory == os.path.join(tmp_path, "lsqecc")
+
+    CompilationCache(directory)
+    if os.name == "posix":
+        # Only the user can read the pickles, or write ones that get loaded
+        assert stat.S_IMODE(os.stat(directory).st_mode) & 0o077 == 0
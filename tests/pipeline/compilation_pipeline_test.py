@@ -0,0 +1,127 @@
+# Copyright (C) 2020-2021 - George Watkins and Alex Nguyen
+#
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or (at your option) any later version.
+#
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public
+# License along with this library; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301
+# USA
+
+from lsqecc.pipeline.compilation_cache import CompilationCache
+from lsqecc.pipeline.compilation_pipeline import (
+    DEFAULT_REPORT_LEVEL,
+    CompilationPipeline,
+    ReportLevel,
+)
+from lsqecc.pipeline.lattice_surgery_compilation_pipeline import compile_str
+from lsqecc.simulation.logical_patch_state_simulation import SimulatorType
+
+QASM = """OPENQASM 2.0;
+include "qelib1.inc";
+qreg q[2];
+h q[0];
+t q[1];
+h q[1];
+"""
+
+
+def make_pipeline(**kwargs) -> CompilationPipeline:
+    return CompilationPipeline(QASM, simulation_type=SimulatorType.NOOP, **kwargs)
+
+
+def test_stop_after_llops():
+    pipeline = make_pipeline()
+    logical_computation = pipeline.logical_computation()
+    assert [record.name for record in pipeline.records] == [
+        "parse",
+        "remove_y",
+        "litinski_transform",
+        "llops",
+    ]
+    assert pipeline.records[-1].op_count == len(logical_computation.ops)
+    assert all(record.peak_memory is None for record in pipeline.records)
+
+    # Stages run once
+    assert pipeline.logical_computation() is logical_computation
+    assert len(pipeline.records) == 4
+
+
+def test_without_litinski_transform():
+    pipeline = make_pipeline(apply_litinski_transform=False)
+    assert pipeline.transformed_circuit() == pipeline.parse().to_y_free_equivalent()
+    assert "litinski_transform" not in [record.name for record in pipeline.records]
+
+
+def test_renders_are_opt_in(monkeypatch):
+    pipeline = make_pipeline()
+    # The estimator needs the opensurgery submodule
+    monkeypatch.setattr(pipeline, "estimate", lambda: None)
+
+    assert pipeline.compilation_text(ReportLevel.ESTIMATE) == ""
+    assert pipeline.records == []
+
+    text = pipeline.compilation_text(ReportLevel.CIRCUITS)
+    assert "Input Circuit" in text
+    assert "Circuit after the Litinski Transform" in text
+    assert [record.name for record in pipeline.records] == [
+        "parse",
+        "render_input",
+        "remove_y",
+        "litinski_transform",
+        "render_transformed",
+    ]
+
+
+def test_slices_and_records():
+    pipeline = make_pipeline(track_memory=True)
+    slices = pipeline.slices()
+    records = {record.name: record for record in pipeline.records}
+    assert records["slices"].op_count == len(slices)
+    assert records["make_computation"].op_count == len(slices)
+    assert all(record.peak_memory is not None for record in pipeline.records)
+    assert all(record.wall_time >= 0 for record in pipeline.records)
+    assert "make_computation" in pipeline.render_records()
+
+
+def test_cached_stages(tmp_path):
+    first = make_pipeline(cache=CompilationCache(tmp_path))
+    first.slices()
+    first.render_input()
+
+    second = make_pipeline(cache=CompilationCache(tmp_path))
+    assert second.render_input() == first.render_input()
+    assert len(second.slices()) == len(first.slices())
+    assert [(record.name, record.from_cache) for record in second.records] == [
+        ("render_input", True),
+        ("slices", True),
+    ]
+
+    without_transform = make_pipeline(
+        apply_litinski_transform=False, cache=CompilationCache(tmp_path)
+    )
+    without_transform.logical_computation()
+    assert [(record.name, record.from_cache) for record in without_transform.records] == [
+        ("remove_y", True),
+        ("llops", False),
+    ]
+
+
+def test_default_report_level(monkeypatch):
+    levels = []
+
+    def compilation_text(self, report_level=ReportLevel.CIRCUITS):
+        levels.append(report_level)
+        return ""
+
+    monkeypatch.setattr(CompilationPipeline, "compilation_text", compilation_text)
+    make_pipeline().run()
+    compile_str(QASM, simulation_type=SimulatorType.NOOP)
+    assert levels == [DEFAULT_REPORT_LEVEL, DEFAULT_REPORT_LEVEL]